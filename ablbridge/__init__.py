@@ -0,0 +1,13 @@
+"""Python client for A Bug's Life: bridges ABL.lua's data files to Archipelago.
+
+Linux-friendly alternative to client/Program.cs speaking the same file
+protocol, meant to run as one lightweight process per slot::
+
+    python -m ablbridge --server localhost:38281 --slot Player1 --data-dir ~/abl/Player1
+
+Requires the ``websockets`` package, which Archipelago itself depends on.
+"""
+from .client import Bridge
+from .protocol import SlotOptions, location_id_for_check
+
+__all__ = ["Bridge", "SlotOptions", "location_id_for_check"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .client import EXIT_LOGIN_REFUSED, Bridge, ConnectionRefused
+from .protocol import DATA_DIR_ENV, INSTANCE_ENV, default_data_dir, instance_data_dir
+from .tracing import CLIENT_LOG, TRACE_ENV, trace_enabled
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ablbridge", description="A Bug's Life Archipelago client")
+    parser.add_argument("--server", required=True, help="host:port, or a ws:// / wss:// URI")
+    parser.add_argument("--slot", required=True)
+    parser.add_argument("--password")
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help=f"directory shared with ABL.lua (default: {default_data_dir()}, which "
+                             f"${DATA_DIR_ENV} overrides for both, or the instance's under it)")
+    parser.add_argument("--instance", default=os.environ.get(INSTANCE_ENV) or None,
+                        help=f"use the data directory of this instance, as ABL.lua does for {INSTANCE_ENV} "
+                             f"(default: ${INSTANCE_ENV})")
+    parser.add_argument("--batch-window", type=float, default=0.05,
+                        help="seconds to gather checks into one LocationChecks packet")
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--poll", action="store_true", help="poll the state file instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="longest gap between polls")
+    parser.add_argument("--latency-trace", action="store_true", default=trace_enabled(),
+                        help=f"log checks and items to {CLIENT_LOG} for python -m ablbridge.latency "
+                             f"(default: on if ${TRACE_ENV} is set)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+
+    data_dir = args.data_dir
+    if data_dir is None:
+        data_dir = instance_data_dir(args.instance) if args.instance else default_data_dir()
+
+    bridge = Bridge(
+        args.server,
+        args.slot,
+        data_dir,
+        password=args.password,
+        batch_window=args.batch_window,
+        max_batch=args.max_batch,
+        poll=args.poll,
+        poll_interval=args.poll_interval,
+        latency_trace=args.latency_trace,
+    )
+    try:
+        asyncio.run(bridge.run())
+    except ConnectionRefused as ex:
+        print(f"Login failed ({ex}). Double-check the server address, slot name, and password.", file=sys.stderr)
+        return EXIT_LOGIN_REFUSED
+    except KeyboardInterrupt:
+        print("Exiting...")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""Asyncio bridge between ABL.lua's data directory and an Archipelago server.
+
+One Bridge serves one slot. It watches the ``abl_state.txt`` journal for
+CHECK entries and sends the resulting locations in batched LocationChecks
+packets: the first new check opens a batch window of ``batch_window`` seconds,
+and the batch is sent when the window closes or ``max_batch`` checks are
+waiting, whichever comes first. The journal is acked only once everything read
+from it has been sent, so checks survive a disconnect or a restart. Locations
+already sent or reported checked by the server are remembered in
+``checked_locations.txt`` and never sent twice. Received items update the
+berry/seed tier store and journal commands for Lua. With ``latency_trace``
+the bridge logs its side of every check and item to ``abl_latency_client.log``
+(see latency.py).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import websockets
+
+from .protocol import (
+    COMMAND_FILE,
+    CONFIG_FILE,
+    GAME,
+    ITEMS_PROCESSED_FILE,
+    SESSION_FILE,
+    SESSION_FILES,
+    STATE_FILE,
+    CheckedLocations,
+    SlotOptions,
+    check_ids_from_slot_data,
+    TierState,
+    apply_items,
+    location_id_for_check,
+    lookup_check,
+    read_int,
+    write_lines_atomic,
+)
+from .journal import JournalReader, JournalWriter
+from .tracing import CLIENT_LOG, LatencyLog, now_ms, stamp, stamp_frame
+from .watcher import open_watcher
+
+logger = logging.getLogger("ablbridge")
+
+AP_VERSION = {"major": 0, "minor": 6, "build": 1, "class": "Version"}
+ITEMS_HANDLING_ALL = 0b111
+
+# Exit status of ``python -m ablbridge`` when the server refuses the login.
+EXIT_LOGIN_REFUSED = 3
+
+
+class ConnectionRefused(Exception):
+    pass
+
+
+def server_uris(address: str) -> List[str]:
+    """Candidate websocket URIs for a server address, secure first."""
+    if "://" in address:
+        return [address]
+    return [f"wss://{address}", f"ws://{address}"]
+
+
+class Bridge:
+    def __init__(
+        self,
+        server: str,
+        slot: str,
+        data_dir: Path,
+        password: Optional[str] = None,
+        batch_window: float = 0.05,
+        max_batch: int = 256,
+        poll: bool = False,
+        poll_interval: float = 0.25,
+        reconnect_delay: float = 5.0,
+        latency_trace: bool = False,
+    ):
+        self.server = server
+        self.slot = slot
+        self.password = password
+        self.data_dir = Path(data_dir)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.poll = poll
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+
+        self.options = SlotOptions()
+        self.check_ids: Optional[Dict[str, int]] = None
+        self.tiers = TierState(self.data_dir)
+        self.checked = CheckedLocations(self.data_dir)
+        self.pending: Dict[int, float] = {}  # location id -> time first seen
+        self.on_sent: Optional[Callable[[List[int]], None]] = None
+
+        self._socket = None
+        self._seed_name = server
+        self._connected = asyncio.Event()
+        self._pending_changed = asyncio.Event()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._open_journals()
+        self._uuid = uuid.uuid4().hex
+        self._arrived = 0.0
+        self.latency: Optional[LatencyLog] = None
+        if latency_trace:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self.latency = LatencyLog(self.data_dir / CLIENT_LOG, slot=slot, server=server)
+
+    @property
+    def state_path(self) -> Path:
+        return self.data_dir / STATE_FILE
+
+    def _open_journals(self) -> None:
+        self._state_journal = JournalReader(self.state_path)
+        self._command_journal = JournalWriter(self.data_dir / COMMAND_FILE)
+
+    # --- main loop -------------------------------------------------------
+
+    async def run(self) -> None:
+        """Stay connected until cancelled; a refused login ends the run."""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        sender = asyncio.create_task(self._send_loop())
+        try:
+            while True:
+                try:
+                    await self._session()
+                    logger.warning("[AP] Disconnected; retrying in %gs", self.reconnect_delay)
+                except ConnectionRefused:
+                    raise
+                except (OSError, websockets.exceptions.WebSocketException) as ex:
+                    logger.warning("[AP] Connection lost: %s; retrying in %gs", ex, self.reconnect_delay)
+                finally:
+                    self._connected.clear()
+                    self._socket = None
+                await asyncio.sleep(self.reconnect_delay)
+        finally:
+            sender.cancel()
+            if self._watch_task is not None:
+                self._watch_task.cancel()
+
+    async def _open(self):
+        last_error: Optional[Exception] = None
+        for uri in server_uris(self.server):
+            try:
+                return await websockets.connect(uri, max_size=None, ping_interval=None)
+            except (OSError, websockets.exceptions.WebSocketException) as ex:
+                last_error = ex
+        raise last_error
+
+    async def _session(self) -> None:
+        socket = await self._open()
+        try:
+            async for message in socket:
+                self._arrived = now_ms()
+                for packet in json.loads(message):
+                    await self._handle(socket, packet)
+        finally:
+            await socket.close()
+
+    async def _send(self, socket, *packets: Dict[str, Any]) -> None:
+        await socket.send(json.dumps(list(packets)))
+
+    # --- packets ---------------------------------------------------------
+
+    async def _handle(self, socket, packet: Dict[str, Any]) -> None:
+        cmd = packet.get("cmd")
+        if cmd == "RoomInfo":
+            self._seed_name = packet.get("seed_name") or self.server
+            await self._send(socket, {
+                "cmd": "Connect",
+                "password": self.password or "",
+                "game": GAME,
+                "name": self.slot,
+                "uuid": self._uuid,
+                "version": AP_VERSION,
+                "items_handling": ITEMS_HANDLING_ALL,
+                "tags": ["AP"],
+                "slot_data": True,
+            })
+        elif cmd == "ConnectionRefused":
+            raise ConnectionRefused(", ".join(packet.get("errors", [])) or "connection refused")
+        elif cmd == "Connected":
+            self._on_connected(socket, packet)
+        elif cmd == "ReceivedItems":
+            await self._on_received_items(socket, packet)
+        elif cmd == "RoomUpdate":
+            self._mark_checked(packet.get("checked_locations", ()))
+        elif cmd == "PrintJSON":
+            text = "".join(part.get("text", "") for part in packet.get("data", ()))
+            if text:
+                logger.info("%s", text)
+
+    def _on_connected(self, socket, packet: Dict[str, Any]) -> None:
+        logger.info("[AP] Connected.")
+        self._reset_if_session_changed(f"{self._seed_name}|{self.slot}|{self.server}")
+
+        self.options = SlotOptions.from_slot_data(packet.get("slot_data"))
+        self.check_ids = check_ids_from_slot_data(packet.get("slot_data"))
+        write_lines_atomic(self.data_dir / CONFIG_FILE, self.options.config_lines())
+        self.tiers.store.bump_config()
+        self.tiers.load()
+
+        server_checked = packet.get("checked_locations", ())
+        resend = self.checked.sync(server_checked)
+        for location_id in server_checked:
+            self.pending.pop(location_id, None)
+        if resend:
+            # Sent before a disconnect but never recorded by the server.
+            logger.info("[AP] Resending %d checked locations the server is missing", len(resend))
+            now = time.monotonic()
+            for location_id in resend:
+                self.pending.setdefault(location_id, now)
+
+        self._socket = socket
+        self._connected.set()
+        if self.pending:
+            self._pending_changed.set()
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch_loop())
+
+    def _reset_if_session_changed(self, session_key: str) -> None:
+        session_path = self.data_dir / SESSION_FILE
+        try:
+            previous = session_path.read_text(encoding="utf-8")
+        except OSError:
+            previous = ""
+        if previous == session_key:
+            return
+
+        logger.info("[AP] New session detected; resetting local state.")
+        for name in SESSION_FILES:
+            try:
+                (self.data_dir / name).unlink(missing_ok=True)
+            except OSError as ex:
+                logger.warning("[AP] Warning: failed to delete %s: %s", name, ex)
+        self.tiers.clear()
+        self.checked.clear()
+        self.pending.clear()
+        self._open_journals()
+        session_path.write_text(session_key, encoding="utf-8")
+
+    async def _on_received_items(self, socket, packet: Dict[str, Any]) -> None:
+        processed_path = self.data_dir / ITEMS_PROCESSED_FILE
+        processed = max(read_int(processed_path, 0), 0)
+        index = packet.get("index", 0)
+        items = packet.get("items", [])
+
+        if index > processed:
+            # Items in between were missed; ask for the full list again.
+            await self._send(socket, {"cmd": "Sync"})
+            return
+
+        fresh = [item["item"] for item in items[processed - index:]]
+        if not fresh:
+            return
+        logger.info("[AP] Processing received items: %d -> %d", processed, index + len(items))
+
+        effects = apply_items(self.tiers, fresh)
+        seq = self._command_journal.append(effects.commands, stamp(now_ms()) if self.latency is not None else "")
+        processed_path.write_text(str(index + len(items)), encoding="utf-8")
+        if self.latency is not None:
+            changed = effects.berries_changed or effects.seeds_changed
+            self.latency.event("items", self._arrived, done=now_ms(), index=index, items=fresh,
+                               gen=self.tiers.store.generation if changed else None,
+                               seq=seq if effects.commands else None)
+
+    def _mark_checked(self, location_ids: Iterable[int]) -> None:
+        location_ids = list(location_ids)
+        self.checked.add(location_ids)
+        for location_id in location_ids:
+            self.pending.pop(location_id, None)
+
+    # --- checks ----------------------------------------------------------
+
+    async def _watch_loop(self) -> None:
+        watcher = open_watcher(self.state_path, poll=self.poll, max_interval=self.poll_interval)
+        try:
+            woke = None
+            while True:
+                self.collect_checks(woke)
+                await watcher.wait()
+                woke = now_ms()
+        finally:
+            watcher.close()
+
+    def collect_checks(self, woke: Optional[float] = None) -> int:
+        """Queue the locations of every CHECK entry Lua has journaled; returns how many are new.
+
+        ``woke`` is when the file watcher returned (ms, monotonic), for the latency trace.
+        """
+        now = time.monotonic()
+        added = 0
+        check_ids = self.check_ids
+        for entry in self._state_journal.read():
+            if check_ids is not None:
+                location_id = lookup_check(entry.payload, check_ids)
+            else:
+                location_id = location_id_for_check(entry.payload, self.options)
+            if location_id is None or location_id in self.checked or location_id in self.pending:
+                continue
+            logger.info("[AP] Completing location %d from %s", location_id, entry.payload)
+            self.pending[location_id] = now
+            added += 1
+            if self.latency is not None:
+                self.latency.event("check_read", seq=entry.seq, f=stamp_frame(entry.trace), woke=woke, loc=location_id)
+        if added:
+            self._pending_changed.set()
+        elif not self.pending:
+            self._state_journal.ack()
+        return added
+
+    async def _send_loop(self) -> None:
+        while True:
+            await self._pending_changed.wait()
+            self._pending_changed.clear()
+            await self._connected.wait()
+            if not self.pending:
+                continue
+
+            deadline = min(self.pending.values()) + self.batch_window
+            while len(self.pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._pending_changed.clear()
+                try:
+                    await asyncio.wait_for(self._pending_changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send every waiting check now, in LocationChecks packets of at most max_batch."""
+        socket = self._socket
+        if socket is None or not self.pending:
+            return
+        batch = list(self.pending)
+        try:
+            for start in range(0, len(batch), self.max_batch):
+                chunk = batch[start:start + self.max_batch]
+                sending = now_ms()
+                await self._send(socket, {"cmd": "LocationChecks", "locations": chunk})
+                if self.latency is not None:
+                    self.latency.event("checks_sent", sending, locs=chunk)
+                for location_id in chunk:
+                    self.pending.pop(location_id, None)
+                self.checked.add(chunk)
+                if self.on_sent is not None:
+                    self.on_sent(chunk)
+            if not self.pending:
+                # Everything read from the journal has reached the server.
+                self._state_journal.ack()
+        except websockets.exceptions.ConnectionClosed:
+            # Whatever was not sent stays pending for the next connection.
+            self._pending_changed.set()
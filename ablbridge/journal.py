@@ -0,0 +1,260 @@
+"""Append-only journal with sequence numbers, reader offsets and compaction.
+
+This is the reference implementation of the format ABL.lua, client/Program.cs
+and the Python client use for ``abl_state.txt`` (Lua writes, the client
+reads) and ``abl_command.txt`` (the client writes, Lua reads). Each journal
+has exactly one writer and one reader::
+
+    #ABLJ <journal id> <epoch>
+    <seq> <payload>
+    <seq> <payload>[\t<trace>]
+    ...
+
+Sequence numbers start at 1 and increase by one per entry, across
+compactions and restarts. The writer only ever appends, so nothing the
+reader has not seen can be lost to a truncate. A line without its trailing
+newline is still being written and is left for the next read.
+
+The reader persists its position to ``<journal>.ack`` as
+``<seq> <journal id> <epoch> <offset>``: the last sequence number it has
+handled, and the byte offset just past it in the file of that epoch. The
+writer compacts when the journal grows past a size limit. It rewrites the file
+with only the entries after the acked sequence number, under a new header with
+the epoch incremented. A reader that sees a new epoch rescans from the top and
+skips whatever it has already read.
+
+A writer tracing latency (ABL_LATENCY_TRACE, see tracing.py) appends a tab
+and a trace field to its entries: ``f=<frame>`` from Lua, ``t=<ms>`` of the
+monotonic clock from a client. Readers hand it back separately from the
+payload, and compaction keeps it.
+
+The journal id is picked at random when a writer starts with neither the
+journal nor its ack file, e.g. after a session reset deleted both. A reader
+that sees a different id starts over from sequence number 0.
+"""
+from __future__ import annotations
+
+import os
+import secrets
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+HEADER_PREFIX = b"#ABLJ "
+DEFAULT_COMPACT_BYTES = 64 * 1024
+
+
+class Entry(NamedTuple):
+    seq: int
+    payload: str
+    trace: str = ""
+
+
+class Header(NamedTuple):
+    journal_id: str
+    epoch: int
+
+
+class Ack(NamedTuple):
+    seq: int = 0
+    journal_id: str = ""
+    epoch: int = -1
+    offset: int = 0
+
+
+def ack_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".ack")
+
+
+def read_ack(path: Path) -> Ack:
+    try:
+        seq, journal_id, epoch, offset = path.read_text(encoding="ascii").split()
+        return Ack(int(seq), journal_id, int(epoch), int(offset))
+    except (OSError, ValueError):
+        return Ack()
+
+
+def write_ack(path: Path, ack: Ack) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(f"{ack.seq} {ack.journal_id} {ack.epoch} {ack.offset}\n", encoding="ascii")
+    os.replace(tmp, path)
+
+
+def format_header(header: Header) -> bytes:
+    return HEADER_PREFIX + b"%s %d\n" % (header.journal_id.encode("ascii"), header.epoch)
+
+
+def parse_header(line: bytes) -> Optional[Header]:
+    if not line.startswith(HEADER_PREFIX) or not line.endswith(b"\n"):
+        return None
+    try:
+        journal_id, epoch = line[len(HEADER_PREFIX):].split()
+        return Header(journal_id.decode("ascii"), int(epoch))
+    except ValueError:
+        return None
+
+
+def encode_entry(seq: int, payload: str, trace: str = "") -> bytes:
+    if trace:
+        return b"%d %s\t%s\n" % (seq, payload.encode("utf-8"), trace.encode("ascii"))
+    return b"%d %s\n" % (seq, payload.encode("utf-8"))
+
+
+def parse_entries(data: bytes) -> Tuple[List[Entry], int]:
+    """Entries in ``data`` and how many bytes of it were complete lines."""
+    complete = data.rfind(b"\n") + 1
+    entries = []
+    for line in data[:complete].splitlines():
+        seq, sep, rest = line.partition(b" ")
+        if sep and seq.isdigit():
+            payload, _, trace = rest.decode("utf-8", errors="replace").rstrip("\r").partition("\t")
+            entries.append(Entry(int(seq), payload, trace))
+    return entries, complete
+
+
+def scan(path: Path) -> Tuple[Optional[Header], List[Entry]]:
+    """The header and every complete entry of a journal file."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, []
+    header_end = data.find(b"\n") + 1
+    header = parse_header(data[:header_end])
+    if header is None:
+        return None, []
+    entries, _ = parse_entries(data[header_end:])
+    return header, entries
+
+
+def backlog(path: Path) -> int:
+    """How many complete entries of a journal its reader has not acked yet."""
+    header, entries = scan(path)
+    if header is None:
+        return 0
+    ack = read_ack(ack_path_for(path))
+    if ack.journal_id != header.journal_id:
+        return len(entries)
+    return sum(1 for entry in entries if entry.seq > ack.seq)
+
+
+class JournalWriter:
+    def __init__(self, path: Path, compact_bytes: int = DEFAULT_COMPACT_BYTES):
+        self.path = Path(path)
+        self.ack_path = ack_path_for(self.path)
+        self.compact_bytes = compact_bytes
+
+        self._terminate_partial_line()
+        header, entries = scan(self.path)
+        ack = read_ack(self.ack_path)
+        self.seq = max(entries[-1].seq if entries else 0, ack.seq)
+        if header is not None:
+            self.journal_id, self.epoch = header
+        elif ack.journal_id:
+            self.journal_id, self.epoch = ack.journal_id, ack.epoch
+        else:
+            self.journal_id, self.epoch = secrets.token_hex(4), -1
+
+    def _terminate_partial_line(self) -> None:
+        # A writer that died mid-line leaves a fragment; ending it keeps the
+        # next entry from being glued onto it, and its sequence number, if it
+        # got that far, counts as used.
+        try:
+            with open(self.path, "rb+") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+        except FileNotFoundError:
+            pass
+
+    def _create(self) -> None:
+        # A fresh file always gets a new epoch so a reader holding an offset
+        # into an older file rescans it.
+        self.epoch += 1
+        with open(self.path, "xb") as f:
+            f.write(format_header(Header(self.journal_id, self.epoch)))
+
+    def append(self, payloads: Iterable[str], trace: str = "") -> int:
+        """Append entries in one write; returns the last sequence number used."""
+        lines = []
+        for payload in payloads:
+            self.seq += 1
+            lines.append(encode_entry(self.seq, payload, trace))
+        if not lines:
+            return self.seq
+
+        if not self.path.exists():
+            try:
+                self._create()
+            except FileExistsError:
+                pass
+        with open(self.path, "ab") as f:
+            f.write(b"".join(lines))
+            size = f.tell()
+
+        if size >= self.compact_bytes:
+            self.compact()
+        return self.seq
+
+    def compact(self) -> bool:
+        """Drop every entry the reader has acked; False if the file could not be replaced."""
+        ack = read_ack(self.ack_path)
+        acked = ack.seq if ack.journal_id == self.journal_id else 0
+        header, entries = scan(self.path)
+        if header is None:
+            return False
+        epoch = max(header.epoch, self.epoch) + 1
+        keep = b"".join(encode_entry(*e) for e in entries if e.seq > acked)
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(format_header(Header(self.journal_id, epoch)) + keep)
+        try:
+            os.replace(tmp, self.path)
+        except OSError:
+            # Windows refuses while the reader has the file open; try again next time.
+            tmp.unlink(missing_ok=True)
+            return False
+        self.epoch = epoch
+        return True
+
+
+class JournalReader:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.ack_path = ack_path_for(self.path)
+        ack = read_ack(self.ack_path)
+        self.seq, self.journal_id, self.epoch, self.offset = ack
+        self._acked = ack
+
+    def read(self) -> List[Entry]:
+        """Entries after the last one read, in order. Call ack() once they are handled."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            line = f.readline()
+            header = parse_header(line)
+            if header is None:
+                return []
+            if header.journal_id != self.journal_id:
+                self.seq = 0
+            if header != (self.journal_id, self.epoch):
+                self.journal_id, self.epoch = header
+                self.offset = len(line)
+            f.seek(self.offset)
+            data = f.read()
+
+        entries, complete = parse_entries(data)
+        self.offset += complete
+        fresh = [e for e in entries if e.seq > self.seq]
+        if fresh:
+            self.seq = fresh[-1].seq
+        return fresh
+
+    def ack(self) -> None:
+        """Persist the position after the last entry read."""
+        ack = Ack(self.seq, self.journal_id, self.epoch, self.offset)
+        if ack != self._acked:
+            write_ack(self.ack_path, ack)
+            self._acked = ack
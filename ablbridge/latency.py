@@ -0,0 +1,302 @@
+"""Where the time goes between ABL.lua, the bridge and the server.
+
+With ``ABL_LATENCY_TRACE=1`` in their environment (or ``--latency-trace`` for
+the bridge), each side appends JSON lines to an event log (the Python side's
+writer is tracing.py):
+
+- ABL.lua: ``abl_latency_lua.log`` in the data directory. Events are stamped
+  with ``f``, the frame count since the script started; a ``clock`` event on
+  the first frame of every ``os.time()`` second gives ``wall``, so frames can
+  be placed in wall time to within about a frame. ``checks`` (the last
+  journal ``seq`` of a flush and how many lines it had), ``commands`` (the
+  same for a command journal read), ``tiers`` (a new tier store generation
+  ``gen`` picked up) and ``tiers_applied`` (tiers written to RAM).
+- The bridge: ``abl_latency_client.log`` next to it. Events carry ``t``, the
+  monotonic clock in ms, and ``clock`` events pair it with ``wall`` now and
+  then. ``check_read`` per new location (with the journal ``seq``, the
+  ``f`` of the line and ``woke``, when the file watcher returned),
+  ``checks_sent`` per LocationChecks packet, and ``items`` per
+  ReceivedItems packet (``t`` on arrival, ``done`` once the tier store and
+  command journal are written, and the ``gen``/``seq`` written).
+- The stand-in server (``benchmarks/standin``): ``checks_received`` and
+  ``items_sent``, on the same clock as the bridge's log.
+
+Journal lines written while tracing also carry their stamp after a tab (see
+journal.py).
+
+::
+
+    python -m ablbridge.latency --data-dir DIR --server-log standin.log
+
+joins the logs and prints latency percentiles and histograms per stage.
+Checks: ``wake`` (Lua's append to the watcher waking the bridge), ``parse``
+(reading and resolving the line), ``batch`` (the batch window), ``network``
+(send to the server receiving it). Items: ``network``, ``parse`` (decoding,
+the tier store update and the command journal append), ``reload`` (waiting
+for ABL.lua's next tier store or command poll) and, for tiers, ``apply``
+(waiting for Flik to be ready so the tiers can be written to RAM).
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .protocol import default_data_dir
+from .tracing import CLIENT_LOG, LUA_LOG
+
+# Allowance for placing Lua frames in wall time when joining events.
+SLACK_MS = 50.0
+FRAME_MS = 1000.0 / 60
+HISTOGRAM_EDGES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+
+
+# --- reading ---------------------------------------------------------------
+
+
+def read_events(path: Optional[Path]) -> List[Dict[str, Any]]:
+    """The events in a log, in file order; missing files and torn lines are skipped."""
+    events = []
+    if path is None:
+        return events
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict) and "ev" in event:
+                    events.append(event)
+    except OSError:
+        pass
+    return events
+
+
+def monotonic_to_wall(events: List[Dict[str, Any]]) -> float:
+    """What to add to a log's ``t`` to get wall time in ms."""
+    offsets = [event["wall"] - event["t"] for event in events if event["ev"] == "clock"]
+    if not offsets:
+        raise ValueError("log has no clock events")
+    return statistics.median(offsets)
+
+
+class LuaClock:
+    """Places the frames of ABL.lua's log in wall time (ms).
+
+    The frame counter restarts with the script, so the log is split into runs
+    where ``f`` goes backwards. A run's first ``clock`` event is dropped: the
+    script can start at any point of a second. The frame of a ``clock`` event
+    ran somewhere in the first frame of its second, so it is placed half a
+    frame in. Frames between two anchors are interpolated; frames outside
+    them are extrapolated at the nearest pace.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.runs: List[Tuple[List[int], List[float]]] = []
+        frames: List[int] = []
+        walls: List[float] = []
+        seen_clock = False
+        last_f = -1
+        for event in events:
+            if event["f"] < last_f:
+                self.runs.append((frames, walls))
+                frames, walls, seen_clock = [], [], False
+            last_f = event["f"]
+            event["run"] = len(self.runs)
+            if event["ev"] == "clock":
+                if seen_clock:
+                    frames.append(event["f"])
+                    walls.append(event["wall"] * 1000.0)
+                seen_clock = True
+        self.runs.append((frames, walls))
+
+    def wall(self, run: int, f: int) -> Optional[float]:
+        frames, walls = self.runs[run]
+        if not frames:
+            return None
+        if len(frames) == 1:
+            return walls[0] + (f - frames[0] + 0.5) * FRAME_MS
+        i = min(max(bisect.bisect_right(frames, f) - 1, 0), len(frames) - 2)
+        pace = (walls[i + 1] - walls[i]) / max(frames[i + 1] - frames[i], 1)
+        return walls[i] + (f - frames[i] + 0.5) * pace
+
+
+# --- joining ---------------------------------------------------------------
+
+
+def _first(events: Iterable[Dict[str, Any]], after: float, match) -> Optional[Dict[str, Any]]:
+    for event in events:
+        if event["wall"] >= after - SLACK_MS and match(event):
+            return event
+    return None
+
+
+def _covers(event: Dict[str, Any], seq: int) -> bool:
+    return event["seq"] - event["n"] < seq <= event["seq"]
+
+
+def analyze(client: List[Dict[str, Any]], lua: List[Dict[str, Any]],
+            server: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[float]]]:
+    """Per event kind and stage, the latencies in ms found by joining the logs."""
+    offset = monotonic_to_wall(client)
+    slot = next((event.get("slot") for event in client if event["ev"] == "start"), None)
+    for event in client:
+        event["wall"] = event["t"] + offset
+        for key in ("woke", "done"):
+            if event.get(key) is not None:
+                event[key + "_wall"] = event[key] + offset
+    if server:
+        server_offset = monotonic_to_wall(server)
+        server = [event for event in server if slot is None or event.get("slot") == slot]
+        for event in server:
+            event["wall"] = event["t"] + server_offset
+    clock = LuaClock(lua)
+    lua = [event for event in lua if event["ev"] != "clock"]
+    for event in lua:
+        event["wall"] = clock.wall(event["run"], event["f"])
+    lua = [event for event in lua if event["wall"] is not None]
+
+    stages: Dict[str, Dict[str, List[float]]] = {}
+
+    def add(kind: str, stage: str, value: Optional[float]) -> None:
+        if value is not None:
+            stages.setdefault(kind, {}).setdefault(stage, []).append(value)
+
+    lua_checks = [event for event in lua if event["ev"] == "checks"]
+    sent = [event for event in client if event["ev"] == "checks_sent"]
+    received = [event for event in server if event["ev"] == "checks_received"]
+    for read in (event for event in client if event["ev"] == "check_read"):
+        written = None
+        for event in reversed(lua_checks):
+            if event["wall"] <= read["wall"] + SLACK_MS and _covers(event, read["seq"]):
+                written = event["wall"]
+                break
+        woke = read.get("woke_wall")
+        packet = _first(sent, read["wall"], lambda event: read["loc"] in event["locs"])
+        arrived = packet and _first(received, packet["wall"], lambda event: read["loc"] in event["locs"])
+        if written is not None and woke is not None:
+            add("checks", "wake", woke - written)
+        if woke is not None:
+            add("checks", "parse", read["wall"] - woke)
+        if packet:
+            add("checks", "batch", packet["wall"] - read["wall"])
+        if packet and arrived:
+            add("checks", "network", arrived["wall"] - packet["wall"])
+        if written is not None and arrived:
+            add("checks", "total", arrived["wall"] - written)
+
+    items_sent = [event for event in server if event["ev"] == "items_sent"]
+    lua_tiers = [event for event in lua if event["ev"] == "tiers"]
+    lua_applied = [event for event in lua if event["ev"] == "tiers_applied"]
+    lua_commands = [event for event in lua if event["ev"] == "commands"]
+    for items in (event for event in client if event["ev"] == "items"):
+        origin = None
+        for event in reversed(items_sent):
+            if event["index"] == items["index"] and event["wall"] <= items["wall"] + SLACK_MS:
+                origin = event
+                break
+        done = items["done_wall"]
+        network = origin and items["wall"] - origin["wall"]
+        start = origin["wall"] if origin else items["wall"]
+        kinds = []
+        if items.get("gen") is not None:
+            picked = _first(lua_tiers, done, lambda event: event["gen"] >= items["gen"])
+            applied = picked and _first(lua_applied, picked["wall"], lambda event: event["gen"] >= items["gen"])
+            kinds.append(("items (tiers)", picked, applied))
+        if items.get("seq") is not None:
+            picked = _first(lua_commands, done, lambda event: event["seq"] >= items["seq"])
+            kinds.append(("items (commands)", picked, picked))
+        for kind, picked, applied in kinds:
+            add(kind, "network", network)
+            add(kind, "parse", done - items["wall"])
+            if picked:
+                add(kind, "reload", picked["wall"] - done)
+            if picked and applied and kind == "items (tiers)":
+                add(kind, "apply", applied["wall"] - picked["wall"])
+            if applied:
+                add(kind, "total", applied["wall"] - start)
+    return stages
+
+
+# --- reporting -------------------------------------------------------------
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100.0 * len(ordered)) - 1, 0)]
+
+
+def histogram(values: List[float]) -> Dict[str, int]:
+    labels = [f"<{HISTOGRAM_EDGES[0]}"]
+    labels += [f"{low}-{high}" for low, high in zip(HISTOGRAM_EDGES, HISTOGRAM_EDGES[1:])]
+    labels.append(f">={HISTOGRAM_EDGES[-1]}")
+    counts = dict.fromkeys(labels, 0)
+    for value in values:
+        counts[labels[bisect.bisect_right(HISTOGRAM_EDGES, value)]] += 1
+    return counts
+
+
+def summarize(stages: Dict[str, Dict[str, List[float]]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    return {
+        kind: {
+            stage: {
+                "n": len(values),
+                "p50_ms": percentile(values, 50),
+                "p99_ms": percentile(values, 99),
+                "max_ms": max(values),
+                "histogram_ms": histogram(values),
+            }
+            for stage, values in by_stage.items()
+        }
+        for kind, by_stage in stages.items()
+    }
+
+
+def format_report(summary: Dict[str, Dict[str, Dict[str, Any]]]) -> str:
+    lines = []
+    for kind, by_stage in summary.items():
+        lines.append(kind)
+        lines.append(f"  {'stage':<10} {'n':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for stage, row in by_stage.items():
+            lines.append(f"  {stage:<10} {row['n']:>6} {row['p50_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}")
+        for stage, row in by_stage.items():
+            lines.append(f"  {stage} (ms)")
+            counts = row["histogram_ms"]
+            widest = max(counts.values())
+            for label, count in counts.items():
+                if count:
+                    lines.append(f"    {label:>9} {count:>6} {'#' * max(1, round(40 * count / widest))}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ablbridge.latency", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help=f"directory holding both traces (default: {default_data_dir()})")
+    parser.add_argument("--client-log", type=Path, help=f"bridge trace (default: <data dir>/{CLIENT_LOG})")
+    parser.add_argument("--lua-log", type=Path, help=f"ABL.lua trace (default: <data dir>/{LUA_LOG})")
+    parser.add_argument("--server-log", type=Path, help="stand-in server trace; without it there are no network stages")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or default_data_dir()
+    client = read_events(args.client_log or data_dir / CLIENT_LOG)
+    lua = read_events(args.lua_log or data_dir / LUA_LOG)
+    if not client or not lua:
+        print("need both the bridge's and ABL.lua's traces", file=sys.stderr)
+        return 1
+    summary = summarize(analyze(client, lua, read_events(args.server_log)))
+    print(json.dumps(summary) if args.json else format_report(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
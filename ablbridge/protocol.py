@@ -0,0 +1,489 @@
+"""The file protocol shared by ABL.lua and the client.
+
+Lua journals ``CHECK <token> <level>`` entries to ``abl_state.txt`` and reads
+``LIFE +1`` / ``HEALTH +1`` commands from the ``abl_command.txt`` journal (see
+journal.py for the format). The client owns the absolute per-level berry and seed tiers (``abl_tiers.bin``,
+see store.py) and ``abl_config.txt``: the slot's option bits and per-level
+check thresholds, copied from slot data so Lua never derives them itself.
+Everything here mirrors client/Program.cs so either client can drive the
+same data directory.
+"""
+from __future__ import annotations
+
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .store import BERRY_FIELD, TierStore, legacy_rows
+
+GAME = "A Bug's Life"
+
+DATA_DIR_NAME = "A_Bugs_Life_Archipelago"
+
+# Replaces the default data directory for ABL.lua and both clients alike;
+# the supervisor's --base-dir is the same setting.
+DATA_DIR_ENV = "ABL_DATA_DIR"
+
+# Names one emulator/client pair's data directory, under INSTANCES_DIR, so
+# several can share a machine. ABL.lua reads only the environment variable;
+# the clients also take --instance.
+INSTANCE_ENV = "ABL_INSTANCE"
+INSTANCES_DIR = "instances"
+
+STATE_FILE = "abl_state.txt"
+COMMAND_FILE = "abl_command.txt"
+TIER_FILE = "abl_tiers.bin"
+CONFIG_FILE = "abl_config.txt"
+SESSION_FILE = "session.txt"
+ITEMS_PROCESSED_FILE = "items_processed.txt"
+CHECKED_FILE = "checked_locations.txt"
+
+# The text tier files abl_tiers.bin replaced; imported once if found.
+LEGACY_BERRY_FILE = "abl_berries.txt"
+LEGACY_SEED_FILE = "abl_seeds.txt"
+
+# Files reset when the client connects to a different room or slot. The tier
+# store is cleared in place instead, since Lua keeps it open.
+SESSION_FILES = (
+    CONFIG_FILE, LEGACY_SEED_FILE, LEGACY_BERRY_FILE,
+    STATE_FILE, STATE_FILE + ".ack", COMMAND_FILE, COMMAND_FILE + ".ack",
+    ITEMS_PROCESSED_FILE, CHECKED_FILE,
+)
+
+EXTRA_LIFE_ID = 210
+HEALTH_UPGRADE_ID = 211
+BERRY_ID_BASE = 300
+SEED_ID_BASE = 400
+
+MAX_BERRY_TIER = 4
+MAX_GRAIN = 50
+LEVEL_SLOTS = 256
+SEED_COLOURS = 5  # brown, green, blue, purple, yellow
+
+# Per level: how many upgrades each seed colour can take, in SEED_COLOURS order.
+SEED_UPGRADE_CAPS: Dict[int, tuple] = {
+    17: (1, 2, 0, 4, 0),
+    1:  (4, 3, 3, 0, 0),
+    3:  (1, 2, 0, 4, 0),
+    2:  (1, 0, 0, 4, 0),
+    6:  (3, 2, 0, 0, 0),
+    10: (2, 4, 3, 0, 0),
+    11: (1, 0, 4, 0, 2),
+    4:  (1, 4, 1, 4, 2),
+    5:  (2, 2, 4, 4, 0),
+    14: (1, 0, 0, 0, 0),
+    7:  (4, 2, 3, 2, 0),
+    12: (4, 4, 0, 0, 0),
+    13: (1, 3, 0, 4, 0),
+    9:  (2, 4, 4, 0, 3),
+    8:  (1, 0, 0, 0, 0),
+    15: (2, 0, 3, 0, 0),
+}
+
+# Levels where purple seeds grant berries / there is no gold berry.
+BERRY_PROGRESSION_DISABLED_LEVELS = frozenset({17, 3, 2, 4, 5, 13, 9})
+
+LOCATION_ID_BASE = 1000
+GRAINSANITY_ID_BASE = 2000
+ENEMYSANITY_ID_BASE = 3000
+
+# Version of the slot data layout below; slot data without "version" is the
+# older one option per key layout.
+SLOT_DATA_VERSION = 1
+
+# Bits of the "options" slot data field and config line.
+OPTION_LEVEL_COMPLETE = 1 << 0
+OPTION_FLIK_INDIVIDUAL = 1 << 1
+OPTION_FLIK_ALL = 1 << 2
+OPTION_GRAIN_ALL = 1 << 3
+OPTION_GRAINSANITY = 1 << 4
+OPTION_ENEMY_25 = 1 << 5
+OPTION_ENEMY_50 = 1 << 6
+OPTION_ENEMY_75 = 1 << 7
+OPTION_ENEMY_100 = 1 << 8
+
+LOCATION_OFFSETS = {
+    "FLIK_F": 0,
+    "FLIK_L": 1,
+    "FLIK_I": 2,
+    "FLIK_K": 3,
+    "FLIK_ALL": 4,
+    "GRAIN": 5,
+    "LEVEL_COMPLETE": 7,
+}
+
+
+def _slot_int(slot_data: Mapping[str, Any], key: str, default: int) -> int:
+    value = slot_data.get(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return int(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# (level index, values) rows of the per-level arrays.
+LevelRows = Tuple[Tuple[int, Tuple[int, ...]], ...]
+
+
+def _level_rows(slot_data: Mapping[str, Any], key: str) -> LevelRows:
+    levels = slot_data.get("levels") or ()
+    values = slot_data.get(key) or ()
+    return tuple((int(level_idx), tuple(int(v) for v in row)) for level_idx, row in zip(levels, values))
+
+
+class SlotOptions(NamedTuple):
+    level_complete: bool = True
+    grain_all: bool = False
+    grainsanity: bool = False
+    grainsanity_step: int = 10
+    flik_all: bool = False
+    flik_individual: bool = False
+    enemy_25: bool = False
+    enemy_50: bool = False
+    enemy_75: bool = False
+    enemy_100: bool = False
+    # Enabled grainsanity amounts, ascending, and the enemy counter value of
+    # each enemysanity tier, 25% to 100% (0: no check), per level.
+    grain_thresholds: LevelRows = ()
+    enemy_kills: LevelRows = ()
+
+    @classmethod
+    def from_slot_data(cls, slot_data: Optional[Mapping[str, Any]]) -> SlotOptions:
+        """Read the options the same way Program.cs does; missing keys use its defaults."""
+        if not slot_data:
+            return cls()
+        if "version" not in slot_data:
+            return cls._from_legacy_slot_data(slot_data)
+
+        bits = _slot_int(slot_data, "options", OPTION_LEVEL_COMPLETE)
+        step = _slot_int(slot_data, "grainsanity_step", 0)
+        return cls(
+            level_complete=bool(bits & OPTION_LEVEL_COMPLETE),
+            grain_all=bool(bits & OPTION_GRAIN_ALL),
+            grainsanity=bool(bits & OPTION_GRAINSANITY),
+            grainsanity_step=min(max(step, 1), MAX_GRAIN) if step else 10,
+            flik_all=bool(bits & OPTION_FLIK_ALL),
+            flik_individual=bool(bits & OPTION_FLIK_INDIVIDUAL),
+            enemy_25=bool(bits & OPTION_ENEMY_25),
+            enemy_50=bool(bits & OPTION_ENEMY_50),
+            enemy_75=bool(bits & OPTION_ENEMY_75),
+            enemy_100=bool(bits & OPTION_ENEMY_100),
+            grain_thresholds=_level_rows(slot_data, "grain"),
+            enemy_kills=_level_rows(slot_data, "enemies"),
+        )
+
+    @classmethod
+    def _from_legacy_slot_data(cls, slot_data: Mapping[str, Any]) -> SlotOptions:
+        # Older apworlds send one key per option and no enemy kill counts, so
+        # enemysanity checks cannot fire for them.
+        grainsanity = _slot_int(slot_data, "enable_grainsanity", 0) != 0
+        step = min(max(_slot_int(slot_data, "grainsanity_step", 10), 1), MAX_GRAIN)
+        amounts = tuple(range(step, MAX_GRAIN + 1, step)) if grainsanity else ()
+        return cls(
+            level_complete=_slot_int(slot_data, "enable_level_complete", 1) != 0,
+            grain_all=_slot_int(slot_data, "enable_grain_all", 0) != 0,
+            grainsanity=grainsanity,
+            grainsanity_step=step,
+            flik_all=_slot_int(slot_data, "enable_flik_all", 0) != 0,
+            flik_individual=_slot_int(slot_data, "enable_flik_individual", 0) != 0,
+            enemy_25=_slot_int(slot_data, "enable_enemy_25", 0) != 0,
+            enemy_50=_slot_int(slot_data, "enable_enemy_50", 0) != 0,
+            enemy_75=_slot_int(slot_data, "enable_enemy_75", 0) != 0,
+            enemy_100=_slot_int(slot_data, "enable_enemy_100", 0) != 0,
+            grain_thresholds=tuple((level_idx, amounts) for level_idx in SEED_UPGRADE_CAPS),
+        )
+
+    @property
+    def bits(self) -> int:
+        bits = 0
+        for flag, bit in (
+            (self.level_complete, OPTION_LEVEL_COMPLETE),
+            (self.flik_individual, OPTION_FLIK_INDIVIDUAL),
+            (self.flik_all, OPTION_FLIK_ALL),
+            (self.grain_all, OPTION_GRAIN_ALL),
+            (self.grainsanity, OPTION_GRAINSANITY),
+            (self.enemy_25, OPTION_ENEMY_25),
+            (self.enemy_50, OPTION_ENEMY_50),
+            (self.enemy_75, OPTION_ENEMY_75),
+            (self.enemy_100, OPTION_ENEMY_100),
+        ):
+            if flag:
+                bits |= bit
+        return bits
+
+    def config_lines(self) -> List[str]:
+        """abl_config.txt, in the order WriteLuaConfigFile writes it."""
+        lines = [f"version={SLOT_DATA_VERSION}", f"options={self.bits}"]
+        if self.grainsanity:
+            lines += [
+                f"grain_{level_idx}=" + ",".join(map(str, amounts))
+                for level_idx, amounts in self.grain_thresholds if amounts
+            ]
+        lines += [
+            f"enemies_{level_idx}=" + ",".join(map(str, kills))
+            for level_idx, kills in self.enemy_kills if any(kills)
+        ]
+        return lines
+
+    def enemy_enabled(self, pct_token: str) -> bool:
+        if pct_token.endswith("25"):
+            return self.enemy_25
+        if pct_token.endswith("50"):
+            return self.enemy_50
+        if pct_token.endswith("75"):
+            return self.enemy_75
+        if pct_token.endswith("100"):
+            return self.enemy_100
+        return True
+
+
+def location_id_for_check(line: str, options: SlotOptions) -> Optional[int]:
+    """Location id of one ``CHECK`` line, or None if it is malformed or disabled.
+
+    Derives the id from the id scheme; only needed for slot data without a
+    ``check_ids`` table (see lookup_check()).
+    """
+    parts = line.split()
+    if len(parts) < 3 or parts[0] != "CHECK":
+        return None
+    try:
+        level_idx = int(parts[-1])
+    except ValueError:
+        return None
+
+    token = parts[1].upper()
+
+    if token == "LEVEL_COMPLETE" and not options.level_complete:
+        return None
+    if token == "GRAIN" and not options.grain_all:
+        return None
+    if token.startswith("GRAIN") and len(token) > 5 and not options.grainsanity:
+        return None
+    if token.startswith("ENEMIES") and len(token) > 7 and not options.enemy_enabled(token):
+        return None
+    if token == "FLIK_ALL" and not options.flik_all:
+        return None
+    if token.startswith("FLIK_") and len(token) == 6 and not options.flik_individual:
+        return None
+
+    if token.startswith("GRAIN") or token.startswith("ENEMIES"):
+        prefix = 5 if token.startswith("GRAIN") else 7
+        amount = 0
+        if len(token) > prefix and token[prefix:].isdigit():
+            amount = int(token[prefix:])
+        elif len(parts) >= 4 and parts[2].isdigit() and parts[3].isdigit():
+            amount, level_idx = int(parts[2]), int(parts[3])
+
+        if prefix == 7:
+            return ENEMYSANITY_ID_BASE + level_idx * 10 + amount // 25
+        if amount > 0:
+            return GRAINSANITY_ID_BASE + level_idx * 100 + amount
+        return LOCATION_ID_BASE + level_idx * 10 + LOCATION_OFFSETS["GRAIN"]
+
+    offset = LOCATION_OFFSETS.get(token)
+    if offset is None or token == "GRAIN":
+        return None
+    return LOCATION_ID_BASE + level_idx * 10 + offset
+
+
+def check_ids_from_slot_data(slot_data: Optional[Mapping[str, Any]]) -> Optional[Dict[str, int]]:
+    """The apworld's "<token> <level>" -> location id table, or None from older apworlds."""
+    table = (slot_data or {}).get("check_ids")
+    if not isinstance(table, Mapping):
+        return None
+    return {str(key): int(location_id) for key, location_id in table.items()}
+
+
+def lookup_check(line: str, check_ids: Mapping[str, int]) -> Optional[int]:
+    """Location id of one ``CHECK`` line via the slot's table; None if it is not a check of this slot."""
+    if not line.startswith("CHECK "):
+        return None
+    return check_ids.get(line[6:].strip())
+
+
+def default_data_dir() -> Path:
+    """Where ABL.lua writes by default: $ABL_DATA_DIR, else A_Bugs_Life_Archipelago in
+    %LOCALAPPDATA%, $XDG_DATA_HOME or ~/.local/share, whichever is found first."""
+    data_dir = os.environ.get(DATA_DIR_ENV)
+    if data_dir:
+        return Path(data_dir)
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / DATA_DIR_NAME
+
+
+def sanitize_instance(name: str) -> str:
+    """Every UTF-8 byte outside [A-Za-z0-9_-] replaced by "_", as ABL.lua and Program.cs do."""
+    return re.sub(rb"[^A-Za-z0-9_-]", b"_", name.encode("utf-8")).decode("ascii")
+
+
+def instance_name(seed_name: str, slot: str) -> str:
+    """The instance of one slot of one room."""
+    return sanitize_instance(f"{seed_name}-{slot}")
+
+
+def instance_data_dir(instance: str, base: Optional[Path] = None) -> Path:
+    return (base or default_data_dir()) / INSTANCES_DIR / sanitize_instance(instance)
+
+
+def write_lines_atomic(path: Path, lines: Iterable[str]) -> None:
+    """Replace a file in one step so Lua never reads it half-written."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_int(path: Path, fallback: int) -> int:
+    try:
+        return int(path.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return fallback
+
+
+class CheckedLocations:
+    """Locations the server has, or has been sent, this session.
+
+    Kept in ``checked_locations.txt``, one id per line, so it survives client
+    restarts: CHECK lines Lua repeats after a script reload are dropped
+    locally instead of being sent again. New ids are appended. On connect the
+    file is rewritten from the server's checked locations, and any cached ids
+    the server is missing are returned so they can be sent again.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.path = data_dir / CHECKED_FILE
+        self.ids: Set[int] = set()
+        self.load()
+
+    def __contains__(self, location_id: int) -> bool:
+        return location_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def load(self) -> None:
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except OSError:
+            text = ""
+        self.ids = {int(line) for line in text.split() if line.lstrip("-").isdigit()}
+
+    def sync(self, server_ids: Iterable[int]) -> List[int]:
+        """Adopt the server's checked locations; returns the cached ids it does not have."""
+        server = set(server_ids)
+        missing = sorted(self.ids - server)
+        self.ids = server.union(missing)
+        write_lines_atomic(self.path, map(str, sorted(self.ids)))
+        return missing
+
+    def add(self, location_ids: Iterable[int]) -> List[int]:
+        """Record locations as checked; returns the ones that were not known yet."""
+        new = [location_id for location_id in dict.fromkeys(location_ids) if location_id not in self.ids]
+        if new:
+            self.ids.update(new)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{location_id}\n" for location_id in new))
+        return new
+
+    def clear(self) -> None:
+        self.ids = set()
+
+
+class TierState:
+    """Absolute berry and seed tiers per level, kept in the tier store Lua reads."""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self.berry_tiers: List[int] = [0] * LEVEL_SLOTS
+        self.seed_tiers: List[List[int]] = [[0] * SEED_COLOURS for _ in range(LEVEL_SLOTS)]
+        self._store: Optional[TierStore] = None
+
+    @property
+    def store(self) -> TierStore:
+        if self._store is None:
+            self._store = TierStore(self.data_dir / TIER_FILE)
+            if self._store.created:
+                self._import_legacy()
+        return self._store
+
+    def load(self) -> None:
+        snapshot = self.store.snapshot()
+        self.berry_tiers = [snapshot.berry(level_idx) for level_idx in range(LEVEL_SLOTS)]
+        self.seed_tiers = [list(snapshot.seeds(level_idx)) for level_idx in range(LEVEL_SLOTS)]
+
+    def clear(self) -> None:
+        self.store.clear()
+        self.load()
+
+    def _import_legacy(self) -> None:
+        """Carry over the tiers of a session started before the store existed."""
+        with self._store.update():
+            for parts in legacy_rows(self.data_dir / LEGACY_BERRY_FILE):
+                if len(parts) == 3 and parts[1].isdigit() and parts[2].lstrip("-").isdigit():
+                    level_idx = int(parts[1])
+                    if level_idx < LEVEL_SLOTS:
+                        self._store.set(level_idx, BERRY_FIELD, min(max(int(parts[2]), 0), MAX_BERRY_TIER))
+
+            for parts in legacy_rows(self.data_dir / LEGACY_SEED_FILE):
+                if len(parts) == 2 + SEED_COLOURS and parts[1].isdigit():
+                    level_idx = int(parts[1])
+                    if level_idx >= LEVEL_SLOTS:
+                        continue
+                    for colour, text in enumerate(parts[2:]):
+                        if text.lstrip("-").isdigit():
+                            self._store.set(level_idx, colour, min(max(0, int(text)), 255))
+
+    def upgrade_berry(self, level_idx: int, copies: int = 1) -> bool:
+        if not 0 <= level_idx < LEVEL_SLOTS or level_idx in BERRY_PROGRESSION_DISABLED_LEVELS:
+            return False
+        if self.berry_tiers[level_idx] >= MAX_BERRY_TIER:
+            return False
+        self.berry_tiers[level_idx] = min(self.berry_tiers[level_idx] + copies, MAX_BERRY_TIER)
+        self.store.set(level_idx, BERRY_FIELD, self.berry_tiers[level_idx])
+        return True
+
+    def upgrade_seed(self, level_idx: int, colour: int, copies: int = 1) -> bool:
+        caps = SEED_UPGRADE_CAPS.get(level_idx)
+        if caps is None or self.seed_tiers[level_idx][colour] >= caps[colour]:
+            return False
+        self.seed_tiers[level_idx][colour] = min(self.seed_tiers[level_idx][colour] + copies, caps[colour])
+        self.store.set(level_idx, colour, self.seed_tiers[level_idx][colour])
+        return True
+
+
+_ITEM_COMMANDS = {EXTRA_LIFE_ID: "LIFE +1", HEALTH_UPGRADE_ID: "HEALTH +1"}
+
+
+class ItemEffects(NamedTuple):
+    commands: List[str]
+    berries_changed: bool
+    seeds_changed: bool
+
+
+def apply_items(tiers: TierState, item_ids: Iterable[int]) -> ItemEffects:
+    """Apply received items, ending where HandleItem one at a time would.
+
+    Tiers are saturating counters, so the items are counted once and each
+    tier is raised by its copies, clamped to its cap (the reduce_items fold
+    of the apworld's Tiers.py). The resulting single-byte writes reach Lua as
+    one store update. Returns the command lines to append for Lua, in item
+    order, and which tiers changed.
+    """
+    item_ids = list(item_ids)
+    commands = [_ITEM_COMMANDS[item_id] for item_id in item_ids if item_id in _ITEM_COMMANDS]
+    berries_changed = seeds_changed = False
+
+    with tiers.store.update():
+        for item_id, copies in Counter(item_ids).items():
+            if BERRY_ID_BASE <= item_id < SEED_ID_BASE:
+                berries_changed |= tiers.upgrade_berry(item_id - BERRY_ID_BASE, copies)
+            elif SEED_ID_BASE <= item_id < SEED_ID_BASE + SEED_COLOURS * 100:
+                colour, level_idx = divmod(item_id - SEED_ID_BASE, 100)
+                seeds_changed |= tiers.upgrade_seed(level_idx, colour, copies)
+
+    return ItemEffects(commands, berries_changed, seeds_changed)
@@ -0,0 +1,187 @@
+"""Fixed-layout binary store of the per-level seed and berry tiers.
+
+This is the reference implementation and the format spec of
+``abl_tiers.bin``, which the client (Program.cs or ablbridge) writes and
+ABL.lua reads. It replaces the ``abl_seeds.txt`` / ``abl_berries.txt`` text
+files, which were rewritten in full on every item and re-parsed by Lua every
+300 frames. All integers are little-endian::
+
+    offset  size  field
+    0       4     magic b"ABLS"
+    4       2     version (1)
+    6       2     level count (256)
+    8       4     generation
+    12      4     config generation
+    16      1536  256 level records of 6 bytes:
+                  brown, green, blue, purple, yellow seed tiers, berry tier
+
+The file has exactly one writer, the client, which maps it and changes
+single bytes in place; the file is never replaced or truncated, so a session
+reset clears it rather than deleting it.
+
+``generation`` works as a sequence lock. The writer makes it odd before
+touching any record and even again, one higher, once done, so a batch of
+items is applied as one update. A reader remembers the last even generation
+it loaded. To poll, it reads the header: if the generation is unchanged there
+is nothing to do, and if it is odd, a write is in progress, so it tries again
+later. Otherwise it reads the records and then the generation again, and
+keeps the records only if the generation has not moved in between.
+
+``config generation`` is bumped whenever the client rewrites abl_config.txt,
+so Lua re-reads the config only when it changed.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional
+
+MAGIC = b"ABLS"
+VERSION = 1
+LEVELS = 256
+SEED_COLOURS = 5
+RECORD_SIZE = SEED_COLOURS + 1
+BERRY_FIELD = SEED_COLOURS
+
+HEADER = struct.Struct("<4sHHII")
+GENERATION = struct.Struct("<I")
+GENERATION_OFFSET = 8
+CONFIG_GENERATION_OFFSET = 12
+SIZE = HEADER.size + LEVELS * RECORD_SIZE
+
+
+class Snapshot(NamedTuple):
+    generation: int
+    config_generation: int
+    records: bytes  # LEVELS * RECORD_SIZE bytes
+
+    def seeds(self, level_idx: int) -> bytes:
+        start = level_idx * RECORD_SIZE
+        return self.records[start:start + SEED_COLOURS]
+
+    def berry(self, level_idx: int) -> int:
+        return self.records[level_idx * RECORD_SIZE + BERRY_FIELD]
+
+
+def _offset(level_idx: int, field: int) -> int:
+    if not 0 <= level_idx < LEVELS or not 0 <= field < RECORD_SIZE:
+        raise IndexError(f"no tier field {field} for level {level_idx}")
+    return HEADER.size + level_idx * RECORD_SIZE + field
+
+
+class TierStore:
+    """The writer's side: the file mapped read-write."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.created = False
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size != SIZE:
+                # New (or not ours): lay out an empty store.
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, SIZE)
+                self.created = True
+            self._map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+
+        magic, version, levels, generation, _ = HEADER.unpack_from(self._map)
+        if self.created or magic != MAGIC or version != VERSION or levels != LEVELS:
+            self._map[:SIZE] = bytes(SIZE)
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, LEVELS, 0, 0)
+            self.created = True
+        elif generation & 1:
+            # The last writer died mid-update; every field is a single byte,
+            # so the records are usable as they are.
+            self._set_generation(generation + 1)
+        self._depth = 0
+
+    def close(self) -> None:
+        self._map.flush()
+        self._map.close()
+
+    @property
+    def generation(self) -> int:
+        return GENERATION.unpack_from(self._map, GENERATION_OFFSET)[0]
+
+    def _set_generation(self, value: int) -> None:
+        GENERATION.pack_into(self._map, GENERATION_OFFSET, value & 0xFFFFFFFF)
+
+    @contextmanager
+    def update(self) -> Iterator[None]:
+        """Group writes so readers see all of them or none; nests."""
+        if self._depth == 0:
+            self._set_generation(self.generation + 1)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._set_generation(self.generation + 1)
+
+    def get(self, level_idx: int, field: int) -> int:
+        return self._map[_offset(level_idx, field)]
+
+    def set(self, level_idx: int, field: int, value: int) -> None:
+        with self.update():
+            self._map[_offset(level_idx, field)] = value
+
+    def clear(self) -> None:
+        with self.update():
+            self._map[HEADER.size:SIZE] = bytes(SIZE - HEADER.size)
+
+    def bump_config(self) -> None:
+        config_generation = GENERATION.unpack_from(self._map, CONFIG_GENERATION_OFFSET)[0]
+        GENERATION.pack_into(self._map, CONFIG_GENERATION_OFFSET, (config_generation + 1) & 0xFFFFFFFF)
+
+    def snapshot(self) -> Snapshot:
+        _, _, _, generation, config_generation = HEADER.unpack_from(self._map)
+        return Snapshot(generation, config_generation, bytes(self._map[HEADER.size:SIZE]))
+
+
+class TierReader:
+    """The reader's side, as ABL.lua does it: plain reads, no mapping."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.generation = -1
+        self.config_generation = -1
+
+    def poll(self) -> Optional[Snapshot]:
+        """A consistent snapshot if the tiers changed since the last one, else None."""
+        try:
+            with open(self.path, "rb") as f:
+                head = f.read(HEADER.size)
+                if len(head) < HEADER.size:
+                    return None
+                magic, version, levels, generation, config_generation = HEADER.unpack(head)
+                if magic != MAGIC or version != VERSION or levels != LEVELS:
+                    return None
+                if generation & 1 or (generation == self.generation and config_generation == self.config_generation):
+                    return None
+                records = f.read(LEVELS * RECORD_SIZE)
+                f.seek(GENERATION_OFFSET)
+                if GENERATION.unpack(f.read(GENERATION.size))[0] != generation:
+                    return None
+        except FileNotFoundError:
+            return None
+        if len(records) != LEVELS * RECORD_SIZE:
+            return None
+        self.generation = generation
+        self.config_generation = config_generation
+        return Snapshot(generation, config_generation, records)
+
+
+def legacy_rows(path: Path) -> List[List[str]]:
+    """``LEVEL ...`` rows of the abl_seeds.txt / abl_berries.txt files the store replaces."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    return [parts for parts in (line.split() for line in text.splitlines()) if parts and parts[0] == "LEVEL"]
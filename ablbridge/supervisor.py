@@ -0,0 +1,192 @@
+"""Run one bridge per slot on a single machine and watch them.
+
+::
+
+    python -m ablbridge.supervisor --server localhost:38281 --slot Player1 --slot Player2 --slot Player3
+
+Asks the server for its room seed, then starts ``python -m ablbridge`` for
+each slot with the instance ``<seed>-<slot>``: its own data directory under
+``instances/`` of ``--base-dir``, whose path it prints. Start each slot's
+BizHawk with ``ABL_DATA_DIR`` and ``ABL_INSTANCE`` set as printed so ABL.lua
+uses the same directory. A bridge that exits is restarted after
+``--restart-delay`` seconds, unless its login was refused. Every
+``--interval`` seconds one line per instance reports its process and queue
+depths: ``checks`` are CHECK entries ABL.lua journaled that the bridge has
+not yet sent and acked, and ``commands`` are entries the bridge queued that
+ABL.lua has not yet acked.
+Each bridge logs to ``bridge.log`` in its directory.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import websockets
+
+from .client import EXIT_LOGIN_REFUSED, server_uris
+from .journal import backlog
+from .protocol import (COMMAND_FILE, DATA_DIR_ENV, INSTANCE_ENV, STATE_FILE, default_data_dir, instance_data_dir,
+                       instance_name)
+
+
+async def _room_seed(server: str) -> str:
+    last_error: Optional[Exception] = None
+    for uri in server_uris(server):
+        try:
+            async with websockets.connect(uri, max_size=None, ping_interval=None) as socket:
+                for packet in json.loads(await socket.recv()):
+                    if packet.get("cmd") == "RoomInfo":
+                        return str(packet["seed_name"])
+        except (OSError, websockets.exceptions.WebSocketException) as ex:
+            last_error = ex
+    raise RuntimeError(f"no RoomInfo from {server}: {last_error}")
+
+
+def room_seed(server: str) -> str:
+    """The seed name the server announces in RoomInfo."""
+    return asyncio.run(_room_seed(server))
+
+
+class Instance:
+    """One slot's bridge process and its data directory."""
+
+    def __init__(self, slot: str, name: str, data_dir: Path, command: List[str]):
+        self.slot = slot
+        self.name = name
+        self.data_dir = data_dir
+        self.command = command
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.exit_code: Optional[int] = None
+        self.restart_at: Optional[float] = None
+
+    def start(self) -> None:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        env = dict(os.environ, **{INSTANCE_ENV: self.name})
+        with open(self.data_dir / "bridge.log", "ab") as log:
+            self.process = subprocess.Popen(self.command, stdout=log, stderr=subprocess.STDOUT, env=env)
+        self.exit_code = None
+        self.restart_at = None
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+    def check(self, restart_delay: float) -> None:
+        """Note an exit and restart the bridge once its delay has passed."""
+        if self.process is not None and self.exit_code is None:
+            code = self.process.poll()
+            if code is None:
+                return
+            self.exit_code = code
+            # A refused login will be refused again.
+            if code != EXIT_LOGIN_REFUSED:
+                self.restart_at = time.monotonic() + restart_delay
+        if self.restart_at is not None and time.monotonic() >= self.restart_at:
+            self.restarts += 1
+            self.start()
+
+    @property
+    def state(self) -> str:
+        if self.exit_code is None:
+            return "running"
+        if self.restart_at is not None:
+            return f"restarting (exit {self.exit_code})"
+        return f"stopped (exit {self.exit_code})"
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "instance": self.name,
+            "slot": self.slot,
+            "pid": self.process.pid if self.process is not None else None,
+            "state": self.state,
+            "restarts": self.restarts,
+            "checks": backlog(self.data_dir / STATE_FILE),
+            "commands": backlog(self.data_dir / COMMAND_FILE),
+        }
+
+
+def bridge_command(args: argparse.Namespace, slot: str, data_dir: Path) -> List[str]:
+    command = [
+        sys.executable, "-m", "ablbridge",
+        "--server", args.server,
+        "--slot", slot,
+        "--data-dir", str(data_dir),
+        "--batch-window", str(args.batch_window),
+    ]
+    if args.password:
+        command += ["--password", args.password]
+    if args.poll:
+        command += ["--poll", "--poll-interval", str(args.poll_interval)]
+    return command
+
+
+def format_row(row: Dict[str, Any]) -> str:
+    return "{instance:<32} pid {pid!s:<7} {state:<22} restarts {restarts:<3} checks {checks:<5} commands {commands}".format(**row)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ablbridge.supervisor", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server", required=True, help="host:port, or a ws:// / wss:// URI")
+    parser.add_argument("--slot", dest="slots", action="append", required=True, help="slot name (repeatable)")
+    parser.add_argument("--password")
+    parser.add_argument("--seed", help="room seed to name the instances by (default: asked from the server)")
+    parser.add_argument("--base-dir", type=Path, default=None,
+                        help=f"directory holding instances/, ${DATA_DIR_ENV} for ABL.lua (default: {default_data_dir()})")
+    parser.add_argument("--batch-window", type=float, default=0.05)
+    parser.add_argument("--poll", action="store_true", help="bridges poll the state file instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between reports")
+    parser.add_argument("--restart-delay", type=float, default=5.0)
+    parser.add_argument("--duration", type=float, default=0.0, help="stop everything after this many seconds (0: never)")
+    parser.add_argument("--json", action="store_true", help="report JSON lines")
+    args = parser.parse_args(argv)
+
+    seed = args.seed or room_seed(args.server)
+    base_dir = (args.base_dir or default_data_dir()).resolve()
+    instances = []
+    for slot in dict.fromkeys(args.slots):
+        name = instance_name(seed, slot)
+        data_dir = instance_data_dir(name, base_dir)
+        instances.append(Instance(slot, name, data_dir, bridge_command(args, slot, data_dir)))
+
+    for instance in instances:
+        instance.start()
+        print(f"{instance.slot}: {DATA_DIR_ENV}={base_dir} {INSTANCE_ENV}={instance.name} -> {instance.data_dir}",
+              flush=True)
+
+    deadline = time.monotonic() + args.duration if args.duration > 0 else None
+    next_report = time.monotonic() + args.interval
+    try:
+        while deadline is None or time.monotonic() < deadline:
+            time.sleep(min(0.5, args.interval))
+            for instance in instances:
+                instance.check(args.restart_delay)
+            if time.monotonic() >= next_report:
+                next_report += args.interval
+                for instance in instances:
+                    row = instance.report()
+                    print(json.dumps(row) if args.json else format_row(row), flush=True)
+    except KeyboardInterrupt:
+        print("Exiting...")
+    finally:
+        for instance in instances:
+            instance.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
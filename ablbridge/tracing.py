@@ -0,0 +1,58 @@
+"""The latency trace's event log and journal stamps; latency.py reads them."""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+TRACE_ENV = "ABL_LATENCY_TRACE"
+CLIENT_LOG = "abl_latency_client.log"
+LUA_LOG = "abl_latency_lua.log"
+
+CLOCK_INTERVAL_MS = 10_000.0
+
+
+def trace_enabled() -> bool:
+    return os.environ.get(TRACE_ENV, "") not in ("", "0")
+
+
+def now_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
+def stamp(t: float) -> str:
+    """The trace field of a journal line written at monotonic time ``t`` (ms)."""
+    return f"t={t:.3f}"
+
+
+def stamp_frame(trace: str) -> Optional[int]:
+    """The frame in a trace field ABL.lua wrote (``f=<frame>``)."""
+    key, _, value = trace.partition("=")
+    return int(value) if key == "f" and value.isdigit() else None
+
+
+class LatencyLog:
+    """Appends JSON events stamped with the monotonic clock in ms, rounded to the microsecond."""
+
+    def __init__(self, path: Path, **start: Any):
+        self.path = Path(path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._next_clock = 0.0
+        self.event("start", **start)
+
+    def event(self, ev: str, t: Optional[float] = None, **fields: Any) -> None:
+        now = now_ms()
+        if now >= self._next_clock:
+            self._next_clock = now + CLOCK_INTERVAL_MS
+            self._write({"ev": "clock", "t": now, "wall": time.time() * 1000.0})
+        self._write({"ev": ev, "t": now if t is None else t, **fields})
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        event = {key: round(value, 3) if isinstance(value, float) else value for key, value in event.items()}
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
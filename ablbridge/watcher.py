@@ -0,0 +1,125 @@
+"""Wait for changes to one file without busy-polling it.
+
+On Linux the file's directory is watched with inotify, so a write wakes the
+client immediately. Elsewhere, or if inotify is unavailable, the file is
+stat()ed on an adaptive interval: it drops to ``min_interval`` after every
+change and doubles while the file stays quiet, up to ``max_interval``.
+"""
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollWatcher:
+    def __init__(self, path: Path, min_interval: float = 0.01, max_interval: float = 0.25):
+        self.path = path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._last = self._signature()
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    async def wait(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            signature = self._signature()
+            if signature != self._last:
+                self._last = signature
+                self.interval = self.min_interval
+                return
+            self.interval = min(self.interval * 2, self.max_interval)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """inotify on the file's directory, filtered to the file's name.
+
+    A timed wake-up every ``fallback_interval`` covers events lost to queue
+    overflow or file systems (network mounts) that do not report them.
+    """
+
+    def __init__(self, path: Path, fallback_interval: float = 1.0):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+
+        self.path = path
+        self.fallback_interval = fallback_interval
+        self._name = os.fsencode(path.name)
+        self._changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(path.parent), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path.parent}")
+        self._loop.add_reader(self._fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            start = offset + _EVENT_HEADER.size
+            name = data[start:start + length].rstrip(b"\0")
+            offset = start + length
+            if name == self._name:
+                self._changed.set()
+
+    async def wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._changed.wait(), self.fallback_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(path: Path, poll: bool = False, min_interval: float = 0.01, max_interval: float = 0.25):
+    """An inotify watcher where available, otherwise an adaptive poller.
+
+    Must be called from a running event loop.
+    """
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path, fallback_interval=max(max_interval, 1.0))
+        except OSError:
+            pass
+    return PollWatcher(path, min_interval, max_interval)
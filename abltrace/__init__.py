@@ -0,0 +1,15 @@
+"""Replay ABL.lua's check detectors over recorded RAM traces, without an emulator.
+
+lua/ABL_trace.lua records the RAM the detectors watch, one packed record per
+frame; ``trace.load()`` memory-maps a recording as a NumPy array, and
+``replay()`` turns it into the ``CHECK`` lines ABL.lua would have journaled::
+
+    python -m abltrace replay session.abltrace --config abl_config.txt
+
+``abltrace.lua.run_script()`` steps the real script through a trace for
+comparison. Requires NumPy; the comparison also needs ``lupa``.
+"""
+from .detect import Check, DetectorConfig, replay
+from .trace import FRAME_DTYPE, load, save
+
+__all__ = ["Check", "DetectorConfig", "FRAME_DTYPE", "load", "replay", "save"]
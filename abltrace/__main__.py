@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from ablbridge.protocol import SlotOptions
+
+from .detect import DetectorConfig, replay
+from .trace import load, save
+
+
+def detector_config(args: argparse.Namespace) -> DetectorConfig:
+    if args.config:
+        return DetectorConfig.from_config_lines(args.config.read_text(encoding="utf-8").splitlines())
+    slot_data = json.loads(args.slot_data.read_text(encoding="utf-8"))
+    return DetectorConfig.from_slot_options(SlotOptions.from_slot_data(slot_data))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m abltrace", description="Replay ABL.lua's check detectors over RAM traces")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (
+        ("replay", "print the CHECK lines ABL.lua would queue"),
+        ("compare", "replay, step ABL.lua through the same trace, and diff the two"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("trace", type=Path)
+        source = command.add_mutually_exclusive_group(required=True)
+        source.add_argument("--config", type=Path, help="abl_config.txt the session ran with")
+        source.add_argument("--slot-data", type=Path, help="the slot's slot data as JSON")
+        command.add_argument("--frames", type=int, default=None, help="only the first N frames")
+    commands.choices["replay"].add_argument("--show-frames", action="store_true", help="prefix each line with its frame")
+
+    convert = commands.add_parser("convert", help="convert between recorded, .npy and .csv traces")
+    convert.add_argument("source", type=Path)
+    convert.add_argument("dest", type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        trace = load(args.source)
+        if args.dest.suffix == ".csv":
+            np.savetxt(args.dest, np.asarray(trace).tolist(), fmt="%d", delimiter=",",
+                       header=",".join(trace.dtype.names), comments="")
+        else:
+            save(trace, args.dest)
+        return 0
+
+    config = detector_config(args)
+    trace = load(args.trace)[:args.frames]
+
+    if args.command == "replay":
+        for check in replay(trace, config):
+            print(f"{check.frame}\t{check.line}" if args.show_frames else check.line)
+        return 0
+
+    from .lua import run_script
+
+    expected = run_script(np.asarray(trace), config.config_lines())
+    got = [check.line for check in replay(trace, config)]
+    if expected == got:
+        print(f"{len(got)} checks over {len(trace)} frames match ABL.lua")
+        return 0
+    index = next((i for i, (a, b) in enumerate(zip(expected, got)) if a != b), min(len(expected), len(got)))
+    print(f"first difference at check {index}:", file=sys.stderr)
+    print(f"  ABL.lua: {expected[index:index + 3]}", file=sys.stderr)
+    print(f"  replay:  {got[index:index + 3]}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
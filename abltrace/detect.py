@@ -0,0 +1,275 @@
+"""ABL.lua's check detectors as edge detection over whole traces.
+
+``replay()`` gives the same ``CHECK`` lines, in the same order, that ABL.lua
+journals when its main loop steps through the trace frame by frame. It
+reproduces the parts of ``step()`` that decide what the detectors compare:
+
+* ``update_level_state`` forgets the level on a level code change or an
+  unknown level index, and initialises it on the next frame whose FLIK status
+  is ready. Initialising starts WARMUP_FRAMES frames during which the previous
+  values are refreshed and no detector runs.
+* Every other frame with a known level index runs the detectors, including
+  frames whose FLIK status is not ready: only the enemy and level complete
+  detectors check the status themselves.
+* A check fires at most once per level per session.
+
+The sequential parts (level initialisation, warmup, level complete arming)
+are resolved per level visit rather than per frame, so the cost is a handful
+of NumPy passes over the trace.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from ablbridge.protocol import SEED_UPGRADE_CAPS, SlotOptions
+
+from .trace import enemy_count
+
+FLIK_STATUS_READY = 0xFF20
+WARMUP_FRAMES = 60
+MAX_GRAIN = 50
+ENEMY_PCTS = (25, 50, 75, 100)
+FLIK_LETTERS = "FLIK"
+
+OPTION_FLIK_INDIVIDUAL = 1 << 1
+OPTION_FLIK_ALL = 1 << 2
+OPTION_GRAINSANITY = 1 << 4
+
+# Order of the detectors within one frame, as step() calls them.
+_ORDER_FLIK = 0           # + letter
+_ORDER_FLIK_ALL = 4
+_ORDER_GRAINSANITY = 10   # + amount
+_ORDER_GRAIN = 70
+_ORDER_ENEMIES = 80       # + tier
+_ORDER_LEVEL_COMPLETE = 90
+
+_KNOWN_LEVEL = np.zeros(256, dtype=bool)
+_KNOWN_LEVEL[list(SEED_UPGRADE_CAPS)] = True
+
+
+class Check(NamedTuple):
+    frame: int
+    line: str
+
+
+class DetectorConfig(NamedTuple):
+    """What ABL.lua's load_config() takes from abl_config.txt."""
+    options: int = 0
+    grain: Mapping[int, Tuple[int, ...]] = {}
+    enemies: Mapping[int, Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_config_lines(cls, lines: Iterable[str]) -> DetectorConfig:
+        options = 0
+        grain: Dict[int, Tuple[int, ...]] = {}
+        enemies: Dict[int, Tuple[int, ...]] = {}
+        for line in lines:
+            key, sep, value = line.partition("=")
+            key, value = key.strip(), value.strip()
+            if not sep or not key or not value:
+                continue
+            prefix, _, level = key.rpartition("_")
+            if key == "options":
+                options = int(value) if value.isdigit() else 0
+            elif prefix in ("grain", "enemies") and level.isdigit():
+                values = tuple(int(v) for v in value.replace(",", " ").split() if v.isdigit())
+                (grain if prefix == "grain" else enemies)[int(level)] = values
+        return cls(options, grain, enemies)
+
+    @classmethod
+    def from_slot_options(cls, options: SlotOptions) -> DetectorConfig:
+        """The config a client writes for these slot options."""
+        return cls.from_config_lines(options.config_lines())
+
+    def config_lines(self) -> List[str]:
+        """abl_config.txt lines that load back as this config."""
+        lines = [f"options={self.options}"]
+        lines += [f"grain_{level}=" + ",".join(map(str, amounts)) for level, amounts in self.grain.items() if amounts]
+        lines += [f"enemies_{level}=" + ",".join(map(str, kills)) for level, kills in self.enemies.items() if kills]
+        return lines
+
+
+class Phases(NamedTuple):
+    """Per-frame state of step() that the detectors depend on."""
+    run: np.ndarray          # the detectors run this frame
+    init_done: np.ndarray    # level_init_done when the detectors run
+    prev_flik: np.ndarray
+    prev_grain: np.ndarray
+    prev_enemies: np.ndarray
+
+
+def _previous(values: np.ndarray, assigned: np.ndarray) -> np.ndarray:
+    """Value at the last assigned frame strictly before each frame (0 before the first)."""
+    frames = np.arange(len(values))
+    last = np.maximum.accumulate(np.where(assigned, frames, -1))
+    before = np.empty_like(last)
+    before[:1] = -1
+    before[1:] = last[:-1]
+    return np.where(before >= 0, values[np.maximum(before, 0)], 0)
+
+
+def phases(trace: np.ndarray, enemies: np.ndarray) -> Phases:
+    n = len(trace)
+    frames = np.arange(n)
+    level = trace["level_index"]
+    code = trace["level_code"]
+    ready = trace["flik_status"] == FLIK_STATUS_READY
+    known = _KNOWN_LEVEL[level]
+
+    # current_level_code starts as nil, so frame 0 always counts as a change.
+    code_change = np.ones(n, dtype=bool)
+    code_change[1:] = code[1:] != code[:-1]
+
+    # level_init_done is cleared by a code change or an unknown level and set
+    # by the first ready frame after that.
+    reset = code_change | ~known
+    last_reset = np.maximum.accumulate(np.where(reset, frames, 0))
+    ready_frames = np.flatnonzero(known & ready)
+    group = last_reset[ready_frames]
+    first = np.ones(len(ready_frames), dtype=bool)
+    first[1:] = group[1:] != group[:-1]
+    inits = ready_frames[first]
+
+    init_mark = np.zeros(n, dtype=bool)
+    init_mark[inits] = True
+    last_init = np.maximum.accumulate(np.where(init_mark, frames, -1))
+    init_done = last_init >= last_reset
+
+    # Warmup counts down on frames with a known level, from the init frame
+    # until the 60th such frame, a code change or the next init.
+    known_count = np.cumsum(known)
+    change_frames = np.flatnonzero(code_change)
+    warm_end = np.searchsorted(known_count, known_count[inits] + WARMUP_FRAMES - 1, side="right")
+    next_change = np.searchsorted(change_frames, inits, side="right")
+    warm_end = np.minimum(warm_end, np.append(change_frames, n)[next_change])
+    warm_end = np.minimum(warm_end, np.append(inits[1:], n))
+    edges = np.zeros(n + 1, dtype=np.int32)
+    np.add.at(edges, inits, 1)
+    np.add.at(edges, warm_end, -1)
+    warm = (np.cumsum(edges[:-1]) > 0) & known
+
+    run = known & ~warm
+    return Phases(
+        run=run,
+        init_done=init_done,
+        # check_flik and check_grain update their previous value every run
+        # frame, the warmup every warm frame; check_enemy_sanity only when ready.
+        prev_flik=_previous(trace["flik_mask"], known),
+        prev_grain=_previous(trace["grain"], known),
+        prev_enemies=_previous(enemies, warm | (run & ready)),
+    )
+
+
+def _crossings(frames: np.ndarray, now: np.ndarray, prev: np.ndarray,
+               thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(frame, threshold index) wherever a value rises to or past a threshold."""
+    hit = (now[:, None] >= thresholds) & (prev[:, None] < thresholds)
+    rows, cols = np.nonzero(hit)
+    return frames[rows], cols
+
+
+def _level_complete(trace: np.ndarray, candidates: np.ndarray) -> List[Tuple[int, int]]:
+    """(frame, level) of each LEVEL_COMPLETE, from the frames check_level_complete reads the status."""
+    status = trace["level_complete"][candidates]
+    levels = trace["level_index"][candidates]
+
+    # The detector arms, once per session, on the first zero status it reads.
+    zeros = np.flatnonzero(status == 0)
+    if not len(zeros):
+        return []
+    status, levels, frames = status[zeros[0]:], levels[zeros[0]:], candidates[zeros[0]:]
+
+    # A completed level stops updating the previous status, which can change
+    # what later frames compare against; resolve one completion at a time.
+    fired: List[Tuple[int, int]] = []
+    alive = np.ones(len(frames), dtype=bool)
+    last = 0
+    while True:
+        positions = np.flatnonzero(alive)
+        now = status[positions]
+        prev = np.zeros_like(now)
+        prev[1:] = now[:-1]
+        hits = positions[(prev == 0) & (now == 1)]
+        hits = hits[hits > last]
+        if not len(hits):
+            return fired
+        pos = last = hits[0]
+        fired.append((int(frames[pos]), int(levels[pos])))
+        alive[pos + 1:] &= levels[pos + 1:] != levels[pos]
+
+
+def replay(trace: np.ndarray, config: DetectorConfig) -> List[Check]:
+    """Every CHECK line ABL.lua queues over the trace, with the frame it is queued on."""
+    if not len(trace):
+        return []
+    enemies = enemy_count(trace)
+    state = phases(trace, enemies)
+    run = np.flatnonzero(state.run)
+    level = trace["level_index"]
+    grain = trace["grain"]
+
+    # (frame, order, level, token) of every edge, before the once-per-level filter.
+    events: List[Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]] = []
+
+    def add(frames: np.ndarray, order: np.ndarray, tokens: Union[str, List[str]]) -> None:
+        if len(frames):
+            events.append((frames, order, level[frames], [tokens] * len(frames) if isinstance(tokens, str) else tokens))
+
+    mask = trace["flik_mask"][run]
+    prev_mask = state.prev_flik[run]
+    if config.options & OPTION_FLIK_INDIVIDUAL:
+        rising = mask & ~prev_mask & 0x0F
+        for bit, letter in enumerate(FLIK_LETTERS):
+            frames = run[(rising >> bit) & 1 == 1]
+            add(frames, np.full(len(frames), _ORDER_FLIK + bit), f"FLIK_{letter}")
+    if config.options & OPTION_FLIK_ALL:
+        frames = run[(mask & 0x0F == 0x0F) & (prev_mask & 0x0F != 0x0F)]
+        add(frames, np.full(len(frames), _ORDER_FLIK_ALL), "FLIK_ALL")
+
+    now_grain = grain[run]
+    prev_grain = state.prev_grain[run]
+    rising = run[now_grain > prev_grain]
+    if config.options & OPTION_GRAINSANITY:
+        for level_idx, amounts in config.grain.items():
+            frames = rising[level[rising] == level_idx]
+            if not len(frames) or not amounts:
+                continue
+            thresholds = np.asarray(amounts)
+            frames, cols = _crossings(frames, grain[frames], state.prev_grain[frames], thresholds)
+            add(frames, _ORDER_GRAINSANITY + thresholds[cols], [f"GRAIN{t}" for t in thresholds[cols]])
+
+    frames = run[(now_grain == MAX_GRAIN) & (prev_grain < MAX_GRAIN)]
+    add(frames, np.full(len(frames), _ORDER_GRAIN), "GRAIN")
+
+    ready = trace["flik_status"] == FLIK_STATUS_READY
+    counting = run[ready[run] & (enemies[run] > state.prev_enemies[run])]
+    for level_idx, kills in config.enemies.items():
+        frames = counting[level[counting] == level_idx]
+        if not len(frames):
+            continue
+        need = np.asarray(kills[:len(ENEMY_PCTS)], dtype=np.int16)
+        need = np.where(need > 0, need, np.iinfo(np.int16).max)
+        frames, cols = _crossings(frames, enemies[frames], state.prev_enemies[frames], need)
+        add(frames, _ORDER_ENEMIES + cols, [f"ENEMIES{ENEMY_PCTS[c]}" for c in cols])
+
+    complete = np.flatnonzero(state.run & state.init_done & ready)
+    lc = _level_complete(trace, complete)
+    if lc:
+        frames = np.array([f for f, _ in lc])
+        add(frames, np.full(len(frames), _ORDER_LEVEL_COMPLETE), "LEVEL_COMPLETE")
+
+    if not events:
+        return []
+    frames = np.concatenate([e[0] for e in events])
+    order = np.concatenate([e[1] for e in events]).astype(np.int64)
+    levels = np.concatenate([e[2] for e in events]).astype(np.int64)
+    tokens = [token for e in events for token in e[3]]
+
+    # Each (check, level) fires once: keep its first edge.
+    first = np.lexsort((frames, levels, order))
+    key = order[first] * 256 + levels[first]
+    keep = first[np.concatenate(([True], key[1:] != key[:-1]))]
+    keep = keep[np.lexsort((order[keep], frames[keep]))]
+    return [Check(int(frames[i]), f"CHECK {tokens[i]} {levels[i]}") for i in keep]
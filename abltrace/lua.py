@@ -0,0 +1,114 @@
+"""Run the real ABL.lua over a trace, as the reference replay() is checked against.
+
+The script runs unmodified in a Lua 5.4 runtime from the ``lupa`` package,
+with BizHawk's ``memory`` and ``emu`` tables stubbed: reads of the traced
+addresses return the current frame's values (little-endian bytes for bulk
+reads), writes land in a scratch RAM that later reads see, and
+``emu.frameadvance()`` moves to the next frame.
+ABL.lua's data directory is a temporary one holding only abl_config.txt.
+Stepping Lua through every frame is slow, so this is for cross-checks on
+traces of minutes rather than hours.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ablbridge.journal import scan
+from ablbridge.protocol import CONFIG_FILE, DATA_DIR_NAME, STATE_FILE
+
+SCRIPT = Path(__file__).resolve().parent.parent / "lua" / "ABL.lua"
+
+# Traced field of each address ABL.lua reads.
+ADDRESSES: Dict[int, str] = {
+    0x082504: "level_index",
+    0x0A64B0: "level_code",
+    0x1FFF18: "flik_status",
+    0x0A65A2: "flik_mask",
+    0x0A65A1: "grain",
+    0x0B019A: "enemy_tens",
+    0x0B019B: "enemy_units",
+    0x0823A0: "level_complete",
+}
+
+
+class _TraceEnd(Exception):
+    """Raised out of the script's main loop once every frame has been stepped."""
+
+
+def run_script(trace: np.ndarray, config_lines: Iterable[str], script: Optional[Path] = None) -> List[str]:
+    """The CHECK lines ABL.lua journals while stepping through ``trace``."""
+    try:
+        from lupa.lua54 import LuaRuntime
+    except ImportError as ex:
+        raise RuntimeError("running ABL.lua needs the 'lupa' package") from ex
+
+    columns = {addr: np.asarray(trace[name]).tolist() for addr, name in ADDRESSES.items()}
+    # Traced 16-bit fields: the address of their high byte -> their address.
+    high_bytes = {addr + 1: addr for addr, name in ADDRESSES.items() if trace.dtype[name].itemsize == 2}
+    frames = len(trace)
+    scratch: Dict[int, int] = {}
+    position = [-1]
+
+    def read_u8(addr, domain=None):
+        if position[0] >= 0:
+            column = columns.get(addr)
+            if column is not None:
+                return column[position[0]] & 0xFF
+            low = high_bytes.get(addr)
+            if low is not None:
+                return columns[low][position[0]] >> 8
+        return scratch.get(addr, 0)
+
+    def read_u16(addr, domain=None):
+        column = columns.get(addr)
+        if column is not None and position[0] >= 0:
+            return column[position[0]]
+        return read_u8(addr) | read_u8(addr + 1) << 8
+
+    def read_bytes(addr, length, domain=None):
+        return lua.table_from([read_u8(addr + i) for i in range(length)])
+
+    def write_u8(addr, value, domain=None):
+        scratch[addr] = value & 0xFF
+
+    def write_u16(addr, value, domain=None):
+        scratch[addr] = value & 0xFF
+        scratch[addr + 1] = value >> 8 & 0xFF
+
+    def frameadvance():
+        position[0] += 1
+        if position[0] >= frames:
+            raise _TraceEnd()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # ABL.lua appends "A_Bugs_Life_Archipelago" to %LOCALAPPDATA%.
+        base = os.path.join(tmp, "data")
+        data_dir = Path(base) / DATA_DIR_NAME
+        data_dir.mkdir(parents=True)
+        (data_dir / CONFIG_FILE).write_text("".join(f"{line}\n" for line in config_lines), encoding="utf-8")
+
+        lua = LuaRuntime()
+        env = lua.globals()
+        env.memory = lua.table(read_u8=read_u8, read_u16_le=read_u16, read_bytes_as_array=read_bytes,
+                               write_u8=write_u8, write_u16_le=write_u16)
+        env.emu = lua.table(frameadvance=frameadvance)
+        env.print = lambda *args: None
+        env.os.execute = lambda *args: True
+        env.os.getenv = lambda name: base if name in ("LOCALAPPDATA", "USERPROFILE") else None
+
+        source = (script or SCRIPT).read_text(encoding="utf-8")
+        try:
+            lua.execute(source)
+        except Exception:
+            # The end of the trace arrives as the _TraceEnd raised in
+            # frameadvance(), possibly wrapped by lupa; anything earlier is real.
+            if position[0] < frames:
+                raise
+
+        _, entries = scan(data_dir / STATE_FILE)
+    return [entry.payload for entry in entries]
@@ -0,0 +1,112 @@
+"""Per-frame traces of the RAM ABL.lua's check detectors read.
+
+A trace is a NumPy structured array with one record per emulated frame, in
+the order ABL.lua's main loop sees them. On disk it is the packed records
+behind a 16 byte header, which is what lua/ABL_trace.lua writes while
+playing, so a recording can be memory-mapped straight into an array::
+
+    b"ABLTRACE" <u32 version> <u32 record size> <record> <record> ...
+
+Traces can also be kept as ``.npy`` files or written by hand as CSV with a
+header row naming the fields below.
+"""
+from __future__ import annotations
+
+import csv
+import struct
+from pathlib import Path
+from typing import Iterable, Mapping, Union
+
+import numpy as np
+
+MAGIC = b"ABLTRACE"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+
+# The watched addresses, in record order. Everything is the raw RAM value;
+# the enemy counter is two BCD digits in separate bytes.
+FRAME_DTYPE = np.dtype([
+    ("level_index", "<u1"),     # 0x082504
+    ("level_code", "<u2"),      # 0x0A64B0
+    ("flik_status", "<u2"),     # 0x1FFF18
+    ("flik_mask", "<u1"),       # 0x0A65A2
+    ("grain", "<u1"),           # 0x0A65A1
+    ("enemy_tens", "<u1"),      # 0x0B019A
+    ("enemy_units", "<u1"),     # 0x0B019B
+    ("level_complete", "<u1"),  # 0x0823A0
+])
+
+PathLike = Union[str, Path]
+
+
+def empty(frames: int) -> np.ndarray:
+    """A zeroed trace of ``frames`` frames."""
+    return np.zeros(frames, dtype=FRAME_DTYPE)
+
+
+def from_columns(columns: Mapping[str, Iterable[int]]) -> np.ndarray:
+    """Build a trace from one sequence per field; missing fields are zero."""
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+    unknown = set(arrays) - set(FRAME_DTYPE.names)
+    if unknown:
+        raise ValueError(f"unknown trace fields: {', '.join(sorted(unknown))}")
+    lengths = {len(values) for values in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError("trace columns differ in length")
+    trace = empty(lengths.pop() if lengths else 0)
+    for name, values in arrays.items():
+        trace[name] = values
+    return trace
+
+
+def save(trace: np.ndarray, path: PathLike) -> None:
+    """Write a trace in the recorder's format, or as ``.npy`` if the name says so."""
+    path = Path(path)
+    trace = np.asarray(trace, dtype=FRAME_DTYPE)
+    if path.suffix == ".npy":
+        np.save(path, trace)
+        return
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, FRAME_DTYPE.itemsize))
+        trace.tofile(f)
+
+
+def load(path: PathLike, mmap: bool = True) -> np.ndarray:
+    """Read a recorded, ``.npy`` or CSV trace; binary ones are memory-mapped by default."""
+    path = Path(path)
+    if path.suffix == ".csv":
+        return _load_csv(path)
+    if path.suffix == ".npy":
+        trace = np.load(path, mmap_mode="r" if mmap else None)
+        if trace.dtype != FRAME_DTYPE:
+            raise ValueError(f"{path}: not a trace array ({trace.dtype})")
+        return trace
+
+    with open(path, "rb") as f:
+        head = f.read(HEADER.size)
+    if len(head) < HEADER.size:
+        raise ValueError(f"{path}: truncated header")
+    magic, version, record_size = HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION or record_size != FRAME_DTYPE.itemsize:
+        raise ValueError(f"{path}: not a version {VERSION} trace")
+
+    # A recorder killed mid-frame leaves a partial record; drop it.
+    frames = (path.stat().st_size - HEADER.size) // record_size
+    if not mmap:
+        return np.fromfile(path, dtype=FRAME_DTYPE, count=frames, offset=HEADER.size)
+    if frames == 0:
+        return empty(0)
+    return np.memmap(path, dtype=FRAME_DTYPE, mode="r", offset=HEADER.size, shape=(frames,))
+
+
+def _load_csv(path: Path) -> np.ndarray:
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        return empty(0)
+    return from_columns({name: [int(row[name], 0) for row in rows] for name in rows[0]})
+
+
+def enemy_count(trace: np.ndarray) -> np.ndarray:
+    """The enemy counter as ABL.lua decodes it: low nibble of each BCD digit."""
+    return (trace["enemy_tens"] & 0x0F).astype(np.int16) * 10 + (trace["enemy_units"] & 0x0F)
@@ -0,0 +1,175 @@
+"""Opt-in generation statistics for BugsLifeWorld.
+
+Set ``ABL_INSTRUMENT=1`` when generating to record, per multiworld:
+
+- wall time of generate_early, create_regions, create_items, set_rules and
+  fill_slot_data (instance stages summed over the A Bug's Life slots)
+- locations per check category and pool items per kind, for each slot
+- how often each Level Complete requirement alternative was evaluated and
+  satisfied, over every slot; this is what fill's reachability sweeps cost
+
+The numbers are written to ``AP_<seed>_ABL_Stats.json`` in the output
+directory, next to the spoiler. With the variable unset nothing is recorded
+and the entrance rules are the uninstrumented ones.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+from .Items import KIND_GROUP_NAMES, KIND_NONE, LEVEL_NAMES
+from .Locations import (
+    CHECK_ENEMY_ALL,
+    CHECK_ENEMYSANITY,
+    CHECK_FLIK_ALL,
+    CHECK_FLIK_LETTER,
+    CHECK_GRAIN_ALL,
+    CHECK_GRAINSANITY,
+    CHECK_LEVEL_COMPLETE,
+)
+from .Rules import level_requirements, level_tier_requirements
+
+ENV_VAR = "ABL_INSTRUMENT"
+
+CATEGORY_NAMES = {
+    CHECK_FLIK_LETTER: "FLIK Letter",
+    CHECK_FLIK_ALL: "All FLIK Letters",
+    CHECK_GRAIN_ALL: "All Grain",
+    CHECK_GRAINSANITY: "Grainsanity",
+    CHECK_ENEMY_ALL: "All Enemies",
+    CHECK_ENEMYSANITY: "Enemysanity",
+    CHECK_LEVEL_COMPLETE: "Level Complete",
+}
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+class GenerationStats:
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.locations: Dict[int, Counter] = {}
+        self.items: Dict[int, Counter] = {}
+        # (level, alternative index) -> count
+        self.rule_evaluations: Counter = Counter()
+        self.rule_satisfied: Counter = Counter()
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def count_locations(self, player: int, categories: Iterable[int]) -> None:
+        self.locations.setdefault(player, Counter()).update(CATEGORY_NAMES.get(c, "Other") for c in categories)
+
+    def count_items(self, player: int, items: Iterable[Any]) -> None:
+        self.items.setdefault(player, Counter()).update(
+            KIND_GROUP_NAMES[item.kind] if item.kind != KIND_NONE else item.name for item in items
+        )
+
+    def to_json(self, multiworld) -> Dict[str, Any]:
+        levels = {}
+        for level_idx in sorted({level_idx for level_idx, _ in self.rule_evaluations}):
+            alternatives = [
+                {
+                    "requires": dict(requirement),
+                    "evaluations": self.rule_evaluations[(level_idx, index)],
+                    "satisfied": self.rule_satisfied[(level_idx, index)],
+                }
+                for index, requirement in enumerate(level_requirements(level_idx))
+            ]
+            levels[LEVEL_NAMES[level_idx]] = {
+                "evaluations": sum(alt["evaluations"] for alt in alternatives),
+                "alternatives": alternatives,
+            }
+        return {
+            "stages": self.stages,
+            "slots": {
+                multiworld.player_name[player]: {
+                    "locations": dict(self.locations.get(player, {})),
+                    "items": dict(self.items.get(player, {})),
+                }
+                for player in sorted(self.locations.keys() | self.items.keys())
+            },
+            "level_rules": levels,
+        }
+
+
+_STATS: "WeakKeyDictionary[Any, GenerationStats]" = WeakKeyDictionary()
+
+
+def generation_stats(multiworld) -> Optional[GenerationStats]:
+    """The multiworld's statistics, or None when instrumentation is off."""
+    if not enabled():
+        return None
+    found = _STATS.get(multiworld)
+    if found is None:
+        found = _STATS[multiworld] = GenerationStats()
+    return found
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Add a World method's wall time to its multiworld's ``stage`` time.
+
+    Works on instance methods and, placed under @classmethod, on stage_*
+    methods taking the multiworld first.
+    """
+    def decorate(fn: F) -> F:
+        @wraps(fn)
+        def run(owner, *args, **kwargs):
+            multiworld = args[0] if isinstance(owner, type) else owner.multiworld
+            found = generation_stats(multiworld)
+            if found is None:
+                return fn(owner, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(owner, *args, **kwargs)
+            finally:
+                found.add_time(stage, time.perf_counter() - start)
+
+        return run  # type: ignore[return-value]
+
+    return decorate
+
+
+def counted_level_rule(player: int, level_idx: int, rule: Callable[..., bool],
+                       found: GenerationStats) -> Callable[..., bool]:
+    """Wrap level_access_rule()'s ``rule``, counting evaluations of each requirement alternative.
+
+    The answer is still ``rule``'s. Alternatives are checked against the
+    state's tier counters in order and the first satisfied one ends the
+    count, as any() does in update_tier().
+    """
+    alternatives: Tuple[Tuple[Tuple[int, int], Tuple[Tuple[int, int], ...]], ...] = tuple(
+        ((level_idx, index), requirement)
+        for index, requirement in enumerate(level_tier_requirements()[level_idx])
+    )
+    evaluations, satisfied = found.rule_evaluations, found.rule_satisfied
+
+    def counted(state) -> bool:
+        tiers = state.abl_tiers[player]
+        for key, requirement in alternatives:
+            evaluations[key] += 1
+            if all(tiers[slot] >= count for slot, count in requirement):
+                satisfied[key] += 1
+                break
+        return rule(state)
+
+    return counted
+
+
+def write_stats(multiworld, output_directory: str) -> Optional[str]:
+    found = _STATS.get(multiworld)
+    if found is None:
+        return None
+    path = os.path.join(output_directory, f"AP_{multiworld.seed_name}_ABL_Stats.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(found.to_json(multiworld), f, indent=2)
+    return path
@@ -1,8 +1,36 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
 from BaseClasses import Item, ItemClassification
 
+from .Tables import ITEM_NAME_TO_ID
+
+# ABLItem.kind, indexed like PROGRESSIVE_PREFIXES (item id // 100 - 3).
+KIND_NONE = -1
+KIND_BERRY = 0
+KIND_BROWN = 1
+KIND_GREEN = 2
+KIND_BLUE = 3
+KIND_PURPLE = 4
+KIND_YELLOW = 5
+
 
 class ABLItem(Item):
     game = "A Bug's Life"
+    __slots__ = ("level_index", "kind")
+
+    def __init__(
+        self,
+        name: str,
+        classification: ItemClassification,
+        code: int,
+        player: int,
+        level_index: int = 0,
+        kind: int = KIND_NONE,
+    ):
+        super().__init__(name, classification, code, player)
+        self.level_index = level_index
+        self.kind = kind
 
 
 LEVEL_NAMES = {
@@ -24,11 +52,6 @@ LEVEL_NAMES = {
     17: "Training",
 }
 
-ITEM_TABLE = {
-    "Extra Life": 210,
-    "Health Upgrade": 211,
-}
-
 PROGRESSIVE_PREFIXES = {
     "Berry": 300,
     "Brown Seed": 400,
@@ -38,18 +61,81 @@ PROGRESSIVE_PREFIXES = {
     "Yellow Seed": 800,
 }
 
-for level_idx, level_name in LEVEL_NAMES.items():
-    for label, base in PROGRESSIVE_PREFIXES.items():
-        ITEM_TABLE[f"Progressive {label} Upgrade - {level_name}"] = base + level_idx
 
-REVERSE_ITEM_TABLE = {v: k for k, v in ITEM_TABLE.items()}
+def build_item_table() -> Dict[str, int]:
+    """Item name -> id; Tables.py holds a prebuilt copy, which is what ITEM_TABLE is."""
+    table = {
+        "Extra Life": 210,
+        "Health Upgrade": 211,
+    }
+    for level_idx, level_name in LEVEL_NAMES.items():
+        for label, base in PROGRESSIVE_PREFIXES.items():
+            table[f"Progressive {label} Upgrade - {level_name}"] = base + level_idx
+    return table
+
+
+ITEM_TABLE = ITEM_NAME_TO_ID
+
+# Item group of each PROGRESSIVE_PREFIXES entry, in the same order.
+KIND_GROUP_NAMES = ["Berries", "Brown Seeds", "Green Seeds", "Blue Seeds", "Purple Seeds", "Yellow Seeds"]
+
+
+def build_item_name_groups() -> Dict[str, Set[str]]:
+    """Item groups from the id scheme: one per level, per kind, and all seeds.
+
+    Tables.py holds a prebuilt copy, which is the World's item_name_groups.
+    """
+    groups: Dict[str, Set[str]] = {}
+    for name, code in build_item_table().items():
+        if code < PROGRESSIVE_PREFIXES["Berry"]:
+            continue
+        level_idx, kind = code % 100, code // 100 - 3
+        groups.setdefault(LEVEL_NAMES[level_idx], set()).add(name)
+        groups.setdefault(KIND_GROUP_NAMES[kind], set()).add(name)
+        if kind != KIND_BERRY:
+            groups.setdefault("Seeds", set()).add(name)
+    return groups
+
+
+@lru_cache(maxsize=None)
+def item_data() -> Dict[str, Tuple[int, ItemClassification, int, int]]:
+    """name -> (code, classification, level index, kind)"""
+    return {
+        name: (
+            (code, ItemClassification.progression, code % 100, code // 100 - 3)
+            if name.startswith("Progressive ")
+            else (code, ItemClassification.filler, 0, KIND_NONE)
+        )
+        for name, code in ITEM_TABLE.items()
+    }
+
+
+# Tables nothing needs at import time, built on first use.
+_LAZY_TABLES = {
+    "REVERSE_ITEM_TABLE": lambda: {v: k for k, v in ITEM_TABLE.items()},
+    "ITEM_DATA": item_data,
+}
+
+
+def __getattr__(name: str) -> Any:
+    build = _LAZY_TABLES.get(name)
+    if build is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = build()
+    return value
+
+
+def create_item(world, name: str, classification: Optional[ItemClassification] = None) -> ABLItem:
+    code, default, level_index, kind = item_data()[name]
+    if classification is None:
+        classification = default
+    return ABLItem(name, classification, code, world.player, level_index, kind)
 
 
-def create_item(world, name: str) -> ABLItem:
-    code = ITEM_TABLE[name]
-    classification = (
-        ItemClassification.progression
-        if name.startswith("Progressive ")
-        else ItemClassification.filler
-    )
-    return ABLItem(name, classification, code, world.player)
+def create_items(player: int, counts: Iterable[Tuple[str, ItemClassification, int]]) -> List[ABLItem]:
+    """Create ``count`` copies of each named item for a player, with the given classification."""
+    items: List[ABLItem] = []
+    for name, classification, count in counts:
+        code, _, level_index, kind = item_data()[name]
+        items.extend([ABLItem(name, classification, code, player, level_index, kind) for _ in range(count)])
+    return items
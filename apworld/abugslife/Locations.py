@@ -1,38 +1,135 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
 from BaseClasses import Location
 from .Items import LEVEL_NAMES
 
+# ABLLoc.category
+CHECK_NONE = -1
+CHECK_FLIK_LETTER = 0
+CHECK_FLIK_ALL = 1
+CHECK_GRAIN_ALL = 2
+CHECK_GRAINSANITY = 3
+CHECK_ENEMY_ALL = 4
+CHECK_ENEMYSANITY = 5
+CHECK_LEVEL_COMPLETE = 6
+
 
 class ABLLoc(Location):
     game = "A Bug's Life"
+    __slots__ = ("level_index", "category")
 
     LEVEL_NAME_TO_INDEX = {v: k for k, v in LEVEL_NAMES.items()}
 
+    def __init__(
+        self,
+        player: int,
+        name: str = "",
+        address: Optional[int] = None,
+        parent=None,
+        level_index: int = 0,
+        category: int = CHECK_NONE,
+    ):
+        super().__init__(player, name, address, parent)
+        self.level_index = level_index
+        self.category = category
+
+    @property
+    def level(self) -> "LevelInfo":
+        return LEVELS[self.level_index]
+
     @staticmethod
     def get_level_index_from_location_name(location_name: str) -> int:
         level_part = location_name.split(" - ", 1)[0].strip()
         return ABLLoc.LEVEL_NAME_TO_INDEX.get(level_part, 0)
 
 
-LOCATION_TABLE = {
-    f"{level} - {suffix}": 1000 + (idx * 10) + off
-    for idx, level in LEVEL_NAMES.items()
-    for off, suffix in enumerate(
-        [
-            "F Letter",
-            "L Letter",
-            "I Letter",
-            "K Letter",
-            "FLIK Letters",
-            "All Grain",
-            "All Enemies",
-            "Level Complete",
-        ]
-    )
-}
+LOCATION_ID_BASE = 1000
+
+LOCATION_SUFFIXES = [
+    "F Letter",
+    "L Letter",
+    "I Letter",
+    "K Letter",
+    "FLIK Letters",
+    "All Grain",
+    "All Enemies",
+    "Level Complete",
+]
+
+# Category of each LOCATION_SUFFIXES entry.
+LOCATION_SUFFIX_CATEGORIES = [
+    CHECK_FLIK_LETTER,
+    CHECK_FLIK_LETTER,
+    CHECK_FLIK_LETTER,
+    CHECK_FLIK_LETTER,
+    CHECK_FLIK_ALL,
+    CHECK_GRAIN_ALL,
+    CHECK_ENEMY_ALL,
+    CHECK_LEVEL_COMPLETE,
+]
+
+# Token ABL.lua writes as "CHECK <token> <level>" for each LOCATION_SUFFIXES
+# entry. "All Enemies" has no check of its own.
+LOCATION_SUFFIX_TOKENS = [
+    "FLIK_F",
+    "FLIK_L",
+    "FLIK_I",
+    "FLIK_K",
+    "FLIK_ALL",
+    "GRAIN",
+    None,
+    "LEVEL_COMPLETE",
+]
 
 GRAINSANITY_ID_BASE = 2000
 ENEMYSANITY_ID_BASE = 3000
 
+MAX_GRAIN = 50
+ENEMYSANITY_PCTS = (25, 50, 75, 100)
+
+# Enemy counter value ABL.lua fires each enemysanity tier at, in
+# ENEMYSANITY_PCTS order; 0 where the level has no check for the tier.
+ENEMY_KILLS_BY_LEVEL: Dict[int, Tuple[int, int, int, int]] = {
+    17: (0, 2, 0, 4),       # Training
+    1:  (5, 10, 15, 21),    # Ant Hill
+    3:  (12, 25, 37, 50),   # Tunnels
+    2:  (0, 2, 0, 3),       # Council Chamber
+    6:  (3, 6, 9, 12),      # Cliffside
+    10: (13, 25, 38, 51),   # Riverbed Canyon
+    11: (2, 5, 7, 9),       # Bird Nest
+    4:  (6, 13, 20, 26),    # City Entrance
+    5:  (6, 12, 18, 23),    # City Square
+    14: (0, 0, 0, 1),       # Bug Bar
+    7:  (6, 12, 18, 24),    # Clover Forest
+    12: (8, 16, 24, 32),    # The Tree
+    13: (0, 2, 0, 4),       # Battle Arena
+    9:  (4, 8, 12, 15),     # Ant Hill Part 2
+    8:  (14, 28, 42, 56),   # Riverbed Flight
+    15: (4, 8, 12, 16),     # Canyon Showdown
+}
+
+
+class LevelInfo(NamedTuple):
+    """Per-level data shared by every location of the level."""
+    index: int
+    name: str
+    location_base: int
+    grainsanity_base: int
+    enemysanity_base: int
+
+
+LEVELS: Dict[int, LevelInfo] = {
+    idx: LevelInfo(
+        idx,
+        name,
+        LOCATION_ID_BASE + (idx * 10),
+        GRAINSANITY_ID_BASE + (idx * 100),
+        ENEMYSANITY_ID_BASE + (idx * 10),
+    )
+    for idx, name in LEVEL_NAMES.items()
+}
+
 def grainsanity_location_id(level_index: int, grain_amount: int) -> int:
     return GRAINSANITY_ID_BASE + (level_index * 100) + grain_amount
 
@@ -42,6 +139,25 @@ def enemysanity_location_id(level_index: int, pct: int) -> int:
     return ENEMYSANITY_ID_BASE + (level_index * 10) + tier
 
 
+def location_level_index(location_id: int) -> int:
+    """Level a location id belongs to, from the id scheme alone (0 if unknown).
+
+    Grainsanity ids of levels 10 and up run into the enemysanity range; an id
+    that reads as a valid enemysanity id is taken to be one.
+    """
+    if location_id >= ENEMYSANITY_ID_BASE:
+        level_idx, tier = divmod(location_id - ENEMYSANITY_ID_BASE, 10)
+        if 1 <= tier <= len(ENEMYSANITY_PCTS) and level_idx in LEVEL_NAMES:
+            return level_idx
+    if location_id >= GRAINSANITY_ID_BASE:
+        level_idx = (location_id - GRAINSANITY_ID_BASE) // 100
+    elif location_id >= LOCATION_ID_BASE:
+        level_idx = (location_id - LOCATION_ID_BASE) // 10
+    else:
+        return 0
+    return level_idx if level_idx in LEVEL_NAMES else 0
+
+
 def build_grainsanity_locations(level_index: int, step: int, max_amount: int) -> dict[str, int]:
     out = {}
     step = max(1, min(50, int(step)))
@@ -78,14 +194,314 @@ def build_enemysanity_locations(
 
     return out
 
-ALL_GRAINSANITY_LOCATIONS: dict[str, int] = {
-    f"{level_name} - {amt} Grain": grainsanity_location_id(level_idx, amt)
-    for level_idx, level_name in LEVEL_NAMES.items()
-    for amt in range(1, 51)
+
+def build_location_table() -> dict[str, int]:
+    return {
+        f"{level} - {suffix}": LOCATION_ID_BASE + (idx * 10) + off
+        for idx, level in LEVEL_NAMES.items()
+        for off, suffix in enumerate(LOCATION_SUFFIXES)
+    }
+
+
+def build_all_grainsanity_locations() -> dict[str, int]:
+    return {
+        f"{level_name} - {amt} Grain": grainsanity_location_id(level_idx, amt)
+        for level_idx, level_name in LEVEL_NAMES.items()
+        for amt in range(1, MAX_GRAIN + 1)
+    }
+
+
+def build_all_enemysanity_locations() -> dict[str, int]:
+    return {
+        f"{level_name} - {pct}% Enemies": enemysanity_location_id(level_idx, pct)
+        for level_idx, level_name in LEVEL_NAMES.items()
+        for pct in ENEMYSANITY_PCTS
+    }
+
+
+def build_location_name_to_id() -> dict[str, int]:
+    """Every location of the game; Tables.py holds a prebuilt copy for the World class."""
+    return {
+        **build_location_table(),
+        **build_all_grainsanity_locations(),
+        **build_all_enemysanity_locations(),
+    }
+
+
+def build_location_name_groups() -> Dict[str, Set[str]]:
+    """Location groups from the id scheme; Tables.py holds a prebuilt copy.
+
+    One group per level ("Bird Nest"), per location suffix ("F Letter",
+    "FLIK Letters", "Level Complete", ...), per grain amount ("30 Grain") and
+    enemy tier ("75% Enemies") across levels, plus "Individual FLIK Letters",
+    "Grainsanity" and "Enemysanity".
+    """
+    groups: Dict[str, Set[str]] = {}
+
+    def add(group: str, name: str) -> None:
+        groups.setdefault(group, set()).add(name)
+
+    for level in LEVELS.values():
+        for off, suffix in enumerate(LOCATION_SUFFIXES):
+            name = f"{level.name} - {suffix}"
+            add(level.name, name)
+            add(suffix, name)
+            if LOCATION_SUFFIX_CATEGORIES[off] == CHECK_FLIK_LETTER:
+                add("Individual FLIK Letters", name)
+        for amt in range(1, MAX_GRAIN + 1):
+            name = f"{level.name} - {amt} Grain"
+            add(level.name, name)
+            add(f"{amt} Grain", name)
+            add("Grainsanity", name)
+        for pct in ENEMYSANITY_PCTS:
+            name = f"{level.name} - {pct}% Enemies"
+            add(level.name, name)
+            add(f"{pct}% Enemies", name)
+            add("Enemysanity", name)
+    return groups
+
+
+# LOCATION_TABLE, ALL_GRAINSANITY_LOCATIONS and ALL_ENEMYSANITY_LOCATIONS are
+# only needed when something asks for them, so they are built on first use.
+_LAZY_TABLES = {
+    "LOCATION_TABLE": build_location_table,
+    "ALL_GRAINSANITY_LOCATIONS": build_all_grainsanity_locations,
+    "ALL_ENEMYSANITY_LOCATIONS": build_all_enemysanity_locations,
 }
 
-ALL_ENEMYSANITY_LOCATIONS: dict[str, int] = {
-    f"{level_name} - {pct}% Enemies": enemysanity_location_id(level_idx, pct)
-    for level_idx, level_name in LEVEL_NAMES.items()
-    for pct in (25, 50, 75, 100)
-}
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+    build = _LAZY_TABLES.get(name)
+    if build is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = build()
+    return value
+
+
+class LocationPlanKey(NamedTuple):
+    """The subset of a slot's options that decides which locations exist."""
+    level_complete: bool
+    flik_individual: bool
+    flik_all: bool
+    grain_all: bool
+    grainsanity_step: int  # 0 when grainsanity is disabled
+    enemy_pcts: Tuple[int, ...]
+
+    @classmethod
+    def from_options(cls, options) -> "LocationPlanKey":
+        step = 0
+        if options.enable_grainsanity.value:
+            step = max(1, min(MAX_GRAIN, int(options.grainsanity_step.value)))
+
+        enemy_toggles = (
+            options.enable_enemy_25.value,
+            options.enable_enemy_50.value,
+            options.enable_enemy_75.value,
+            options.enable_enemy_100.value,
+        )
+        return cls(
+            level_complete=bool(options.enable_level_complete.value),
+            flik_individual=bool(options.enable_flik_individual.value),
+            flik_all=bool(options.enable_flik_all.value),
+            grain_all=bool(options.enable_grain_all.value),
+            grainsanity_step=step,
+            enemy_pcts=tuple(pct for pct, on in zip(ENEMYSANITY_PCTS, enemy_toggles) if on),
+        )
+
+
+# (location name, location id, level index, check category)
+PlannedLocation = Tuple[str, int, int, int]
+
+
+def _enemysanity_ids(key: LocationPlanKey) -> FrozenSet[int]:
+    return frozenset(
+        enemysanity_location_id(level_idx, pct)
+        for level_idx, kills_by_pct in ENEMY_KILLS_BY_LEVEL.items()
+        for pct, kills in zip(ENEMYSANITY_PCTS, kills_by_pct)
+        if kills and pct in key.enemy_pcts
+    )
+
+
+@lru_cache(maxsize=None)
+def grainsanity_amounts(key: LocationPlanKey, level_index: int) -> Tuple[int, ...]:
+    """Grain amounts with a grainsanity location in one level, ascending.
+
+    Grainsanity ids of levels 10 and 11 run into the enemysanity range (for
+    example "Riverbed Canyon - 11 Grain" and "Ant Hill - 25% Enemies" are both
+    3011), and the server keys a slot's locations by id. An amount whose id an
+    enabled enemysanity location already has is left out. Giving grainsanity
+    a range of its own would fix the id scheme itself, but changes the data
+    package, so it has to wait for a breaking release.
+    """
+    if not key.grainsanity_step:
+        return ()
+    taken = _enemysanity_ids(key)
+    return tuple(
+        amt for amt in range(key.grainsanity_step, MAX_GRAIN + 1, key.grainsanity_step)
+        if grainsanity_location_id(level_index, amt) not in taken
+    )
+
+
+@lru_cache(maxsize=None)
+def plan_locations(key: LocationPlanKey) -> Tuple[PlannedLocation, ...]:
+    """Every location a slot with these options gets, in creation order.
+
+    Ids come straight from the id scheme above, so nothing is parsed back out
+    of location names. The result is shared between all slots with the same key.
+    """
+    enabled_offsets = [
+        off
+        for off, enabled in enumerate(
+            (
+                key.flik_individual,
+                key.flik_individual,
+                key.flik_individual,
+                key.flik_individual,
+                key.flik_all,
+                key.grain_all,
+                True,
+                key.level_complete,
+            )
+        )
+        if enabled
+    ]
+
+    rows = []
+    for level in LEVELS.values():
+        for off in enabled_offsets:
+            rows.append((
+                f"{level.name} - {LOCATION_SUFFIXES[off]}",
+                level.location_base + off,
+                level.index,
+                LOCATION_SUFFIX_CATEGORIES[off],
+            ))
+
+    if key.grainsanity_step:
+        for level in LEVELS.values():
+            for amt in grainsanity_amounts(key, level.index):
+                rows.append((
+                    f"{level.name} - {amt} Grain",
+                    level.grainsanity_base + amt,
+                    level.index,
+                    CHECK_GRAINSANITY,
+                ))
+
+    if key.enemy_pcts:
+        for level in LEVELS.values():
+            for pct, kills in zip(ENEMYSANITY_PCTS, ENEMY_KILLS_BY_LEVEL[level.index]):
+                if not kills or pct not in key.enemy_pcts:
+                    continue
+                rows.append((
+                    f"{level.name} - {pct}% Enemies",
+                    enemysanity_location_id(level.index, pct),
+                    level.index,
+                    CHECK_ENEMYSANITY,
+                ))
+
+    ids = [row[1] for row in rows]
+    if len(set(ids)) != len(ids):
+        shared = sorted({loc_id for loc_id in ids if ids.count(loc_id) > 1})
+        raise Exception(f"Location plan has several locations with the same id: {shared}")
+    return tuple(rows)
+
+
+def check_token(location_id: int, level_index: int, category: int) -> Optional[str]:
+    """Token of the CHECK line that sends a location, or None if nothing sends it."""
+    level = LEVELS[level_index]
+    if category == CHECK_GRAINSANITY:
+        return f"GRAIN{location_id - level.grainsanity_base}"
+    if category == CHECK_ENEMYSANITY:
+        return f"ENEMIES{ENEMYSANITY_PCTS[location_id - level.enemysanity_base - 1]}"
+    return LOCATION_SUFFIX_TOKENS[location_id - level.location_base]
+
+
+@lru_cache(maxsize=None)
+def check_lookup(key: LocationPlanKey) -> Dict[str, int]:
+    """"<token> <level>" -> location id for every check a slot with these options sends.
+
+    Keys are ABL.lua's CHECK lines without the leading "CHECK ", so a client
+    resolves a line with one dict lookup; lines for disabled checks are absent.
+    Two keys sharing an id would make clients drop whichever is sent second as
+    already sent, so that raises instead (see grainsanity_amounts()).
+    """
+    lookup: Dict[str, int] = {}
+    for _, loc_id, level_idx, category in plan_locations(key):
+        token = check_token(loc_id, level_idx, category)
+        if token is not None:
+            lookup[f"{token} {level_idx}"] = loc_id
+    ids = list(lookup.values())
+    if len(set(ids)) != len(ids):
+        shared = sorted({loc_id for loc_id in ids if ids.count(loc_id) > 1})
+        raise Exception(f"Several CHECK lines resolve to the same location ids: {shared}")
+    return lookup
+
+
+SLOT_DATA_VERSION = 1
+
+# Bits of the "options" slot data field.
+OPTION_LEVEL_COMPLETE = 1 << 0
+OPTION_FLIK_INDIVIDUAL = 1 << 1
+OPTION_FLIK_ALL = 1 << 2
+OPTION_GRAIN_ALL = 1 << 3
+OPTION_GRAINSANITY = 1 << 4
+OPTION_ENEMY = {25: 1 << 5, 50: 1 << 6, 75: 1 << 7, 100: 1 << 8}
+
+
+def option_bits(key: LocationPlanKey) -> int:
+    bits = 0
+    for flag, bit in (
+        (key.level_complete, OPTION_LEVEL_COMPLETE),
+        (key.flik_individual, OPTION_FLIK_INDIVIDUAL),
+        (key.flik_all, OPTION_FLIK_ALL),
+        (key.grain_all, OPTION_GRAIN_ALL),
+        (key.grainsanity_step, OPTION_GRAINSANITY),
+    ):
+        if flag:
+            bits |= bit
+    for pct in key.enemy_pcts:
+        bits |= OPTION_ENEMY[pct]
+    return bits
+
+
+@lru_cache(maxsize=None)
+def check_tables(key: LocationPlanKey) -> Dict[str, Any]:
+    """The versioned per-level check arrays a slot's slot data carries.
+
+    Row i of every array belongs to ``levels[i]``. ``grain`` lists the enabled
+    grainsanity amounts in ascending order and ``enemies`` the enemy counter
+    value of each ENEMYSANITY_PCTS tier (0: no check), with the location id of
+    each entry in ``grain_ids`` / ``enemy_ids``. Clients copy the arrays into
+    abl_config.txt so ABL.lua compares against them without recomputing.
+    """
+    levels: List[int] = []
+    grain: List[List[int]] = []
+    grain_ids: List[List[int]] = []
+    enemies: List[List[int]] = []
+    enemy_ids: List[List[int]] = []
+
+    for level in LEVELS.values():
+        amounts = list(grainsanity_amounts(key, level.index))
+        levels.append(level.index)
+        grain.append(amounts)
+        grain_ids.append([level.grainsanity_base + amt for amt in amounts])
+
+        kills = [
+            count if pct in key.enemy_pcts else 0
+            for pct, count in zip(ENEMYSANITY_PCTS, ENEMY_KILLS_BY_LEVEL[level.index])
+        ]
+        enemies.append(kills)
+        enemy_ids.append([
+            enemysanity_location_id(level.index, pct) if count else 0
+            for pct, count in zip(ENEMYSANITY_PCTS, kills)
+        ])
+
+    return {
+        "version": SLOT_DATA_VERSION,
+        "options": option_bits(key),
+        "grainsanity_step": key.grainsanity_step,
+        "levels": levels,
+        "grain": grain,
+        "grain_ids": grain_ids,
+        "enemies": enemies,
+        "enemy_ids": enemy_ids,
+    }
@@ -0,0 +1,264 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from worlds.AutoWorld import LogicMixin
+
+from .Items import ABLItem, ITEM_TABLE, LEVEL_NAMES
+
+GOLD_BERRY_LEVELS = {1, 6, 10, 11, 14, 7, 12, 8, 15}
+
+BERRY_PROXY_BY_LEVEL: Dict[int, str] = {
+    17: "purple",  # Training
+    3:  "purple",  # Tunnels
+    2:  "purple",  # Council Chamber
+    4:  "purple",  # City Entrance
+    5:  "purple",  # City Square
+    13: "purple",  # Battle Arena
+    9:  "yellow",  # Ant Hill, Part 2
+}
+
+LEVEL_COMPLETE_REQS: Dict[int, List[Dict[str, int]]] = {
+    17: [{"brown": 1, "green": 2, "blue": 0, "yellow": 0, "berry": 0}],
+    1:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    3:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    2:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
+    6:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    10: [
+        {"brown": 2, "green": 0, "blue": 0, "yellow": 0, "berry": 0},
+        {"brown": 1, "green": 4, "blue": 0, "yellow": 0, "berry": 0},
+    ],
+    11: [
+        {"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1},
+        {"brown": 1, "green": 0, "blue": 0, "yellow": 1, "berry": 0},
+    ],
+    4:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    5:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    14: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
+    7:  [{"brown": 4, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    12: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    13: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
+    9:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 2, "berry": 0}],
+    8:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
+    15: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
+}
+
+def _option_cost(opt: Dict[str, int]) -> int:
+    return (
+        max(0, opt.get("brown", 0) - 1)
+        + max(0, opt.get("green", 0))
+        + max(0, opt.get("blue", 0))
+        + max(0, opt.get("yellow", 0))
+        + max(0, opt.get("berry", 0))
+    )
+
+
+@lru_cache(maxsize=None)
+def required_progressives() -> Dict[Tuple[str, int], int]:
+    """Progressive copies needed per (kind, level) to complete every level.
+
+    Uses the cheapest requirement alternative of each level.
+    """
+    required: Dict[Tuple[str, int], int] = {}
+
+    def bump(kind: str, level_idx: int, count: int) -> None:
+        if count <= 0:
+            return
+        key = (kind, level_idx)
+        required[key] = max(required.get(key, 0), count)
+
+    for level_idx, alternatives in LEVEL_COMPLETE_REQS.items():
+        chosen = min(alternatives, key=_option_cost)
+
+        bump("brown", level_idx, max(0, chosen.get("brown", 0) - 1))
+        bump("green", level_idx, max(0, chosen.get("green", 0)))
+        bump("blue",  level_idx, max(0, chosen.get("blue", 0)))
+        bump("yellow", level_idx, max(0, chosen.get("yellow", 0)))
+
+        berry_tier = max(0, chosen.get("berry", 0))
+        if berry_tier > 0:
+            if level_idx in GOLD_BERRY_LEVELS:
+                bump("berry", level_idx, berry_tier)
+            else:
+                proxy = BERRY_PROXY_BY_LEVEL.get(level_idx, "purple")
+                bump("purple" if proxy == "purple" else "yellow", level_idx, berry_tier)
+
+    return required
+
+
+SEED_KINDS = ("brown", "green", "blue", "yellow")
+
+# One way of completing a level: ((item name, copies needed), ...)
+Requirement = Tuple[Tuple[str, int], ...]
+
+
+def progressive_item_name(kind: str, level_idx: int) -> str:
+    lvl = LEVEL_NAMES[level_idx]
+    if kind == "berry":
+        return f"Progressive Berry Upgrade - {lvl}"
+    return f"Progressive {kind.capitalize()} Seed Upgrade - {lvl}"
+
+
+def _compile_alternative(level_idx: int, opt: Dict[str, int]) -> Requirement:
+    needed: Dict[str, int] = {}
+
+    def need(kind: str, count: int) -> None:
+        if count <= 0:
+            return
+        name = progressive_item_name(kind, level_idx)
+        needed[name] = max(needed.get(name, 0), count)
+
+    for seed in SEED_KINDS:
+        tier = opt.get(seed, 0)
+        if tier > 0:
+            # Brown tier 1 is the level's base seed and costs no items.
+            need(seed, tier - 1 if seed == "brown" else tier)
+
+    berry_tier = opt.get("berry", 0)
+    if berry_tier > 0:
+        if level_idx in GOLD_BERRY_LEVELS:
+            need("berry", berry_tier)
+        else:
+            need(BERRY_PROXY_BY_LEVEL.get(level_idx, "purple"), berry_tier)
+
+    return tuple(sorted(needed.items()))
+
+
+@lru_cache(maxsize=None)
+def level_requirements(level_idx: int) -> Tuple[Requirement, ...]:
+    """Item alternatives for completing a level, with tiers already turned into item counts."""
+    return tuple(_compile_alternative(level_idx, opt) for opt in LEVEL_COMPLETE_REQS.get(level_idx, []))
+
+
+@lru_cache(maxsize=None)
+def logical_copies() -> Dict[str, int]:
+    """Item name -> most copies any level's entrance rule can ask for.
+
+    Levels with a free alternative get no rule, so their items never count.
+    Copies past these never change what is reachable.
+    """
+    copies: Dict[str, int] = {}
+    for level_idx in LEVEL_COMPLETE_REQS:
+        alternatives = level_requirements(level_idx)
+        if not alternatives or any(not alt for alt in alternatives):
+            continue
+        for alt in alternatives:
+            for name, count in alt:
+                copies[name] = max(copies.get(name, 0), count)
+    return copies
+
+
+RuleFactory = Callable[[int], Callable[..., bool]]
+
+
+def _level_rule_factory(level_idx: int) -> Optional[RuleFactory]:
+    alternatives = level_requirements(level_idx)
+    if not alternatives or any(not alt for alt in alternatives):
+        return None
+
+    if all(len(alt) == 1 for alt in alternatives):
+        singles = [alt[0] for alt in alternatives]
+        if len(singles) == 1:
+            name, count = singles[0]
+            return lambda player: lambda state: state.has(name, player, count)
+        return lambda player: lambda state: any(state.has(name, player, count) for name, count in singles)
+
+    counts = [dict(alt) for alt in alternatives]
+    if len(counts) == 1:
+        only = counts[0]
+        return lambda player: lambda state: state.has_all_counts(only, player)
+    return lambda player: lambda state: any(state.has_all_counts(c, player) for c in counts)
+
+
+@lru_cache(maxsize=None)
+def level_rule_factories() -> Dict[int, Optional[RuleFactory]]:
+    """Per level, a function building that level's entrance rule for a player.
+
+    Requirement compilation happens once; a factory only closes over the player.
+    Levels without requirements map to None.
+    """
+    return {level_idx: _level_rule_factory(level_idx) for level_idx in LEVEL_COMPLETE_REQS}
+
+
+# Per-player tier counters kept in the CollectionState: one slot per
+# (level, ABLItem.kind), berry first, then the five seed colours.
+TIER_KINDS = 6
+TIER_SLOTS = (max(LEVEL_NAMES) + 1) * TIER_KINDS
+
+# One way of completing a level as ((tier slot, copies needed), ...)
+TierRequirement = Tuple[Tuple[int, int], ...]
+
+
+def tier_slot(level_idx: int, kind: int) -> int:
+    return level_idx * TIER_KINDS + kind
+
+
+@lru_cache(maxsize=None)
+def level_tier_requirements() -> Dict[int, Tuple[TierRequirement, ...]]:
+    """level_requirements() on tier slots, for the levels that get an entrance rule."""
+    requirements: Dict[int, Tuple[TierRequirement, ...]] = {}
+    for level_idx in LEVEL_COMPLETE_REQS:
+        if _level_rule_factory(level_idx) is None:
+            continue
+        requirements[level_idx] = tuple(
+            tuple((tier_slot(ITEM_TABLE[name] % 100, ITEM_TABLE[name] // 100 - 3), count) for name, count in alt)
+            for alt in level_requirements(level_idx)
+        )
+    return requirements
+
+
+@lru_cache(maxsize=None)
+def levels_by_tier_slot() -> Dict[int, Tuple[int, ...]]:
+    """Tier slot -> levels whose requirements read it."""
+    levels: Dict[int, List[int]] = {}
+    for level_idx, alternatives in level_tier_requirements().items():
+        for slot in sorted({slot for alt in alternatives for slot, _ in alt}):
+            levels.setdefault(slot, []).append(level_idx)
+    return {slot: tuple(level_list) for slot, level_list in levels.items()}
+
+
+class BugsLifeLogic(LogicMixin):
+    abl_tiers: Dict[int, List[int]]  # player -> progression copies collected per tier slot
+    abl_open: Dict[int, int]  # player -> bit per level whose entrance rule holds
+
+    def init_mixin(self, multiworld) -> None:
+        # Item-link groups have worlds of their own, which collect the linked items.
+        groups = (group_id for group_id, group in multiworld.groups.items() if group["game"] == ABLItem.game)
+        players = (*multiworld.get_game_players(ABLItem.game), *groups)
+        self.abl_tiers = {player: [0] * TIER_SLOTS for player in players}
+        self.abl_open = {player: 0 for player in players}
+
+    def copy_mixin(self, new_state) -> "BugsLifeLogic":
+        new_state.abl_tiers = {player: tiers.copy() for player, tiers in self.abl_tiers.items()}
+        new_state.abl_open = self.abl_open.copy()
+        return new_state
+
+
+def update_tier(state, player: int, item: ABLItem, delta: int) -> None:
+    """Count a collected (+1) or removed (-1) progression item and re-check the levels it affects."""
+    tiers = state.abl_tiers[player]
+    slot = tier_slot(item.level_index, item.kind)
+    tiers[slot] += delta
+    levels = levels_by_tier_slot().get(slot)
+    if not levels:
+        return
+    requirements = level_tier_requirements()
+    open_levels = state.abl_open[player]
+    for level_idx in levels:
+        if any(all(tiers[s] >= count for s, count in alt) for alt in requirements[level_idx]):
+            open_levels |= 1 << level_idx
+        else:
+            open_levels &= ~(1 << level_idx)
+    state.abl_open[player] = open_levels
+
+
+def level_access_rule(player: int, level_idx: int) -> Optional[Callable[..., bool]]:
+    """Access rule for entering a level region, or None if the level is free.
+
+    Reads the level's bit kept up to date by update_tier(), which
+    BugsLifeWorld.collect() and remove() call; level_rule_factories() builds
+    the equivalent rules on item names.
+    """
+    if level_idx not in level_tier_requirements():
+        return None
+    bit = 1 << level_idx
+    return lambda state: (state.abl_open[player] & bit) != 0
@@ -0,0 +1,245 @@
+"""Standalone progression solver for A Bug's Life slots.
+
+Item counts for the 16 levels x 6 progressive kinds are packed into a single
+integer, one 16-bit lane per (level, kind). A level's requirement alternatives
+are packed the same way, so "has every item this alternative needs" is one
+guarded subtraction over all lanes at once. Solving a placement is a few dozen
+of those checks, which makes it cheap enough to validate generated seeds and
+spoiler logs in bulk without a MultiWorld or CollectionState.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .Items import ITEM_TABLE, LEVEL_NAMES, PROGRESSIVE_PREFIXES
+from .Locations import (
+    ABLLoc,
+    LocationPlanKey,
+    check_token,
+    plan_locations,
+)
+from .Rules import LEVEL_COMPLETE_REQS, level_requirements
+from .Tables import LOCATION_NAME_TO_ID
+
+LANE_BITS = 16
+LANE_MAX = (1 << (LANE_BITS - 1)) - 1
+KIND_COUNT = len(PROGRESSIVE_PREFIXES)
+
+LEVEL_ORDER: Tuple[int, ...] = tuple(sorted(LEVEL_NAMES))
+LEVEL_SLOT: Dict[int, int] = {level_idx: slot for slot, level_idx in enumerate(LEVEL_ORDER)}
+
+# The high bit of every lane; lanes hold at most LANE_MAX so it is free.
+GUARD = sum(1 << (lane * LANE_BITS + LANE_BITS - 1) for lane in range(len(LEVEL_ORDER) * KIND_COUNT))
+
+
+def lane_shift(level_idx: int, kind: int) -> int:
+    return (LEVEL_SLOT[level_idx] * KIND_COUNT + kind) * LANE_BITS
+
+
+def item_lane_shift(item_id: int) -> Optional[int]:
+    """Lane of a progressive item id, or None for anything else."""
+    kind = item_id // 100 - 3
+    level_idx = item_id % 100
+    if 0 <= kind < KIND_COUNT and level_idx in LEVEL_SLOT:
+        return lane_shift(level_idx, kind)
+    return None
+
+
+# Item id -> the packed value of one copy of it.
+ITEM_INCREMENT: Dict[int, int] = {
+    item_id: 1 << shift
+    for item_id in ITEM_TABLE.values()
+    if (shift := item_lane_shift(item_id)) is not None
+}
+
+
+def lane_count(counts: int, level_idx: int, kind: int) -> int:
+    return (counts >> lane_shift(level_idx, kind)) & LANE_MAX
+
+
+def pack_items(item_ids: Iterable[int]) -> int:
+    """Packed counts of a bag of item ids; non-progressive items add nothing.
+
+    Lanes do not saturate, so no single item may appear more than LANE_MAX times.
+    """
+    increment = ITEM_INCREMENT.get
+    return sum(increment(item_id, 0) for item_id in item_ids if item_id is not None)
+
+
+def satisfies(counts: int, requirement: int) -> bool:
+    """True if every lane of counts is at least the same lane of requirement."""
+    return ((counts | GUARD) - requirement) & GUARD == GUARD
+
+
+def _pack_requirement(alternative) -> int:
+    packed = 0
+    for item_name, count in alternative:
+        packed |= min(count, LANE_MAX) << item_lane_shift(ITEM_TABLE[item_name])
+    return packed
+
+
+PACKED_REQUIREMENTS: Dict[int, Tuple[int, ...]] = {
+    level_idx: tuple(_pack_requirement(alt) for alt in level_requirements(level_idx))
+    for level_idx in LEVEL_COMPLETE_REQS
+}
+
+
+class SolveResult(NamedTuple):
+    spheres: Tuple[Tuple[str, ...], ...]
+    unreachable: Tuple[str, ...]
+    open_levels: FrozenSet[int]
+    counts: int
+
+    @property
+    def beatable(self) -> bool:
+        """Every level can be entered, so every Level Complete check can be done."""
+        return len(self.open_levels) == len(LEVEL_ORDER)
+
+    @property
+    def fully_accessible(self) -> bool:
+        return not self.unreachable
+
+
+class ProgressionSolver:
+    """Sphere-by-sphere reachability for one A Bug's Life slot.
+
+    With ``level_complete`` off the world sets no rules, so every level is open.
+    """
+
+    def __init__(self, level_complete: bool = True):
+        self.level_complete = level_complete
+
+    def level_open(self, counts: int, level_idx: int) -> bool:
+        if not self.level_complete:
+            return True
+        alternatives = PACKED_REQUIREMENTS.get(level_idx)
+        if not alternatives:
+            return True
+        return any(satisfies(counts, req) for req in alternatives)
+
+    def open_levels(self, counts: int) -> FrozenSet[int]:
+        return frozenset(level_idx for level_idx in LEVEL_ORDER if self.level_open(counts, level_idx))
+
+    def solve(
+        self,
+        placement: Mapping[str, Optional[int]],
+        start_items: Iterable[int] = (),
+        levels: Optional[Mapping[str, int]] = None,
+    ) -> SolveResult:
+        """Collect everything reachable, one sphere at a time.
+
+        ``placement`` maps this slot's location names to the ids of this slot's
+        own items found there; locations holding anything else can map to None.
+        Names rather than ids, since grainsanity and enemysanity ids overlap.
+        ``start_items`` are items the slot has from the start or receives from
+        other worlds. ``levels`` maps location names to level indices (see
+        plan_levels()); without it the level is read from the name.
+        """
+        level_of = levels.__getitem__ if levels is not None else ABLLoc.get_level_index_from_location_name
+        increment = ITEM_INCREMENT.get
+
+        # Every location of a level opens at once, so all a level's items can be
+        # summed into one packed gain up front.
+        pending: Dict[int, List[str]] = {}
+        gains: Dict[int, int] = {}
+        for location_name, item_id in placement.items():
+            level_idx = level_of(location_name)
+            if level_idx in pending:
+                pending[level_idx].append(location_name)
+                gains[level_idx] += increment(item_id, 0)
+            else:
+                pending[level_idx] = [location_name]
+                gains[level_idx] = increment(item_id, 0)
+
+        counts = pack_items(start_items)
+        spheres: List[Tuple[str, ...]] = []
+
+        while pending:
+            newly_open = [
+                level_idx for level_idx in pending
+                if level_idx == 0 or self.level_open(counts, level_idx)
+            ]
+            if not newly_open:
+                break
+
+            sphere: List[str] = []
+            for level_idx in newly_open:
+                sphere.extend(pending.pop(level_idx))
+                counts += gains[level_idx]
+            spheres.append(tuple(sorted(sphere)))
+
+        unreachable = tuple(sorted(location_name for rows in pending.values() for location_name in rows))
+        return SolveResult(tuple(spheres), unreachable, self.open_levels(counts), counts)
+
+
+def plan_levels(key: LocationPlanKey) -> Dict[str, int]:
+    """Location name -> level index for every location of a plan."""
+    return {location_name: level_idx for location_name, _, level_idx, _ in plan_locations(key)}
+
+
+def unreachable_with_full_pool(key: LocationPlanKey, pool: Iterable[Tuple[str, int]]) -> Tuple[str, ...]:
+    """Location names of a plan that can't be checked even with every pool item collected.
+
+    That is the locations of levels that stay locked, plus those no CHECK line
+    sends (check_token() is None, as for "All Enemies"). ``pool`` is
+    (item name, copies), as produced by item_pool_counts().
+    """
+    counts = sum(ITEM_INCREMENT.get(ITEM_TABLE[name], 0) * copies for name, copies in pool)
+
+    solver = ProgressionSolver(key.level_complete)
+    return tuple(
+        location_name
+        for location_name, location_id, level_idx, category in plan_locations(key)
+        if not solver.level_open(counts, level_idx) or check_token(location_id, level_idx, category) is None
+    )
+
+
+_ALL_LOCATIONS: Dict[str, int] = LOCATION_NAME_TO_ID
+_OWNED = re.compile(r"^(.*) \((.+)\)$")
+
+
+def _split_owner(text: str) -> Tuple[str, Optional[str]]:
+    match = _OWNED.match(text)
+    if match:
+        return match.group(1), match.group(2)
+    return text, None
+
+
+def placement_from_spoiler(text: str, player_name: Optional[str] = None) -> Tuple[Dict[str, Optional[int]], List[int]]:
+    """Read one slot's placement out of an Archipelago spoiler log.
+
+    Returns (placement, external_items): the names of the slot's locations
+    mapped to the ids of its own items found there (None for anything else),
+    and the slot's items placed in other worlds. For single-player spoilers
+    leave player_name unset.
+    """
+    placement: Dict[str, Optional[int]] = {}
+    external: List[int] = []
+    in_locations = False
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not in_locations:
+            in_locations = line == "Locations:"
+            continue
+        if not line:
+            continue
+        if line.endswith(":") and ": " not in line:
+            break
+
+        location_part, sep, item_part = line.partition(": ")
+        if not sep:
+            continue
+        location_name, location_owner = _split_owner(location_part)
+        item_name, item_owner = _split_owner(item_part)
+
+        own_location = location_owner == player_name and location_name in _ALL_LOCATIONS
+        own_item = item_owner == player_name and item_name in ITEM_TABLE
+
+        if own_location:
+            placement[location_name] = ITEM_TABLE[item_name] if own_item else None
+        elif own_item:
+            external.append(ITEM_TABLE[item_name])
+
+    return placement, external
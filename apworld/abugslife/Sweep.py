@@ -0,0 +1,259 @@
+"""Generate many A Bug's Life multiworlds across an option matrix.
+
+Run from an Archipelago checkout::
+
+    python -m worlds.abugslife.Sweep --set grainsanity_step=1,10,50 --set enable_enemy_100=0,1 \\
+        --players 1 8 --seeds 5 --jobs 8 -o sweep.csv
+
+Every combination of the ``--set`` / ``--matrix`` values is one point; each
+point is generated for every ``--players`` count with seeds ``--seed`` to
+``--seed + --seeds - 1``, so all points see the same seeds. Runs are spread
+over a process pool and written in matrix order, one row per run (or per
+point with ``--aggregate``), as JSONL or, for a ``.csv`` output, CSV.
+
+A run drives every slot through the World's generation stages up to
+fill_slot_data and records whether it failed (and in which stage), the
+location and item counts, the pool's progression/useful/filler split and each
+stage's wall time. Fill itself is Archipelago's and is not run.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import statistics
+import sys
+import time
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from BaseClasses import CollectionState, ItemClassification, MultiWorld
+
+GAME = "A Bug's Life"
+
+STAGES = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+    "connect_entrances",
+    "generate_basic",
+    "pre_fill",
+    "fill_slot_data",
+)
+
+
+class Task(NamedTuple):
+    point: int
+    players: int
+    seed: int
+    options: Dict[str, Any]
+
+
+def world_type() -> type:
+    from . import BugsLifeWorld
+
+    return BugsLifeWorld
+
+
+def build_multiworld(players: int, option_values: Dict[str, Any], seed: int) -> MultiWorld:
+    """A MultiWorld where every slot plays A Bug's Life with the same options."""
+    world = world_type()
+    multiworld = MultiWorld(players)
+    multiworld.game = {player: GAME for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Player{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+
+    args = Namespace()
+    for key, option in world.options_dataclass.type_hints.items():
+        value = option_values.get(key, option.default)
+        setattr(args, key, {player: option.from_any(value) for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def run_stage(multiworld: MultiWorld, stage: str) -> None:
+    from worlds.AutoWorld import call_all
+
+    if stage == "fill_slot_data":
+        for player in multiworld.player_ids:
+            multiworld.worlds[player].fill_slot_data()
+    else:
+        call_all(multiworld, stage)
+
+
+def run_task(task: Task) -> Dict[str, Any]:
+    row: Dict[str, Any] = {
+        "point": task.point,
+        "players": task.players,
+        "seed": task.seed,
+        "options": task.options,
+        "ok": True,
+        "stages": {},
+    }
+    start = time.perf_counter()
+    stage = "build"
+    try:
+        multiworld = build_multiworld(task.players, task.options, task.seed)
+        for stage in STAGES:
+            stage_start = time.perf_counter()
+            run_stage(multiworld, stage)
+            row["stages"][stage] = time.perf_counter() - stage_start
+    except Exception as ex:
+        row.update(ok=False, failed_stage=stage, error=f"{type(ex).__name__}: {ex}")
+    else:
+        pool = multiworld.itempool
+        progression = sum(1 for item in pool if item.classification & ItemClassification.progression)
+        useful = sum(1 for item in pool if item.classification == ItemClassification.useful)
+        row.update(
+            locations=sum(1 for location in multiworld.get_locations() if location.address is not None),
+            items=len(pool),
+            progression=progression,
+            useful=useful,
+            filler=len(pool) - progression - useful,
+        )
+    row["total_s"] = time.perf_counter() - start
+    return row
+
+
+def parse_value(text: str) -> Any:
+    text = text.strip()
+    return int(text) if text.lstrip("-").isdigit() else text
+
+
+def option_points(matrix: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the matrix values, in a fixed order."""
+    keys = list(matrix)
+    return [dict(zip(keys, values)) for values in itertools.product(*(matrix[key] for key in keys))]
+
+
+def tasks(points: Sequence[Dict[str, Any]], players: Sequence[int], seed: int, seeds: int) -> Iterator[Task]:
+    for index, options in enumerate(points):
+        for count in players:
+            for offset in range(seeds):
+                yield Task(index, count, seed + offset, options)
+
+
+def aggregate(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One row per (point, player count): failures and median stage times over seeds."""
+    groups: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault((row["point"], row["players"]), []).append(row)
+
+    out = []
+    for (point, players), runs in groups.items():
+        done = [run for run in runs if run["ok"]]
+        summary: Dict[str, Any] = {
+            "point": point,
+            "players": players,
+            "options": runs[0]["options"],
+            "runs": len(runs),
+            "failures": len(runs) - len(done),
+            "errors": sorted({run["error"] for run in runs if not run["ok"]}),
+        }
+        if done:
+            for key in ("locations", "items", "progression", "useful", "filler"):
+                summary[key] = done[0][key]
+            summary["stages"] = {
+                stage: statistics.median(run["stages"][stage] for run in done) for stage in STAGES
+            }
+            summary["total_s"] = statistics.median(run["total_s"] for run in done)
+        out.append(summary)
+    return out
+
+
+def flatten(row: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            flat[prefix + key] = "; ".join(map(str, value))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def write_report(rows: List[Dict[str, Any]], out, as_csv: bool) -> None:
+    if not as_csv:
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+        return
+    flat = [flatten(row) for row in rows]
+    fields: List[str] = []
+    for row in flat:
+        fields.extend(key for key in row if key not in fields)
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(flat)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m worlds.abugslife.Sweep", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--set", dest="sets", action="append", default=[], metavar="OPTION=V1,V2,...",
+                        help="values to sweep for one option (repeatable)")
+    parser.add_argument("--matrix", metavar="FILE",
+                        help='JSON object of option -> list of values, e.g. {"grainsanity_step": [1, 10]}')
+    parser.add_argument("--players", type=int, nargs="+", default=[1])
+    parser.add_argument("--seed", type=int, default=1, help="first seed")
+    parser.add_argument("--seeds", type=int, default=1, help="seeds per point and player count")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--aggregate", action="store_true", help="one row per point and player count")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="default: from the output file's extension")
+    parser.add_argument("--output", "-o", metavar="FILE", help="report file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    known = world_type().options_dataclass.type_hints
+    matrix: Dict[str, List[Any]] = {}
+    if args.matrix:
+        with open(args.matrix, encoding="utf-8") as f:
+            for key, values in json.load(f).items():
+                matrix[key] = values if isinstance(values, list) else [values]
+    for spec in args.sets:
+        key, sep, values = spec.partition("=")
+        if not sep or not values:
+            parser.error(f"--set expects OPTION=V1,V2,... (got {spec!r})")
+        matrix[key.strip()] = [parse_value(value) for value in values.split(",")]
+    for key in matrix:
+        if key not in known:
+            parser.error(f"unknown option {key!r}; options are: {', '.join(sorted(known))}")
+    args.matrix_values = matrix
+
+    if args.format is None:
+        args.format = "csv" if args.output and args.output.endswith(".csv") else "jsonl"
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    points = option_points(args.matrix_values)
+    work = list(tasks(points, args.players, args.seed, args.seeds))
+
+    if args.jobs == 1:
+        rows = [run_task(task) for task in work]
+    else:
+        # Resolved through the package so the pool pickles a name workers can import.
+        from .Sweep import run_task as task_fn
+
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            rows = list(pool.map(task_fn, work, chunksize=max(1, len(work) // (4 * (args.jobs or 8)))))
+
+    report = aggregate(rows) if args.aggregate else rows
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        write_report(report, out, args.format == "csv")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    failures = sum(1 for row in rows if not row["ok"])
+    print(f"{len(rows)} runs over {len(points)} points, {failures} failed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4500 @@
+"""Prebuilt name -> id tables and name groups for the World class.
+
+Generated by ``python -m benchmarks.imports --write-tables`` from the
+build_item_*() functions in Items.py and build_location_*() functions in
+Locations.py; change those and regenerate instead of editing this file.
+"""
+
+ITEM_NAME_TO_ID = {
+    'Extra Life': 210,
+    'Health Upgrade': 211,
+    'Progressive Berry Upgrade - Ant Hill': 301,
+    'Progressive Brown Seed Upgrade - Ant Hill': 401,
+    'Progressive Green Seed Upgrade - Ant Hill': 501,
+    'Progressive Blue Seed Upgrade - Ant Hill': 601,
+    'Progressive Purple Seed Upgrade - Ant Hill': 701,
+    'Progressive Yellow Seed Upgrade - Ant Hill': 801,
+    'Progressive Berry Upgrade - Council Chamber': 302,
+    'Progressive Brown Seed Upgrade - Council Chamber': 402,
+    'Progressive Green Seed Upgrade - Council Chamber': 502,
+    'Progressive Blue Seed Upgrade - Council Chamber': 602,
+    'Progressive Purple Seed Upgrade - Council Chamber': 702,
+    'Progressive Yellow Seed Upgrade - Council Chamber': 802,
+    'Progressive Berry Upgrade - Tunnels': 303,
+    'Progressive Brown Seed Upgrade - Tunnels': 403,
+    'Progressive Green Seed Upgrade - Tunnels': 503,
+    'Progressive Blue Seed Upgrade - Tunnels': 603,
+    'Progressive Purple Seed Upgrade - Tunnels': 703,
+    'Progressive Yellow Seed Upgrade - Tunnels': 803,
+    'Progressive Berry Upgrade - City Entrance': 304,
+    'Progressive Brown Seed Upgrade - City Entrance': 404,
+    'Progressive Green Seed Upgrade - City Entrance': 504,
+    'Progressive Blue Seed Upgrade - City Entrance': 604,
+    'Progressive Purple Seed Upgrade - City Entrance': 704,
+    'Progressive Yellow Seed Upgrade - City Entrance': 804,
+    'Progressive Berry Upgrade - City Square': 305,
+    'Progressive Brown Seed Upgrade - City Square': 405,
+    'Progressive Green Seed Upgrade - City Square': 505,
+    'Progressive Blue Seed Upgrade - City Square': 605,
+    'Progressive Purple Seed Upgrade - City Square': 705,
+    'Progressive Yellow Seed Upgrade - City Square': 805,
+    'Progressive Berry Upgrade - Cliffside': 306,
+    'Progressive Brown Seed Upgrade - Cliffside': 406,
+    'Progressive Green Seed Upgrade - Cliffside': 506,
+    'Progressive Blue Seed Upgrade - Cliffside': 606,
+    'Progressive Purple Seed Upgrade - Cliffside': 706,
+    'Progressive Yellow Seed Upgrade - Cliffside': 806,
+    'Progressive Berry Upgrade - Clover Forest': 307,
+    'Progressive Brown Seed Upgrade - Clover Forest': 407,
+    'Progressive Green Seed Upgrade - Clover Forest': 507,
+    'Progressive Blue Seed Upgrade - Clover Forest': 607,
+    'Progressive Purple Seed Upgrade - Clover Forest': 707,
+    'Progressive Yellow Seed Upgrade - Clover Forest': 807,
+    'Progressive Berry Upgrade - Riverbed Flight': 308,
+    'Progressive Brown Seed Upgrade - Riverbed Flight': 408,
+    'Progressive Green Seed Upgrade - Riverbed Flight': 508,
+    'Progressive Blue Seed Upgrade - Riverbed Flight': 608,
+    'Progressive Purple Seed Upgrade - Riverbed Flight': 708,
+    'Progressive Yellow Seed Upgrade - Riverbed Flight': 808,
+    'Progressive Berry Upgrade - Ant Hill, Part 2': 309,
+    'Progressive Brown Seed Upgrade - Ant Hill, Part 2': 409,
+    'Progressive Green Seed Upgrade - Ant Hill, Part 2': 509,
+    'Progressive Blue Seed Upgrade - Ant Hill, Part 2': 609,
+    'Progressive Purple Seed Upgrade - Ant Hill, Part 2': 709,
+    'Progressive Yellow Seed Upgrade - Ant Hill, Part 2': 809,
+    'Progressive Berry Upgrade - Riverbed Canyon': 310,
+    'Progressive Brown Seed Upgrade - Riverbed Canyon': 410,
+    'Progressive Green Seed Upgrade - Riverbed Canyon': 510,
+    'Progressive Blue Seed Upgrade - Riverbed Canyon': 610,
+    'Progressive Purple Seed Upgrade - Riverbed Canyon': 710,
+    'Progressive Yellow Seed Upgrade - Riverbed Canyon': 810,
+    'Progressive Berry Upgrade - Bird Nest': 311,
+    'Progressive Brown Seed Upgrade - Bird Nest': 411,
+    'Progressive Green Seed Upgrade - Bird Nest': 511,
+    'Progressive Blue Seed Upgrade - Bird Nest': 611,
+    'Progressive Purple Seed Upgrade - Bird Nest': 711,
+    'Progressive Yellow Seed Upgrade - Bird Nest': 811,
+    'Progressive Berry Upgrade - The Tree': 312,
+    'Progressive Brown Seed Upgrade - The Tree': 412,
+    'Progressive Green Seed Upgrade - The Tree': 512,
+    'Progressive Blue Seed Upgrade - The Tree': 612,
+    'Progressive Purple Seed Upgrade - The Tree': 712,
+    'Progressive Yellow Seed Upgrade - The Tree': 812,
+    'Progressive Berry Upgrade - Battle Arena': 313,
+    'Progressive Brown Seed Upgrade - Battle Arena': 413,
+    'Progressive Green Seed Upgrade - Battle Arena': 513,
+    'Progressive Blue Seed Upgrade - Battle Arena': 613,
+    'Progressive Purple Seed Upgrade - Battle Arena': 713,
+    'Progressive Yellow Seed Upgrade - Battle Arena': 813,
+    'Progressive Berry Upgrade - Bug Bar': 314,
+    'Progressive Brown Seed Upgrade - Bug Bar': 414,
+    'Progressive Green Seed Upgrade - Bug Bar': 514,
+    'Progressive Blue Seed Upgrade - Bug Bar': 614,
+    'Progressive Purple Seed Upgrade - Bug Bar': 714,
+    'Progressive Yellow Seed Upgrade - Bug Bar': 814,
+    'Progressive Berry Upgrade - Canyon Showdown': 315,
+    'Progressive Brown Seed Upgrade - Canyon Showdown': 415,
+    'Progressive Green Seed Upgrade - Canyon Showdown': 515,
+    'Progressive Blue Seed Upgrade - Canyon Showdown': 615,
+    'Progressive Purple Seed Upgrade - Canyon Showdown': 715,
+    'Progressive Yellow Seed Upgrade - Canyon Showdown': 815,
+    'Progressive Berry Upgrade - Training': 317,
+    'Progressive Brown Seed Upgrade - Training': 417,
+    'Progressive Green Seed Upgrade - Training': 517,
+    'Progressive Blue Seed Upgrade - Training': 617,
+    'Progressive Purple Seed Upgrade - Training': 717,
+    'Progressive Yellow Seed Upgrade - Training': 817,
+}
+
+LOCATION_NAME_TO_ID = {
+    'Ant Hill - F Letter': 1010,
+    'Ant Hill - L Letter': 1011,
+    'Ant Hill - I Letter': 1012,
+    'Ant Hill - K Letter': 1013,
+    'Ant Hill - FLIK Letters': 1014,
+    'Ant Hill - All Grain': 1015,
+    'Ant Hill - All Enemies': 1016,
+    'Ant Hill - Level Complete': 1017,
+    'Council Chamber - F Letter': 1020,
+    'Council Chamber - L Letter': 1021,
+    'Council Chamber - I Letter': 1022,
+    'Council Chamber - K Letter': 1023,
+    'Council Chamber - FLIK Letters': 1024,
+    'Council Chamber - All Grain': 1025,
+    'Council Chamber - All Enemies': 1026,
+    'Council Chamber - Level Complete': 1027,
+    'Tunnels - F Letter': 1030,
+    'Tunnels - L Letter': 1031,
+    'Tunnels - I Letter': 1032,
+    'Tunnels - K Letter': 1033,
+    'Tunnels - FLIK Letters': 1034,
+    'Tunnels - All Grain': 1035,
+    'Tunnels - All Enemies': 1036,
+    'Tunnels - Level Complete': 1037,
+    'City Entrance - F Letter': 1040,
+    'City Entrance - L Letter': 1041,
+    'City Entrance - I Letter': 1042,
+    'City Entrance - K Letter': 1043,
+    'City Entrance - FLIK Letters': 1044,
+    'City Entrance - All Grain': 1045,
+    'City Entrance - All Enemies': 1046,
+    'City Entrance - Level Complete': 1047,
+    'City Square - F Letter': 1050,
+    'City Square - L Letter': 1051,
+    'City Square - I Letter': 1052,
+    'City Square - K Letter': 1053,
+    'City Square - FLIK Letters': 1054,
+    'City Square - All Grain': 1055,
+    'City Square - All Enemies': 1056,
+    'City Square - Level Complete': 1057,
+    'Cliffside - F Letter': 1060,
+    'Cliffside - L Letter': 1061,
+    'Cliffside - I Letter': 1062,
+    'Cliffside - K Letter': 1063,
+    'Cliffside - FLIK Letters': 1064,
+    'Cliffside - All Grain': 1065,
+    'Cliffside - All Enemies': 1066,
+    'Cliffside - Level Complete': 1067,
+    'Clover Forest - F Letter': 1070,
+    'Clover Forest - L Letter': 1071,
+    'Clover Forest - I Letter': 1072,
+    'Clover Forest - K Letter': 1073,
+    'Clover Forest - FLIK Letters': 1074,
+    'Clover Forest - All Grain': 1075,
+    'Clover Forest - All Enemies': 1076,
+    'Clover Forest - Level Complete': 1077,
+    'Riverbed Flight - F Letter': 1080,
+    'Riverbed Flight - L Letter': 1081,
+    'Riverbed Flight - I Letter': 1082,
+    'Riverbed Flight - K Letter': 1083,
+    'Riverbed Flight - FLIK Letters': 1084,
+    'Riverbed Flight - All Grain': 1085,
+    'Riverbed Flight - All Enemies': 1086,
+    'Riverbed Flight - Level Complete': 1087,
+    'Ant Hill, Part 2 - F Letter': 1090,
+    'Ant Hill, Part 2 - L Letter': 1091,
+    'Ant Hill, Part 2 - I Letter': 1092,
+    'Ant Hill, Part 2 - K Letter': 1093,
+    'Ant Hill, Part 2 - FLIK Letters': 1094,
+    'Ant Hill, Part 2 - All Grain': 1095,
+    'Ant Hill, Part 2 - All Enemies': 1096,
+    'Ant Hill, Part 2 - Level Complete': 1097,
+    'Riverbed Canyon - F Letter': 1100,
+    'Riverbed Canyon - L Letter': 1101,
+    'Riverbed Canyon - I Letter': 1102,
+    'Riverbed Canyon - K Letter': 1103,
+    'Riverbed Canyon - FLIK Letters': 1104,
+    'Riverbed Canyon - All Grain': 1105,
+    'Riverbed Canyon - All Enemies': 1106,
+    'Riverbed Canyon - Level Complete': 1107,
+    'Bird Nest - F Letter': 1110,
+    'Bird Nest - L Letter': 1111,
+    'Bird Nest - I Letter': 1112,
+    'Bird Nest - K Letter': 1113,
+    'Bird Nest - FLIK Letters': 1114,
+    'Bird Nest - All Grain': 1115,
+    'Bird Nest - All Enemies': 1116,
+    'Bird Nest - Level Complete': 1117,
+    'The Tree - F Letter': 1120,
+    'The Tree - L Letter': 1121,
+    'The Tree - I Letter': 1122,
+    'The Tree - K Letter': 1123,
+    'The Tree - FLIK Letters': 1124,
+    'The Tree - All Grain': 1125,
+    'The Tree - All Enemies': 1126,
+    'The Tree - Level Complete': 1127,
+    'Battle Arena - F Letter': 1130,
+    'Battle Arena - L Letter': 1131,
+    'Battle Arena - I Letter': 1132,
+    'Battle Arena - K Letter': 1133,
+    'Battle Arena - FLIK Letters': 1134,
+    'Battle Arena - All Grain': 1135,
+    'Battle Arena - All Enemies': 1136,
+    'Battle Arena - Level Complete': 1137,
+    'Bug Bar - F Letter': 1140,
+    'Bug Bar - L Letter': 1141,
+    'Bug Bar - I Letter': 1142,
+    'Bug Bar - K Letter': 1143,
+    'Bug Bar - FLIK Letters': 1144,
+    'Bug Bar - All Grain': 1145,
+    'Bug Bar - All Enemies': 1146,
+    'Bug Bar - Level Complete': 1147,
+    'Canyon Showdown - F Letter': 1150,
+    'Canyon Showdown - L Letter': 1151,
+    'Canyon Showdown - I Letter': 1152,
+    'Canyon Showdown - K Letter': 1153,
+    'Canyon Showdown - FLIK Letters': 1154,
+    'Canyon Showdown - All Grain': 1155,
+    'Canyon Showdown - All Enemies': 1156,
+    'Canyon Showdown - Level Complete': 1157,
+    'Training - F Letter': 1170,
+    'Training - L Letter': 1171,
+    'Training - I Letter': 1172,
+    'Training - K Letter': 1173,
+    'Training - FLIK Letters': 1174,
+    'Training - All Grain': 1175,
+    'Training - All Enemies': 1176,
+    'Training - Level Complete': 1177,
+    'Ant Hill - 1 Grain': 2101,
+    'Ant Hill - 2 Grain': 2102,
+    'Ant Hill - 3 Grain': 2103,
+    'Ant Hill - 4 Grain': 2104,
+    'Ant Hill - 5 Grain': 2105,
+    'Ant Hill - 6 Grain': 2106,
+    'Ant Hill - 7 Grain': 2107,
+    'Ant Hill - 8 Grain': 2108,
+    'Ant Hill - 9 Grain': 2109,
+    'Ant Hill - 10 Grain': 2110,
+    'Ant Hill - 11 Grain': 2111,
+    'Ant Hill - 12 Grain': 2112,
+    'Ant Hill - 13 Grain': 2113,
+    'Ant Hill - 14 Grain': 2114,
+    'Ant Hill - 15 Grain': 2115,
+    'Ant Hill - 16 Grain': 2116,
+    'Ant Hill - 17 Grain': 2117,
+    'Ant Hill - 18 Grain': 2118,
+    'Ant Hill - 19 Grain': 2119,
+    'Ant Hill - 20 Grain': 2120,
+    'Ant Hill - 21 Grain': 2121,
+    'Ant Hill - 22 Grain': 2122,
+    'Ant Hill - 23 Grain': 2123,
+    'Ant Hill - 24 Grain': 2124,
+    'Ant Hill - 25 Grain': 2125,
+    'Ant Hill - 26 Grain': 2126,
+    'Ant Hill - 27 Grain': 2127,
+    'Ant Hill - 28 Grain': 2128,
+    'Ant Hill - 29 Grain': 2129,
+    'Ant Hill - 30 Grain': 2130,
+    'Ant Hill - 31 Grain': 2131,
+    'Ant Hill - 32 Grain': 2132,
+    'Ant Hill - 33 Grain': 2133,
+    'Ant Hill - 34 Grain': 2134,
+    'Ant Hill - 35 Grain': 2135,
+    'Ant Hill - 36 Grain': 2136,
+    'Ant Hill - 37 Grain': 2137,
+    'Ant Hill - 38 Grain': 2138,
+    'Ant Hill - 39 Grain': 2139,
+    'Ant Hill - 40 Grain': 2140,
+    'Ant Hill - 41 Grain': 2141,
+    'Ant Hill - 42 Grain': 2142,
+    'Ant Hill - 43 Grain': 2143,
+    'Ant Hill - 44 Grain': 2144,
+    'Ant Hill - 45 Grain': 2145,
+    'Ant Hill - 46 Grain': 2146,
+    'Ant Hill - 47 Grain': 2147,
+    'Ant Hill - 48 Grain': 2148,
+    'Ant Hill - 49 Grain': 2149,
+    'Ant Hill - 50 Grain': 2150,
+    'Council Chamber - 1 Grain': 2201,
+    'Council Chamber - 2 Grain': 2202,
+    'Council Chamber - 3 Grain': 2203,
+    'Council Chamber - 4 Grain': 2204,
+    'Council Chamber - 5 Grain': 2205,
+    'Council Chamber - 6 Grain': 2206,
+    'Council Chamber - 7 Grain': 2207,
+    'Council Chamber - 8 Grain': 2208,
+    'Council Chamber - 9 Grain': 2209,
+    'Council Chamber - 10 Grain': 2210,
+    'Council Chamber - 11 Grain': 2211,
+    'Council Chamber - 12 Grain': 2212,
+    'Council Chamber - 13 Grain': 2213,
+    'Council Chamber - 14 Grain': 2214,
+    'Council Chamber - 15 Grain': 2215,
+    'Council Chamber - 16 Grain': 2216,
+    'Council Chamber - 17 Grain': 2217,
+    'Council Chamber - 18 Grain': 2218,
+    'Council Chamber - 19 Grain': 2219,
+    'Council Chamber - 20 Grain': 2220,
+    'Council Chamber - 21 Grain': 2221,
+    'Council Chamber - 22 Grain': 2222,
+    'Council Chamber - 23 Grain': 2223,
+    'Council Chamber - 24 Grain': 2224,
+    'Council Chamber - 25 Grain': 2225,
+    'Council Chamber - 26 Grain': 2226,
+    'Council Chamber - 27 Grain': 2227,
+    'Council Chamber - 28 Grain': 2228,
+    'Council Chamber - 29 Grain': 2229,
+    'Council Chamber - 30 Grain': 2230,
+    'Council Chamber - 31 Grain': 2231,
+    'Council Chamber - 32 Grain': 2232,
+    'Council Chamber - 33 Grain': 2233,
+    'Council Chamber - 34 Grain': 2234,
+    'Council Chamber - 35 Grain': 2235,
+    'Council Chamber - 36 Grain': 2236,
+    'Council Chamber - 37 Grain': 2237,
+    'Council Chamber - 38 Grain': 2238,
+    'Council Chamber - 39 Grain': 2239,
+    'Council Chamber - 40 Grain': 2240,
+    'Council Chamber - 41 Grain': 2241,
+    'Council Chamber - 42 Grain': 2242,
+    'Council Chamber - 43 Grain': 2243,
+    'Council Chamber - 44 Grain': 2244,
+    'Council Chamber - 45 Grain': 2245,
+    'Council Chamber - 46 Grain': 2246,
+    'Council Chamber - 47 Grain': 2247,
+    'Council Chamber - 48 Grain': 2248,
+    'Council Chamber - 49 Grain': 2249,
+    'Council Chamber - 50 Grain': 2250,
+    'Tunnels - 1 Grain': 2301,
+    'Tunnels - 2 Grain': 2302,
+    'Tunnels - 3 Grain': 2303,
+    'Tunnels - 4 Grain': 2304,
+    'Tunnels - 5 Grain': 2305,
+    'Tunnels - 6 Grain': 2306,
+    'Tunnels - 7 Grain': 2307,
+    'Tunnels - 8 Grain': 2308,
+    'Tunnels - 9 Grain': 2309,
+    'Tunnels - 10 Grain': 2310,
+    'Tunnels - 11 Grain': 2311,
+    'Tunnels - 12 Grain': 2312,
+    'Tunnels - 13 Grain': 2313,
+    'Tunnels - 14 Grain': 2314,
+    'Tunnels - 15 Grain': 2315,
+    'Tunnels - 16 Grain': 2316,
+    'Tunnels - 17 Grain': 2317,
+    'Tunnels - 18 Grain': 2318,
+    'Tunnels - 19 Grain': 2319,
+    'Tunnels - 20 Grain': 2320,
+    'Tunnels - 21 Grain': 2321,
+    'Tunnels - 22 Grain': 2322,
+    'Tunnels - 23 Grain': 2323,
+    'Tunnels - 24 Grain': 2324,
+    'Tunnels - 25 Grain': 2325,
+    'Tunnels - 26 Grain': 2326,
+    'Tunnels - 27 Grain': 2327,
+    'Tunnels - 28 Grain': 2328,
+    'Tunnels - 29 Grain': 2329,
+    'Tunnels - 30 Grain': 2330,
+    'Tunnels - 31 Grain': 2331,
+    'Tunnels - 32 Grain': 2332,
+    'Tunnels - 33 Grain': 2333,
+    'Tunnels - 34 Grain': 2334,
+    'Tunnels - 35 Grain': 2335,
+    'Tunnels - 36 Grain': 2336,
+    'Tunnels - 37 Grain': 2337,
+    'Tunnels - 38 Grain': 2338,
+    'Tunnels - 39 Grain': 2339,
+    'Tunnels - 40 Grain': 2340,
+    'Tunnels - 41 Grain': 2341,
+    'Tunnels - 42 Grain': 2342,
+    'Tunnels - 43 Grain': 2343,
+    'Tunnels - 44 Grain': 2344,
+    'Tunnels - 45 Grain': 2345,
+    'Tunnels - 46 Grain': 2346,
+    'Tunnels - 47 Grain': 2347,
+    'Tunnels - 48 Grain': 2348,
+    'Tunnels - 49 Grain': 2349,
+    'Tunnels - 50 Grain': 2350,
+    'City Entrance - 1 Grain': 2401,
+    'City Entrance - 2 Grain': 2402,
+    'City Entrance - 3 Grain': 2403,
+    'City Entrance - 4 Grain': 2404,
+    'City Entrance - 5 Grain': 2405,
+    'City Entrance - 6 Grain': 2406,
+    'City Entrance - 7 Grain': 2407,
+    'City Entrance - 8 Grain': 2408,
+    'City Entrance - 9 Grain': 2409,
+    'City Entrance - 10 Grain': 2410,
+    'City Entrance - 11 Grain': 2411,
+    'City Entrance - 12 Grain': 2412,
+    'City Entrance - 13 Grain': 2413,
+    'City Entrance - 14 Grain': 2414,
+    'City Entrance - 15 Grain': 2415,
+    'City Entrance - 16 Grain': 2416,
+    'City Entrance - 17 Grain': 2417,
+    'City Entrance - 18 Grain': 2418,
+    'City Entrance - 19 Grain': 2419,
+    'City Entrance - 20 Grain': 2420,
+    'City Entrance - 21 Grain': 2421,
+    'City Entrance - 22 Grain': 2422,
+    'City Entrance - 23 Grain': 2423,
+    'City Entrance - 24 Grain': 2424,
+    'City Entrance - 25 Grain': 2425,
+    'City Entrance - 26 Grain': 2426,
+    'City Entrance - 27 Grain': 2427,
+    'City Entrance - 28 Grain': 2428,
+    'City Entrance - 29 Grain': 2429,
+    'City Entrance - 30 Grain': 2430,
+    'City Entrance - 31 Grain': 2431,
+    'City Entrance - 32 Grain': 2432,
+    'City Entrance - 33 Grain': 2433,
+    'City Entrance - 34 Grain': 2434,
+    'City Entrance - 35 Grain': 2435,
+    'City Entrance - 36 Grain': 2436,
+    'City Entrance - 37 Grain': 2437,
+    'City Entrance - 38 Grain': 2438,
+    'City Entrance - 39 Grain': 2439,
+    'City Entrance - 40 Grain': 2440,
+    'City Entrance - 41 Grain': 2441,
+    'City Entrance - 42 Grain': 2442,
+    'City Entrance - 43 Grain': 2443,
+    'City Entrance - 44 Grain': 2444,
+    'City Entrance - 45 Grain': 2445,
+    'City Entrance - 46 Grain': 2446,
+    'City Entrance - 47 Grain': 2447,
+    'City Entrance - 48 Grain': 2448,
+    'City Entrance - 49 Grain': 2449,
+    'City Entrance - 50 Grain': 2450,
+    'City Square - 1 Grain': 2501,
+    'City Square - 2 Grain': 2502,
+    'City Square - 3 Grain': 2503,
+    'City Square - 4 Grain': 2504,
+    'City Square - 5 Grain': 2505,
+    'City Square - 6 Grain': 2506,
+    'City Square - 7 Grain': 2507,
+    'City Square - 8 Grain': 2508,
+    'City Square - 9 Grain': 2509,
+    'City Square - 10 Grain': 2510,
+    'City Square - 11 Grain': 2511,
+    'City Square - 12 Grain': 2512,
+    'City Square - 13 Grain': 2513,
+    'City Square - 14 Grain': 2514,
+    'City Square - 15 Grain': 2515,
+    'City Square - 16 Grain': 2516,
+    'City Square - 17 Grain': 2517,
+    'City Square - 18 Grain': 2518,
+    'City Square - 19 Grain': 2519,
+    'City Square - 20 Grain': 2520,
+    'City Square - 21 Grain': 2521,
+    'City Square - 22 Grain': 2522,
+    'City Square - 23 Grain': 2523,
+    'City Square - 24 Grain': 2524,
+    'City Square - 25 Grain': 2525,
+    'City Square - 26 Grain': 2526,
+    'City Square - 27 Grain': 2527,
+    'City Square - 28 Grain': 2528,
+    'City Square - 29 Grain': 2529,
+    'City Square - 30 Grain': 2530,
+    'City Square - 31 Grain': 2531,
+    'City Square - 32 Grain': 2532,
+    'City Square - 33 Grain': 2533,
+    'City Square - 34 Grain': 2534,
+    'City Square - 35 Grain': 2535,
+    'City Square - 36 Grain': 2536,
+    'City Square - 37 Grain': 2537,
+    'City Square - 38 Grain': 2538,
+    'City Square - 39 Grain': 2539,
+    'City Square - 40 Grain': 2540,
+    'City Square - 41 Grain': 2541,
+    'City Square - 42 Grain': 2542,
+    'City Square - 43 Grain': 2543,
+    'City Square - 44 Grain': 2544,
+    'City Square - 45 Grain': 2545,
+    'City Square - 46 Grain': 2546,
+    'City Square - 47 Grain': 2547,
+    'City Square - 48 Grain': 2548,
+    'City Square - 49 Grain': 2549,
+    'City Square - 50 Grain': 2550,
+    'Cliffside - 1 Grain': 2601,
+    'Cliffside - 2 Grain': 2602,
+    'Cliffside - 3 Grain': 2603,
+    'Cliffside - 4 Grain': 2604,
+    'Cliffside - 5 Grain': 2605,
+    'Cliffside - 6 Grain': 2606,
+    'Cliffside - 7 Grain': 2607,
+    'Cliffside - 8 Grain': 2608,
+    'Cliffside - 9 Grain': 2609,
+    'Cliffside - 10 Grain': 2610,
+    'Cliffside - 11 Grain': 2611,
+    'Cliffside - 12 Grain': 2612,
+    'Cliffside - 13 Grain': 2613,
+    'Cliffside - 14 Grain': 2614,
+    'Cliffside - 15 Grain': 2615,
+    'Cliffside - 16 Grain': 2616,
+    'Cliffside - 17 Grain': 2617,
+    'Cliffside - 18 Grain': 2618,
+    'Cliffside - 19 Grain': 2619,
+    'Cliffside - 20 Grain': 2620,
+    'Cliffside - 21 Grain': 2621,
+    'Cliffside - 22 Grain': 2622,
+    'Cliffside - 23 Grain': 2623,
+    'Cliffside - 24 Grain': 2624,
+    'Cliffside - 25 Grain': 2625,
+    'Cliffside - 26 Grain': 2626,
+    'Cliffside - 27 Grain': 2627,
+    'Cliffside - 28 Grain': 2628,
+    'Cliffside - 29 Grain': 2629,
+    'Cliffside - 30 Grain': 2630,
+    'Cliffside - 31 Grain': 2631,
+    'Cliffside - 32 Grain': 2632,
+    'Cliffside - 33 Grain': 2633,
+    'Cliffside - 34 Grain': 2634,
+    'Cliffside - 35 Grain': 2635,
+    'Cliffside - 36 Grain': 2636,
+    'Cliffside - 37 Grain': 2637,
+    'Cliffside - 38 Grain': 2638,
+    'Cliffside - 39 Grain': 2639,
+    'Cliffside - 40 Grain': 2640,
+    'Cliffside - 41 Grain': 2641,
+    'Cliffside - 42 Grain': 2642,
+    'Cliffside - 43 Grain': 2643,
+    'Cliffside - 44 Grain': 2644,
+    'Cliffside - 45 Grain': 2645,
+    'Cliffside - 46 Grain': 2646,
+    'Cliffside - 47 Grain': 2647,
+    'Cliffside - 48 Grain': 2648,
+    'Cliffside - 49 Grain': 2649,
+    'Cliffside - 50 Grain': 2650,
+    'Clover Forest - 1 Grain': 2701,
+    'Clover Forest - 2 Grain': 2702,
+    'Clover Forest - 3 Grain': 2703,
+    'Clover Forest - 4 Grain': 2704,
+    'Clover Forest - 5 Grain': 2705,
+    'Clover Forest - 6 Grain': 2706,
+    'Clover Forest - 7 Grain': 2707,
+    'Clover Forest - 8 Grain': 2708,
+    'Clover Forest - 9 Grain': 2709,
+    'Clover Forest - 10 Grain': 2710,
+    'Clover Forest - 11 Grain': 2711,
+    'Clover Forest - 12 Grain': 2712,
+    'Clover Forest - 13 Grain': 2713,
+    'Clover Forest - 14 Grain': 2714,
+    'Clover Forest - 15 Grain': 2715,
+    'Clover Forest - 16 Grain': 2716,
+    'Clover Forest - 17 Grain': 2717,
+    'Clover Forest - 18 Grain': 2718,
+    'Clover Forest - 19 Grain': 2719,
+    'Clover Forest - 20 Grain': 2720,
+    'Clover Forest - 21 Grain': 2721,
+    'Clover Forest - 22 Grain': 2722,
+    'Clover Forest - 23 Grain': 2723,
+    'Clover Forest - 24 Grain': 2724,
+    'Clover Forest - 25 Grain': 2725,
+    'Clover Forest - 26 Grain': 2726,
+    'Clover Forest - 27 Grain': 2727,
+    'Clover Forest - 28 Grain': 2728,
+    'Clover Forest - 29 Grain': 2729,
+    'Clover Forest - 30 Grain': 2730,
+    'Clover Forest - 31 Grain': 2731,
+    'Clover Forest - 32 Grain': 2732,
+    'Clover Forest - 33 Grain': 2733,
+    'Clover Forest - 34 Grain': 2734,
+    'Clover Forest - 35 Grain': 2735,
+    'Clover Forest - 36 Grain': 2736,
+    'Clover Forest - 37 Grain': 2737,
+    'Clover Forest - 38 Grain': 2738,
+    'Clover Forest - 39 Grain': 2739,
+    'Clover Forest - 40 Grain': 2740,
+    'Clover Forest - 41 Grain': 2741,
+    'Clover Forest - 42 Grain': 2742,
+    'Clover Forest - 43 Grain': 2743,
+    'Clover Forest - 44 Grain': 2744,
+    'Clover Forest - 45 Grain': 2745,
+    'Clover Forest - 46 Grain': 2746,
+    'Clover Forest - 47 Grain': 2747,
+    'Clover Forest - 48 Grain': 2748,
+    'Clover Forest - 49 Grain': 2749,
+    'Clover Forest - 50 Grain': 2750,
+    'Riverbed Flight - 1 Grain': 2801,
+    'Riverbed Flight - 2 Grain': 2802,
+    'Riverbed Flight - 3 Grain': 2803,
+    'Riverbed Flight - 4 Grain': 2804,
+    'Riverbed Flight - 5 Grain': 2805,
+    'Riverbed Flight - 6 Grain': 2806,
+    'Riverbed Flight - 7 Grain': 2807,
+    'Riverbed Flight - 8 Grain': 2808,
+    'Riverbed Flight - 9 Grain': 2809,
+    'Riverbed Flight - 10 Grain': 2810,
+    'Riverbed Flight - 11 Grain': 2811,
+    'Riverbed Flight - 12 Grain': 2812,
+    'Riverbed Flight - 13 Grain': 2813,
+    'Riverbed Flight - 14 Grain': 2814,
+    'Riverbed Flight - 15 Grain': 2815,
+    'Riverbed Flight - 16 Grain': 2816,
+    'Riverbed Flight - 17 Grain': 2817,
+    'Riverbed Flight - 18 Grain': 2818,
+    'Riverbed Flight - 19 Grain': 2819,
+    'Riverbed Flight - 20 Grain': 2820,
+    'Riverbed Flight - 21 Grain': 2821,
+    'Riverbed Flight - 22 Grain': 2822,
+    'Riverbed Flight - 23 Grain': 2823,
+    'Riverbed Flight - 24 Grain': 2824,
+    'Riverbed Flight - 25 Grain': 2825,
+    'Riverbed Flight - 26 Grain': 2826,
+    'Riverbed Flight - 27 Grain': 2827,
+    'Riverbed Flight - 28 Grain': 2828,
+    'Riverbed Flight - 29 Grain': 2829,
+    'Riverbed Flight - 30 Grain': 2830,
+    'Riverbed Flight - 31 Grain': 2831,
+    'Riverbed Flight - 32 Grain': 2832,
+    'Riverbed Flight - 33 Grain': 2833,
+    'Riverbed Flight - 34 Grain': 2834,
+    'Riverbed Flight - 35 Grain': 2835,
+    'Riverbed Flight - 36 Grain': 2836,
+    'Riverbed Flight - 37 Grain': 2837,
+    'Riverbed Flight - 38 Grain': 2838,
+    'Riverbed Flight - 39 Grain': 2839,
+    'Riverbed Flight - 40 Grain': 2840,
+    'Riverbed Flight - 41 Grain': 2841,
+    'Riverbed Flight - 42 Grain': 2842,
+    'Riverbed Flight - 43 Grain': 2843,
+    'Riverbed Flight - 44 Grain': 2844,
+    'Riverbed Flight - 45 Grain': 2845,
+    'Riverbed Flight - 46 Grain': 2846,
+    'Riverbed Flight - 47 Grain': 2847,
+    'Riverbed Flight - 48 Grain': 2848,
+    'Riverbed Flight - 49 Grain': 2849,
+    'Riverbed Flight - 50 Grain': 2850,
+    'Ant Hill, Part 2 - 1 Grain': 2901,
+    'Ant Hill, Part 2 - 2 Grain': 2902,
+    'Ant Hill, Part 2 - 3 Grain': 2903,
+    'Ant Hill, Part 2 - 4 Grain': 2904,
+    'Ant Hill, Part 2 - 5 Grain': 2905,
+    'Ant Hill, Part 2 - 6 Grain': 2906,
+    'Ant Hill, Part 2 - 7 Grain': 2907,
+    'Ant Hill, Part 2 - 8 Grain': 2908,
+    'Ant Hill, Part 2 - 9 Grain': 2909,
+    'Ant Hill, Part 2 - 10 Grain': 2910,
+    'Ant Hill, Part 2 - 11 Grain': 2911,
+    'Ant Hill, Part 2 - 12 Grain': 2912,
+    'Ant Hill, Part 2 - 13 Grain': 2913,
+    'Ant Hill, Part 2 - 14 Grain': 2914,
+    'Ant Hill, Part 2 - 15 Grain': 2915,
+    'Ant Hill, Part 2 - 16 Grain': 2916,
+    'Ant Hill, Part 2 - 17 Grain': 2917,
+    'Ant Hill, Part 2 - 18 Grain': 2918,
+    'Ant Hill, Part 2 - 19 Grain': 2919,
+    'Ant Hill, Part 2 - 20 Grain': 2920,
+    'Ant Hill, Part 2 - 21 Grain': 2921,
+    'Ant Hill, Part 2 - 22 Grain': 2922,
+    'Ant Hill, Part 2 - 23 Grain': 2923,
+    'Ant Hill, Part 2 - 24 Grain': 2924,
+    'Ant Hill, Part 2 - 25 Grain': 2925,
+    'Ant Hill, Part 2 - 26 Grain': 2926,
+    'Ant Hill, Part 2 - 27 Grain': 2927,
+    'Ant Hill, Part 2 - 28 Grain': 2928,
+    'Ant Hill, Part 2 - 29 Grain': 2929,
+    'Ant Hill, Part 2 - 30 Grain': 2930,
+    'Ant Hill, Part 2 - 31 Grain': 2931,
+    'Ant Hill, Part 2 - 32 Grain': 2932,
+    'Ant Hill, Part 2 - 33 Grain': 2933,
+    'Ant Hill, Part 2 - 34 Grain': 2934,
+    'Ant Hill, Part 2 - 35 Grain': 2935,
+    'Ant Hill, Part 2 - 36 Grain': 2936,
+    'Ant Hill, Part 2 - 37 Grain': 2937,
+    'Ant Hill, Part 2 - 38 Grain': 2938,
+    'Ant Hill, Part 2 - 39 Grain': 2939,
+    'Ant Hill, Part 2 - 40 Grain': 2940,
+    'Ant Hill, Part 2 - 41 Grain': 2941,
+    'Ant Hill, Part 2 - 42 Grain': 2942,
+    'Ant Hill, Part 2 - 43 Grain': 2943,
+    'Ant Hill, Part 2 - 44 Grain': 2944,
+    'Ant Hill, Part 2 - 45 Grain': 2945,
+    'Ant Hill, Part 2 - 46 Grain': 2946,
+    'Ant Hill, Part 2 - 47 Grain': 2947,
+    'Ant Hill, Part 2 - 48 Grain': 2948,
+    'Ant Hill, Part 2 - 49 Grain': 2949,
+    'Ant Hill, Part 2 - 50 Grain': 2950,
+    'Riverbed Canyon - 1 Grain': 3001,
+    'Riverbed Canyon - 2 Grain': 3002,
+    'Riverbed Canyon - 3 Grain': 3003,
+    'Riverbed Canyon - 4 Grain': 3004,
+    'Riverbed Canyon - 5 Grain': 3005,
+    'Riverbed Canyon - 6 Grain': 3006,
+    'Riverbed Canyon - 7 Grain': 3007,
+    'Riverbed Canyon - 8 Grain': 3008,
+    'Riverbed Canyon - 9 Grain': 3009,
+    'Riverbed Canyon - 10 Grain': 3010,
+    'Riverbed Canyon - 11 Grain': 3011,
+    'Riverbed Canyon - 12 Grain': 3012,
+    'Riverbed Canyon - 13 Grain': 3013,
+    'Riverbed Canyon - 14 Grain': 3014,
+    'Riverbed Canyon - 15 Grain': 3015,
+    'Riverbed Canyon - 16 Grain': 3016,
+    'Riverbed Canyon - 17 Grain': 3017,
+    'Riverbed Canyon - 18 Grain': 3018,
+    'Riverbed Canyon - 19 Grain': 3019,
+    'Riverbed Canyon - 20 Grain': 3020,
+    'Riverbed Canyon - 21 Grain': 3021,
+    'Riverbed Canyon - 22 Grain': 3022,
+    'Riverbed Canyon - 23 Grain': 3023,
+    'Riverbed Canyon - 24 Grain': 3024,
+    'Riverbed Canyon - 25 Grain': 3025,
+    'Riverbed Canyon - 26 Grain': 3026,
+    'Riverbed Canyon - 27 Grain': 3027,
+    'Riverbed Canyon - 28 Grain': 3028,
+    'Riverbed Canyon - 29 Grain': 3029,
+    'Riverbed Canyon - 30 Grain': 3030,
+    'Riverbed Canyon - 31 Grain': 3031,
+    'Riverbed Canyon - 32 Grain': 3032,
+    'Riverbed Canyon - 33 Grain': 3033,
+    'Riverbed Canyon - 34 Grain': 3034,
+    'Riverbed Canyon - 35 Grain': 3035,
+    'Riverbed Canyon - 36 Grain': 3036,
+    'Riverbed Canyon - 37 Grain': 3037,
+    'Riverbed Canyon - 38 Grain': 3038,
+    'Riverbed Canyon - 39 Grain': 3039,
+    'Riverbed Canyon - 40 Grain': 3040,
+    'Riverbed Canyon - 41 Grain': 3041,
+    'Riverbed Canyon - 42 Grain': 3042,
+    'Riverbed Canyon - 43 Grain': 3043,
+    'Riverbed Canyon - 44 Grain': 3044,
+    'Riverbed Canyon - 45 Grain': 3045,
+    'Riverbed Canyon - 46 Grain': 3046,
+    'Riverbed Canyon - 47 Grain': 3047,
+    'Riverbed Canyon - 48 Grain': 3048,
+    'Riverbed Canyon - 49 Grain': 3049,
+    'Riverbed Canyon - 50 Grain': 3050,
+    'Bird Nest - 1 Grain': 3101,
+    'Bird Nest - 2 Grain': 3102,
+    'Bird Nest - 3 Grain': 3103,
+    'Bird Nest - 4 Grain': 3104,
+    'Bird Nest - 5 Grain': 3105,
+    'Bird Nest - 6 Grain': 3106,
+    'Bird Nest - 7 Grain': 3107,
+    'Bird Nest - 8 Grain': 3108,
+    'Bird Nest - 9 Grain': 3109,
+    'Bird Nest - 10 Grain': 3110,
+    'Bird Nest - 11 Grain': 3111,
+    'Bird Nest - 12 Grain': 3112,
+    'Bird Nest - 13 Grain': 3113,
+    'Bird Nest - 14 Grain': 3114,
+    'Bird Nest - 15 Grain': 3115,
+    'Bird Nest - 16 Grain': 3116,
+    'Bird Nest - 17 Grain': 3117,
+    'Bird Nest - 18 Grain': 3118,
+    'Bird Nest - 19 Grain': 3119,
+    'Bird Nest - 20 Grain': 3120,
+    'Bird Nest - 21 Grain': 3121,
+    'Bird Nest - 22 Grain': 3122,
+    'Bird Nest - 23 Grain': 3123,
+    'Bird Nest - 24 Grain': 3124,
+    'Bird Nest - 25 Grain': 3125,
+    'Bird Nest - 26 Grain': 3126,
+    'Bird Nest - 27 Grain': 3127,
+    'Bird Nest - 28 Grain': 3128,
+    'Bird Nest - 29 Grain': 3129,
+    'Bird Nest - 30 Grain': 3130,
+    'Bird Nest - 31 Grain': 3131,
+    'Bird Nest - 32 Grain': 3132,
+    'Bird Nest - 33 Grain': 3133,
+    'Bird Nest - 34 Grain': 3134,
+    'Bird Nest - 35 Grain': 3135,
+    'Bird Nest - 36 Grain': 3136,
+    'Bird Nest - 37 Grain': 3137,
+    'Bird Nest - 38 Grain': 3138,
+    'Bird Nest - 39 Grain': 3139,
+    'Bird Nest - 40 Grain': 3140,
+    'Bird Nest - 41 Grain': 3141,
+    'Bird Nest - 42 Grain': 3142,
+    'Bird Nest - 43 Grain': 3143,
+    'Bird Nest - 44 Grain': 3144,
+    'Bird Nest - 45 Grain': 3145,
+    'Bird Nest - 46 Grain': 3146,
+    'Bird Nest - 47 Grain': 3147,
+    'Bird Nest - 48 Grain': 3148,
+    'Bird Nest - 49 Grain': 3149,
+    'Bird Nest - 50 Grain': 3150,
+    'The Tree - 1 Grain': 3201,
+    'The Tree - 2 Grain': 3202,
+    'The Tree - 3 Grain': 3203,
+    'The Tree - 4 Grain': 3204,
+    'The Tree - 5 Grain': 3205,
+    'The Tree - 6 Grain': 3206,
+    'The Tree - 7 Grain': 3207,
+    'The Tree - 8 Grain': 3208,
+    'The Tree - 9 Grain': 3209,
+    'The Tree - 10 Grain': 3210,
+    'The Tree - 11 Grain': 3211,
+    'The Tree - 12 Grain': 3212,
+    'The Tree - 13 Grain': 3213,
+    'The Tree - 14 Grain': 3214,
+    'The Tree - 15 Grain': 3215,
+    'The Tree - 16 Grain': 3216,
+    'The Tree - 17 Grain': 3217,
+    'The Tree - 18 Grain': 3218,
+    'The Tree - 19 Grain': 3219,
+    'The Tree - 20 Grain': 3220,
+    'The Tree - 21 Grain': 3221,
+    'The Tree - 22 Grain': 3222,
+    'The Tree - 23 Grain': 3223,
+    'The Tree - 24 Grain': 3224,
+    'The Tree - 25 Grain': 3225,
+    'The Tree - 26 Grain': 3226,
+    'The Tree - 27 Grain': 3227,
+    'The Tree - 28 Grain': 3228,
+    'The Tree - 29 Grain': 3229,
+    'The Tree - 30 Grain': 3230,
+    'The Tree - 31 Grain': 3231,
+    'The Tree - 32 Grain': 3232,
+    'The Tree - 33 Grain': 3233,
+    'The Tree - 34 Grain': 3234,
+    'The Tree - 35 Grain': 3235,
+    'The Tree - 36 Grain': 3236,
+    'The Tree - 37 Grain': 3237,
+    'The Tree - 38 Grain': 3238,
+    'The Tree - 39 Grain': 3239,
+    'The Tree - 40 Grain': 3240,
+    'The Tree - 41 Grain': 3241,
+    'The Tree - 42 Grain': 3242,
+    'The Tree - 43 Grain': 3243,
+    'The Tree - 44 Grain': 3244,
+    'The Tree - 45 Grain': 3245,
+    'The Tree - 46 Grain': 3246,
+    'The Tree - 47 Grain': 3247,
+    'The Tree - 48 Grain': 3248,
+    'The Tree - 49 Grain': 3249,
+    'The Tree - 50 Grain': 3250,
+    'Battle Arena - 1 Grain': 3301,
+    'Battle Arena - 2 Grain': 3302,
+    'Battle Arena - 3 Grain': 3303,
+    'Battle Arena - 4 Grain': 3304,
+    'Battle Arena - 5 Grain': 3305,
+    'Battle Arena - 6 Grain': 3306,
+    'Battle Arena - 7 Grain': 3307,
+    'Battle Arena - 8 Grain': 3308,
+    'Battle Arena - 9 Grain': 3309,
+    'Battle Arena - 10 Grain': 3310,
+    'Battle Arena - 11 Grain': 3311,
+    'Battle Arena - 12 Grain': 3312,
+    'Battle Arena - 13 Grain': 3313,
+    'Battle Arena - 14 Grain': 3314,
+    'Battle Arena - 15 Grain': 3315,
+    'Battle Arena - 16 Grain': 3316,
+    'Battle Arena - 17 Grain': 3317,
+    'Battle Arena - 18 Grain': 3318,
+    'Battle Arena - 19 Grain': 3319,
+    'Battle Arena - 20 Grain': 3320,
+    'Battle Arena - 21 Grain': 3321,
+    'Battle Arena - 22 Grain': 3322,
+    'Battle Arena - 23 Grain': 3323,
+    'Battle Arena - 24 Grain': 3324,
+    'Battle Arena - 25 Grain': 3325,
+    'Battle Arena - 26 Grain': 3326,
+    'Battle Arena - 27 Grain': 3327,
+    'Battle Arena - 28 Grain': 3328,
+    'Battle Arena - 29 Grain': 3329,
+    'Battle Arena - 30 Grain': 3330,
+    'Battle Arena - 31 Grain': 3331,
+    'Battle Arena - 32 Grain': 3332,
+    'Battle Arena - 33 Grain': 3333,
+    'Battle Arena - 34 Grain': 3334,
+    'Battle Arena - 35 Grain': 3335,
+    'Battle Arena - 36 Grain': 3336,
+    'Battle Arena - 37 Grain': 3337,
+    'Battle Arena - 38 Grain': 3338,
+    'Battle Arena - 39 Grain': 3339,
+    'Battle Arena - 40 Grain': 3340,
+    'Battle Arena - 41 Grain': 3341,
+    'Battle Arena - 42 Grain': 3342,
+    'Battle Arena - 43 Grain': 3343,
+    'Battle Arena - 44 Grain': 3344,
+    'Battle Arena - 45 Grain': 3345,
+    'Battle Arena - 46 Grain': 3346,
+    'Battle Arena - 47 Grain': 3347,
+    'Battle Arena - 48 Grain': 3348,
+    'Battle Arena - 49 Grain': 3349,
+    'Battle Arena - 50 Grain': 3350,
+    'Bug Bar - 1 Grain': 3401,
+    'Bug Bar - 2 Grain': 3402,
+    'Bug Bar - 3 Grain': 3403,
+    'Bug Bar - 4 Grain': 3404,
+    'Bug Bar - 5 Grain': 3405,
+    'Bug Bar - 6 Grain': 3406,
+    'Bug Bar - 7 Grain': 3407,
+    'Bug Bar - 8 Grain': 3408,
+    'Bug Bar - 9 Grain': 3409,
+    'Bug Bar - 10 Grain': 3410,
+    'Bug Bar - 11 Grain': 3411,
+    'Bug Bar - 12 Grain': 3412,
+    'Bug Bar - 13 Grain': 3413,
+    'Bug Bar - 14 Grain': 3414,
+    'Bug Bar - 15 Grain': 3415,
+    'Bug Bar - 16 Grain': 3416,
+    'Bug Bar - 17 Grain': 3417,
+    'Bug Bar - 18 Grain': 3418,
+    'Bug Bar - 19 Grain': 3419,
+    'Bug Bar - 20 Grain': 3420,
+    'Bug Bar - 21 Grain': 3421,
+    'Bug Bar - 22 Grain': 3422,
+    'Bug Bar - 23 Grain': 3423,
+    'Bug Bar - 24 Grain': 3424,
+    'Bug Bar - 25 Grain': 3425,
+    'Bug Bar - 26 Grain': 3426,
+    'Bug Bar - 27 Grain': 3427,
+    'Bug Bar - 28 Grain': 3428,
+    'Bug Bar - 29 Grain': 3429,
+    'Bug Bar - 30 Grain': 3430,
+    'Bug Bar - 31 Grain': 3431,
+    'Bug Bar - 32 Grain': 3432,
+    'Bug Bar - 33 Grain': 3433,
+    'Bug Bar - 34 Grain': 3434,
+    'Bug Bar - 35 Grain': 3435,
+    'Bug Bar - 36 Grain': 3436,
+    'Bug Bar - 37 Grain': 3437,
+    'Bug Bar - 38 Grain': 3438,
+    'Bug Bar - 39 Grain': 3439,
+    'Bug Bar - 40 Grain': 3440,
+    'Bug Bar - 41 Grain': 3441,
+    'Bug Bar - 42 Grain': 3442,
+    'Bug Bar - 43 Grain': 3443,
+    'Bug Bar - 44 Grain': 3444,
+    'Bug Bar - 45 Grain': 3445,
+    'Bug Bar - 46 Grain': 3446,
+    'Bug Bar - 47 Grain': 3447,
+    'Bug Bar - 48 Grain': 3448,
+    'Bug Bar - 49 Grain': 3449,
+    'Bug Bar - 50 Grain': 3450,
+    'Canyon Showdown - 1 Grain': 3501,
+    'Canyon Showdown - 2 Grain': 3502,
+    'Canyon Showdown - 3 Grain': 3503,
+    'Canyon Showdown - 4 Grain': 3504,
+    'Canyon Showdown - 5 Grain': 3505,
+    'Canyon Showdown - 6 Grain': 3506,
+    'Canyon Showdown - 7 Grain': 3507,
+    'Canyon Showdown - 8 Grain': 3508,
+    'Canyon Showdown - 9 Grain': 3509,
+    'Canyon Showdown - 10 Grain': 3510,
+    'Canyon Showdown - 11 Grain': 3511,
+    'Canyon Showdown - 12 Grain': 3512,
+    'Canyon Showdown - 13 Grain': 3513,
+    'Canyon Showdown - 14 Grain': 3514,
+    'Canyon Showdown - 15 Grain': 3515,
+    'Canyon Showdown - 16 Grain': 3516,
+    'Canyon Showdown - 17 Grain': 3517,
+    'Canyon Showdown - 18 Grain': 3518,
+    'Canyon Showdown - 19 Grain': 3519,
+    'Canyon Showdown - 20 Grain': 3520,
+    'Canyon Showdown - 21 Grain': 3521,
+    'Canyon Showdown - 22 Grain': 3522,
+    'Canyon Showdown - 23 Grain': 3523,
+    'Canyon Showdown - 24 Grain': 3524,
+    'Canyon Showdown - 25 Grain': 3525,
+    'Canyon Showdown - 26 Grain': 3526,
+    'Canyon Showdown - 27 Grain': 3527,
+    'Canyon Showdown - 28 Grain': 3528,
+    'Canyon Showdown - 29 Grain': 3529,
+    'Canyon Showdown - 30 Grain': 3530,
+    'Canyon Showdown - 31 Grain': 3531,
+    'Canyon Showdown - 32 Grain': 3532,
+    'Canyon Showdown - 33 Grain': 3533,
+    'Canyon Showdown - 34 Grain': 3534,
+    'Canyon Showdown - 35 Grain': 3535,
+    'Canyon Showdown - 36 Grain': 3536,
+    'Canyon Showdown - 37 Grain': 3537,
+    'Canyon Showdown - 38 Grain': 3538,
+    'Canyon Showdown - 39 Grain': 3539,
+    'Canyon Showdown - 40 Grain': 3540,
+    'Canyon Showdown - 41 Grain': 3541,
+    'Canyon Showdown - 42 Grain': 3542,
+    'Canyon Showdown - 43 Grain': 3543,
+    'Canyon Showdown - 44 Grain': 3544,
+    'Canyon Showdown - 45 Grain': 3545,
+    'Canyon Showdown - 46 Grain': 3546,
+    'Canyon Showdown - 47 Grain': 3547,
+    'Canyon Showdown - 48 Grain': 3548,
+    'Canyon Showdown - 49 Grain': 3549,
+    'Canyon Showdown - 50 Grain': 3550,
+    'Training - 1 Grain': 3701,
+    'Training - 2 Grain': 3702,
+    'Training - 3 Grain': 3703,
+    'Training - 4 Grain': 3704,
+    'Training - 5 Grain': 3705,
+    'Training - 6 Grain': 3706,
+    'Training - 7 Grain': 3707,
+    'Training - 8 Grain': 3708,
+    'Training - 9 Grain': 3709,
+    'Training - 10 Grain': 3710,
+    'Training - 11 Grain': 3711,
+    'Training - 12 Grain': 3712,
+    'Training - 13 Grain': 3713,
+    'Training - 14 Grain': 3714,
+    'Training - 15 Grain': 3715,
+    'Training - 16 Grain': 3716,
+    'Training - 17 Grain': 3717,
+    'Training - 18 Grain': 3718,
+    'Training - 19 Grain': 3719,
+    'Training - 20 Grain': 3720,
+    'Training - 21 Grain': 3721,
+    'Training - 22 Grain': 3722,
+    'Training - 23 Grain': 3723,
+    'Training - 24 Grain': 3724,
+    'Training - 25 Grain': 3725,
+    'Training - 26 Grain': 3726,
+    'Training - 27 Grain': 3727,
+    'Training - 28 Grain': 3728,
+    'Training - 29 Grain': 3729,
+    'Training - 30 Grain': 3730,
+    'Training - 31 Grain': 3731,
+    'Training - 32 Grain': 3732,
+    'Training - 33 Grain': 3733,
+    'Training - 34 Grain': 3734,
+    'Training - 35 Grain': 3735,
+    'Training - 36 Grain': 3736,
+    'Training - 37 Grain': 3737,
+    'Training - 38 Grain': 3738,
+    'Training - 39 Grain': 3739,
+    'Training - 40 Grain': 3740,
+    'Training - 41 Grain': 3741,
+    'Training - 42 Grain': 3742,
+    'Training - 43 Grain': 3743,
+    'Training - 44 Grain': 3744,
+    'Training - 45 Grain': 3745,
+    'Training - 46 Grain': 3746,
+    'Training - 47 Grain': 3747,
+    'Training - 48 Grain': 3748,
+    'Training - 49 Grain': 3749,
+    'Training - 50 Grain': 3750,
+    'Ant Hill - 25% Enemies': 3011,
+    'Ant Hill - 50% Enemies': 3012,
+    'Ant Hill - 75% Enemies': 3013,
+    'Ant Hill - 100% Enemies': 3014,
+    'Council Chamber - 25% Enemies': 3021,
+    'Council Chamber - 50% Enemies': 3022,
+    'Council Chamber - 75% Enemies': 3023,
+    'Council Chamber - 100% Enemies': 3024,
+    'Tunnels - 25% Enemies': 3031,
+    'Tunnels - 50% Enemies': 3032,
+    'Tunnels - 75% Enemies': 3033,
+    'Tunnels - 100% Enemies': 3034,
+    'City Entrance - 25% Enemies': 3041,
+    'City Entrance - 50% Enemies': 3042,
+    'City Entrance - 75% Enemies': 3043,
+    'City Entrance - 100% Enemies': 3044,
+    'City Square - 25% Enemies': 3051,
+    'City Square - 50% Enemies': 3052,
+    'City Square - 75% Enemies': 3053,
+    'City Square - 100% Enemies': 3054,
+    'Cliffside - 25% Enemies': 3061,
+    'Cliffside - 50% Enemies': 3062,
+    'Cliffside - 75% Enemies': 3063,
+    'Cliffside - 100% Enemies': 3064,
+    'Clover Forest - 25% Enemies': 3071,
+    'Clover Forest - 50% Enemies': 3072,
+    'Clover Forest - 75% Enemies': 3073,
+    'Clover Forest - 100% Enemies': 3074,
+    'Riverbed Flight - 25% Enemies': 3081,
+    'Riverbed Flight - 50% Enemies': 3082,
+    'Riverbed Flight - 75% Enemies': 3083,
+    'Riverbed Flight - 100% Enemies': 3084,
+    'Ant Hill, Part 2 - 25% Enemies': 3091,
+    'Ant Hill, Part 2 - 50% Enemies': 3092,
+    'Ant Hill, Part 2 - 75% Enemies': 3093,
+    'Ant Hill, Part 2 - 100% Enemies': 3094,
+    'Riverbed Canyon - 25% Enemies': 3101,
+    'Riverbed Canyon - 50% Enemies': 3102,
+    'Riverbed Canyon - 75% Enemies': 3103,
+    'Riverbed Canyon - 100% Enemies': 3104,
+    'Bird Nest - 25% Enemies': 3111,
+    'Bird Nest - 50% Enemies': 3112,
+    'Bird Nest - 75% Enemies': 3113,
+    'Bird Nest - 100% Enemies': 3114,
+    'The Tree - 25% Enemies': 3121,
+    'The Tree - 50% Enemies': 3122,
+    'The Tree - 75% Enemies': 3123,
+    'The Tree - 100% Enemies': 3124,
+    'Battle Arena - 25% Enemies': 3131,
+    'Battle Arena - 50% Enemies': 3132,
+    'Battle Arena - 75% Enemies': 3133,
+    'Battle Arena - 100% Enemies': 3134,
+    'Bug Bar - 25% Enemies': 3141,
+    'Bug Bar - 50% Enemies': 3142,
+    'Bug Bar - 75% Enemies': 3143,
+    'Bug Bar - 100% Enemies': 3144,
+    'Canyon Showdown - 25% Enemies': 3151,
+    'Canyon Showdown - 50% Enemies': 3152,
+    'Canyon Showdown - 75% Enemies': 3153,
+    'Canyon Showdown - 100% Enemies': 3154,
+    'Training - 25% Enemies': 3171,
+    'Training - 50% Enemies': 3172,
+    'Training - 75% Enemies': 3173,
+    'Training - 100% Enemies': 3174,
+}
+
+ITEM_NAME_GROUPS = {
+    'Ant Hill': {
+        'Progressive Berry Upgrade - Ant Hill',
+        'Progressive Blue Seed Upgrade - Ant Hill',
+        'Progressive Brown Seed Upgrade - Ant Hill',
+        'Progressive Green Seed Upgrade - Ant Hill',
+        'Progressive Purple Seed Upgrade - Ant Hill',
+        'Progressive Yellow Seed Upgrade - Ant Hill',
+    },
+    'Berries': {
+        'Progressive Berry Upgrade - Ant Hill',
+        'Progressive Berry Upgrade - Ant Hill, Part 2',
+        'Progressive Berry Upgrade - Battle Arena',
+        'Progressive Berry Upgrade - Bird Nest',
+        'Progressive Berry Upgrade - Bug Bar',
+        'Progressive Berry Upgrade - Canyon Showdown',
+        'Progressive Berry Upgrade - City Entrance',
+        'Progressive Berry Upgrade - City Square',
+        'Progressive Berry Upgrade - Cliffside',
+        'Progressive Berry Upgrade - Clover Forest',
+        'Progressive Berry Upgrade - Council Chamber',
+        'Progressive Berry Upgrade - Riverbed Canyon',
+        'Progressive Berry Upgrade - Riverbed Flight',
+        'Progressive Berry Upgrade - The Tree',
+        'Progressive Berry Upgrade - Training',
+        'Progressive Berry Upgrade - Tunnels',
+    },
+    'Brown Seeds': {
+        'Progressive Brown Seed Upgrade - Ant Hill',
+        'Progressive Brown Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Brown Seed Upgrade - Battle Arena',
+        'Progressive Brown Seed Upgrade - Bird Nest',
+        'Progressive Brown Seed Upgrade - Bug Bar',
+        'Progressive Brown Seed Upgrade - Canyon Showdown',
+        'Progressive Brown Seed Upgrade - City Entrance',
+        'Progressive Brown Seed Upgrade - City Square',
+        'Progressive Brown Seed Upgrade - Cliffside',
+        'Progressive Brown Seed Upgrade - Clover Forest',
+        'Progressive Brown Seed Upgrade - Council Chamber',
+        'Progressive Brown Seed Upgrade - Riverbed Canyon',
+        'Progressive Brown Seed Upgrade - Riverbed Flight',
+        'Progressive Brown Seed Upgrade - The Tree',
+        'Progressive Brown Seed Upgrade - Training',
+        'Progressive Brown Seed Upgrade - Tunnels',
+    },
+    'Seeds': {
+        'Progressive Blue Seed Upgrade - Ant Hill',
+        'Progressive Blue Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Blue Seed Upgrade - Battle Arena',
+        'Progressive Blue Seed Upgrade - Bird Nest',
+        'Progressive Blue Seed Upgrade - Bug Bar',
+        'Progressive Blue Seed Upgrade - Canyon Showdown',
+        'Progressive Blue Seed Upgrade - City Entrance',
+        'Progressive Blue Seed Upgrade - City Square',
+        'Progressive Blue Seed Upgrade - Cliffside',
+        'Progressive Blue Seed Upgrade - Clover Forest',
+        'Progressive Blue Seed Upgrade - Council Chamber',
+        'Progressive Blue Seed Upgrade - Riverbed Canyon',
+        'Progressive Blue Seed Upgrade - Riverbed Flight',
+        'Progressive Blue Seed Upgrade - The Tree',
+        'Progressive Blue Seed Upgrade - Training',
+        'Progressive Blue Seed Upgrade - Tunnels',
+        'Progressive Brown Seed Upgrade - Ant Hill',
+        'Progressive Brown Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Brown Seed Upgrade - Battle Arena',
+        'Progressive Brown Seed Upgrade - Bird Nest',
+        'Progressive Brown Seed Upgrade - Bug Bar',
+        'Progressive Brown Seed Upgrade - Canyon Showdown',
+        'Progressive Brown Seed Upgrade - City Entrance',
+        'Progressive Brown Seed Upgrade - City Square',
+        'Progressive Brown Seed Upgrade - Cliffside',
+        'Progressive Brown Seed Upgrade - Clover Forest',
+        'Progressive Brown Seed Upgrade - Council Chamber',
+        'Progressive Brown Seed Upgrade - Riverbed Canyon',
+        'Progressive Brown Seed Upgrade - Riverbed Flight',
+        'Progressive Brown Seed Upgrade - The Tree',
+        'Progressive Brown Seed Upgrade - Training',
+        'Progressive Brown Seed Upgrade - Tunnels',
+        'Progressive Green Seed Upgrade - Ant Hill',
+        'Progressive Green Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Green Seed Upgrade - Battle Arena',
+        'Progressive Green Seed Upgrade - Bird Nest',
+        'Progressive Green Seed Upgrade - Bug Bar',
+        'Progressive Green Seed Upgrade - Canyon Showdown',
+        'Progressive Green Seed Upgrade - City Entrance',
+        'Progressive Green Seed Upgrade - City Square',
+        'Progressive Green Seed Upgrade - Cliffside',
+        'Progressive Green Seed Upgrade - Clover Forest',
+        'Progressive Green Seed Upgrade - Council Chamber',
+        'Progressive Green Seed Upgrade - Riverbed Canyon',
+        'Progressive Green Seed Upgrade - Riverbed Flight',
+        'Progressive Green Seed Upgrade - The Tree',
+        'Progressive Green Seed Upgrade - Training',
+        'Progressive Green Seed Upgrade - Tunnels',
+        'Progressive Purple Seed Upgrade - Ant Hill',
+        'Progressive Purple Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Purple Seed Upgrade - Battle Arena',
+        'Progressive Purple Seed Upgrade - Bird Nest',
+        'Progressive Purple Seed Upgrade - Bug Bar',
+        'Progressive Purple Seed Upgrade - Canyon Showdown',
+        'Progressive Purple Seed Upgrade - City Entrance',
+        'Progressive Purple Seed Upgrade - City Square',
+        'Progressive Purple Seed Upgrade - Cliffside',
+        'Progressive Purple Seed Upgrade - Clover Forest',
+        'Progressive Purple Seed Upgrade - Council Chamber',
+        'Progressive Purple Seed Upgrade - Riverbed Canyon',
+        'Progressive Purple Seed Upgrade - Riverbed Flight',
+        'Progressive Purple Seed Upgrade - The Tree',
+        'Progressive Purple Seed Upgrade - Training',
+        'Progressive Purple Seed Upgrade - Tunnels',
+        'Progressive Yellow Seed Upgrade - Ant Hill',
+        'Progressive Yellow Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Yellow Seed Upgrade - Battle Arena',
+        'Progressive Yellow Seed Upgrade - Bird Nest',
+        'Progressive Yellow Seed Upgrade - Bug Bar',
+        'Progressive Yellow Seed Upgrade - Canyon Showdown',
+        'Progressive Yellow Seed Upgrade - City Entrance',
+        'Progressive Yellow Seed Upgrade - City Square',
+        'Progressive Yellow Seed Upgrade - Cliffside',
+        'Progressive Yellow Seed Upgrade - Clover Forest',
+        'Progressive Yellow Seed Upgrade - Council Chamber',
+        'Progressive Yellow Seed Upgrade - Riverbed Canyon',
+        'Progressive Yellow Seed Upgrade - Riverbed Flight',
+        'Progressive Yellow Seed Upgrade - The Tree',
+        'Progressive Yellow Seed Upgrade - Training',
+        'Progressive Yellow Seed Upgrade - Tunnels',
+    },
+    'Green Seeds': {
+        'Progressive Green Seed Upgrade - Ant Hill',
+        'Progressive Green Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Green Seed Upgrade - Battle Arena',
+        'Progressive Green Seed Upgrade - Bird Nest',
+        'Progressive Green Seed Upgrade - Bug Bar',
+        'Progressive Green Seed Upgrade - Canyon Showdown',
+        'Progressive Green Seed Upgrade - City Entrance',
+        'Progressive Green Seed Upgrade - City Square',
+        'Progressive Green Seed Upgrade - Cliffside',
+        'Progressive Green Seed Upgrade - Clover Forest',
+        'Progressive Green Seed Upgrade - Council Chamber',
+        'Progressive Green Seed Upgrade - Riverbed Canyon',
+        'Progressive Green Seed Upgrade - Riverbed Flight',
+        'Progressive Green Seed Upgrade - The Tree',
+        'Progressive Green Seed Upgrade - Training',
+        'Progressive Green Seed Upgrade - Tunnels',
+    },
+    'Blue Seeds': {
+        'Progressive Blue Seed Upgrade - Ant Hill',
+        'Progressive Blue Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Blue Seed Upgrade - Battle Arena',
+        'Progressive Blue Seed Upgrade - Bird Nest',
+        'Progressive Blue Seed Upgrade - Bug Bar',
+        'Progressive Blue Seed Upgrade - Canyon Showdown',
+        'Progressive Blue Seed Upgrade - City Entrance',
+        'Progressive Blue Seed Upgrade - City Square',
+        'Progressive Blue Seed Upgrade - Cliffside',
+        'Progressive Blue Seed Upgrade - Clover Forest',
+        'Progressive Blue Seed Upgrade - Council Chamber',
+        'Progressive Blue Seed Upgrade - Riverbed Canyon',
+        'Progressive Blue Seed Upgrade - Riverbed Flight',
+        'Progressive Blue Seed Upgrade - The Tree',
+        'Progressive Blue Seed Upgrade - Training',
+        'Progressive Blue Seed Upgrade - Tunnels',
+    },
+    'Purple Seeds': {
+        'Progressive Purple Seed Upgrade - Ant Hill',
+        'Progressive Purple Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Purple Seed Upgrade - Battle Arena',
+        'Progressive Purple Seed Upgrade - Bird Nest',
+        'Progressive Purple Seed Upgrade - Bug Bar',
+        'Progressive Purple Seed Upgrade - Canyon Showdown',
+        'Progressive Purple Seed Upgrade - City Entrance',
+        'Progressive Purple Seed Upgrade - City Square',
+        'Progressive Purple Seed Upgrade - Cliffside',
+        'Progressive Purple Seed Upgrade - Clover Forest',
+        'Progressive Purple Seed Upgrade - Council Chamber',
+        'Progressive Purple Seed Upgrade - Riverbed Canyon',
+        'Progressive Purple Seed Upgrade - Riverbed Flight',
+        'Progressive Purple Seed Upgrade - The Tree',
+        'Progressive Purple Seed Upgrade - Training',
+        'Progressive Purple Seed Upgrade - Tunnels',
+    },
+    'Yellow Seeds': {
+        'Progressive Yellow Seed Upgrade - Ant Hill',
+        'Progressive Yellow Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Yellow Seed Upgrade - Battle Arena',
+        'Progressive Yellow Seed Upgrade - Bird Nest',
+        'Progressive Yellow Seed Upgrade - Bug Bar',
+        'Progressive Yellow Seed Upgrade - Canyon Showdown',
+        'Progressive Yellow Seed Upgrade - City Entrance',
+        'Progressive Yellow Seed Upgrade - City Square',
+        'Progressive Yellow Seed Upgrade - Cliffside',
+        'Progressive Yellow Seed Upgrade - Clover Forest',
+        'Progressive Yellow Seed Upgrade - Council Chamber',
+        'Progressive Yellow Seed Upgrade - Riverbed Canyon',
+        'Progressive Yellow Seed Upgrade - Riverbed Flight',
+        'Progressive Yellow Seed Upgrade - The Tree',
+        'Progressive Yellow Seed Upgrade - Training',
+        'Progressive Yellow Seed Upgrade - Tunnels',
+    },
+    'Council Chamber': {
+        'Progressive Berry Upgrade - Council Chamber',
+        'Progressive Blue Seed Upgrade - Council Chamber',
+        'Progressive Brown Seed Upgrade - Council Chamber',
+        'Progressive Green Seed Upgrade - Council Chamber',
+        'Progressive Purple Seed Upgrade - Council Chamber',
+        'Progressive Yellow Seed Upgrade - Council Chamber',
+    },
+    'Tunnels': {
+        'Progressive Berry Upgrade - Tunnels',
+        'Progressive Blue Seed Upgrade - Tunnels',
+        'Progressive Brown Seed Upgrade - Tunnels',
+        'Progressive Green Seed Upgrade - Tunnels',
+        'Progressive Purple Seed Upgrade - Tunnels',
+        'Progressive Yellow Seed Upgrade - Tunnels',
+    },
+    'City Entrance': {
+        'Progressive Berry Upgrade - City Entrance',
+        'Progressive Blue Seed Upgrade - City Entrance',
+        'Progressive Brown Seed Upgrade - City Entrance',
+        'Progressive Green Seed Upgrade - City Entrance',
+        'Progressive Purple Seed Upgrade - City Entrance',
+        'Progressive Yellow Seed Upgrade - City Entrance',
+    },
+    'City Square': {
+        'Progressive Berry Upgrade - City Square',
+        'Progressive Blue Seed Upgrade - City Square',
+        'Progressive Brown Seed Upgrade - City Square',
+        'Progressive Green Seed Upgrade - City Square',
+        'Progressive Purple Seed Upgrade - City Square',
+        'Progressive Yellow Seed Upgrade - City Square',
+    },
+    'Cliffside': {
+        'Progressive Berry Upgrade - Cliffside',
+        'Progressive Blue Seed Upgrade - Cliffside',
+        'Progressive Brown Seed Upgrade - Cliffside',
+        'Progressive Green Seed Upgrade - Cliffside',
+        'Progressive Purple Seed Upgrade - Cliffside',
+        'Progressive Yellow Seed Upgrade - Cliffside',
+    },
+    'Clover Forest': {
+        'Progressive Berry Upgrade - Clover Forest',
+        'Progressive Blue Seed Upgrade - Clover Forest',
+        'Progressive Brown Seed Upgrade - Clover Forest',
+        'Progressive Green Seed Upgrade - Clover Forest',
+        'Progressive Purple Seed Upgrade - Clover Forest',
+        'Progressive Yellow Seed Upgrade - Clover Forest',
+    },
+    'Riverbed Flight': {
+        'Progressive Berry Upgrade - Riverbed Flight',
+        'Progressive Blue Seed Upgrade - Riverbed Flight',
+        'Progressive Brown Seed Upgrade - Riverbed Flight',
+        'Progressive Green Seed Upgrade - Riverbed Flight',
+        'Progressive Purple Seed Upgrade - Riverbed Flight',
+        'Progressive Yellow Seed Upgrade - Riverbed Flight',
+    },
+    'Ant Hill, Part 2': {
+        'Progressive Berry Upgrade - Ant Hill, Part 2',
+        'Progressive Blue Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Brown Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Green Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Purple Seed Upgrade - Ant Hill, Part 2',
+        'Progressive Yellow Seed Upgrade - Ant Hill, Part 2',
+    },
+    'Riverbed Canyon': {
+        'Progressive Berry Upgrade - Riverbed Canyon',
+        'Progressive Blue Seed Upgrade - Riverbed Canyon',
+        'Progressive Brown Seed Upgrade - Riverbed Canyon',
+        'Progressive Green Seed Upgrade - Riverbed Canyon',
+        'Progressive Purple Seed Upgrade - Riverbed Canyon',
+        'Progressive Yellow Seed Upgrade - Riverbed Canyon',
+    },
+    'Bird Nest': {
+        'Progressive Berry Upgrade - Bird Nest',
+        'Progressive Blue Seed Upgrade - Bird Nest',
+        'Progressive Brown Seed Upgrade - Bird Nest',
+        'Progressive Green Seed Upgrade - Bird Nest',
+        'Progressive Purple Seed Upgrade - Bird Nest',
+        'Progressive Yellow Seed Upgrade - Bird Nest',
+    },
+    'The Tree': {
+        'Progressive Berry Upgrade - The Tree',
+        'Progressive Blue Seed Upgrade - The Tree',
+        'Progressive Brown Seed Upgrade - The Tree',
+        'Progressive Green Seed Upgrade - The Tree',
+        'Progressive Purple Seed Upgrade - The Tree',
+        'Progressive Yellow Seed Upgrade - The Tree',
+    },
+    'Battle Arena': {
+        'Progressive Berry Upgrade - Battle Arena',
+        'Progressive Blue Seed Upgrade - Battle Arena',
+        'Progressive Brown Seed Upgrade - Battle Arena',
+        'Progressive Green Seed Upgrade - Battle Arena',
+        'Progressive Purple Seed Upgrade - Battle Arena',
+        'Progressive Yellow Seed Upgrade - Battle Arena',
+    },
+    'Bug Bar': {
+        'Progressive Berry Upgrade - Bug Bar',
+        'Progressive Blue Seed Upgrade - Bug Bar',
+        'Progressive Brown Seed Upgrade - Bug Bar',
+        'Progressive Green Seed Upgrade - Bug Bar',
+        'Progressive Purple Seed Upgrade - Bug Bar',
+        'Progressive Yellow Seed Upgrade - Bug Bar',
+    },
+    'Canyon Showdown': {
+        'Progressive Berry Upgrade - Canyon Showdown',
+        'Progressive Blue Seed Upgrade - Canyon Showdown',
+        'Progressive Brown Seed Upgrade - Canyon Showdown',
+        'Progressive Green Seed Upgrade - Canyon Showdown',
+        'Progressive Purple Seed Upgrade - Canyon Showdown',
+        'Progressive Yellow Seed Upgrade - Canyon Showdown',
+    },
+    'Training': {
+        'Progressive Berry Upgrade - Training',
+        'Progressive Blue Seed Upgrade - Training',
+        'Progressive Brown Seed Upgrade - Training',
+        'Progressive Green Seed Upgrade - Training',
+        'Progressive Purple Seed Upgrade - Training',
+        'Progressive Yellow Seed Upgrade - Training',
+    },
+}
+
+LOCATION_NAME_GROUPS = {
+    'Ant Hill': {
+        'Ant Hill - 1 Grain',
+        'Ant Hill - 10 Grain',
+        'Ant Hill - 100% Enemies',
+        'Ant Hill - 11 Grain',
+        'Ant Hill - 12 Grain',
+        'Ant Hill - 13 Grain',
+        'Ant Hill - 14 Grain',
+        'Ant Hill - 15 Grain',
+        'Ant Hill - 16 Grain',
+        'Ant Hill - 17 Grain',
+        'Ant Hill - 18 Grain',
+        'Ant Hill - 19 Grain',
+        'Ant Hill - 2 Grain',
+        'Ant Hill - 20 Grain',
+        'Ant Hill - 21 Grain',
+        'Ant Hill - 22 Grain',
+        'Ant Hill - 23 Grain',
+        'Ant Hill - 24 Grain',
+        'Ant Hill - 25 Grain',
+        'Ant Hill - 25% Enemies',
+        'Ant Hill - 26 Grain',
+        'Ant Hill - 27 Grain',
+        'Ant Hill - 28 Grain',
+        'Ant Hill - 29 Grain',
+        'Ant Hill - 3 Grain',
+        'Ant Hill - 30 Grain',
+        'Ant Hill - 31 Grain',
+        'Ant Hill - 32 Grain',
+        'Ant Hill - 33 Grain',
+        'Ant Hill - 34 Grain',
+        'Ant Hill - 35 Grain',
+        'Ant Hill - 36 Grain',
+        'Ant Hill - 37 Grain',
+        'Ant Hill - 38 Grain',
+        'Ant Hill - 39 Grain',
+        'Ant Hill - 4 Grain',
+        'Ant Hill - 40 Grain',
+        'Ant Hill - 41 Grain',
+        'Ant Hill - 42 Grain',
+        'Ant Hill - 43 Grain',
+        'Ant Hill - 44 Grain',
+        'Ant Hill - 45 Grain',
+        'Ant Hill - 46 Grain',
+        'Ant Hill - 47 Grain',
+        'Ant Hill - 48 Grain',
+        'Ant Hill - 49 Grain',
+        'Ant Hill - 5 Grain',
+        'Ant Hill - 50 Grain',
+        'Ant Hill - 50% Enemies',
+        'Ant Hill - 6 Grain',
+        'Ant Hill - 7 Grain',
+        'Ant Hill - 75% Enemies',
+        'Ant Hill - 8 Grain',
+        'Ant Hill - 9 Grain',
+        'Ant Hill - All Enemies',
+        'Ant Hill - All Grain',
+        'Ant Hill - F Letter',
+        'Ant Hill - FLIK Letters',
+        'Ant Hill - I Letter',
+        'Ant Hill - K Letter',
+        'Ant Hill - L Letter',
+        'Ant Hill - Level Complete',
+    },
+    'F Letter': {
+        'Ant Hill - F Letter',
+        'Ant Hill, Part 2 - F Letter',
+        'Battle Arena - F Letter',
+        'Bird Nest - F Letter',
+        'Bug Bar - F Letter',
+        'Canyon Showdown - F Letter',
+        'City Entrance - F Letter',
+        'City Square - F Letter',
+        'Cliffside - F Letter',
+        'Clover Forest - F Letter',
+        'Council Chamber - F Letter',
+        'Riverbed Canyon - F Letter',
+        'Riverbed Flight - F Letter',
+        'The Tree - F Letter',
+        'Training - F Letter',
+        'Tunnels - F Letter',
+    },
+    'Individual FLIK Letters': {
+        'Ant Hill - F Letter',
+        'Ant Hill - I Letter',
+        'Ant Hill - K Letter',
+        'Ant Hill - L Letter',
+        'Ant Hill, Part 2 - F Letter',
+        'Ant Hill, Part 2 - I Letter',
+        'Ant Hill, Part 2 - K Letter',
+        'Ant Hill, Part 2 - L Letter',
+        'Battle Arena - F Letter',
+        'Battle Arena - I Letter',
+        'Battle Arena - K Letter',
+        'Battle Arena - L Letter',
+        'Bird Nest - F Letter',
+        'Bird Nest - I Letter',
+        'Bird Nest - K Letter',
+        'Bird Nest - L Letter',
+        'Bug Bar - F Letter',
+        'Bug Bar - I Letter',
+        'Bug Bar - K Letter',
+        'Bug Bar - L Letter',
+        'Canyon Showdown - F Letter',
+        'Canyon Showdown - I Letter',
+        'Canyon Showdown - K Letter',
+        'Canyon Showdown - L Letter',
+        'City Entrance - F Letter',
+        'City Entrance - I Letter',
+        'City Entrance - K Letter',
+        'City Entrance - L Letter',
+        'City Square - F Letter',
+        'City Square - I Letter',
+        'City Square - K Letter',
+        'City Square - L Letter',
+        'Cliffside - F Letter',
+        'Cliffside - I Letter',
+        'Cliffside - K Letter',
+        'Cliffside - L Letter',
+        'Clover Forest - F Letter',
+        'Clover Forest - I Letter',
+        'Clover Forest - K Letter',
+        'Clover Forest - L Letter',
+        'Council Chamber - F Letter',
+        'Council Chamber - I Letter',
+        'Council Chamber - K Letter',
+        'Council Chamber - L Letter',
+        'Riverbed Canyon - F Letter',
+        'Riverbed Canyon - I Letter',
+        'Riverbed Canyon - K Letter',
+        'Riverbed Canyon - L Letter',
+        'Riverbed Flight - F Letter',
+        'Riverbed Flight - I Letter',
+        'Riverbed Flight - K Letter',
+        'Riverbed Flight - L Letter',
+        'The Tree - F Letter',
+        'The Tree - I Letter',
+        'The Tree - K Letter',
+        'The Tree - L Letter',
+        'Training - F Letter',
+        'Training - I Letter',
+        'Training - K Letter',
+        'Training - L Letter',
+        'Tunnels - F Letter',
+        'Tunnels - I Letter',
+        'Tunnels - K Letter',
+        'Tunnels - L Letter',
+    },
+    'L Letter': {
+        'Ant Hill - L Letter',
+        'Ant Hill, Part 2 - L Letter',
+        'Battle Arena - L Letter',
+        'Bird Nest - L Letter',
+        'Bug Bar - L Letter',
+        'Canyon Showdown - L Letter',
+        'City Entrance - L Letter',
+        'City Square - L Letter',
+        'Cliffside - L Letter',
+        'Clover Forest - L Letter',
+        'Council Chamber - L Letter',
+        'Riverbed Canyon - L Letter',
+        'Riverbed Flight - L Letter',
+        'The Tree - L Letter',
+        'Training - L Letter',
+        'Tunnels - L Letter',
+    },
+    'I Letter': {
+        'Ant Hill - I Letter',
+        'Ant Hill, Part 2 - I Letter',
+        'Battle Arena - I Letter',
+        'Bird Nest - I Letter',
+        'Bug Bar - I Letter',
+        'Canyon Showdown - I Letter',
+        'City Entrance - I Letter',
+        'City Square - I Letter',
+        'Cliffside - I Letter',
+        'Clover Forest - I Letter',
+        'Council Chamber - I Letter',
+        'Riverbed Canyon - I Letter',
+        'Riverbed Flight - I Letter',
+        'The Tree - I Letter',
+        'Training - I Letter',
+        'Tunnels - I Letter',
+    },
+    'K Letter': {
+        'Ant Hill - K Letter',
+        'Ant Hill, Part 2 - K Letter',
+        'Battle Arena - K Letter',
+        'Bird Nest - K Letter',
+        'Bug Bar - K Letter',
+        'Canyon Showdown - K Letter',
+        'City Entrance - K Letter',
+        'City Square - K Letter',
+        'Cliffside - K Letter',
+        'Clover Forest - K Letter',
+        'Council Chamber - K Letter',
+        'Riverbed Canyon - K Letter',
+        'Riverbed Flight - K Letter',
+        'The Tree - K Letter',
+        'Training - K Letter',
+        'Tunnels - K Letter',
+    },
+    'FLIK Letters': {
+        'Ant Hill - FLIK Letters',
+        'Ant Hill, Part 2 - FLIK Letters',
+        'Battle Arena - FLIK Letters',
+        'Bird Nest - FLIK Letters',
+        'Bug Bar - FLIK Letters',
+        'Canyon Showdown - FLIK Letters',
+        'City Entrance - FLIK Letters',
+        'City Square - FLIK Letters',
+        'Cliffside - FLIK Letters',
+        'Clover Forest - FLIK Letters',
+        'Council Chamber - FLIK Letters',
+        'Riverbed Canyon - FLIK Letters',
+        'Riverbed Flight - FLIK Letters',
+        'The Tree - FLIK Letters',
+        'Training - FLIK Letters',
+        'Tunnels - FLIK Letters',
+    },
+    'All Grain': {
+        'Ant Hill - All Grain',
+        'Ant Hill, Part 2 - All Grain',
+        'Battle Arena - All Grain',
+        'Bird Nest - All Grain',
+        'Bug Bar - All Grain',
+        'Canyon Showdown - All Grain',
+        'City Entrance - All Grain',
+        'City Square - All Grain',
+        'Cliffside - All Grain',
+        'Clover Forest - All Grain',
+        'Council Chamber - All Grain',
+        'Riverbed Canyon - All Grain',
+        'Riverbed Flight - All Grain',
+        'The Tree - All Grain',
+        'Training - All Grain',
+        'Tunnels - All Grain',
+    },
+    'All Enemies': {
+        'Ant Hill - All Enemies',
+        'Ant Hill, Part 2 - All Enemies',
+        'Battle Arena - All Enemies',
+        'Bird Nest - All Enemies',
+        'Bug Bar - All Enemies',
+        'Canyon Showdown - All Enemies',
+        'City Entrance - All Enemies',
+        'City Square - All Enemies',
+        'Cliffside - All Enemies',
+        'Clover Forest - All Enemies',
+        'Council Chamber - All Enemies',
+        'Riverbed Canyon - All Enemies',
+        'Riverbed Flight - All Enemies',
+        'The Tree - All Enemies',
+        'Training - All Enemies',
+        'Tunnels - All Enemies',
+    },
+    'Level Complete': {
+        'Ant Hill - Level Complete',
+        'Ant Hill, Part 2 - Level Complete',
+        'Battle Arena - Level Complete',
+        'Bird Nest - Level Complete',
+        'Bug Bar - Level Complete',
+        'Canyon Showdown - Level Complete',
+        'City Entrance - Level Complete',
+        'City Square - Level Complete',
+        'Cliffside - Level Complete',
+        'Clover Forest - Level Complete',
+        'Council Chamber - Level Complete',
+        'Riverbed Canyon - Level Complete',
+        'Riverbed Flight - Level Complete',
+        'The Tree - Level Complete',
+        'Training - Level Complete',
+        'Tunnels - Level Complete',
+    },
+    '1 Grain': {
+        'Ant Hill - 1 Grain',
+        'Ant Hill, Part 2 - 1 Grain',
+        'Battle Arena - 1 Grain',
+        'Bird Nest - 1 Grain',
+        'Bug Bar - 1 Grain',
+        'Canyon Showdown - 1 Grain',
+        'City Entrance - 1 Grain',
+        'City Square - 1 Grain',
+        'Cliffside - 1 Grain',
+        'Clover Forest - 1 Grain',
+        'Council Chamber - 1 Grain',
+        'Riverbed Canyon - 1 Grain',
+        'Riverbed Flight - 1 Grain',
+        'The Tree - 1 Grain',
+        'Training - 1 Grain',
+        'Tunnels - 1 Grain',
+    },
+    'Grainsanity': {
+        'Ant Hill - 1 Grain',
+        'Ant Hill - 10 Grain',
+        'Ant Hill - 11 Grain',
+        'Ant Hill - 12 Grain',
+        'Ant Hill - 13 Grain',
+        'Ant Hill - 14 Grain',
+        'Ant Hill - 15 Grain',
+        'Ant Hill - 16 Grain',
+        'Ant Hill - 17 Grain',
+        'Ant Hill - 18 Grain',
+        'Ant Hill - 19 Grain',
+        'Ant Hill - 2 Grain',
+        'Ant Hill - 20 Grain',
+        'Ant Hill - 21 Grain',
+        'Ant Hill - 22 Grain',
+        'Ant Hill - 23 Grain',
+        'Ant Hill - 24 Grain',
+        'Ant Hill - 25 Grain',
+        'Ant Hill - 26 Grain',
+        'Ant Hill - 27 Grain',
+        'Ant Hill - 28 Grain',
+        'Ant Hill - 29 Grain',
+        'Ant Hill - 3 Grain',
+        'Ant Hill - 30 Grain',
+        'Ant Hill - 31 Grain',
+        'Ant Hill - 32 Grain',
+        'Ant Hill - 33 Grain',
+        'Ant Hill - 34 Grain',
+        'Ant Hill - 35 Grain',
+        'Ant Hill - 36 Grain',
+        'Ant Hill - 37 Grain',
+        'Ant Hill - 38 Grain',
+        'Ant Hill - 39 Grain',
+        'Ant Hill - 4 Grain',
+        'Ant Hill - 40 Grain',
+        'Ant Hill - 41 Grain',
+        'Ant Hill - 42 Grain',
+        'Ant Hill - 43 Grain',
+        'Ant Hill - 44 Grain',
+        'Ant Hill - 45 Grain',
+        'Ant Hill - 46 Grain',
+        'Ant Hill - 47 Grain',
+        'Ant Hill - 48 Grain',
+        'Ant Hill - 49 Grain',
+        'Ant Hill - 5 Grain',
+        'Ant Hill - 50 Grain',
+        'Ant Hill - 6 Grain',
+        'Ant Hill - 7 Grain',
+        'Ant Hill - 8 Grain',
+        'Ant Hill - 9 Grain',
+        'Ant Hill, Part 2 - 1 Grain',
+        'Ant Hill, Part 2 - 10 Grain',
+        'Ant Hill, Part 2 - 11 Grain',
+        'Ant Hill, Part 2 - 12 Grain',
+        'Ant Hill, Part 2 - 13 Grain',
+        'Ant Hill, Part 2 - 14 Grain',
+        'Ant Hill, Part 2 - 15 Grain',
+        'Ant Hill, Part 2 - 16 Grain',
+        'Ant Hill, Part 2 - 17 Grain',
+        'Ant Hill, Part 2 - 18 Grain',
+        'Ant Hill, Part 2 - 19 Grain',
+        'Ant Hill, Part 2 - 2 Grain',
+        'Ant Hill, Part 2 - 20 Grain',
+        'Ant Hill, Part 2 - 21 Grain',
+        'Ant Hill, Part 2 - 22 Grain',
+        'Ant Hill, Part 2 - 23 Grain',
+        'Ant Hill, Part 2 - 24 Grain',
+        'Ant Hill, Part 2 - 25 Grain',
+        'Ant Hill, Part 2 - 26 Grain',
+        'Ant Hill, Part 2 - 27 Grain',
+        'Ant Hill, Part 2 - 28 Grain',
+        'Ant Hill, Part 2 - 29 Grain',
+        'Ant Hill, Part 2 - 3 Grain',
+        'Ant Hill, Part 2 - 30 Grain',
+        'Ant Hill, Part 2 - 31 Grain',
+        'Ant Hill, Part 2 - 32 Grain',
+        'Ant Hill, Part 2 - 33 Grain',
+        'Ant Hill, Part 2 - 34 Grain',
+        'Ant Hill, Part 2 - 35 Grain',
+        'Ant Hill, Part 2 - 36 Grain',
+        'Ant Hill, Part 2 - 37 Grain',
+        'Ant Hill, Part 2 - 38 Grain',
+        'Ant Hill, Part 2 - 39 Grain',
+        'Ant Hill, Part 2 - 4 Grain',
+        'Ant Hill, Part 2 - 40 Grain',
+        'Ant Hill, Part 2 - 41 Grain',
+        'Ant Hill, Part 2 - 42 Grain',
+        'Ant Hill, Part 2 - 43 Grain',
+        'Ant Hill, Part 2 - 44 Grain',
+        'Ant Hill, Part 2 - 45 Grain',
+        'Ant Hill, Part 2 - 46 Grain',
+        'Ant Hill, Part 2 - 47 Grain',
+        'Ant Hill, Part 2 - 48 Grain',
+        'Ant Hill, Part 2 - 49 Grain',
+        'Ant Hill, Part 2 - 5 Grain',
+        'Ant Hill, Part 2 - 50 Grain',
+        'Ant Hill, Part 2 - 6 Grain',
+        'Ant Hill, Part 2 - 7 Grain',
+        'Ant Hill, Part 2 - 8 Grain',
+        'Ant Hill, Part 2 - 9 Grain',
+        'Battle Arena - 1 Grain',
+        'Battle Arena - 10 Grain',
+        'Battle Arena - 11 Grain',
+        'Battle Arena - 12 Grain',
+        'Battle Arena - 13 Grain',
+        'Battle Arena - 14 Grain',
+        'Battle Arena - 15 Grain',
+        'Battle Arena - 16 Grain',
+        'Battle Arena - 17 Grain',
+        'Battle Arena - 18 Grain',
+        'Battle Arena - 19 Grain',
+        'Battle Arena - 2 Grain',
+        'Battle Arena - 20 Grain',
+        'Battle Arena - 21 Grain',
+        'Battle Arena - 22 Grain',
+        'Battle Arena - 23 Grain',
+        'Battle Arena - 24 Grain',
+        'Battle Arena - 25 Grain',
+        'Battle Arena - 26 Grain',
+        'Battle Arena - 27 Grain',
+        'Battle Arena - 28 Grain',
+        'Battle Arena - 29 Grain',
+        'Battle Arena - 3 Grain',
+        'Battle Arena - 30 Grain',
+        'Battle Arena - 31 Grain',
+        'Battle Arena - 32 Grain',
+        'Battle Arena - 33 Grain',
+        'Battle Arena - 34 Grain',
+        'Battle Arena - 35 Grain',
+        'Battle Arena - 36 Grain',
+        'Battle Arena - 37 Grain',
+        'Battle Arena - 38 Grain',
+        'Battle Arena - 39 Grain',
+        'Battle Arena - 4 Grain',
+        'Battle Arena - 40 Grain',
+        'Battle Arena - 41 Grain',
+        'Battle Arena - 42 Grain',
+        'Battle Arena - 43 Grain',
+        'Battle Arena - 44 Grain',
+        'Battle Arena - 45 Grain',
+        'Battle Arena - 46 Grain',
+        'Battle Arena - 47 Grain',
+        'Battle Arena - 48 Grain',
+        'Battle Arena - 49 Grain',
+        'Battle Arena - 5 Grain',
+        'Battle Arena - 50 Grain',
+        'Battle Arena - 6 Grain',
+        'Battle Arena - 7 Grain',
+        'Battle Arena - 8 Grain',
+        'Battle Arena - 9 Grain',
+        'Bird Nest - 1 Grain',
+        'Bird Nest - 10 Grain',
+        'Bird Nest - 11 Grain',
+        'Bird Nest - 12 Grain',
+        'Bird Nest - 13 Grain',
+        'Bird Nest - 14 Grain',
+        'Bird Nest - 15 Grain',
+        'Bird Nest - 16 Grain',
+        'Bird Nest - 17 Grain',
+        'Bird Nest - 18 Grain',
+        'Bird Nest - 19 Grain',
+        'Bird Nest - 2 Grain',
+        'Bird Nest - 20 Grain',
+        'Bird Nest - 21 Grain',
+        'Bird Nest - 22 Grain',
+        'Bird Nest - 23 Grain',
+        'Bird Nest - 24 Grain',
+        'Bird Nest - 25 Grain',
+        'Bird Nest - 26 Grain',
+        'Bird Nest - 27 Grain',
+        'Bird Nest - 28 Grain',
+        'Bird Nest - 29 Grain',
+        'Bird Nest - 3 Grain',
+        'Bird Nest - 30 Grain',
+        'Bird Nest - 31 Grain',
+        'Bird Nest - 32 Grain',
+        'Bird Nest - 33 Grain',
+        'Bird Nest - 34 Grain',
+        'Bird Nest - 35 Grain',
+        'Bird Nest - 36 Grain',
+        'Bird Nest - 37 Grain',
+        'Bird Nest - 38 Grain',
+        'Bird Nest - 39 Grain',
+        'Bird Nest - 4 Grain',
+        'Bird Nest - 40 Grain',
+        'Bird Nest - 41 Grain',
+        'Bird Nest - 42 Grain',
+        'Bird Nest - 43 Grain',
+        'Bird Nest - 44 Grain',
+        'Bird Nest - 45 Grain',
+        'Bird Nest - 46 Grain',
+        'Bird Nest - 47 Grain',
+        'Bird Nest - 48 Grain',
+        'Bird Nest - 49 Grain',
+        'Bird Nest - 5 Grain',
+        'Bird Nest - 50 Grain',
+        'Bird Nest - 6 Grain',
+        'Bird Nest - 7 Grain',
+        'Bird Nest - 8 Grain',
+        'Bird Nest - 9 Grain',
+        'Bug Bar - 1 Grain',
+        'Bug Bar - 10 Grain',
+        'Bug Bar - 11 Grain',
+        'Bug Bar - 12 Grain',
+        'Bug Bar - 13 Grain',
+        'Bug Bar - 14 Grain',
+        'Bug Bar - 15 Grain',
+        'Bug Bar - 16 Grain',
+        'Bug Bar - 17 Grain',
+        'Bug Bar - 18 Grain',
+        'Bug Bar - 19 Grain',
+        'Bug Bar - 2 Grain',
+        'Bug Bar - 20 Grain',
+        'Bug Bar - 21 Grain',
+        'Bug Bar - 22 Grain',
+        'Bug Bar - 23 Grain',
+        'Bug Bar - 24 Grain',
+        'Bug Bar - 25 Grain',
+        'Bug Bar - 26 Grain',
+        'Bug Bar - 27 Grain',
+        'Bug Bar - 28 Grain',
+        'Bug Bar - 29 Grain',
+        'Bug Bar - 3 Grain',
+        'Bug Bar - 30 Grain',
+        'Bug Bar - 31 Grain',
+        'Bug Bar - 32 Grain',
+        'Bug Bar - 33 Grain',
+        'Bug Bar - 34 Grain',
+        'Bug Bar - 35 Grain',
+        'Bug Bar - 36 Grain',
+        'Bug Bar - 37 Grain',
+        'Bug Bar - 38 Grain',
+        'Bug Bar - 39 Grain',
+        'Bug Bar - 4 Grain',
+        'Bug Bar - 40 Grain',
+        'Bug Bar - 41 Grain',
+        'Bug Bar - 42 Grain',
+        'Bug Bar - 43 Grain',
+        'Bug Bar - 44 Grain',
+        'Bug Bar - 45 Grain',
+        'Bug Bar - 46 Grain',
+        'Bug Bar - 47 Grain',
+        'Bug Bar - 48 Grain',
+        'Bug Bar - 49 Grain',
+        'Bug Bar - 5 Grain',
+        'Bug Bar - 50 Grain',
+        'Bug Bar - 6 Grain',
+        'Bug Bar - 7 Grain',
+        'Bug Bar - 8 Grain',
+        'Bug Bar - 9 Grain',
+        'Canyon Showdown - 1 Grain',
+        'Canyon Showdown - 10 Grain',
+        'Canyon Showdown - 11 Grain',
+        'Canyon Showdown - 12 Grain',
+        'Canyon Showdown - 13 Grain',
+        'Canyon Showdown - 14 Grain',
+        'Canyon Showdown - 15 Grain',
+        'Canyon Showdown - 16 Grain',
+        'Canyon Showdown - 17 Grain',
+        'Canyon Showdown - 18 Grain',
+        'Canyon Showdown - 19 Grain',
+        'Canyon Showdown - 2 Grain',
+        'Canyon Showdown - 20 Grain',
+        'Canyon Showdown - 21 Grain',
+        'Canyon Showdown - 22 Grain',
+        'Canyon Showdown - 23 Grain',
+        'Canyon Showdown - 24 Grain',
+        'Canyon Showdown - 25 Grain',
+        'Canyon Showdown - 26 Grain',
+        'Canyon Showdown - 27 Grain',
+        'Canyon Showdown - 28 Grain',
+        'Canyon Showdown - 29 Grain',
+        'Canyon Showdown - 3 Grain',
+        'Canyon Showdown - 30 Grain',
+        'Canyon Showdown - 31 Grain',
+        'Canyon Showdown - 32 Grain',
+        'Canyon Showdown - 33 Grain',
+        'Canyon Showdown - 34 Grain',
+        'Canyon Showdown - 35 Grain',
+        'Canyon Showdown - 36 Grain',
+        'Canyon Showdown - 37 Grain',
+        'Canyon Showdown - 38 Grain',
+        'Canyon Showdown - 39 Grain',
+        'Canyon Showdown - 4 Grain',
+        'Canyon Showdown - 40 Grain',
+        'Canyon Showdown - 41 Grain',
+        'Canyon Showdown - 42 Grain',
+        'Canyon Showdown - 43 Grain',
+        'Canyon Showdown - 44 Grain',
+        'Canyon Showdown - 45 Grain',
+        'Canyon Showdown - 46 Grain',
+        'Canyon Showdown - 47 Grain',
+        'Canyon Showdown - 48 Grain',
+        'Canyon Showdown - 49 Grain',
+        'Canyon Showdown - 5 Grain',
+        'Canyon Showdown - 50 Grain',
+        'Canyon Showdown - 6 Grain',
+        'Canyon Showdown - 7 Grain',
+        'Canyon Showdown - 8 Grain',
+        'Canyon Showdown - 9 Grain',
+        'City Entrance - 1 Grain',
+        'City Entrance - 10 Grain',
+        'City Entrance - 11 Grain',
+        'City Entrance - 12 Grain',
+        'City Entrance - 13 Grain',
+        'City Entrance - 14 Grain',
+        'City Entrance - 15 Grain',
+        'City Entrance - 16 Grain',
+        'City Entrance - 17 Grain',
+        'City Entrance - 18 Grain',
+        'City Entrance - 19 Grain',
+        'City Entrance - 2 Grain',
+        'City Entrance - 20 Grain',
+        'City Entrance - 21 Grain',
+        'City Entrance - 22 Grain',
+        'City Entrance - 23 Grain',
+        'City Entrance - 24 Grain',
+        'City Entrance - 25 Grain',
+        'City Entrance - 26 Grain',
+        'City Entrance - 27 Grain',
+        'City Entrance - 28 Grain',
+        'City Entrance - 29 Grain',
+        'City Entrance - 3 Grain',
+        'City Entrance - 30 Grain',
+        'City Entrance - 31 Grain',
+        'City Entrance - 32 Grain',
+        'City Entrance - 33 Grain',
+        'City Entrance - 34 Grain',
+        'City Entrance - 35 Grain',
+        'City Entrance - 36 Grain',
+        'City Entrance - 37 Grain',
+        'City Entrance - 38 Grain',
+        'City Entrance - 39 Grain',
+        'City Entrance - 4 Grain',
+        'City Entrance - 40 Grain',
+        'City Entrance - 41 Grain',
+        'City Entrance - 42 Grain',
+        'City Entrance - 43 Grain',
+        'City Entrance - 44 Grain',
+        'City Entrance - 45 Grain',
+        'City Entrance - 46 Grain',
+        'City Entrance - 47 Grain',
+        'City Entrance - 48 Grain',
+        'City Entrance - 49 Grain',
+        'City Entrance - 5 Grain',
+        'City Entrance - 50 Grain',
+        'City Entrance - 6 Grain',
+        'City Entrance - 7 Grain',
+        'City Entrance - 8 Grain',
+        'City Entrance - 9 Grain',
+        'City Square - 1 Grain',
+        'City Square - 10 Grain',
+        'City Square - 11 Grain',
+        'City Square - 12 Grain',
+        'City Square - 13 Grain',
+        'City Square - 14 Grain',
+        'City Square - 15 Grain',
+        'City Square - 16 Grain',
+        'City Square - 17 Grain',
+        'City Square - 18 Grain',
+        'City Square - 19 Grain',
+        'City Square - 2 Grain',
+        'City Square - 20 Grain',
+        'City Square - 21 Grain',
+        'City Square - 22 Grain',
+        'City Square - 23 Grain',
+        'City Square - 24 Grain',
+        'City Square - 25 Grain',
+        'City Square - 26 Grain',
+        'City Square - 27 Grain',
+        'City Square - 28 Grain',
+        'City Square - 29 Grain',
+        'City Square - 3 Grain',
+        'City Square - 30 Grain',
+        'City Square - 31 Grain',
+        'City Square - 32 Grain',
+        'City Square - 33 Grain',
+        'City Square - 34 Grain',
+        'City Square - 35 Grain',
+        'City Square - 36 Grain',
+        'City Square - 37 Grain',
+        'City Square - 38 Grain',
+        'City Square - 39 Grain',
+        'City Square - 4 Grain',
+        'City Square - 40 Grain',
+        'City Square - 41 Grain',
+        'City Square - 42 Grain',
+        'City Square - 43 Grain',
+        'City Square - 44 Grain',
+        'City Square - 45 Grain',
+        'City Square - 46 Grain',
+        'City Square - 47 Grain',
+        'City Square - 48 Grain',
+        'City Square - 49 Grain',
+        'City Square - 5 Grain',
+        'City Square - 50 Grain',
+        'City Square - 6 Grain',
+        'City Square - 7 Grain',
+        'City Square - 8 Grain',
+        'City Square - 9 Grain',
+        'Cliffside - 1 Grain',
+        'Cliffside - 10 Grain',
+        'Cliffside - 11 Grain',
+        'Cliffside - 12 Grain',
+        'Cliffside - 13 Grain',
+        'Cliffside - 14 Grain',
+        'Cliffside - 15 Grain',
+        'Cliffside - 16 Grain',
+        'Cliffside - 17 Grain',
+        'Cliffside - 18 Grain',
+        'Cliffside - 19 Grain',
+        'Cliffside - 2 Grain',
+        'Cliffside - 20 Grain',
+        'Cliffside - 21 Grain',
+        'Cliffside - 22 Grain',
+        'Cliffside - 23 Grain',
+        'Cliffside - 24 Grain',
+        'Cliffside - 25 Grain',
+        'Cliffside - 26 Grain',
+        'Cliffside - 27 Grain',
+        'Cliffside - 28 Grain',
+        'Cliffside - 29 Grain',
+        'Cliffside - 3 Grain',
+        'Cliffside - 30 Grain',
+        'Cliffside - 31 Grain',
+        'Cliffside - 32 Grain',
+        'Cliffside - 33 Grain',
+        'Cliffside - 34 Grain',
+        'Cliffside - 35 Grain',
+        'Cliffside - 36 Grain',
+        'Cliffside - 37 Grain',
+        'Cliffside - 38 Grain',
+        'Cliffside - 39 Grain',
+        'Cliffside - 4 Grain',
+        'Cliffside - 40 Grain',
+        'Cliffside - 41 Grain',
+        'Cliffside - 42 Grain',
+        'Cliffside - 43 Grain',
+        'Cliffside - 44 Grain',
+        'Cliffside - 45 Grain',
+        'Cliffside - 46 Grain',
+        'Cliffside - 47 Grain',
+        'Cliffside - 48 Grain',
+        'Cliffside - 49 Grain',
+        'Cliffside - 5 Grain',
+        'Cliffside - 50 Grain',
+        'Cliffside - 6 Grain',
+        'Cliffside - 7 Grain',
+        'Cliffside - 8 Grain',
+        'Cliffside - 9 Grain',
+        'Clover Forest - 1 Grain',
+        'Clover Forest - 10 Grain',
+        'Clover Forest - 11 Grain',
+        'Clover Forest - 12 Grain',
+        'Clover Forest - 13 Grain',
+        'Clover Forest - 14 Grain',
+        'Clover Forest - 15 Grain',
+        'Clover Forest - 16 Grain',
+        'Clover Forest - 17 Grain',
+        'Clover Forest - 18 Grain',
+        'Clover Forest - 19 Grain',
+        'Clover Forest - 2 Grain',
+        'Clover Forest - 20 Grain',
+        'Clover Forest - 21 Grain',
+        'Clover Forest - 22 Grain',
+        'Clover Forest - 23 Grain',
+        'Clover Forest - 24 Grain',
+        'Clover Forest - 25 Grain',
+        'Clover Forest - 26 Grain',
+        'Clover Forest - 27 Grain',
+        'Clover Forest - 28 Grain',
+        'Clover Forest - 29 Grain',
+        'Clover Forest - 3 Grain',
+        'Clover Forest - 30 Grain',
+        'Clover Forest - 31 Grain',
+        'Clover Forest - 32 Grain',
+        'Clover Forest - 33 Grain',
+        'Clover Forest - 34 Grain',
+        'Clover Forest - 35 Grain',
+        'Clover Forest - 36 Grain',
+        'Clover Forest - 37 Grain',
+        'Clover Forest - 38 Grain',
+        'Clover Forest - 39 Grain',
+        'Clover Forest - 4 Grain',
+        'Clover Forest - 40 Grain',
+        'Clover Forest - 41 Grain',
+        'Clover Forest - 42 Grain',
+        'Clover Forest - 43 Grain',
+        'Clover Forest - 44 Grain',
+        'Clover Forest - 45 Grain',
+        'Clover Forest - 46 Grain',
+        'Clover Forest - 47 Grain',
+        'Clover Forest - 48 Grain',
+        'Clover Forest - 49 Grain',
+        'Clover Forest - 5 Grain',
+        'Clover Forest - 50 Grain',
+        'Clover Forest - 6 Grain',
+        'Clover Forest - 7 Grain',
+        'Clover Forest - 8 Grain',
+        'Clover Forest - 9 Grain',
+        'Council Chamber - 1 Grain',
+        'Council Chamber - 10 Grain',
+        'Council Chamber - 11 Grain',
+        'Council Chamber - 12 Grain',
+        'Council Chamber - 13 Grain',
+        'Council Chamber - 14 Grain',
+        'Council Chamber - 15 Grain',
+        'Council Chamber - 16 Grain',
+        'Council Chamber - 17 Grain',
+        'Council Chamber - 18 Grain',
+        'Council Chamber - 19 Grain',
+        'Council Chamber - 2 Grain',
+        'Council Chamber - 20 Grain',
+        'Council Chamber - 21 Grain',
+        'Council Chamber - 22 Grain',
+        'Council Chamber - 23 Grain',
+        'Council Chamber - 24 Grain',
+        'Council Chamber - 25 Grain',
+        'Council Chamber - 26 Grain',
+        'Council Chamber - 27 Grain',
+        'Council Chamber - 28 Grain',
+        'Council Chamber - 29 Grain',
+        'Council Chamber - 3 Grain',
+        'Council Chamber - 30 Grain',
+        'Council Chamber - 31 Grain',
+        'Council Chamber - 32 Grain',
+        'Council Chamber - 33 Grain',
+        'Council Chamber - 34 Grain',
+        'Council Chamber - 35 Grain',
+        'Council Chamber - 36 Grain',
+        'Council Chamber - 37 Grain',
+        'Council Chamber - 38 Grain',
+        'Council Chamber - 39 Grain',
+        'Council Chamber - 4 Grain',
+        'Council Chamber - 40 Grain',
+        'Council Chamber - 41 Grain',
+        'Council Chamber - 42 Grain',
+        'Council Chamber - 43 Grain',
+        'Council Chamber - 44 Grain',
+        'Council Chamber - 45 Grain',
+        'Council Chamber - 46 Grain',
+        'Council Chamber - 47 Grain',
+        'Council Chamber - 48 Grain',
+        'Council Chamber - 49 Grain',
+        'Council Chamber - 5 Grain',
+        'Council Chamber - 50 Grain',
+        'Council Chamber - 6 Grain',
+        'Council Chamber - 7 Grain',
+        'Council Chamber - 8 Grain',
+        'Council Chamber - 9 Grain',
+        'Riverbed Canyon - 1 Grain',
+        'Riverbed Canyon - 10 Grain',
+        'Riverbed Canyon - 11 Grain',
+        'Riverbed Canyon - 12 Grain',
+        'Riverbed Canyon - 13 Grain',
+        'Riverbed Canyon - 14 Grain',
+        'Riverbed Canyon - 15 Grain',
+        'Riverbed Canyon - 16 Grain',
+        'Riverbed Canyon - 17 Grain',
+        'Riverbed Canyon - 18 Grain',
+        'Riverbed Canyon - 19 Grain',
+        'Riverbed Canyon - 2 Grain',
+        'Riverbed Canyon - 20 Grain',
+        'Riverbed Canyon - 21 Grain',
+        'Riverbed Canyon - 22 Grain',
+        'Riverbed Canyon - 23 Grain',
+        'Riverbed Canyon - 24 Grain',
+        'Riverbed Canyon - 25 Grain',
+        'Riverbed Canyon - 26 Grain',
+        'Riverbed Canyon - 27 Grain',
+        'Riverbed Canyon - 28 Grain',
+        'Riverbed Canyon - 29 Grain',
+        'Riverbed Canyon - 3 Grain',
+        'Riverbed Canyon - 30 Grain',
+        'Riverbed Canyon - 31 Grain',
+        'Riverbed Canyon - 32 Grain',
+        'Riverbed Canyon - 33 Grain',
+        'Riverbed Canyon - 34 Grain',
+        'Riverbed Canyon - 35 Grain',
+        'Riverbed Canyon - 36 Grain',
+        'Riverbed Canyon - 37 Grain',
+        'Riverbed Canyon - 38 Grain',
+        'Riverbed Canyon - 39 Grain',
+        'Riverbed Canyon - 4 Grain',
+        'Riverbed Canyon - 40 Grain',
+        'Riverbed Canyon - 41 Grain',
+        'Riverbed Canyon - 42 Grain',
+        'Riverbed Canyon - 43 Grain',
+        'Riverbed Canyon - 44 Grain',
+        'Riverbed Canyon - 45 Grain',
+        'Riverbed Canyon - 46 Grain',
+        'Riverbed Canyon - 47 Grain',
+        'Riverbed Canyon - 48 Grain',
+        'Riverbed Canyon - 49 Grain',
+        'Riverbed Canyon - 5 Grain',
+        'Riverbed Canyon - 50 Grain',
+        'Riverbed Canyon - 6 Grain',
+        'Riverbed Canyon - 7 Grain',
+        'Riverbed Canyon - 8 Grain',
+        'Riverbed Canyon - 9 Grain',
+        'Riverbed Flight - 1 Grain',
+        'Riverbed Flight - 10 Grain',
+        'Riverbed Flight - 11 Grain',
+        'Riverbed Flight - 12 Grain',
+        'Riverbed Flight - 13 Grain',
+        'Riverbed Flight - 14 Grain',
+        'Riverbed Flight - 15 Grain',
+        'Riverbed Flight - 16 Grain',
+        'Riverbed Flight - 17 Grain',
+        'Riverbed Flight - 18 Grain',
+        'Riverbed Flight - 19 Grain',
+        'Riverbed Flight - 2 Grain',
+        'Riverbed Flight - 20 Grain',
+        'Riverbed Flight - 21 Grain',
+        'Riverbed Flight - 22 Grain',
+        'Riverbed Flight - 23 Grain',
+        'Riverbed Flight - 24 Grain',
+        'Riverbed Flight - 25 Grain',
+        'Riverbed Flight - 26 Grain',
+        'Riverbed Flight - 27 Grain',
+        'Riverbed Flight - 28 Grain',
+        'Riverbed Flight - 29 Grain',
+        'Riverbed Flight - 3 Grain',
+        'Riverbed Flight - 30 Grain',
+        'Riverbed Flight - 31 Grain',
+        'Riverbed Flight - 32 Grain',
+        'Riverbed Flight - 33 Grain',
+        'Riverbed Flight - 34 Grain',
+        'Riverbed Flight - 35 Grain',
+        'Riverbed Flight - 36 Grain',
+        'Riverbed Flight - 37 Grain',
+        'Riverbed Flight - 38 Grain',
+        'Riverbed Flight - 39 Grain',
+        'Riverbed Flight - 4 Grain',
+        'Riverbed Flight - 40 Grain',
+        'Riverbed Flight - 41 Grain',
+        'Riverbed Flight - 42 Grain',
+        'Riverbed Flight - 43 Grain',
+        'Riverbed Flight - 44 Grain',
+        'Riverbed Flight - 45 Grain',
+        'Riverbed Flight - 46 Grain',
+        'Riverbed Flight - 47 Grain',
+        'Riverbed Flight - 48 Grain',
+        'Riverbed Flight - 49 Grain',
+        'Riverbed Flight - 5 Grain',
+        'Riverbed Flight - 50 Grain',
+        'Riverbed Flight - 6 Grain',
+        'Riverbed Flight - 7 Grain',
+        'Riverbed Flight - 8 Grain',
+        'Riverbed Flight - 9 Grain',
+        'The Tree - 1 Grain',
+        'The Tree - 10 Grain',
+        'The Tree - 11 Grain',
+        'The Tree - 12 Grain',
+        'The Tree - 13 Grain',
+        'The Tree - 14 Grain',
+        'The Tree - 15 Grain',
+        'The Tree - 16 Grain',
+        'The Tree - 17 Grain',
+        'The Tree - 18 Grain',
+        'The Tree - 19 Grain',
+        'The Tree - 2 Grain',
+        'The Tree - 20 Grain',
+        'The Tree - 21 Grain',
+        'The Tree - 22 Grain',
+        'The Tree - 23 Grain',
+        'The Tree - 24 Grain',
+        'The Tree - 25 Grain',
+        'The Tree - 26 Grain',
+        'The Tree - 27 Grain',
+        'The Tree - 28 Grain',
+        'The Tree - 29 Grain',
+        'The Tree - 3 Grain',
+        'The Tree - 30 Grain',
+        'The Tree - 31 Grain',
+        'The Tree - 32 Grain',
+        'The Tree - 33 Grain',
+        'The Tree - 34 Grain',
+        'The Tree - 35 Grain',
+        'The Tree - 36 Grain',
+        'The Tree - 37 Grain',
+        'The Tree - 38 Grain',
+        'The Tree - 39 Grain',
+        'The Tree - 4 Grain',
+        'The Tree - 40 Grain',
+        'The Tree - 41 Grain',
+        'The Tree - 42 Grain',
+        'The Tree - 43 Grain',
+        'The Tree - 44 Grain',
+        'The Tree - 45 Grain',
+        'The Tree - 46 Grain',
+        'The Tree - 47 Grain',
+        'The Tree - 48 Grain',
+        'The Tree - 49 Grain',
+        'The Tree - 5 Grain',
+        'The Tree - 50 Grain',
+        'The Tree - 6 Grain',
+        'The Tree - 7 Grain',
+        'The Tree - 8 Grain',
+        'The Tree - 9 Grain',
+        'Training - 1 Grain',
+        'Training - 10 Grain',
+        'Training - 11 Grain',
+        'Training - 12 Grain',
+        'Training - 13 Grain',
+        'Training - 14 Grain',
+        'Training - 15 Grain',
+        'Training - 16 Grain',
+        'Training - 17 Grain',
+        'Training - 18 Grain',
+        'Training - 19 Grain',
+        'Training - 2 Grain',
+        'Training - 20 Grain',
+        'Training - 21 Grain',
+        'Training - 22 Grain',
+        'Training - 23 Grain',
+        'Training - 24 Grain',
+        'Training - 25 Grain',
+        'Training - 26 Grain',
+        'Training - 27 Grain',
+        'Training - 28 Grain',
+        'Training - 29 Grain',
+        'Training - 3 Grain',
+        'Training - 30 Grain',
+        'Training - 31 Grain',
+        'Training - 32 Grain',
+        'Training - 33 Grain',
+        'Training - 34 Grain',
+        'Training - 35 Grain',
+        'Training - 36 Grain',
+        'Training - 37 Grain',
+        'Training - 38 Grain',
+        'Training - 39 Grain',
+        'Training - 4 Grain',
+        'Training - 40 Grain',
+        'Training - 41 Grain',
+        'Training - 42 Grain',
+        'Training - 43 Grain',
+        'Training - 44 Grain',
+        'Training - 45 Grain',
+        'Training - 46 Grain',
+        'Training - 47 Grain',
+        'Training - 48 Grain',
+        'Training - 49 Grain',
+        'Training - 5 Grain',
+        'Training - 50 Grain',
+        'Training - 6 Grain',
+        'Training - 7 Grain',
+        'Training - 8 Grain',
+        'Training - 9 Grain',
+        'Tunnels - 1 Grain',
+        'Tunnels - 10 Grain',
+        'Tunnels - 11 Grain',
+        'Tunnels - 12 Grain',
+        'Tunnels - 13 Grain',
+        'Tunnels - 14 Grain',
+        'Tunnels - 15 Grain',
+        'Tunnels - 16 Grain',
+        'Tunnels - 17 Grain',
+        'Tunnels - 18 Grain',
+        'Tunnels - 19 Grain',
+        'Tunnels - 2 Grain',
+        'Tunnels - 20 Grain',
+        'Tunnels - 21 Grain',
+        'Tunnels - 22 Grain',
+        'Tunnels - 23 Grain',
+        'Tunnels - 24 Grain',
+        'Tunnels - 25 Grain',
+        'Tunnels - 26 Grain',
+        'Tunnels - 27 Grain',
+        'Tunnels - 28 Grain',
+        'Tunnels - 29 Grain',
+        'Tunnels - 3 Grain',
+        'Tunnels - 30 Grain',
+        'Tunnels - 31 Grain',
+        'Tunnels - 32 Grain',
+        'Tunnels - 33 Grain',
+        'Tunnels - 34 Grain',
+        'Tunnels - 35 Grain',
+        'Tunnels - 36 Grain',
+        'Tunnels - 37 Grain',
+        'Tunnels - 38 Grain',
+        'Tunnels - 39 Grain',
+        'Tunnels - 4 Grain',
+        'Tunnels - 40 Grain',
+        'Tunnels - 41 Grain',
+        'Tunnels - 42 Grain',
+        'Tunnels - 43 Grain',
+        'Tunnels - 44 Grain',
+        'Tunnels - 45 Grain',
+        'Tunnels - 46 Grain',
+        'Tunnels - 47 Grain',
+        'Tunnels - 48 Grain',
+        'Tunnels - 49 Grain',
+        'Tunnels - 5 Grain',
+        'Tunnels - 50 Grain',
+        'Tunnels - 6 Grain',
+        'Tunnels - 7 Grain',
+        'Tunnels - 8 Grain',
+        'Tunnels - 9 Grain',
+    },
+    '2 Grain': {
+        'Ant Hill - 2 Grain',
+        'Ant Hill, Part 2 - 2 Grain',
+        'Battle Arena - 2 Grain',
+        'Bird Nest - 2 Grain',
+        'Bug Bar - 2 Grain',
+        'Canyon Showdown - 2 Grain',
+        'City Entrance - 2 Grain',
+        'City Square - 2 Grain',
+        'Cliffside - 2 Grain',
+        'Clover Forest - 2 Grain',
+        'Council Chamber - 2 Grain',
+        'Riverbed Canyon - 2 Grain',
+        'Riverbed Flight - 2 Grain',
+        'The Tree - 2 Grain',
+        'Training - 2 Grain',
+        'Tunnels - 2 Grain',
+    },
+    '3 Grain': {
+        'Ant Hill - 3 Grain',
+        'Ant Hill, Part 2 - 3 Grain',
+        'Battle Arena - 3 Grain',
+        'Bird Nest - 3 Grain',
+        'Bug Bar - 3 Grain',
+        'Canyon Showdown - 3 Grain',
+        'City Entrance - 3 Grain',
+        'City Square - 3 Grain',
+        'Cliffside - 3 Grain',
+        'Clover Forest - 3 Grain',
+        'Council Chamber - 3 Grain',
+        'Riverbed Canyon - 3 Grain',
+        'Riverbed Flight - 3 Grain',
+        'The Tree - 3 Grain',
+        'Training - 3 Grain',
+        'Tunnels - 3 Grain',
+    },
+    '4 Grain': {
+        'Ant Hill - 4 Grain',
+        'Ant Hill, Part 2 - 4 Grain',
+        'Battle Arena - 4 Grain',
+        'Bird Nest - 4 Grain',
+        'Bug Bar - 4 Grain',
+        'Canyon Showdown - 4 Grain',
+        'City Entrance - 4 Grain',
+        'City Square - 4 Grain',
+        'Cliffside - 4 Grain',
+        'Clover Forest - 4 Grain',
+        'Council Chamber - 4 Grain',
+        'Riverbed Canyon - 4 Grain',
+        'Riverbed Flight - 4 Grain',
+        'The Tree - 4 Grain',
+        'Training - 4 Grain',
+        'Tunnels - 4 Grain',
+    },
+    '5 Grain': {
+        'Ant Hill - 5 Grain',
+        'Ant Hill, Part 2 - 5 Grain',
+        'Battle Arena - 5 Grain',
+        'Bird Nest - 5 Grain',
+        'Bug Bar - 5 Grain',
+        'Canyon Showdown - 5 Grain',
+        'City Entrance - 5 Grain',
+        'City Square - 5 Grain',
+        'Cliffside - 5 Grain',
+        'Clover Forest - 5 Grain',
+        'Council Chamber - 5 Grain',
+        'Riverbed Canyon - 5 Grain',
+        'Riverbed Flight - 5 Grain',
+        'The Tree - 5 Grain',
+        'Training - 5 Grain',
+        'Tunnels - 5 Grain',
+    },
+    '6 Grain': {
+        'Ant Hill - 6 Grain',
+        'Ant Hill, Part 2 - 6 Grain',
+        'Battle Arena - 6 Grain',
+        'Bird Nest - 6 Grain',
+        'Bug Bar - 6 Grain',
+        'Canyon Showdown - 6 Grain',
+        'City Entrance - 6 Grain',
+        'City Square - 6 Grain',
+        'Cliffside - 6 Grain',
+        'Clover Forest - 6 Grain',
+        'Council Chamber - 6 Grain',
+        'Riverbed Canyon - 6 Grain',
+        'Riverbed Flight - 6 Grain',
+        'The Tree - 6 Grain',
+        'Training - 6 Grain',
+        'Tunnels - 6 Grain',
+    },
+    '7 Grain': {
+        'Ant Hill - 7 Grain',
+        'Ant Hill, Part 2 - 7 Grain',
+        'Battle Arena - 7 Grain',
+        'Bird Nest - 7 Grain',
+        'Bug Bar - 7 Grain',
+        'Canyon Showdown - 7 Grain',
+        'City Entrance - 7 Grain',
+        'City Square - 7 Grain',
+        'Cliffside - 7 Grain',
+        'Clover Forest - 7 Grain',
+        'Council Chamber - 7 Grain',
+        'Riverbed Canyon - 7 Grain',
+        'Riverbed Flight - 7 Grain',
+        'The Tree - 7 Grain',
+        'Training - 7 Grain',
+        'Tunnels - 7 Grain',
+    },
+    '8 Grain': {
+        'Ant Hill - 8 Grain',
+        'Ant Hill, Part 2 - 8 Grain',
+        'Battle Arena - 8 Grain',
+        'Bird Nest - 8 Grain',
+        'Bug Bar - 8 Grain',
+        'Canyon Showdown - 8 Grain',
+        'City Entrance - 8 Grain',
+        'City Square - 8 Grain',
+        'Cliffside - 8 Grain',
+        'Clover Forest - 8 Grain',
+        'Council Chamber - 8 Grain',
+        'Riverbed Canyon - 8 Grain',
+        'Riverbed Flight - 8 Grain',
+        'The Tree - 8 Grain',
+        'Training - 8 Grain',
+        'Tunnels - 8 Grain',
+    },
+    '9 Grain': {
+        'Ant Hill - 9 Grain',
+        'Ant Hill, Part 2 - 9 Grain',
+        'Battle Arena - 9 Grain',
+        'Bird Nest - 9 Grain',
+        'Bug Bar - 9 Grain',
+        'Canyon Showdown - 9 Grain',
+        'City Entrance - 9 Grain',
+        'City Square - 9 Grain',
+        'Cliffside - 9 Grain',
+        'Clover Forest - 9 Grain',
+        'Council Chamber - 9 Grain',
+        'Riverbed Canyon - 9 Grain',
+        'Riverbed Flight - 9 Grain',
+        'The Tree - 9 Grain',
+        'Training - 9 Grain',
+        'Tunnels - 9 Grain',
+    },
+    '10 Grain': {
+        'Ant Hill - 10 Grain',
+        'Ant Hill, Part 2 - 10 Grain',
+        'Battle Arena - 10 Grain',
+        'Bird Nest - 10 Grain',
+        'Bug Bar - 10 Grain',
+        'Canyon Showdown - 10 Grain',
+        'City Entrance - 10 Grain',
+        'City Square - 10 Grain',
+        'Cliffside - 10 Grain',
+        'Clover Forest - 10 Grain',
+        'Council Chamber - 10 Grain',
+        'Riverbed Canyon - 10 Grain',
+        'Riverbed Flight - 10 Grain',
+        'The Tree - 10 Grain',
+        'Training - 10 Grain',
+        'Tunnels - 10 Grain',
+    },
+    '11 Grain': {
+        'Ant Hill - 11 Grain',
+        'Ant Hill, Part 2 - 11 Grain',
+        'Battle Arena - 11 Grain',
+        'Bird Nest - 11 Grain',
+        'Bug Bar - 11 Grain',
+        'Canyon Showdown - 11 Grain',
+        'City Entrance - 11 Grain',
+        'City Square - 11 Grain',
+        'Cliffside - 11 Grain',
+        'Clover Forest - 11 Grain',
+        'Council Chamber - 11 Grain',
+        'Riverbed Canyon - 11 Grain',
+        'Riverbed Flight - 11 Grain',
+        'The Tree - 11 Grain',
+        'Training - 11 Grain',
+        'Tunnels - 11 Grain',
+    },
+    '12 Grain': {
+        'Ant Hill - 12 Grain',
+        'Ant Hill, Part 2 - 12 Grain',
+        'Battle Arena - 12 Grain',
+        'Bird Nest - 12 Grain',
+        'Bug Bar - 12 Grain',
+        'Canyon Showdown - 12 Grain',
+        'City Entrance - 12 Grain',
+        'City Square - 12 Grain',
+        'Cliffside - 12 Grain',
+        'Clover Forest - 12 Grain',
+        'Council Chamber - 12 Grain',
+        'Riverbed Canyon - 12 Grain',
+        'Riverbed Flight - 12 Grain',
+        'The Tree - 12 Grain',
+        'Training - 12 Grain',
+        'Tunnels - 12 Grain',
+    },
+    '13 Grain': {
+        'Ant Hill - 13 Grain',
+        'Ant Hill, Part 2 - 13 Grain',
+        'Battle Arena - 13 Grain',
+        'Bird Nest - 13 Grain',
+        'Bug Bar - 13 Grain',
+        'Canyon Showdown - 13 Grain',
+        'City Entrance - 13 Grain',
+        'City Square - 13 Grain',
+        'Cliffside - 13 Grain',
+        'Clover Forest - 13 Grain',
+        'Council Chamber - 13 Grain',
+        'Riverbed Canyon - 13 Grain',
+        'Riverbed Flight - 13 Grain',
+        'The Tree - 13 Grain',
+        'Training - 13 Grain',
+        'Tunnels - 13 Grain',
+    },
+    '14 Grain': {
+        'Ant Hill - 14 Grain',
+        'Ant Hill, Part 2 - 14 Grain',
+        'Battle Arena - 14 Grain',
+        'Bird Nest - 14 Grain',
+        'Bug Bar - 14 Grain',
+        'Canyon Showdown - 14 Grain',
+        'City Entrance - 14 Grain',
+        'City Square - 14 Grain',
+        'Cliffside - 14 Grain',
+        'Clover Forest - 14 Grain',
+        'Council Chamber - 14 Grain',
+        'Riverbed Canyon - 14 Grain',
+        'Riverbed Flight - 14 Grain',
+        'The Tree - 14 Grain',
+        'Training - 14 Grain',
+        'Tunnels - 14 Grain',
+    },
+    '15 Grain': {
+        'Ant Hill - 15 Grain',
+        'Ant Hill, Part 2 - 15 Grain',
+        'Battle Arena - 15 Grain',
+        'Bird Nest - 15 Grain',
+        'Bug Bar - 15 Grain',
+        'Canyon Showdown - 15 Grain',
+        'City Entrance - 15 Grain',
+        'City Square - 15 Grain',
+        'Cliffside - 15 Grain',
+        'Clover Forest - 15 Grain',
+        'Council Chamber - 15 Grain',
+        'Riverbed Canyon - 15 Grain',
+        'Riverbed Flight - 15 Grain',
+        'The Tree - 15 Grain',
+        'Training - 15 Grain',
+        'Tunnels - 15 Grain',
+    },
+    '16 Grain': {
+        'Ant Hill - 16 Grain',
+        'Ant Hill, Part 2 - 16 Grain',
+        'Battle Arena - 16 Grain',
+        'Bird Nest - 16 Grain',
+        'Bug Bar - 16 Grain',
+        'Canyon Showdown - 16 Grain',
+        'City Entrance - 16 Grain',
+        'City Square - 16 Grain',
+        'Cliffside - 16 Grain',
+        'Clover Forest - 16 Grain',
+        'Council Chamber - 16 Grain',
+        'Riverbed Canyon - 16 Grain',
+        'Riverbed Flight - 16 Grain',
+        'The Tree - 16 Grain',
+        'Training - 16 Grain',
+        'Tunnels - 16 Grain',
+    },
+    '17 Grain': {
+        'Ant Hill - 17 Grain',
+        'Ant Hill, Part 2 - 17 Grain',
+        'Battle Arena - 17 Grain',
+        'Bird Nest - 17 Grain',
+        'Bug Bar - 17 Grain',
+        'Canyon Showdown - 17 Grain',
+        'City Entrance - 17 Grain',
+        'City Square - 17 Grain',
+        'Cliffside - 17 Grain',
+        'Clover Forest - 17 Grain',
+        'Council Chamber - 17 Grain',
+        'Riverbed Canyon - 17 Grain',
+        'Riverbed Flight - 17 Grain',
+        'The Tree - 17 Grain',
+        'Training - 17 Grain',
+        'Tunnels - 17 Grain',
+    },
+    '18 Grain': {
+        'Ant Hill - 18 Grain',
+        'Ant Hill, Part 2 - 18 Grain',
+        'Battle Arena - 18 Grain',
+        'Bird Nest - 18 Grain',
+        'Bug Bar - 18 Grain',
+        'Canyon Showdown - 18 Grain',
+        'City Entrance - 18 Grain',
+        'City Square - 18 Grain',
+        'Cliffside - 18 Grain',
+        'Clover Forest - 18 Grain',
+        'Council Chamber - 18 Grain',
+        'Riverbed Canyon - 18 Grain',
+        'Riverbed Flight - 18 Grain',
+        'The Tree - 18 Grain',
+        'Training - 18 Grain',
+        'Tunnels - 18 Grain',
+    },
+    '19 Grain': {
+        'Ant Hill - 19 Grain',
+        'Ant Hill, Part 2 - 19 Grain',
+        'Battle Arena - 19 Grain',
+        'Bird Nest - 19 Grain',
+        'Bug Bar - 19 Grain',
+        'Canyon Showdown - 19 Grain',
+        'City Entrance - 19 Grain',
+        'City Square - 19 Grain',
+        'Cliffside - 19 Grain',
+        'Clover Forest - 19 Grain',
+        'Council Chamber - 19 Grain',
+        'Riverbed Canyon - 19 Grain',
+        'Riverbed Flight - 19 Grain',
+        'The Tree - 19 Grain',
+        'Training - 19 Grain',
+        'Tunnels - 19 Grain',
+    },
+    '20 Grain': {
+        'Ant Hill - 20 Grain',
+        'Ant Hill, Part 2 - 20 Grain',
+        'Battle Arena - 20 Grain',
+        'Bird Nest - 20 Grain',
+        'Bug Bar - 20 Grain',
+        'Canyon Showdown - 20 Grain',
+        'City Entrance - 20 Grain',
+        'City Square - 20 Grain',
+        'Cliffside - 20 Grain',
+        'Clover Forest - 20 Grain',
+        'Council Chamber - 20 Grain',
+        'Riverbed Canyon - 20 Grain',
+        'Riverbed Flight - 20 Grain',
+        'The Tree - 20 Grain',
+        'Training - 20 Grain',
+        'Tunnels - 20 Grain',
+    },
+    '21 Grain': {
+        'Ant Hill - 21 Grain',
+        'Ant Hill, Part 2 - 21 Grain',
+        'Battle Arena - 21 Grain',
+        'Bird Nest - 21 Grain',
+        'Bug Bar - 21 Grain',
+        'Canyon Showdown - 21 Grain',
+        'City Entrance - 21 Grain',
+        'City Square - 21 Grain',
+        'Cliffside - 21 Grain',
+        'Clover Forest - 21 Grain',
+        'Council Chamber - 21 Grain',
+        'Riverbed Canyon - 21 Grain',
+        'Riverbed Flight - 21 Grain',
+        'The Tree - 21 Grain',
+        'Training - 21 Grain',
+        'Tunnels - 21 Grain',
+    },
+    '22 Grain': {
+        'Ant Hill - 22 Grain',
+        'Ant Hill, Part 2 - 22 Grain',
+        'Battle Arena - 22 Grain',
+        'Bird Nest - 22 Grain',
+        'Bug Bar - 22 Grain',
+        'Canyon Showdown - 22 Grain',
+        'City Entrance - 22 Grain',
+        'City Square - 22 Grain',
+        'Cliffside - 22 Grain',
+        'Clover Forest - 22 Grain',
+        'Council Chamber - 22 Grain',
+        'Riverbed Canyon - 22 Grain',
+        'Riverbed Flight - 22 Grain',
+        'The Tree - 22 Grain',
+        'Training - 22 Grain',
+        'Tunnels - 22 Grain',
+    },
+    '23 Grain': {
+        'Ant Hill - 23 Grain',
+        'Ant Hill, Part 2 - 23 Grain',
+        'Battle Arena - 23 Grain',
+        'Bird Nest - 23 Grain',
+        'Bug Bar - 23 Grain',
+        'Canyon Showdown - 23 Grain',
+        'City Entrance - 23 Grain',
+        'City Square - 23 Grain',
+        'Cliffside - 23 Grain',
+        'Clover Forest - 23 Grain',
+        'Council Chamber - 23 Grain',
+        'Riverbed Canyon - 23 Grain',
+        'Riverbed Flight - 23 Grain',
+        'The Tree - 23 Grain',
+        'Training - 23 Grain',
+        'Tunnels - 23 Grain',
+    },
+    '24 Grain': {
+        'Ant Hill - 24 Grain',
+        'Ant Hill, Part 2 - 24 Grain',
+        'Battle Arena - 24 Grain',
+        'Bird Nest - 24 Grain',
+        'Bug Bar - 24 Grain',
+        'Canyon Showdown - 24 Grain',
+        'City Entrance - 24 Grain',
+        'City Square - 24 Grain',
+        'Cliffside - 24 Grain',
+        'Clover Forest - 24 Grain',
+        'Council Chamber - 24 Grain',
+        'Riverbed Canyon - 24 Grain',
+        'Riverbed Flight - 24 Grain',
+        'The Tree - 24 Grain',
+        'Training - 24 Grain',
+        'Tunnels - 24 Grain',
+    },
+    '25 Grain': {
+        'Ant Hill - 25 Grain',
+        'Ant Hill, Part 2 - 25 Grain',
+        'Battle Arena - 25 Grain',
+        'Bird Nest - 25 Grain',
+        'Bug Bar - 25 Grain',
+        'Canyon Showdown - 25 Grain',
+        'City Entrance - 25 Grain',
+        'City Square - 25 Grain',
+        'Cliffside - 25 Grain',
+        'Clover Forest - 25 Grain',
+        'Council Chamber - 25 Grain',
+        'Riverbed Canyon - 25 Grain',
+        'Riverbed Flight - 25 Grain',
+        'The Tree - 25 Grain',
+        'Training - 25 Grain',
+        'Tunnels - 25 Grain',
+    },
+    '26 Grain': {
+        'Ant Hill - 26 Grain',
+        'Ant Hill, Part 2 - 26 Grain',
+        'Battle Arena - 26 Grain',
+        'Bird Nest - 26 Grain',
+        'Bug Bar - 26 Grain',
+        'Canyon Showdown - 26 Grain',
+        'City Entrance - 26 Grain',
+        'City Square - 26 Grain',
+        'Cliffside - 26 Grain',
+        'Clover Forest - 26 Grain',
+        'Council Chamber - 26 Grain',
+        'Riverbed Canyon - 26 Grain',
+        'Riverbed Flight - 26 Grain',
+        'The Tree - 26 Grain',
+        'Training - 26 Grain',
+        'Tunnels - 26 Grain',
+    },
+    '27 Grain': {
+        'Ant Hill - 27 Grain',
+        'Ant Hill, Part 2 - 27 Grain',
+        'Battle Arena - 27 Grain',
+        'Bird Nest - 27 Grain',
+        'Bug Bar - 27 Grain',
+        'Canyon Showdown - 27 Grain',
+        'City Entrance - 27 Grain',
+        'City Square - 27 Grain',
+        'Cliffside - 27 Grain',
+        'Clover Forest - 27 Grain',
+        'Council Chamber - 27 Grain',
+        'Riverbed Canyon - 27 Grain',
+        'Riverbed Flight - 27 Grain',
+        'The Tree - 27 Grain',
+        'Training - 27 Grain',
+        'Tunnels - 27 Grain',
+    },
+    '28 Grain': {
+        'Ant Hill - 28 Grain',
+        'Ant Hill, Part 2 - 28 Grain',
+        'Battle Arena - 28 Grain',
+        'Bird Nest - 28 Grain',
+        'Bug Bar - 28 Grain',
+        'Canyon Showdown - 28 Grain',
+        'City Entrance - 28 Grain',
+        'City Square - 28 Grain',
+        'Cliffside - 28 Grain',
+        'Clover Forest - 28 Grain',
+        'Council Chamber - 28 Grain',
+        'Riverbed Canyon - 28 Grain',
+        'Riverbed Flight - 28 Grain',
+        'The Tree - 28 Grain',
+        'Training - 28 Grain',
+        'Tunnels - 28 Grain',
+    },
+    '29 Grain': {
+        'Ant Hill - 29 Grain',
+        'Ant Hill, Part 2 - 29 Grain',
+        'Battle Arena - 29 Grain',
+        'Bird Nest - 29 Grain',
+        'Bug Bar - 29 Grain',
+        'Canyon Showdown - 29 Grain',
+        'City Entrance - 29 Grain',
+        'City Square - 29 Grain',
+        'Cliffside - 29 Grain',
+        'Clover Forest - 29 Grain',
+        'Council Chamber - 29 Grain',
+        'Riverbed Canyon - 29 Grain',
+        'Riverbed Flight - 29 Grain',
+        'The Tree - 29 Grain',
+        'Training - 29 Grain',
+        'Tunnels - 29 Grain',
+    },
+    '30 Grain': {
+        'Ant Hill - 30 Grain',
+        'Ant Hill, Part 2 - 30 Grain',
+        'Battle Arena - 30 Grain',
+        'Bird Nest - 30 Grain',
+        'Bug Bar - 30 Grain',
+        'Canyon Showdown - 30 Grain',
+        'City Entrance - 30 Grain',
+        'City Square - 30 Grain',
+        'Cliffside - 30 Grain',
+        'Clover Forest - 30 Grain',
+        'Council Chamber - 30 Grain',
+        'Riverbed Canyon - 30 Grain',
+        'Riverbed Flight - 30 Grain',
+        'The Tree - 30 Grain',
+        'Training - 30 Grain',
+        'Tunnels - 30 Grain',
+    },
+    '31 Grain': {
+        'Ant Hill - 31 Grain',
+        'Ant Hill, Part 2 - 31 Grain',
+        'Battle Arena - 31 Grain',
+        'Bird Nest - 31 Grain',
+        'Bug Bar - 31 Grain',
+        'Canyon Showdown - 31 Grain',
+        'City Entrance - 31 Grain',
+        'City Square - 31 Grain',
+        'Cliffside - 31 Grain',
+        'Clover Forest - 31 Grain',
+        'Council Chamber - 31 Grain',
+        'Riverbed Canyon - 31 Grain',
+        'Riverbed Flight - 31 Grain',
+        'The Tree - 31 Grain',
+        'Training - 31 Grain',
+        'Tunnels - 31 Grain',
+    },
+    '32 Grain': {
+        'Ant Hill - 32 Grain',
+        'Ant Hill, Part 2 - 32 Grain',
+        'Battle Arena - 32 Grain',
+        'Bird Nest - 32 Grain',
+        'Bug Bar - 32 Grain',
+        'Canyon Showdown - 32 Grain',
+        'City Entrance - 32 Grain',
+        'City Square - 32 Grain',
+        'Cliffside - 32 Grain',
+        'Clover Forest - 32 Grain',
+        'Council Chamber - 32 Grain',
+        'Riverbed Canyon - 32 Grain',
+        'Riverbed Flight - 32 Grain',
+        'The Tree - 32 Grain',
+        'Training - 32 Grain',
+        'Tunnels - 32 Grain',
+    },
+    '33 Grain': {
+        'Ant Hill - 33 Grain',
+        'Ant Hill, Part 2 - 33 Grain',
+        'Battle Arena - 33 Grain',
+        'Bird Nest - 33 Grain',
+        'Bug Bar - 33 Grain',
+        'Canyon Showdown - 33 Grain',
+        'City Entrance - 33 Grain',
+        'City Square - 33 Grain',
+        'Cliffside - 33 Grain',
+        'Clover Forest - 33 Grain',
+        'Council Chamber - 33 Grain',
+        'Riverbed Canyon - 33 Grain',
+        'Riverbed Flight - 33 Grain',
+        'The Tree - 33 Grain',
+        'Training - 33 Grain',
+        'Tunnels - 33 Grain',
+    },
+    '34 Grain': {
+        'Ant Hill - 34 Grain',
+        'Ant Hill, Part 2 - 34 Grain',
+        'Battle Arena - 34 Grain',
+        'Bird Nest - 34 Grain',
+        'Bug Bar - 34 Grain',
+        'Canyon Showdown - 34 Grain',
+        'City Entrance - 34 Grain',
+        'City Square - 34 Grain',
+        'Cliffside - 34 Grain',
+        'Clover Forest - 34 Grain',
+        'Council Chamber - 34 Grain',
+        'Riverbed Canyon - 34 Grain',
+        'Riverbed Flight - 34 Grain',
+        'The Tree - 34 Grain',
+        'Training - 34 Grain',
+        'Tunnels - 34 Grain',
+    },
+    '35 Grain': {
+        'Ant Hill - 35 Grain',
+        'Ant Hill, Part 2 - 35 Grain',
+        'Battle Arena - 35 Grain',
+        'Bird Nest - 35 Grain',
+        'Bug Bar - 35 Grain',
+        'Canyon Showdown - 35 Grain',
+        'City Entrance - 35 Grain',
+        'City Square - 35 Grain',
+        'Cliffside - 35 Grain',
+        'Clover Forest - 35 Grain',
+        'Council Chamber - 35 Grain',
+        'Riverbed Canyon - 35 Grain',
+        'Riverbed Flight - 35 Grain',
+        'The Tree - 35 Grain',
+        'Training - 35 Grain',
+        'Tunnels - 35 Grain',
+    },
+    '36 Grain': {
+        'Ant Hill - 36 Grain',
+        'Ant Hill, Part 2 - 36 Grain',
+        'Battle Arena - 36 Grain',
+        'Bird Nest - 36 Grain',
+        'Bug Bar - 36 Grain',
+        'Canyon Showdown - 36 Grain',
+        'City Entrance - 36 Grain',
+        'City Square - 36 Grain',
+        'Cliffside - 36 Grain',
+        'Clover Forest - 36 Grain',
+        'Council Chamber - 36 Grain',
+        'Riverbed Canyon - 36 Grain',
+        'Riverbed Flight - 36 Grain',
+        'The Tree - 36 Grain',
+        'Training - 36 Grain',
+        'Tunnels - 36 Grain',
+    },
+    '37 Grain': {
+        'Ant Hill - 37 Grain',
+        'Ant Hill, Part 2 - 37 Grain',
+        'Battle Arena - 37 Grain',
+        'Bird Nest - 37 Grain',
+        'Bug Bar - 37 Grain',
+        'Canyon Showdown - 37 Grain',
+        'City Entrance - 37 Grain',
+        'City Square - 37 Grain',
+        'Cliffside - 37 Grain',
+        'Clover Forest - 37 Grain',
+        'Council Chamber - 37 Grain',
+        'Riverbed Canyon - 37 Grain',
+        'Riverbed Flight - 37 Grain',
+        'The Tree - 37 Grain',
+        'Training - 37 Grain',
+        'Tunnels - 37 Grain',
+    },
+    '38 Grain': {
+        'Ant Hill - 38 Grain',
+        'Ant Hill, Part 2 - 38 Grain',
+        'Battle Arena - 38 Grain',
+        'Bird Nest - 38 Grain',
+        'Bug Bar - 38 Grain',
+        'Canyon Showdown - 38 Grain',
+        'City Entrance - 38 Grain',
+        'City Square - 38 Grain',
+        'Cliffside - 38 Grain',
+        'Clover Forest - 38 Grain',
+        'Council Chamber - 38 Grain',
+        'Riverbed Canyon - 38 Grain',
+        'Riverbed Flight - 38 Grain',
+        'The Tree - 38 Grain',
+        'Training - 38 Grain',
+        'Tunnels - 38 Grain',
+    },
+    '39 Grain': {
+        'Ant Hill - 39 Grain',
+        'Ant Hill, Part 2 - 39 Grain',
+        'Battle Arena - 39 Grain',
+        'Bird Nest - 39 Grain',
+        'Bug Bar - 39 Grain',
+        'Canyon Showdown - 39 Grain',
+        'City Entrance - 39 Grain',
+        'City Square - 39 Grain',
+        'Cliffside - 39 Grain',
+        'Clover Forest - 39 Grain',
+        'Council Chamber - 39 Grain',
+        'Riverbed Canyon - 39 Grain',
+        'Riverbed Flight - 39 Grain',
+        'The Tree - 39 Grain',
+        'Training - 39 Grain',
+        'Tunnels - 39 Grain',
+    },
+    '40 Grain': {
+        'Ant Hill - 40 Grain',
+        'Ant Hill, Part 2 - 40 Grain',
+        'Battle Arena - 40 Grain',
+        'Bird Nest - 40 Grain',
+        'Bug Bar - 40 Grain',
+        'Canyon Showdown - 40 Grain',
+        'City Entrance - 40 Grain',
+        'City Square - 40 Grain',
+        'Cliffside - 40 Grain',
+        'Clover Forest - 40 Grain',
+        'Council Chamber - 40 Grain',
+        'Riverbed Canyon - 40 Grain',
+        'Riverbed Flight - 40 Grain',
+        'The Tree - 40 Grain',
+        'Training - 40 Grain',
+        'Tunnels - 40 Grain',
+    },
+    '41 Grain': {
+        'Ant Hill - 41 Grain',
+        'Ant Hill, Part 2 - 41 Grain',
+        'Battle Arena - 41 Grain',
+        'Bird Nest - 41 Grain',
+        'Bug Bar - 41 Grain',
+        'Canyon Showdown - 41 Grain',
+        'City Entrance - 41 Grain',
+        'City Square - 41 Grain',
+        'Cliffside - 41 Grain',
+        'Clover Forest - 41 Grain',
+        'Council Chamber - 41 Grain',
+        'Riverbed Canyon - 41 Grain',
+        'Riverbed Flight - 41 Grain',
+        'The Tree - 41 Grain',
+        'Training - 41 Grain',
+        'Tunnels - 41 Grain',
+    },
+    '42 Grain': {
+        'Ant Hill - 42 Grain',
+        'Ant Hill, Part 2 - 42 Grain',
+        'Battle Arena - 42 Grain',
+        'Bird Nest - 42 Grain',
+        'Bug Bar - 42 Grain',
+        'Canyon Showdown - 42 Grain',
+        'City Entrance - 42 Grain',
+        'City Square - 42 Grain',
+        'Cliffside - 42 Grain',
+        'Clover Forest - 42 Grain',
+        'Council Chamber - 42 Grain',
+        'Riverbed Canyon - 42 Grain',
+        'Riverbed Flight - 42 Grain',
+        'The Tree - 42 Grain',
+        'Training - 42 Grain',
+        'Tunnels - 42 Grain',
+    },
+    '43 Grain': {
+        'Ant Hill - 43 Grain',
+        'Ant Hill, Part 2 - 43 Grain',
+        'Battle Arena - 43 Grain',
+        'Bird Nest - 43 Grain',
+        'Bug Bar - 43 Grain',
+        'Canyon Showdown - 43 Grain',
+        'City Entrance - 43 Grain',
+        'City Square - 43 Grain',
+        'Cliffside - 43 Grain',
+        'Clover Forest - 43 Grain',
+        'Council Chamber - 43 Grain',
+        'Riverbed Canyon - 43 Grain',
+        'Riverbed Flight - 43 Grain',
+        'The Tree - 43 Grain',
+        'Training - 43 Grain',
+        'Tunnels - 43 Grain',
+    },
+    '44 Grain': {
+        'Ant Hill - 44 Grain',
+        'Ant Hill, Part 2 - 44 Grain',
+        'Battle Arena - 44 Grain',
+        'Bird Nest - 44 Grain',
+        'Bug Bar - 44 Grain',
+        'Canyon Showdown - 44 Grain',
+        'City Entrance - 44 Grain',
+        'City Square - 44 Grain',
+        'Cliffside - 44 Grain',
+        'Clover Forest - 44 Grain',
+        'Council Chamber - 44 Grain',
+        'Riverbed Canyon - 44 Grain',
+        'Riverbed Flight - 44 Grain',
+        'The Tree - 44 Grain',
+        'Training - 44 Grain',
+        'Tunnels - 44 Grain',
+    },
+    '45 Grain': {
+        'Ant Hill - 45 Grain',
+        'Ant Hill, Part 2 - 45 Grain',
+        'Battle Arena - 45 Grain',
+        'Bird Nest - 45 Grain',
+        'Bug Bar - 45 Grain',
+        'Canyon Showdown - 45 Grain',
+        'City Entrance - 45 Grain',
+        'City Square - 45 Grain',
+        'Cliffside - 45 Grain',
+        'Clover Forest - 45 Grain',
+        'Council Chamber - 45 Grain',
+        'Riverbed Canyon - 45 Grain',
+        'Riverbed Flight - 45 Grain',
+        'The Tree - 45 Grain',
+        'Training - 45 Grain',
+        'Tunnels - 45 Grain',
+    },
+    '46 Grain': {
+        'Ant Hill - 46 Grain',
+        'Ant Hill, Part 2 - 46 Grain',
+        'Battle Arena - 46 Grain',
+        'Bird Nest - 46 Grain',
+        'Bug Bar - 46 Grain',
+        'Canyon Showdown - 46 Grain',
+        'City Entrance - 46 Grain',
+        'City Square - 46 Grain',
+        'Cliffside - 46 Grain',
+        'Clover Forest - 46 Grain',
+        'Council Chamber - 46 Grain',
+        'Riverbed Canyon - 46 Grain',
+        'Riverbed Flight - 46 Grain',
+        'The Tree - 46 Grain',
+        'Training - 46 Grain',
+        'Tunnels - 46 Grain',
+    },
+    '47 Grain': {
+        'Ant Hill - 47 Grain',
+        'Ant Hill, Part 2 - 47 Grain',
+        'Battle Arena - 47 Grain',
+        'Bird Nest - 47 Grain',
+        'Bug Bar - 47 Grain',
+        'Canyon Showdown - 47 Grain',
+        'City Entrance - 47 Grain',
+        'City Square - 47 Grain',
+        'Cliffside - 47 Grain',
+        'Clover Forest - 47 Grain',
+        'Council Chamber - 47 Grain',
+        'Riverbed Canyon - 47 Grain',
+        'Riverbed Flight - 47 Grain',
+        'The Tree - 47 Grain',
+        'Training - 47 Grain',
+        'Tunnels - 47 Grain',
+    },
+    '48 Grain': {
+        'Ant Hill - 48 Grain',
+        'Ant Hill, Part 2 - 48 Grain',
+        'Battle Arena - 48 Grain',
+        'Bird Nest - 48 Grain',
+        'Bug Bar - 48 Grain',
+        'Canyon Showdown - 48 Grain',
+        'City Entrance - 48 Grain',
+        'City Square - 48 Grain',
+        'Cliffside - 48 Grain',
+        'Clover Forest - 48 Grain',
+        'Council Chamber - 48 Grain',
+        'Riverbed Canyon - 48 Grain',
+        'Riverbed Flight - 48 Grain',
+        'The Tree - 48 Grain',
+        'Training - 48 Grain',
+        'Tunnels - 48 Grain',
+    },
+    '49 Grain': {
+        'Ant Hill - 49 Grain',
+        'Ant Hill, Part 2 - 49 Grain',
+        'Battle Arena - 49 Grain',
+        'Bird Nest - 49 Grain',
+        'Bug Bar - 49 Grain',
+        'Canyon Showdown - 49 Grain',
+        'City Entrance - 49 Grain',
+        'City Square - 49 Grain',
+        'Cliffside - 49 Grain',
+        'Clover Forest - 49 Grain',
+        'Council Chamber - 49 Grain',
+        'Riverbed Canyon - 49 Grain',
+        'Riverbed Flight - 49 Grain',
+        'The Tree - 49 Grain',
+        'Training - 49 Grain',
+        'Tunnels - 49 Grain',
+    },
+    '50 Grain': {
+        'Ant Hill - 50 Grain',
+        'Ant Hill, Part 2 - 50 Grain',
+        'Battle Arena - 50 Grain',
+        'Bird Nest - 50 Grain',
+        'Bug Bar - 50 Grain',
+        'Canyon Showdown - 50 Grain',
+        'City Entrance - 50 Grain',
+        'City Square - 50 Grain',
+        'Cliffside - 50 Grain',
+        'Clover Forest - 50 Grain',
+        'Council Chamber - 50 Grain',
+        'Riverbed Canyon - 50 Grain',
+        'Riverbed Flight - 50 Grain',
+        'The Tree - 50 Grain',
+        'Training - 50 Grain',
+        'Tunnels - 50 Grain',
+    },
+    '25% Enemies': {
+        'Ant Hill - 25% Enemies',
+        'Ant Hill, Part 2 - 25% Enemies',
+        'Battle Arena - 25% Enemies',
+        'Bird Nest - 25% Enemies',
+        'Bug Bar - 25% Enemies',
+        'Canyon Showdown - 25% Enemies',
+        'City Entrance - 25% Enemies',
+        'City Square - 25% Enemies',
+        'Cliffside - 25% Enemies',
+        'Clover Forest - 25% Enemies',
+        'Council Chamber - 25% Enemies',
+        'Riverbed Canyon - 25% Enemies',
+        'Riverbed Flight - 25% Enemies',
+        'The Tree - 25% Enemies',
+        'Training - 25% Enemies',
+        'Tunnels - 25% Enemies',
+    },
+    'Enemysanity': {
+        'Ant Hill - 100% Enemies',
+        'Ant Hill - 25% Enemies',
+        'Ant Hill - 50% Enemies',
+        'Ant Hill - 75% Enemies',
+        'Ant Hill, Part 2 - 100% Enemies',
+        'Ant Hill, Part 2 - 25% Enemies',
+        'Ant Hill, Part 2 - 50% Enemies',
+        'Ant Hill, Part 2 - 75% Enemies',
+        'Battle Arena - 100% Enemies',
+        'Battle Arena - 25% Enemies',
+        'Battle Arena - 50% Enemies',
+        'Battle Arena - 75% Enemies',
+        'Bird Nest - 100% Enemies',
+        'Bird Nest - 25% Enemies',
+        'Bird Nest - 50% Enemies',
+        'Bird Nest - 75% Enemies',
+        'Bug Bar - 100% Enemies',
+        'Bug Bar - 25% Enemies',
+        'Bug Bar - 50% Enemies',
+        'Bug Bar - 75% Enemies',
+        'Canyon Showdown - 100% Enemies',
+        'Canyon Showdown - 25% Enemies',
+        'Canyon Showdown - 50% Enemies',
+        'Canyon Showdown - 75% Enemies',
+        'City Entrance - 100% Enemies',
+        'City Entrance - 25% Enemies',
+        'City Entrance - 50% Enemies',
+        'City Entrance - 75% Enemies',
+        'City Square - 100% Enemies',
+        'City Square - 25% Enemies',
+        'City Square - 50% Enemies',
+        'City Square - 75% Enemies',
+        'Cliffside - 100% Enemies',
+        'Cliffside - 25% Enemies',
+        'Cliffside - 50% Enemies',
+        'Cliffside - 75% Enemies',
+        'Clover Forest - 100% Enemies',
+        'Clover Forest - 25% Enemies',
+        'Clover Forest - 50% Enemies',
+        'Clover Forest - 75% Enemies',
+        'Council Chamber - 100% Enemies',
+        'Council Chamber - 25% Enemies',
+        'Council Chamber - 50% Enemies',
+        'Council Chamber - 75% Enemies',
+        'Riverbed Canyon - 100% Enemies',
+        'Riverbed Canyon - 25% Enemies',
+        'Riverbed Canyon - 50% Enemies',
+        'Riverbed Canyon - 75% Enemies',
+        'Riverbed Flight - 100% Enemies',
+        'Riverbed Flight - 25% Enemies',
+        'Riverbed Flight - 50% Enemies',
+        'Riverbed Flight - 75% Enemies',
+        'The Tree - 100% Enemies',
+        'The Tree - 25% Enemies',
+        'The Tree - 50% Enemies',
+        'The Tree - 75% Enemies',
+        'Training - 100% Enemies',
+        'Training - 25% Enemies',
+        'Training - 50% Enemies',
+        'Training - 75% Enemies',
+        'Tunnels - 100% Enemies',
+        'Tunnels - 25% Enemies',
+        'Tunnels - 50% Enemies',
+        'Tunnels - 75% Enemies',
+    },
+    '50% Enemies': {
+        'Ant Hill - 50% Enemies',
+        'Ant Hill, Part 2 - 50% Enemies',
+        'Battle Arena - 50% Enemies',
+        'Bird Nest - 50% Enemies',
+        'Bug Bar - 50% Enemies',
+        'Canyon Showdown - 50% Enemies',
+        'City Entrance - 50% Enemies',
+        'City Square - 50% Enemies',
+        'Cliffside - 50% Enemies',
+        'Clover Forest - 50% Enemies',
+        'Council Chamber - 50% Enemies',
+        'Riverbed Canyon - 50% Enemies',
+        'Riverbed Flight - 50% Enemies',
+        'The Tree - 50% Enemies',
+        'Training - 50% Enemies',
+        'Tunnels - 50% Enemies',
+    },
+    '75% Enemies': {
+        'Ant Hill - 75% Enemies',
+        'Ant Hill, Part 2 - 75% Enemies',
+        'Battle Arena - 75% Enemies',
+        'Bird Nest - 75% Enemies',
+        'Bug Bar - 75% Enemies',
+        'Canyon Showdown - 75% Enemies',
+        'City Entrance - 75% Enemies',
+        'City Square - 75% Enemies',
+        'Cliffside - 75% Enemies',
+        'Clover Forest - 75% Enemies',
+        'Council Chamber - 75% Enemies',
+        'Riverbed Canyon - 75% Enemies',
+        'Riverbed Flight - 75% Enemies',
+        'The Tree - 75% Enemies',
+        'Training - 75% Enemies',
+        'Tunnels - 75% Enemies',
+    },
+    '100% Enemies': {
+        'Ant Hill - 100% Enemies',
+        'Ant Hill, Part 2 - 100% Enemies',
+        'Battle Arena - 100% Enemies',
+        'Bird Nest - 100% Enemies',
+        'Bug Bar - 100% Enemies',
+        'Canyon Showdown - 100% Enemies',
+        'City Entrance - 100% Enemies',
+        'City Square - 100% Enemies',
+        'Cliffside - 100% Enemies',
+        'Clover Forest - 100% Enemies',
+        'Council Chamber - 100% Enemies',
+        'Riverbed Canyon - 100% Enemies',
+        'Riverbed Flight - 100% Enemies',
+        'The Tree - 100% Enemies',
+        'Training - 100% Enemies',
+        'Tunnels - 100% Enemies',
+    },
+    'Council Chamber': {
+        'Council Chamber - 1 Grain',
+        'Council Chamber - 10 Grain',
+        'Council Chamber - 100% Enemies',
+        'Council Chamber - 11 Grain',
+        'Council Chamber - 12 Grain',
+        'Council Chamber - 13 Grain',
+        'Council Chamber - 14 Grain',
+        'Council Chamber - 15 Grain',
+        'Council Chamber - 16 Grain',
+        'Council Chamber - 17 Grain',
+        'Council Chamber - 18 Grain',
+        'Council Chamber - 19 Grain',
+        'Council Chamber - 2 Grain',
+        'Council Chamber - 20 Grain',
+        'Council Chamber - 21 Grain',
+        'Council Chamber - 22 Grain',
+        'Council Chamber - 23 Grain',
+        'Council Chamber - 24 Grain',
+        'Council Chamber - 25 Grain',
+        'Council Chamber - 25% Enemies',
+        'Council Chamber - 26 Grain',
+        'Council Chamber - 27 Grain',
+        'Council Chamber - 28 Grain',
+        'Council Chamber - 29 Grain',
+        'Council Chamber - 3 Grain',
+        'Council Chamber - 30 Grain',
+        'Council Chamber - 31 Grain',
+        'Council Chamber - 32 Grain',
+        'Council Chamber - 33 Grain',
+        'Council Chamber - 34 Grain',
+        'Council Chamber - 35 Grain',
+        'Council Chamber - 36 Grain',
+        'Council Chamber - 37 Grain',
+        'Council Chamber - 38 Grain',
+        'Council Chamber - 39 Grain',
+        'Council Chamber - 4 Grain',
+        'Council Chamber - 40 Grain',
+        'Council Chamber - 41 Grain',
+        'Council Chamber - 42 Grain',
+        'Council Chamber - 43 Grain',
+        'Council Chamber - 44 Grain',
+        'Council Chamber - 45 Grain',
+        'Council Chamber - 46 Grain',
+        'Council Chamber - 47 Grain',
+        'Council Chamber - 48 Grain',
+        'Council Chamber - 49 Grain',
+        'Council Chamber - 5 Grain',
+        'Council Chamber - 50 Grain',
+        'Council Chamber - 50% Enemies',
+        'Council Chamber - 6 Grain',
+        'Council Chamber - 7 Grain',
+        'Council Chamber - 75% Enemies',
+        'Council Chamber - 8 Grain',
+        'Council Chamber - 9 Grain',
+        'Council Chamber - All Enemies',
+        'Council Chamber - All Grain',
+        'Council Chamber - F Letter',
+        'Council Chamber - FLIK Letters',
+        'Council Chamber - I Letter',
+        'Council Chamber - K Letter',
+        'Council Chamber - L Letter',
+        'Council Chamber - Level Complete',
+    },
+    'Tunnels': {
+        'Tunnels - 1 Grain',
+        'Tunnels - 10 Grain',
+        'Tunnels - 100% Enemies',
+        'Tunnels - 11 Grain',
+        'Tunnels - 12 Grain',
+        'Tunnels - 13 Grain',
+        'Tunnels - 14 Grain',
+        'Tunnels - 15 Grain',
+        'Tunnels - 16 Grain',
+        'Tunnels - 17 Grain',
+        'Tunnels - 18 Grain',
+        'Tunnels - 19 Grain',
+        'Tunnels - 2 Grain',
+        'Tunnels - 20 Grain',
+        'Tunnels - 21 Grain',
+        'Tunnels - 22 Grain',
+        'Tunnels - 23 Grain',
+        'Tunnels - 24 Grain',
+        'Tunnels - 25 Grain',
+        'Tunnels - 25% Enemies',
+        'Tunnels - 26 Grain',
+        'Tunnels - 27 Grain',
+        'Tunnels - 28 Grain',
+        'Tunnels - 29 Grain',
+        'Tunnels - 3 Grain',
+        'Tunnels - 30 Grain',
+        'Tunnels - 31 Grain',
+        'Tunnels - 32 Grain',
+        'Tunnels - 33 Grain',
+        'Tunnels - 34 Grain',
+        'Tunnels - 35 Grain',
+        'Tunnels - 36 Grain',
+        'Tunnels - 37 Grain',
+        'Tunnels - 38 Grain',
+        'Tunnels - 39 Grain',
+        'Tunnels - 4 Grain',
+        'Tunnels - 40 Grain',
+        'Tunnels - 41 Grain',
+        'Tunnels - 42 Grain',
+        'Tunnels - 43 Grain',
+        'Tunnels - 44 Grain',
+        'Tunnels - 45 Grain',
+        'Tunnels - 46 Grain',
+        'Tunnels - 47 Grain',
+        'Tunnels - 48 Grain',
+        'Tunnels - 49 Grain',
+        'Tunnels - 5 Grain',
+        'Tunnels - 50 Grain',
+        'Tunnels - 50% Enemies',
+        'Tunnels - 6 Grain',
+        'Tunnels - 7 Grain',
+        'Tunnels - 75% Enemies',
+        'Tunnels - 8 Grain',
+        'Tunnels - 9 Grain',
+        'Tunnels - All Enemies',
+        'Tunnels - All Grain',
+        'Tunnels - F Letter',
+        'Tunnels - FLIK Letters',
+        'Tunnels - I Letter',
+        'Tunnels - K Letter',
+        'Tunnels - L Letter',
+        'Tunnels - Level Complete',
+    },
+    'City Entrance': {
+        'City Entrance - 1 Grain',
+        'City Entrance - 10 Grain',
+        'City Entrance - 100% Enemies',
+        'City Entrance - 11 Grain',
+        'City Entrance - 12 Grain',
+        'City Entrance - 13 Grain',
+        'City Entrance - 14 Grain',
+        'City Entrance - 15 Grain',
+        'City Entrance - 16 Grain',
+        'City Entrance - 17 Grain',
+        'City Entrance - 18 Grain',
+        'City Entrance - 19 Grain',
+        'City Entrance - 2 Grain',
+        'City Entrance - 20 Grain',
+        'City Entrance - 21 Grain',
+        'City Entrance - 22 Grain',
+        'City Entrance - 23 Grain',
+        'City Entrance - 24 Grain',
+        'City Entrance - 25 Grain',
+        'City Entrance - 25% Enemies',
+        'City Entrance - 26 Grain',
+        'City Entrance - 27 Grain',
+        'City Entrance - 28 Grain',
+        'City Entrance - 29 Grain',
+        'City Entrance - 3 Grain',
+        'City Entrance - 30 Grain',
+        'City Entrance - 31 Grain',
+        'City Entrance - 32 Grain',
+        'City Entrance - 33 Grain',
+        'City Entrance - 34 Grain',
+        'City Entrance - 35 Grain',
+        'City Entrance - 36 Grain',
+        'City Entrance - 37 Grain',
+        'City Entrance - 38 Grain',
+        'City Entrance - 39 Grain',
+        'City Entrance - 4 Grain',
+        'City Entrance - 40 Grain',
+        'City Entrance - 41 Grain',
+        'City Entrance - 42 Grain',
+        'City Entrance - 43 Grain',
+        'City Entrance - 44 Grain',
+        'City Entrance - 45 Grain',
+        'City Entrance - 46 Grain',
+        'City Entrance - 47 Grain',
+        'City Entrance - 48 Grain',
+        'City Entrance - 49 Grain',
+        'City Entrance - 5 Grain',
+        'City Entrance - 50 Grain',
+        'City Entrance - 50% Enemies',
+        'City Entrance - 6 Grain',
+        'City Entrance - 7 Grain',
+        'City Entrance - 75% Enemies',
+        'City Entrance - 8 Grain',
+        'City Entrance - 9 Grain',
+        'City Entrance - All Enemies',
+        'City Entrance - All Grain',
+        'City Entrance - F Letter',
+        'City Entrance - FLIK Letters',
+        'City Entrance - I Letter',
+        'City Entrance - K Letter',
+        'City Entrance - L Letter',
+        'City Entrance - Level Complete',
+    },
+    'City Square': {
+        'City Square - 1 Grain',
+        'City Square - 10 Grain',
+        'City Square - 100% Enemies',
+        'City Square - 11 Grain',
+        'City Square - 12 Grain',
+        'City Square - 13 Grain',
+        'City Square - 14 Grain',
+        'City Square - 15 Grain',
+        'City Square - 16 Grain',
+        'City Square - 17 Grain',
+        'City Square - 18 Grain',
+        'City Square - 19 Grain',
+        'City Square - 2 Grain',
+        'City Square - 20 Grain',
+        'City Square - 21 Grain',
+        'City Square - 22 Grain',
+        'City Square - 23 Grain',
+        'City Square - 24 Grain',
+        'City Square - 25 Grain',
+        'City Square - 25% Enemies',
+        'City Square - 26 Grain',
+        'City Square - 27 Grain',
+        'City Square - 28 Grain',
+        'City Square - 29 Grain',
+        'City Square - 3 Grain',
+        'City Square - 30 Grain',
+        'City Square - 31 Grain',
+        'City Square - 32 Grain',
+        'City Square - 33 Grain',
+        'City Square - 34 Grain',
+        'City Square - 35 Grain',
+        'City Square - 36 Grain',
+        'City Square - 37 Grain',
+        'City Square - 38 Grain',
+        'City Square - 39 Grain',
+        'City Square - 4 Grain',
+        'City Square - 40 Grain',
+        'City Square - 41 Grain',
+        'City Square - 42 Grain',
+        'City Square - 43 Grain',
+        'City Square - 44 Grain',
+        'City Square - 45 Grain',
+        'City Square - 46 Grain',
+        'City Square - 47 Grain',
+        'City Square - 48 Grain',
+        'City Square - 49 Grain',
+        'City Square - 5 Grain',
+        'City Square - 50 Grain',
+        'City Square - 50% Enemies',
+        'City Square - 6 Grain',
+        'City Square - 7 Grain',
+        'City Square - 75% Enemies',
+        'City Square - 8 Grain',
+        'City Square - 9 Grain',
+        'City Square - All Enemies',
+        'City Square - All Grain',
+        'City Square - F Letter',
+        'City Square - FLIK Letters',
+        'City Square - I Letter',
+        'City Square - K Letter',
+        'City Square - L Letter',
+        'City Square - Level Complete',
+    },
+    'Cliffside': {
+        'Cliffside - 1 Grain',
+        'Cliffside - 10 Grain',
+        'Cliffside - 100% Enemies',
+        'Cliffside - 11 Grain',
+        'Cliffside - 12 Grain',
+        'Cliffside - 13 Grain',
+        'Cliffside - 14 Grain',
+        'Cliffside - 15 Grain',
+        'Cliffside - 16 Grain',
+        'Cliffside - 17 Grain',
+        'Cliffside - 18 Grain',
+        'Cliffside - 19 Grain',
+        'Cliffside - 2 Grain',
+        'Cliffside - 20 Grain',
+        'Cliffside - 21 Grain',
+        'Cliffside - 22 Grain',
+        'Cliffside - 23 Grain',
+        'Cliffside - 24 Grain',
+        'Cliffside - 25 Grain',
+        'Cliffside - 25% Enemies',
+        'Cliffside - 26 Grain',
+        'Cliffside - 27 Grain',
+        'Cliffside - 28 Grain',
+        'Cliffside - 29 Grain',
+        'Cliffside - 3 Grain',
+        'Cliffside - 30 Grain',
+        'Cliffside - 31 Grain',
+        'Cliffside - 32 Grain',
+        'Cliffside - 33 Grain',
+        'Cliffside - 34 Grain',
+        'Cliffside - 35 Grain',
+        'Cliffside - 36 Grain',
+        'Cliffside - 37 Grain',
+        'Cliffside - 38 Grain',
+        'Cliffside - 39 Grain',
+        'Cliffside - 4 Grain',
+        'Cliffside - 40 Grain',
+        'Cliffside - 41 Grain',
+        'Cliffside - 42 Grain',
+        'Cliffside - 43 Grain',
+        'Cliffside - 44 Grain',
+        'Cliffside - 45 Grain',
+        'Cliffside - 46 Grain',
+        'Cliffside - 47 Grain',
+        'Cliffside - 48 Grain',
+        'Cliffside - 49 Grain',
+        'Cliffside - 5 Grain',
+        'Cliffside - 50 Grain',
+        'Cliffside - 50% Enemies',
+        'Cliffside - 6 Grain',
+        'Cliffside - 7 Grain',
+        'Cliffside - 75% Enemies',
+        'Cliffside - 8 Grain',
+        'Cliffside - 9 Grain',
+        'Cliffside - All Enemies',
+        'Cliffside - All Grain',
+        'Cliffside - F Letter',
+        'Cliffside - FLIK Letters',
+        'Cliffside - I Letter',
+        'Cliffside - K Letter',
+        'Cliffside - L Letter',
+        'Cliffside - Level Complete',
+    },
+    'Clover Forest': {
+        'Clover Forest - 1 Grain',
+        'Clover Forest - 10 Grain',
+        'Clover Forest - 100% Enemies',
+        'Clover Forest - 11 Grain',
+        'Clover Forest - 12 Grain',
+        'Clover Forest - 13 Grain',
+        'Clover Forest - 14 Grain',
+        'Clover Forest - 15 Grain',
+        'Clover Forest - 16 Grain',
+        'Clover Forest - 17 Grain',
+        'Clover Forest - 18 Grain',
+        'Clover Forest - 19 Grain',
+        'Clover Forest - 2 Grain',
+        'Clover Forest - 20 Grain',
+        'Clover Forest - 21 Grain',
+        'Clover Forest - 22 Grain',
+        'Clover Forest - 23 Grain',
+        'Clover Forest - 24 Grain',
+        'Clover Forest - 25 Grain',
+        'Clover Forest - 25% Enemies',
+        'Clover Forest - 26 Grain',
+        'Clover Forest - 27 Grain',
+        'Clover Forest - 28 Grain',
+        'Clover Forest - 29 Grain',
+        'Clover Forest - 3 Grain',
+        'Clover Forest - 30 Grain',
+        'Clover Forest - 31 Grain',
+        'Clover Forest - 32 Grain',
+        'Clover Forest - 33 Grain',
+        'Clover Forest - 34 Grain',
+        'Clover Forest - 35 Grain',
+        'Clover Forest - 36 Grain',
+        'Clover Forest - 37 Grain',
+        'Clover Forest - 38 Grain',
+        'Clover Forest - 39 Grain',
+        'Clover Forest - 4 Grain',
+        'Clover Forest - 40 Grain',
+        'Clover Forest - 41 Grain',
+        'Clover Forest - 42 Grain',
+        'Clover Forest - 43 Grain',
+        'Clover Forest - 44 Grain',
+        'Clover Forest - 45 Grain',
+        'Clover Forest - 46 Grain',
+        'Clover Forest - 47 Grain',
+        'Clover Forest - 48 Grain',
+        'Clover Forest - 49 Grain',
+        'Clover Forest - 5 Grain',
+        'Clover Forest - 50 Grain',
+        'Clover Forest - 50% Enemies',
+        'Clover Forest - 6 Grain',
+        'Clover Forest - 7 Grain',
+        'Clover Forest - 75% Enemies',
+        'Clover Forest - 8 Grain',
+        'Clover Forest - 9 Grain',
+        'Clover Forest - All Enemies',
+        'Clover Forest - All Grain',
+        'Clover Forest - F Letter',
+        'Clover Forest - FLIK Letters',
+        'Clover Forest - I Letter',
+        'Clover Forest - K Letter',
+        'Clover Forest - L Letter',
+        'Clover Forest - Level Complete',
+    },
+    'Riverbed Flight': {
+        'Riverbed Flight - 1 Grain',
+        'Riverbed Flight - 10 Grain',
+        'Riverbed Flight - 100% Enemies',
+        'Riverbed Flight - 11 Grain',
+        'Riverbed Flight - 12 Grain',
+        'Riverbed Flight - 13 Grain',
+        'Riverbed Flight - 14 Grain',
+        'Riverbed Flight - 15 Grain',
+        'Riverbed Flight - 16 Grain',
+        'Riverbed Flight - 17 Grain',
+        'Riverbed Flight - 18 Grain',
+        'Riverbed Flight - 19 Grain',
+        'Riverbed Flight - 2 Grain',
+        'Riverbed Flight - 20 Grain',
+        'Riverbed Flight - 21 Grain',
+        'Riverbed Flight - 22 Grain',
+        'Riverbed Flight - 23 Grain',
+        'Riverbed Flight - 24 Grain',
+        'Riverbed Flight - 25 Grain',
+        'Riverbed Flight - 25% Enemies',
+        'Riverbed Flight - 26 Grain',
+        'Riverbed Flight - 27 Grain',
+        'Riverbed Flight - 28 Grain',
+        'Riverbed Flight - 29 Grain',
+        'Riverbed Flight - 3 Grain',
+        'Riverbed Flight - 30 Grain',
+        'Riverbed Flight - 31 Grain',
+        'Riverbed Flight - 32 Grain',
+        'Riverbed Flight - 33 Grain',
+        'Riverbed Flight - 34 Grain',
+        'Riverbed Flight - 35 Grain',
+        'Riverbed Flight - 36 Grain',
+        'Riverbed Flight - 37 Grain',
+        'Riverbed Flight - 38 Grain',
+        'Riverbed Flight - 39 Grain',
+        'Riverbed Flight - 4 Grain',
+        'Riverbed Flight - 40 Grain',
+        'Riverbed Flight - 41 Grain',
+        'Riverbed Flight - 42 Grain',
+        'Riverbed Flight - 43 Grain',
+        'Riverbed Flight - 44 Grain',
+        'Riverbed Flight - 45 Grain',
+        'Riverbed Flight - 46 Grain',
+        'Riverbed Flight - 47 Grain',
+        'Riverbed Flight - 48 Grain',
+        'Riverbed Flight - 49 Grain',
+        'Riverbed Flight - 5 Grain',
+        'Riverbed Flight - 50 Grain',
+        'Riverbed Flight - 50% Enemies',
+        'Riverbed Flight - 6 Grain',
+        'Riverbed Flight - 7 Grain',
+        'Riverbed Flight - 75% Enemies',
+        'Riverbed Flight - 8 Grain',
+        'Riverbed Flight - 9 Grain',
+        'Riverbed Flight - All Enemies',
+        'Riverbed Flight - All Grain',
+        'Riverbed Flight - F Letter',
+        'Riverbed Flight - FLIK Letters',
+        'Riverbed Flight - I Letter',
+        'Riverbed Flight - K Letter',
+        'Riverbed Flight - L Letter',
+        'Riverbed Flight - Level Complete',
+    },
+    'Ant Hill, Part 2': {
+        'Ant Hill, Part 2 - 1 Grain',
+        'Ant Hill, Part 2 - 10 Grain',
+        'Ant Hill, Part 2 - 100% Enemies',
+        'Ant Hill, Part 2 - 11 Grain',
+        'Ant Hill, Part 2 - 12 Grain',
+        'Ant Hill, Part 2 - 13 Grain',
+        'Ant Hill, Part 2 - 14 Grain',
+        'Ant Hill, Part 2 - 15 Grain',
+        'Ant Hill, Part 2 - 16 Grain',
+        'Ant Hill, Part 2 - 17 Grain',
+        'Ant Hill, Part 2 - 18 Grain',
+        'Ant Hill, Part 2 - 19 Grain',
+        'Ant Hill, Part 2 - 2 Grain',
+        'Ant Hill, Part 2 - 20 Grain',
+        'Ant Hill, Part 2 - 21 Grain',
+        'Ant Hill, Part 2 - 22 Grain',
+        'Ant Hill, Part 2 - 23 Grain',
+        'Ant Hill, Part 2 - 24 Grain',
+        'Ant Hill, Part 2 - 25 Grain',
+        'Ant Hill, Part 2 - 25% Enemies',
+        'Ant Hill, Part 2 - 26 Grain',
+        'Ant Hill, Part 2 - 27 Grain',
+        'Ant Hill, Part 2 - 28 Grain',
+        'Ant Hill, Part 2 - 29 Grain',
+        'Ant Hill, Part 2 - 3 Grain',
+        'Ant Hill, Part 2 - 30 Grain',
+        'Ant Hill, Part 2 - 31 Grain',
+        'Ant Hill, Part 2 - 32 Grain',
+        'Ant Hill, Part 2 - 33 Grain',
+        'Ant Hill, Part 2 - 34 Grain',
+        'Ant Hill, Part 2 - 35 Grain',
+        'Ant Hill, Part 2 - 36 Grain',
+        'Ant Hill, Part 2 - 37 Grain',
+        'Ant Hill, Part 2 - 38 Grain',
+        'Ant Hill, Part 2 - 39 Grain',
+        'Ant Hill, Part 2 - 4 Grain',
+        'Ant Hill, Part 2 - 40 Grain',
+        'Ant Hill, Part 2 - 41 Grain',
+        'Ant Hill, Part 2 - 42 Grain',
+        'Ant Hill, Part 2 - 43 Grain',
+        'Ant Hill, Part 2 - 44 Grain',
+        'Ant Hill, Part 2 - 45 Grain',
+        'Ant Hill, Part 2 - 46 Grain',
+        'Ant Hill, Part 2 - 47 Grain',
+        'Ant Hill, Part 2 - 48 Grain',
+        'Ant Hill, Part 2 - 49 Grain',
+        'Ant Hill, Part 2 - 5 Grain',
+        'Ant Hill, Part 2 - 50 Grain',
+        'Ant Hill, Part 2 - 50% Enemies',
+        'Ant Hill, Part 2 - 6 Grain',
+        'Ant Hill, Part 2 - 7 Grain',
+        'Ant Hill, Part 2 - 75% Enemies',
+        'Ant Hill, Part 2 - 8 Grain',
+        'Ant Hill, Part 2 - 9 Grain',
+        'Ant Hill, Part 2 - All Enemies',
+        'Ant Hill, Part 2 - All Grain',
+        'Ant Hill, Part 2 - F Letter',
+        'Ant Hill, Part 2 - FLIK Letters',
+        'Ant Hill, Part 2 - I Letter',
+        'Ant Hill, Part 2 - K Letter',
+        'Ant Hill, Part 2 - L Letter',
+        'Ant Hill, Part 2 - Level Complete',
+    },
+    'Riverbed Canyon': {
+        'Riverbed Canyon - 1 Grain',
+        'Riverbed Canyon - 10 Grain',
+        'Riverbed Canyon - 100% Enemies',
+        'Riverbed Canyon - 11 Grain',
+        'Riverbed Canyon - 12 Grain',
+        'Riverbed Canyon - 13 Grain',
+        'Riverbed Canyon - 14 Grain',
+        'Riverbed Canyon - 15 Grain',
+        'Riverbed Canyon - 16 Grain',
+        'Riverbed Canyon - 17 Grain',
+        'Riverbed Canyon - 18 Grain',
+        'Riverbed Canyon - 19 Grain',
+        'Riverbed Canyon - 2 Grain',
+        'Riverbed Canyon - 20 Grain',
+        'Riverbed Canyon - 21 Grain',
+        'Riverbed Canyon - 22 Grain',
+        'Riverbed Canyon - 23 Grain',
+        'Riverbed Canyon - 24 Grain',
+        'Riverbed Canyon - 25 Grain',
+        'Riverbed Canyon - 25% Enemies',
+        'Riverbed Canyon - 26 Grain',
+        'Riverbed Canyon - 27 Grain',
+        'Riverbed Canyon - 28 Grain',
+        'Riverbed Canyon - 29 Grain',
+        'Riverbed Canyon - 3 Grain',
+        'Riverbed Canyon - 30 Grain',
+        'Riverbed Canyon - 31 Grain',
+        'Riverbed Canyon - 32 Grain',
+        'Riverbed Canyon - 33 Grain',
+        'Riverbed Canyon - 34 Grain',
+        'Riverbed Canyon - 35 Grain',
+        'Riverbed Canyon - 36 Grain',
+        'Riverbed Canyon - 37 Grain',
+        'Riverbed Canyon - 38 Grain',
+        'Riverbed Canyon - 39 Grain',
+        'Riverbed Canyon - 4 Grain',
+        'Riverbed Canyon - 40 Grain',
+        'Riverbed Canyon - 41 Grain',
+        'Riverbed Canyon - 42 Grain',
+        'Riverbed Canyon - 43 Grain',
+        'Riverbed Canyon - 44 Grain',
+        'Riverbed Canyon - 45 Grain',
+        'Riverbed Canyon - 46 Grain',
+        'Riverbed Canyon - 47 Grain',
+        'Riverbed Canyon - 48 Grain',
+        'Riverbed Canyon - 49 Grain',
+        'Riverbed Canyon - 5 Grain',
+        'Riverbed Canyon - 50 Grain',
+        'Riverbed Canyon - 50% Enemies',
+        'Riverbed Canyon - 6 Grain',
+        'Riverbed Canyon - 7 Grain',
+        'Riverbed Canyon - 75% Enemies',
+        'Riverbed Canyon - 8 Grain',
+        'Riverbed Canyon - 9 Grain',
+        'Riverbed Canyon - All Enemies',
+        'Riverbed Canyon - All Grain',
+        'Riverbed Canyon - F Letter',
+        'Riverbed Canyon - FLIK Letters',
+        'Riverbed Canyon - I Letter',
+        'Riverbed Canyon - K Letter',
+        'Riverbed Canyon - L Letter',
+        'Riverbed Canyon - Level Complete',
+    },
+    'Bird Nest': {
+        'Bird Nest - 1 Grain',
+        'Bird Nest - 10 Grain',
+        'Bird Nest - 100% Enemies',
+        'Bird Nest - 11 Grain',
+        'Bird Nest - 12 Grain',
+        'Bird Nest - 13 Grain',
+        'Bird Nest - 14 Grain',
+        'Bird Nest - 15 Grain',
+        'Bird Nest - 16 Grain',
+        'Bird Nest - 17 Grain',
+        'Bird Nest - 18 Grain',
+        'Bird Nest - 19 Grain',
+        'Bird Nest - 2 Grain',
+        'Bird Nest - 20 Grain',
+        'Bird Nest - 21 Grain',
+        'Bird Nest - 22 Grain',
+        'Bird Nest - 23 Grain',
+        'Bird Nest - 24 Grain',
+        'Bird Nest - 25 Grain',
+        'Bird Nest - 25% Enemies',
+        'Bird Nest - 26 Grain',
+        'Bird Nest - 27 Grain',
+        'Bird Nest - 28 Grain',
+        'Bird Nest - 29 Grain',
+        'Bird Nest - 3 Grain',
+        'Bird Nest - 30 Grain',
+        'Bird Nest - 31 Grain',
+        'Bird Nest - 32 Grain',
+        'Bird Nest - 33 Grain',
+        'Bird Nest - 34 Grain',
+        'Bird Nest - 35 Grain',
+        'Bird Nest - 36 Grain',
+        'Bird Nest - 37 Grain',
+        'Bird Nest - 38 Grain',
+        'Bird Nest - 39 Grain',
+        'Bird Nest - 4 Grain',
+        'Bird Nest - 40 Grain',
+        'Bird Nest - 41 Grain',
+        'Bird Nest - 42 Grain',
+        'Bird Nest - 43 Grain',
+        'Bird Nest - 44 Grain',
+        'Bird Nest - 45 Grain',
+        'Bird Nest - 46 Grain',
+        'Bird Nest - 47 Grain',
+        'Bird Nest - 48 Grain',
+        'Bird Nest - 49 Grain',
+        'Bird Nest - 5 Grain',
+        'Bird Nest - 50 Grain',
+        'Bird Nest - 50% Enemies',
+        'Bird Nest - 6 Grain',
+        'Bird Nest - 7 Grain',
+        'Bird Nest - 75% Enemies',
+        'Bird Nest - 8 Grain',
+        'Bird Nest - 9 Grain',
+        'Bird Nest - All Enemies',
+        'Bird Nest - All Grain',
+        'Bird Nest - F Letter',
+        'Bird Nest - FLIK Letters',
+        'Bird Nest - I Letter',
+        'Bird Nest - K Letter',
+        'Bird Nest - L Letter',
+        'Bird Nest - Level Complete',
+    },
+    'The Tree': {
+        'The Tree - 1 Grain',
+        'The Tree - 10 Grain',
+        'The Tree - 100% Enemies',
+        'The Tree - 11 Grain',
+        'The Tree - 12 Grain',
+        'The Tree - 13 Grain',
+        'The Tree - 14 Grain',
+        'The Tree - 15 Grain',
+        'The Tree - 16 Grain',
+        'The Tree - 17 Grain',
+        'The Tree - 18 Grain',
+        'The Tree - 19 Grain',
+        'The Tree - 2 Grain',
+        'The Tree - 20 Grain',
+        'The Tree - 21 Grain',
+        'The Tree - 22 Grain',
+        'The Tree - 23 Grain',
+        'The Tree - 24 Grain',
+        'The Tree - 25 Grain',
+        'The Tree - 25% Enemies',
+        'The Tree - 26 Grain',
+        'The Tree - 27 Grain',
+        'The Tree - 28 Grain',
+        'The Tree - 29 Grain',
+        'The Tree - 3 Grain',
+        'The Tree - 30 Grain',
+        'The Tree - 31 Grain',
+        'The Tree - 32 Grain',
+        'The Tree - 33 Grain',
+        'The Tree - 34 Grain',
+        'The Tree - 35 Grain',
+        'The Tree - 36 Grain',
+        'The Tree - 37 Grain',
+        'The Tree - 38 Grain',
+        'The Tree - 39 Grain',
+        'The Tree - 4 Grain',
+        'The Tree - 40 Grain',
+        'The Tree - 41 Grain',
+        'The Tree - 42 Grain',
+        'The Tree - 43 Grain',
+        'The Tree - 44 Grain',
+        'The Tree - 45 Grain',
+        'The Tree - 46 Grain',
+        'The Tree - 47 Grain',
+        'The Tree - 48 Grain',
+        'The Tree - 49 Grain',
+        'The Tree - 5 Grain',
+        'The Tree - 50 Grain',
+        'The Tree - 50% Enemies',
+        'The Tree - 6 Grain',
+        'The Tree - 7 Grain',
+        'The Tree - 75% Enemies',
+        'The Tree - 8 Grain',
+        'The Tree - 9 Grain',
+        'The Tree - All Enemies',
+        'The Tree - All Grain',
+        'The Tree - F Letter',
+        'The Tree - FLIK Letters',
+        'The Tree - I Letter',
+        'The Tree - K Letter',
+        'The Tree - L Letter',
+        'The Tree - Level Complete',
+    },
+    'Battle Arena': {
+        'Battle Arena - 1 Grain',
+        'Battle Arena - 10 Grain',
+        'Battle Arena - 100% Enemies',
+        'Battle Arena - 11 Grain',
+        'Battle Arena - 12 Grain',
+        'Battle Arena - 13 Grain',
+        'Battle Arena - 14 Grain',
+        'Battle Arena - 15 Grain',
+        'Battle Arena - 16 Grain',
+        'Battle Arena - 17 Grain',
+        'Battle Arena - 18 Grain',
+        'Battle Arena - 19 Grain',
+        'Battle Arena - 2 Grain',
+        'Battle Arena - 20 Grain',
+        'Battle Arena - 21 Grain',
+        'Battle Arena - 22 Grain',
+        'Battle Arena - 23 Grain',
+        'Battle Arena - 24 Grain',
+        'Battle Arena - 25 Grain',
+        'Battle Arena - 25% Enemies',
+        'Battle Arena - 26 Grain',
+        'Battle Arena - 27 Grain',
+        'Battle Arena - 28 Grain',
+        'Battle Arena - 29 Grain',
+        'Battle Arena - 3 Grain',
+        'Battle Arena - 30 Grain',
+        'Battle Arena - 31 Grain',
+        'Battle Arena - 32 Grain',
+        'Battle Arena - 33 Grain',
+        'Battle Arena - 34 Grain',
+        'Battle Arena - 35 Grain',
+        'Battle Arena - 36 Grain',
+        'Battle Arena - 37 Grain',
+        'Battle Arena - 38 Grain',
+        'Battle Arena - 39 Grain',
+        'Battle Arena - 4 Grain',
+        'Battle Arena - 40 Grain',
+        'Battle Arena - 41 Grain',
+        'Battle Arena - 42 Grain',
+        'Battle Arena - 43 Grain',
+        'Battle Arena - 44 Grain',
+        'Battle Arena - 45 Grain',
+        'Battle Arena - 46 Grain',
+        'Battle Arena - 47 Grain',
+        'Battle Arena - 48 Grain',
+        'Battle Arena - 49 Grain',
+        'Battle Arena - 5 Grain',
+        'Battle Arena - 50 Grain',
+        'Battle Arena - 50% Enemies',
+        'Battle Arena - 6 Grain',
+        'Battle Arena - 7 Grain',
+        'Battle Arena - 75% Enemies',
+        'Battle Arena - 8 Grain',
+        'Battle Arena - 9 Grain',
+        'Battle Arena - All Enemies',
+        'Battle Arena - All Grain',
+        'Battle Arena - F Letter',
+        'Battle Arena - FLIK Letters',
+        'Battle Arena - I Letter',
+        'Battle Arena - K Letter',
+        'Battle Arena - L Letter',
+        'Battle Arena - Level Complete',
+    },
+    'Bug Bar': {
+        'Bug Bar - 1 Grain',
+        'Bug Bar - 10 Grain',
+        'Bug Bar - 100% Enemies',
+        'Bug Bar - 11 Grain',
+        'Bug Bar - 12 Grain',
+        'Bug Bar - 13 Grain',
+        'Bug Bar - 14 Grain',
+        'Bug Bar - 15 Grain',
+        'Bug Bar - 16 Grain',
+        'Bug Bar - 17 Grain',
+        'Bug Bar - 18 Grain',
+        'Bug Bar - 19 Grain',
+        'Bug Bar - 2 Grain',
+        'Bug Bar - 20 Grain',
+        'Bug Bar - 21 Grain',
+        'Bug Bar - 22 Grain',
+        'Bug Bar - 23 Grain',
+        'Bug Bar - 24 Grain',
+        'Bug Bar - 25 Grain',
+        'Bug Bar - 25% Enemies',
+        'Bug Bar - 26 Grain',
+        'Bug Bar - 27 Grain',
+        'Bug Bar - 28 Grain',
+        'Bug Bar - 29 Grain',
+        'Bug Bar - 3 Grain',
+        'Bug Bar - 30 Grain',
+        'Bug Bar - 31 Grain',
+        'Bug Bar - 32 Grain',
+        'Bug Bar - 33 Grain',
+        'Bug Bar - 34 Grain',
+        'Bug Bar - 35 Grain',
+        'Bug Bar - 36 Grain',
+        'Bug Bar - 37 Grain',
+        'Bug Bar - 38 Grain',
+        'Bug Bar - 39 Grain',
+        'Bug Bar - 4 Grain',
+        'Bug Bar - 40 Grain',
+        'Bug Bar - 41 Grain',
+        'Bug Bar - 42 Grain',
+        'Bug Bar - 43 Grain',
+        'Bug Bar - 44 Grain',
+        'Bug Bar - 45 Grain',
+        'Bug Bar - 46 Grain',
+        'Bug Bar - 47 Grain',
+        'Bug Bar - 48 Grain',
+        'Bug Bar - 49 Grain',
+        'Bug Bar - 5 Grain',
+        'Bug Bar - 50 Grain',
+        'Bug Bar - 50% Enemies',
+        'Bug Bar - 6 Grain',
+        'Bug Bar - 7 Grain',
+        'Bug Bar - 75% Enemies',
+        'Bug Bar - 8 Grain',
+        'Bug Bar - 9 Grain',
+        'Bug Bar - All Enemies',
+        'Bug Bar - All Grain',
+        'Bug Bar - F Letter',
+        'Bug Bar - FLIK Letters',
+        'Bug Bar - I Letter',
+        'Bug Bar - K Letter',
+        'Bug Bar - L Letter',
+        'Bug Bar - Level Complete',
+    },
+    'Canyon Showdown': {
+        'Canyon Showdown - 1 Grain',
+        'Canyon Showdown - 10 Grain',
+        'Canyon Showdown - 100% Enemies',
+        'Canyon Showdown - 11 Grain',
+        'Canyon Showdown - 12 Grain',
+        'Canyon Showdown - 13 Grain',
+        'Canyon Showdown - 14 Grain',
+        'Canyon Showdown - 15 Grain',
+        'Canyon Showdown - 16 Grain',
+        'Canyon Showdown - 17 Grain',
+        'Canyon Showdown - 18 Grain',
+        'Canyon Showdown - 19 Grain',
+        'Canyon Showdown - 2 Grain',
+        'Canyon Showdown - 20 Grain',
+        'Canyon Showdown - 21 Grain',
+        'Canyon Showdown - 22 Grain',
+        'Canyon Showdown - 23 Grain',
+        'Canyon Showdown - 24 Grain',
+        'Canyon Showdown - 25 Grain',
+        'Canyon Showdown - 25% Enemies',
+        'Canyon Showdown - 26 Grain',
+        'Canyon Showdown - 27 Grain',
+        'Canyon Showdown - 28 Grain',
+        'Canyon Showdown - 29 Grain',
+        'Canyon Showdown - 3 Grain',
+        'Canyon Showdown - 30 Grain',
+        'Canyon Showdown - 31 Grain',
+        'Canyon Showdown - 32 Grain',
+        'Canyon Showdown - 33 Grain',
+        'Canyon Showdown - 34 Grain',
+        'Canyon Showdown - 35 Grain',
+        'Canyon Showdown - 36 Grain',
+        'Canyon Showdown - 37 Grain',
+        'Canyon Showdown - 38 Grain',
+        'Canyon Showdown - 39 Grain',
+        'Canyon Showdown - 4 Grain',
+        'Canyon Showdown - 40 Grain',
+        'Canyon Showdown - 41 Grain',
+        'Canyon Showdown - 42 Grain',
+        'Canyon Showdown - 43 Grain',
+        'Canyon Showdown - 44 Grain',
+        'Canyon Showdown - 45 Grain',
+        'Canyon Showdown - 46 Grain',
+        'Canyon Showdown - 47 Grain',
+        'Canyon Showdown - 48 Grain',
+        'Canyon Showdown - 49 Grain',
+        'Canyon Showdown - 5 Grain',
+        'Canyon Showdown - 50 Grain',
+        'Canyon Showdown - 50% Enemies',
+        'Canyon Showdown - 6 Grain',
+        'Canyon Showdown - 7 Grain',
+        'Canyon Showdown - 75% Enemies',
+        'Canyon Showdown - 8 Grain',
+        'Canyon Showdown - 9 Grain',
+        'Canyon Showdown - All Enemies',
+        'Canyon Showdown - All Grain',
+        'Canyon Showdown - F Letter',
+        'Canyon Showdown - FLIK Letters',
+        'Canyon Showdown - I Letter',
+        'Canyon Showdown - K Letter',
+        'Canyon Showdown - L Letter',
+        'Canyon Showdown - Level Complete',
+    },
+    'Training': {
+        'Training - 1 Grain',
+        'Training - 10 Grain',
+        'Training - 100% Enemies',
+        'Training - 11 Grain',
+        'Training - 12 Grain',
+        'Training - 13 Grain',
+        'Training - 14 Grain',
+        'Training - 15 Grain',
+        'Training - 16 Grain',
+        'Training - 17 Grain',
+        'Training - 18 Grain',
+        'Training - 19 Grain',
+        'Training - 2 Grain',
+        'Training - 20 Grain',
+        'Training - 21 Grain',
+        'Training - 22 Grain',
+        'Training - 23 Grain',
+        'Training - 24 Grain',
+        'Training - 25 Grain',
+        'Training - 25% Enemies',
+        'Training - 26 Grain',
+        'Training - 27 Grain',
+        'Training - 28 Grain',
+        'Training - 29 Grain',
+        'Training - 3 Grain',
+        'Training - 30 Grain',
+        'Training - 31 Grain',
+        'Training - 32 Grain',
+        'Training - 33 Grain',
+        'Training - 34 Grain',
+        'Training - 35 Grain',
+        'Training - 36 Grain',
+        'Training - 37 Grain',
+        'Training - 38 Grain',
+        'Training - 39 Grain',
+        'Training - 4 Grain',
+        'Training - 40 Grain',
+        'Training - 41 Grain',
+        'Training - 42 Grain',
+        'Training - 43 Grain',
+        'Training - 44 Grain',
+        'Training - 45 Grain',
+        'Training - 46 Grain',
+        'Training - 47 Grain',
+        'Training - 48 Grain',
+        'Training - 49 Grain',
+        'Training - 5 Grain',
+        'Training - 50 Grain',
+        'Training - 50% Enemies',
+        'Training - 6 Grain',
+        'Training - 7 Grain',
+        'Training - 75% Enemies',
+        'Training - 8 Grain',
+        'Training - 9 Grain',
+        'Training - All Enemies',
+        'Training - All Grain',
+        'Training - F Letter',
+        'Training - FLIK Letters',
+        'Training - I Letter',
+        'Training - K Letter',
+        'Training - L Letter',
+        'Training - Level Complete',
+    },
+}
@@ -0,0 +1,106 @@
+"""Fold received items into the per-level tiers the client keeps.
+
+The client raises a level's berry tier, or one of its seed tiers, by one for
+every progressive item it receives, and ignores items past the tier's cap
+(``SeedUpgradeCaps`` in client/Program.cs). Every tier is a saturating counter
+of its own, so the final state does not depend on item order: a tier ends at
+``min(start + copies, cap)``. reduce_items() counts a whole backlog once and
+clamps, where the client used to replay it item by item and save the tier
+state after each one. This is the reference implementation; client/Program.cs
+and ablbridge fold their backlogs the same way.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .Items import ITEM_TABLE, KIND_BERRY, PROGRESSIVE_PREFIXES
+
+EXTRA_LIFE_ID = ITEM_TABLE["Extra Life"]
+HEALTH_UPGRADE_ID = ITEM_TABLE["Health Upgrade"]
+
+MAX_BERRY_TIER = 4
+SEED_COLOURS = 5  # brown, green, blue, purple, yellow: ABLItem.kind - 1
+
+# Per level: how many upgrades each seed colour can take, in SEED_COLOURS order.
+SEED_UPGRADE_CAPS: Dict[int, Tuple[int, ...]] = {
+    17: (1, 2, 0, 4, 0),
+    1:  (4, 3, 3, 0, 0),
+    3:  (1, 2, 0, 4, 0),
+    2:  (1, 0, 0, 4, 0),
+    6:  (3, 2, 0, 0, 0),
+    10: (2, 4, 3, 0, 0),
+    11: (1, 0, 4, 0, 2),
+    4:  (1, 4, 1, 4, 2),
+    5:  (2, 2, 4, 4, 0),
+    14: (1, 0, 0, 0, 0),
+    7:  (4, 2, 3, 2, 0),
+    12: (4, 4, 0, 0, 0),
+    13: (1, 3, 0, 4, 0),
+    9:  (2, 4, 4, 0, 3),
+    8:  (1, 0, 0, 0, 0),
+    15: (2, 0, 3, 0, 0),
+}
+
+# Levels where purple seeds grant berries / there is no gold berry.
+BERRY_PROGRESSION_DISABLED_LEVELS = frozenset({17, 3, 2, 4, 5, 13, 9})
+
+
+class ReceivedTiers(NamedTuple):
+    berry: Dict[int, int]  # level -> berry tier, levels above 0 only
+    seeds: Dict[int, Tuple[int, ...]]  # level -> seed tiers, levels with any above 0 only
+    extra_lives: int
+    health_upgrades: int
+
+
+@lru_cache(maxsize=None)
+def tier_slots() -> Dict[int, Tuple[int, int, int]]:
+    """item id -> (level, kind, cap) for every progressive item the client applies."""
+    slots: Dict[int, Tuple[int, int, int]] = {}
+    for kind, base in enumerate(PROGRESSIVE_PREFIXES.values()):
+        for level_idx, caps in SEED_UPGRADE_CAPS.items():
+            if kind == KIND_BERRY:
+                cap = 0 if level_idx in BERRY_PROGRESSION_DISABLED_LEVELS else MAX_BERRY_TIER
+            else:
+                cap = caps[kind - 1]
+            if cap:
+                slots[base + level_idx] = (level_idx, kind, cap)
+    return slots
+
+
+def reduce_items(
+    item_ids: Iterable[int],
+    berry: Optional[Mapping[int, int]] = None,
+    seeds: Optional[Mapping[int, Sequence[int]]] = None,
+) -> ReceivedTiers:
+    """The tiers after receiving ``item_ids`` on top of ``berry`` / ``seeds``.
+
+    Equivalent to applying the items one at a time with the client's caps, in
+    one pass over the ids plus one step per distinct item.
+    """
+    counts = Counter(item_ids)
+    new_berry = {level_idx: tier for level_idx, tier in (berry or {}).items() if tier > 0}
+    new_seeds = {level_idx: list(tiers) for level_idx, tiers in (seeds or {}).items() if any(tiers)}
+    slots = tier_slots()
+
+    for item_id, copies in counts.items():
+        slot = slots.get(item_id)
+        if slot is None:
+            continue
+        level_idx, kind, cap = slot
+        if kind == KIND_BERRY:
+            current = new_berry.get(level_idx, 0)
+            if current < cap:
+                new_berry[level_idx] = min(current + copies, cap)
+        else:
+            tiers = new_seeds.setdefault(level_idx, [0] * SEED_COLOURS)
+            if tiers[kind - 1] < cap:
+                tiers[kind - 1] = min(tiers[kind - 1] + copies, cap)
+
+    return ReceivedTiers(
+        new_berry,
+        {level_idx: tuple(tiers) for level_idx, tiers in new_seeds.items() if any(tiers)},
+        counts[EXTRA_LIFE_ID],
+        counts[HEALTH_UPGRADE_ID],
+    )
@@ -1,79 +1,121 @@
 from __future__ import annotations
 
-import itertools
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Tuple
 
 from BaseClasses import Region, Entrance, Location, Item, ItemClassification
 from worlds.AutoWorld import World, WebWorld
 from worlds.generic.Rules import set_rule
 
-from .Items import ITEM_TABLE, REVERSE_ITEM_TABLE, create_item, LEVEL_NAMES
+from .Items import ABLItem, ITEM_TABLE, KIND_NONE, create_item, create_items, LEVEL_NAMES
 from .Locations import (
     ABLLoc,
-    LOCATION_TABLE,
-    build_grainsanity_locations,
-    build_enemysanity_locations,
-    ALL_GRAINSANITY_LOCATIONS,
-    ALL_ENEMYSANITY_LOCATIONS,
+    LocationPlanKey,
+    PlannedLocation,
+    ENEMY_KILLS_BY_LEVEL,
+    check_lookup,
+    check_tables,
+    plan_locations,
 )
+from .Instrument import counted_level_rule, generation_stats, timed, write_stats
+from .Tables import ITEM_NAME_GROUPS, LOCATION_NAME_GROUPS, LOCATION_NAME_TO_ID
 
 from .Options import BugsLifeOptions
+from .Rules import (
+    GOLD_BERRY_LEVELS,
+    BERRY_PROXY_BY_LEVEL,
+    LEVEL_COMPLETE_REQS,
+    level_access_rule,
+    logical_copies,
+    progressive_item_name,
+    required_progressives,
+    update_tier,
+)
+from .Tiers import tier_slots
+
+ENEMY_MAX_BY_LEVEL = {level_idx: kills[-1] for level_idx, kills in ENEMY_KILLS_BY_LEVEL.items()}
+
+
+_FILLER_KINDS = ["brown", "green", "blue", "purple", "yellow", "berry"]
+
+FILLER_CYCLE: Tuple[str, ...] = tuple(
+    progressive_item_name(kind, level_idx)
+    for level_idx in sorted(LEVEL_NAMES.keys())
+    for kind in _FILLER_KINDS
+)
+
+
+@lru_cache(maxsize=None)
+def item_pool_counts(level_complete: bool, total_locations: int) -> Tuple[Tuple[str, int], ...]:
+    """(item name, copies) making up a slot's pool, one item per location.
 
-GOLD_BERRY_LEVELS = {1, 6, 10, 11, 14, 7, 12, 8, 15}
-
-BERRY_PROXY_BY_LEVEL: Dict[int, str] = {
-    17: "purple",  # Training
-    3:  "purple",  # Tunnels
-    2:  "purple",  # Council Chamber
-    4:  "purple",  # City Entrance
-    5:  "purple",  # City Square
-    13: "purple",  # Battle Arena
-    9:  "yellow",  # Ant Hill, Part 2
-}
-
-LEVEL_COMPLETE_REQS: Dict[int, List[Dict[str, int]]] = {
-    17: [{"brown": 1, "green": 2, "blue": 0, "yellow": 0, "berry": 0}],
-    1:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    3:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    2:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
-    6:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    10: [
-        {"brown": 2, "green": 0, "blue": 0, "yellow": 0, "berry": 0},
-        {"brown": 1, "green": 4, "blue": 0, "yellow": 0, "berry": 0},
-    ],
-    11: [
-        {"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1},
-        {"brown": 1, "green": 0, "blue": 0, "yellow": 1, "berry": 0},
-    ],
-    4:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    5:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    14: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
-    7:  [{"brown": 4, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    12: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    13: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
-    9:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 2, "berry": 0}],
-    8:  [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 0}],
-    15: [{"brown": 1, "green": 0, "blue": 0, "yellow": 0, "berry": 1}],
-}
-
-ENEMY_MAX_BY_LEVEL = {
-    17: 4,
-    1:  21,
-    3:  50,
-    2:  3,
-    6:  12,
-    10: 51,
-    11: 9,
-    4:  26,
-    5:  23,
-    14: 1,
-    7:  24,
-    12: 32,
-    13: 4,
-    9:  15,
-    8:  56,
-    15: 16,
-}
+    Required progressives come first; the remaining locations are padded by
+    cycling over every level and kind, so each name's share of the padding is
+    a whole number of cycles plus one for the first names of a partial cycle.
+    """
+    counts: Dict[str, int] = {}
+    if level_complete:
+        required = required_progressives()
+        for (kind, level_idx) in sorted(required.keys(), key=lambda k: (k[1], k[0])):
+            counts[progressive_item_name(kind, level_idx)] = required[(kind, level_idx)]
+
+    required_total = sum(counts.values())
+    if required_total > total_locations:
+        raise Exception(
+            f"Too many required progression items for enabled locations: "
+            f"{required_total} items for {total_locations} locations. "
+            f"Disable some location categories/options."
+        )
+
+    full_cycles, partial = divmod(total_locations - required_total, len(FILLER_CYCLE))
+    for i, name in enumerate(FILLER_CYCLE):
+        copies = full_cycles + (1 if i < partial else 0)
+        if copies:
+            counts[name] = counts.get(name, 0) + copies
+
+    return tuple(counts.items())
+
+
+@lru_cache(maxsize=None)
+def copy_limits() -> Dict[str, Tuple[int, int]]:
+    """Item name -> (copies an entrance rule can need, copies the client applies)."""
+    needed = logical_copies()
+    slots = tier_slots()
+    return {
+        name: (needed.get(name, 0), slots[code][2] if code in slots else 0)
+        for name, code in ITEM_TABLE.items()
+    }
+
+
+def classify_copies(name: str, copies: int, level_complete: bool) -> Iterator[Tuple[ItemClassification, int]]:
+    """Split ``copies`` of an item into progression, useful and filler copies.
+
+    Only copies some entrance rule can need are progression; the rest raise a
+    tier the client still applies (useful) or are past its cap (filler). Without
+    Level Complete there are no entrance rules and nothing is progression.
+    """
+    needed, usable = copy_limits()[name]
+    if not level_complete:
+        needed = 0
+    progression = min(copies, needed)
+    useful = min(copies - progression, max(usable - needed, 0))
+    for classification, count in (
+        (ItemClassification.progression, progression),
+        (ItemClassification.useful, useful),
+        (ItemClassification.filler, copies - progression - useful),
+    ):
+        if count:
+            yield classification, count
+
+
+@lru_cache(maxsize=None)
+def item_pool(level_complete: bool, total_locations: int) -> Tuple[Tuple[str, ItemClassification, int], ...]:
+    """item_pool_counts() as (item name, classification, copies)."""
+    return tuple(
+        (name, classification, count)
+        for name, copies in item_pool_counts(level_complete, total_locations)
+        for classification, count in classify_copies(name, copies, level_complete)
+    )
 
 
 class BugsLifeWeb(WebWorld):
@@ -92,283 +134,144 @@ class BugsLifeWorld(World):
     data_version = 0
     required_client_version = (0, 6, 0)
 
+    # Prebuilt in Tables.py; AutoWorldRegister derives the id -> name maps.
     item_name_to_id = ITEM_TABLE
-    item_id_to_name = REVERSE_ITEM_TABLE
-    location_name_to_id = {
-        **LOCATION_TABLE,
-        **ALL_GRAINSANITY_LOCATIONS,
-        **ALL_ENEMYSANITY_LOCATIONS,
-    }
+    location_name_to_id = LOCATION_NAME_TO_ID
+    item_name_groups = ITEM_NAME_GROUPS
+    location_name_groups = LOCATION_NAME_GROUPS
     options_dataclass = BugsLifeOptions
     options: BugsLifeOptions
 
-    def generate_early(self) -> None:
-        dynamic: Dict[str, int] = {}
-
-        if self.options.enable_grainsanity.value:
-            step = int(self.options.grainsanity_step.value)
-            for level_idx in LEVEL_NAMES.keys():
-                dynamic.update(build_grainsanity_locations(level_idx, step, 50))
-
-        if (
-            self.options.enable_enemy_25.value
-            or self.options.enable_enemy_50.value
-            or self.options.enable_enemy_75.value
-            or self.options.enable_enemy_100.value
-        ):
-            for level_idx in LEVEL_NAMES.keys():
-                max_e = ENEMY_MAX_BY_LEVEL.get(level_idx, 0)
-                dynamic.update(
-                    build_enemysanity_locations(
-                        level_idx,
-                        max_e,
-                        bool(self.options.enable_enemy_25.value),
-                        bool(self.options.enable_enemy_50.value),
-                        bool(self.options.enable_enemy_75.value),
-                        bool(self.options.enable_enemy_100.value),
-                    )
+    location_plan: Tuple[PlannedLocation, ...]
+    plan_key: LocationPlanKey
+    level_entrances: Dict[int, Entrance]
+
+    @classmethod
+    def _worlds_by_plan_key(cls, multiworld) -> Dict[LocationPlanKey, List[BugsLifeWorld]]:
+        groups: Dict[LocationPlanKey, List[BugsLifeWorld]] = {}
+        for world in multiworld.get_game_worlds(cls.game):
+            key = getattr(world, "plan_key", None) or LocationPlanKey.from_options(world.options)
+            groups.setdefault(key, []).append(world)
+        return groups
+
+    @classmethod
+    @timed("generate_early")
+    def stage_generate_early(cls, multiworld) -> None:
+        # Slots with identical options share one location plan.
+        for key, worlds in cls._worlds_by_plan_key(multiworld).items():
+            plan = plan_locations(key)
+
+            required_items = sum(required_progressives().values()) if key.level_complete else 0
+            if required_items > len(plan):
+                players = ", ".join(multiworld.player_name[world.player] for world in worlds)
+                raise Exception(
+                    f"Too many required progression items for enabled locations: "
+                    f"{required_items} items for {len(plan)} locations. "
+                    f"Disable some location categories/options. (Players: {players})"
                 )
 
-        self._dynamic_location_table = dynamic
-
-    def _location_enabled(self, loc_name: str) -> bool:
-        suffix = loc_name.split(" - ", 1)[1] if " - " in loc_name else loc_name
-
-        if suffix == "Level Complete":
-            return bool(self.options.enable_level_complete.value)
-
-        if suffix == "FLIK Letters":
-            return bool(self.options.enable_flik_all.value)
-
-        if suffix in ("F Letter", "L Letter", "I Letter", "K Letter"):
-            return bool(self.options.enable_flik_individual.value)
-
-        if suffix == "All Grain":
-            return bool(self.options.enable_grain_all.value)
-
-        if suffix.endswith(" Grain"):
-            if not bool(self.options.enable_grainsanity.value):
-                return False
-            try:
-                amt = int(suffix.split(" ", 1)[0])
-            except Exception:
-                return False
-            step = int(self.options.grainsanity_step.value)
-            return (amt % step) == 0
-
-        if suffix.endswith(" Enemies") and "%" in suffix:
-            try:
-                pct = int(suffix.split("%", 1)[0])
-            except Exception:
-                return False
-
-            return {
-                25: bool(self.options.enable_enemy_25.value),
-                50: bool(self.options.enable_enemy_50.value),
-                75: bool(self.options.enable_enemy_75.value),
-                100: bool(self.options.enable_enemy_100.value),
-            }.get(pct, False)
-
-        return True
+            for world in worlds:
+                world.plan_key = key
+                world.location_plan = plan
 
+    @timed("create_regions")
     def create_regions(self) -> None:
         menu = Region("Menu", self.player, self.multiworld)
         self.multiworld.regions.append(menu)
 
+        regions: Dict[int, Region] = {}
+        self.level_entrances: Dict[int, Entrance] = {}
         for level_idx, level_name in LEVEL_NAMES.items():
             r = Region(level_name, self.player, self.multiworld)
             self.multiworld.regions.append(r)
             e = Entrance(self.player, f"Menu -> {level_name}", menu)
             menu.exits.append(e)
             e.connect(r)
+            regions[level_idx] = r
+            self.level_entrances[level_idx] = e
 
-        for loc_name, loc_id in self.location_name_to_id.items():
-            if not self._location_enabled(loc_name):
-                continue
-            level_idx = ABLLoc.get_level_index_from_location_name(loc_name)
-            region_name = LEVEL_NAMES.get(level_idx, "Menu")
-            region = self.multiworld.get_region(region_name, self.player)
-            region.locations.append(ABLLoc(self.player, loc_name, loc_id, region))
+        for loc_name, loc_id, level_idx, category in self.location_plan:
+            region = regions[level_idx]
+            region.locations.append(ABLLoc(self.player, loc_name, loc_id, region, level_idx, category))
 
         victory = VictoryLocation(self.player, "Victory", None, menu)
         victory.event = True
         menu.locations.append(victory)
 
-    def create_items(self) -> None:
-        victory_loc = self.multiworld.get_location("Victory", self.player)
-        if not victory_loc.locked:
-            event_item = Item("Victory", ItemClassification.progression, None, self.player)
-            event_item.classification = ItemClassification.progression
-            victory_loc.place_locked_item(event_item)
-
-        total_locations = len(self.multiworld.get_unfilled_locations(self.player))
-
-        required: Dict[tuple[str, int], int] = {}
-
-        def bump(kind: str, level_idx: int, count: int) -> None:
-            if count <= 0:
-                return
-            key = (kind, level_idx)
-            required[key] = max(required.get(key, 0), count)
-
-        def option_cost(opt: Dict[str, int]) -> int:
-            return (
-                max(0, opt.get("brown", 0) - 1)
-                + max(0, opt.get("green", 0))
-                + max(0, opt.get("blue", 0))
-                + max(0, opt.get("yellow", 0))
-                + max(0, opt.get("berry", 0))
-            )
-
-        if self.options.enable_level_complete.value:
-            for level_idx, alternatives in LEVEL_COMPLETE_REQS.items():
-                chosen = min(alternatives, key=option_cost)
-
-                bump("brown", level_idx, max(0, chosen.get("brown", 0) - 1))
-                bump("green", level_idx, max(0, chosen.get("green", 0)))
-                bump("blue",  level_idx, max(0, chosen.get("blue", 0)))
-                bump("yellow", level_idx, max(0, chosen.get("yellow", 0)))
-
-                berry_tier = max(0, chosen.get("berry", 0))
-                if berry_tier > 0:
-                    if level_idx in GOLD_BERRY_LEVELS:
-                        bump("berry", level_idx, berry_tier)
-                    else:
-                        proxy = BERRY_PROXY_BY_LEVEL.get(level_idx, "purple")
-                        bump("purple" if proxy == "purple" else "yellow", level_idx, berry_tier)
-
-        def name_for(kind: str, level_idx: int) -> str:
-            lvl = LEVEL_NAMES[level_idx]
-            if kind == "berry":
-                return f"Progressive Berry Upgrade - {lvl}"
-            return f"Progressive {kind.capitalize()} Seed Upgrade - {lvl}"
-
-        itempool: List = []
-        for (kind, level_idx) in sorted(required.keys(), key=lambda k: (k[1], k[0])):
-            for _ in range(required[(kind, level_idx)]):
-                itempool.append(create_item(self, name_for(kind, level_idx)))
-
-        if len(itempool) > total_locations:
-            raise Exception(
-                f"Too many required progression items for enabled locations: "
-                f"{len(itempool)} items for {total_locations} locations. "
-                f"Disable some location categories/options."
+        stats = generation_stats(self.multiworld)
+        if stats is not None:
+            stats.count_locations(self.player, (category for *_, category in self.location_plan))
+
+    @classmethod
+    @timed("create_items")
+    def stage_create_items(cls, multiworld) -> None:
+        stats = generation_stats(multiworld)
+        for key, worlds in cls._worlds_by_plan_key(multiworld).items():
+            pool = item_pool(key.level_complete, len(plan_locations(key)))
+
+            for world in worlds:
+                victory_loc = multiworld.get_location("Victory", world.player)
+                if not victory_loc.locked:
+                    event_item = Item("Victory", ItemClassification.progression, None, world.player)
+                    victory_loc.place_locked_item(event_item)
+
+                items = create_items(world.player, pool)
+                multiworld.itempool += items
+                if stats is not None:
+                    stats.count_items(world.player, items)
+
+    @classmethod
+    @timed("set_rules")
+    def stage_set_rules(cls, multiworld) -> None:
+        # Level requirements guard the entrance into each level, so every check
+        # in the level inherits them through region reachability.
+        stats = generation_stats(multiworld)
+
+        for world in multiworld.get_game_worlds(cls.game):
+            player = world.player
+            if world.options.enable_level_complete.value:
+                for level_idx, entrance in world.level_entrances.items():
+                    rule = level_access_rule(player, level_idx)
+                    if rule is None:
+                        continue
+                    if stats is not None:
+                        rule = counted_level_rule(player, level_idx, rule, stats)
+                    set_rule(entrance, rule)
+
+            multiworld.completion_condition[player] = (
+                lambda state, p=player: state.can_reach_location("Victory", p)
             )
 
-        missing = total_locations - len(itempool)
-        if missing > 0:
-            progressive_kinds = ["brown", "green", "blue", "purple", "yellow", "berry"]
-            filler_cycle = [
-                name_for(kind, level_idx)
-                for level_idx in sorted(LEVEL_NAMES.keys())
-                for kind in progressive_kinds
-            ]
-            for nm in itertools.islice(itertools.cycle(filler_cycle), missing):
-                itempool.append(create_item(self, nm))
-
-        total_locations_now = len(self.multiworld.get_unfilled_locations(self.player))
-        toggle = False
-        while len(itempool) < total_locations_now:
-            itempool.append(create_item(self, "Extra Life" if not toggle else "Health Upgrade"))
-            toggle = not toggle
-
-        if len(itempool) != len(self.multiworld.get_unfilled_locations(self.player)):
-            raise Exception(
-                f"Itempool mismatch: items={len(itempool)} "
-                f"locations={len(self.multiworld.get_unfilled_locations(self.player))}"
-            )
+    def create_item(self, name: str) -> Item:
+        classification = next(classify_copies(name, 1, bool(self.options.enable_level_complete.value)))[0]
+        return create_item(self, name, classification)
 
-        self.multiworld.itempool += itempool
-
-    def set_rules(self) -> None:
-        def tier_to_required_progressives(seed: str, tier: int) -> int:
-            if seed == "brown":
-                return max(0, tier - 1)
-            return max(0, tier)
-
-        def has_seed_tier(state, level_idx: int, seed: str, tier: int) -> bool:
-            if tier <= 0:
-                return True
-            required = tier_to_required_progressives(seed, tier)
-            level_name = LEVEL_NAMES[level_idx]
-            item_name = f"Progressive {seed.capitalize()} Seed Upgrade - {level_name}"
-            return state.has(item_name, self.player, required)
-
-        def has_berry_tier(state, level_idx: int, tier: int) -> bool:
-            if tier <= 0:
-                return True
-
-            level_name = LEVEL_NAMES[level_idx]
-
-            if level_idx in GOLD_BERRY_LEVELS:
-                return state.has(f"Progressive Berry Upgrade - {level_name}", self.player, tier)
-
-            proxy = BERRY_PROXY_BY_LEVEL.get(level_idx, "purple")
-            if proxy == "yellow":
-                return has_seed_tier(state, level_idx, "yellow", tier)
-            return has_seed_tier(state, level_idx, "purple", tier)
-
-        def option_satisfied(state, level_idx: int, opt: Dict[str, int]) -> bool:
-            return (
-                has_seed_tier(state, level_idx, "brown", opt.get("brown", 0))
-                and has_seed_tier(state, level_idx, "green", opt.get("green", 0))
-                and has_seed_tier(state, level_idx, "blue", opt.get("blue", 0))
-                and has_seed_tier(state, level_idx, "yellow", opt.get("yellow", 0))
-                and has_berry_tier(state, level_idx, opt.get("berry", 0))
-            )
+    def get_filler_item_name(self) -> str:
+        return "Extra Life"
 
-        if self.options.enable_level_complete.value:
-            for level_idx, options in LEVEL_COMPLETE_REQS.items():
-                loc_name = f"{LEVEL_NAMES[level_idx]} - Level Complete"
-                try:
-                    loc = self.multiworld.get_location(loc_name, self.player)
-                except KeyError:
-                    continue
-                set_rule(
-                    loc,
-                    lambda state, li=level_idx, opts=options: any(
-                        option_satisfied(state, li, o) for o in opts
-                    ),
-                )
+    # Keep the per-level tier counters and entrance flags in the state in step
+    # with prog_items; the entrance rules only read the flags.
+    def collect(self, state, item: Item) -> bool:
+        changed = super().collect(state, item)
+        if changed and isinstance(item, ABLItem) and item.kind != KIND_NONE:
+            update_tier(state, self.player, item, 1)
+        return changed
 
-        self.multiworld.completion_condition[self.player] = (
-            lambda state: state.can_reach_location("Victory", self.player)
-        )
+    def remove(self, state, item: Item) -> bool:
+        changed = super().remove(state, item)
+        if changed and isinstance(item, ABLItem) and item.kind != KIND_NONE:
+            update_tier(state, self.player, item, -1)
+        return changed
 
+    @timed("fill_slot_data")
     def fill_slot_data(self) -> Dict[str, Any]:
-        enable_level_complete = int(self.options.enable_level_complete.value)
-        enable_grain_all = int(self.options.enable_grain_all.value)
-        enable_grainsanity = int(self.options.enable_grainsanity.value)
-        grainsanity_step = int(self.options.grainsanity_step.value)
-        enable_flik_all = int(self.options.enable_flik_all.value)
-        enable_flik_individual = int(self.options.enable_flik_individual.value)
-        enable_enemy_25 = int(self.options.enable_enemy_25.value)
-        enable_enemy_50 = int(self.options.enable_enemy_50.value)
-        enable_enemy_75 = int(self.options.enable_enemy_75.value)
-        enable_enemy_100 = int(self.options.enable_enemy_100.value)
-
         return {
             "goal": int(self.options.goal.value),
-
-            "enable_level_complete": enable_level_complete,
-            "enable_grain_all": enable_grain_all,
-            "enable_grainsanity": enable_grainsanity,
-            "grainsanity_step": grainsanity_step,
-            "enable_flik_all": enable_flik_all,
-            "enable_flik_individual": enable_flik_individual,
-            "enable_enemy_25": enable_enemy_25,
-            "enable_enemy_50": enable_enemy_50,
-            "enable_enemy_75": enable_enemy_75,
-            "enable_enemy_100": enable_enemy_100,
-
-            "level_complete": enable_level_complete,
-            "grain_all": enable_grain_all,
-            "grainsanity": enable_grainsanity,
-            "step": grainsanity_step,
-            "flik_all": enable_flik_all,
-            "flik_individual": enable_flik_individual,
-            "enemy25": enable_enemy_25,
-            "enemy50": enable_enemy_50,
-            "enemy75": enable_enemy_75,
-            "enemy100": enable_enemy_100,
+            **check_tables(self.plan_key),
+            "check_ids": check_lookup(self.plan_key),
         }
+
+    @classmethod
+    def stage_generate_output(cls, multiworld, output_directory: str) -> None:
+        # Only writes anything when ABL_INSTRUMENT is set; see Instrument.py.
+        write_stats(multiworld, output_directory)
@@ -0,0 +1,10 @@
+"""Benchmarks for the A Bug's Life apworld and its tooling.
+
+Run them from the repository root, e.g.::
+
+    python -m benchmarks.generation --players 1 10 100 --output report.jsonl
+
+By default the world is driven against the lightweight Archipelago stand-in in
+``benchmarks/standin``; pass ``--archipelago PATH`` to use a local Archipelago
+checkout instead.
+"""
@@ -0,0 +1,121 @@
+"""Reconnect cost of a received-item backlog: replaying it vs folding it.
+
+Builds backlogs of random received items (``--sizes``, 10k by default) and
+brings a fresh data directory up to date with each of them four ways:
+
+- ``legacy``: item by item, rewriting the text tier files after every tier
+  item, as the clients did before abl_tiers.bin
+- ``replay``: item by item through the tier store
+- ``reduce``: the apworld's reduce_items() fold, then the final tiers written
+  to the store once
+- ``bridge``: ablbridge's apply_items() on the whole backlog
+
+Every way must end in the same tiers. ``store_updates`` is how many store
+updates Lua would have seen, which is what a reconnect costs the game.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ablbridge.protocol import TierState, apply_items
+from ablbridge.store import BERRY_FIELD
+
+from .harness import load_world
+from .store import save_legacy
+
+Tiers = Tuple[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+
+
+def backlog(size: int, seed: int) -> List[int]:
+    from worlds.abugslife.Items import ITEM_TABLE
+
+    return random.Random(seed).choices(sorted(ITEM_TABLE.values()), k=size)
+
+
+def final_tiers(tiers: TierState) -> Tiers:
+    tiers.load()
+    return tuple(tiers.berry_tiers), tuple(tuple(seeds) for seeds in tiers.seed_tiers)
+
+
+def run_way(apply: Callable[[TierState, Path, List[int]], None], items: List[int]) -> Tuple[float, int, Tiers]:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        tiers = TierState(data_dir)
+        tiers.load()
+        before = tiers.store.generation
+        start = time.perf_counter()
+        apply(tiers, data_dir, items)
+        seconds = time.perf_counter() - start
+        updates = (tiers.store.generation - before) // 2
+        return seconds, updates, final_tiers(tiers)
+
+
+def legacy(tiers: TierState, data_dir: Path, items: List[int]) -> None:
+    for item_id in items:
+        effects = apply_items(tiers, [item_id])
+        if effects.berries_changed or effects.seeds_changed:
+            save_legacy(tiers, data_dir)
+
+
+def replay(tiers: TierState, data_dir: Path, items: List[int]) -> None:
+    for item_id in items:
+        apply_items(tiers, [item_id])
+
+
+def reduce(tiers: TierState, data_dir: Path, items: List[int]) -> None:
+    from worlds.abugslife.Tiers import reduce_items
+
+    reduced = reduce_items(items)
+    store = tiers.store
+    with store.update():
+        for level_idx, tier in reduced.berry.items():
+            store.set(level_idx, BERRY_FIELD, tier)
+        for level_idx, seeds in reduced.seeds.items():
+            for colour, tier in enumerate(seeds):
+                store.set(level_idx, colour, tier)
+
+
+def bridge(tiers: TierState, data_dir: Path, items: List[int]) -> None:
+    apply_items(tiers, items)
+
+
+WAYS = {"legacy": legacy, "replay": replay, "reduce": reduce, "bridge": bridge}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.backlog", description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--ways", nargs="+", choices=sorted(WAYS), default=list(WAYS))
+    parser.add_argument("--archipelago", default=None, help="Archipelago checkout (default: the stand-in modules)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    load_world(args.archipelago)
+
+    failed = False
+    for size in args.sizes:
+        items = backlog(size, args.seed)
+        results: Dict[str, Tiers] = {}
+        for name in args.ways:
+            seconds, updates, tiers = run_way(WAYS[name], items)
+            results[name] = tiers
+            print(json.dumps({
+                "items": size,
+                "way": name,
+                "ms": seconds * 1000,
+                "store_updates": updates,
+                "matches": tiers == next(iter(results.values())),
+            }), flush=True)
+        failed |= len(set(results.values())) > 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""End-to-end latency of the Python bridge against the stand-in server.
+
+A writer thread journals CHECK entries to ``abl_state.txt`` the way ABL.lua
+does (one append per check) while the bridge forwards them to a local
+stand-in Archipelago server. Reports per-check latency from the append to the
+server receiving it, how many LocationChecks packets carried them, and how
+long a burst of received items takes to reach the tier store.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ablbridge.client import Bridge
+from ablbridge.journal import JournalWriter
+from ablbridge.protocol import (
+    GAME,
+    ITEMS_PROCESSED_FILE,
+    SEED_UPGRADE_CAPS,
+    STATE_FILE,
+    SlotOptions,
+    check_ids_from_slot_data,
+    location_id_for_check,
+    lookup_check,
+    read_int,
+)
+
+from .harness import WORLD_MODULE, load_world
+from .mirrors import drifted
+from .standin.server import StandinServer
+
+SLOT = "Player1"
+
+
+def check_lines(step: int) -> List[str]:
+    """Every CHECK line one playthrough can write, level by level."""
+    lines = []
+    for level_idx in sorted(SEED_UPGRADE_CAPS):
+        lines += [f"CHECK FLIK_{letter} {level_idx}" for letter in "FLIK"]
+        lines.append(f"CHECK FLIK_ALL {level_idx}")
+        lines += [f"CHECK GRAIN{amount} {level_idx}" for amount in range(step, 51, step)]
+        lines.append(f"CHECK GRAIN {level_idx}")
+        lines += [f"CHECK ENEMIES{pct} {level_idx}" for pct in (25, 50, 75, 100)]
+        lines.append(f"CHECK LEVEL_COMPLETE {level_idx}")
+    return lines
+
+
+def slot_data(step: int, check_ids: bool = True) -> Dict[str, object]:
+    """Slot data for every check enabled; without check_ids, the older one-key-per-option layout."""
+    if not check_ids:
+        return {
+            "enable_level_complete": 1,
+            "enable_grain_all": 1,
+            "enable_grainsanity": 1,
+            "grainsanity_step": step,
+            "enable_flik_all": 1,
+            "enable_flik_individual": 1,
+            "enable_enemy_25": 1,
+            "enable_enemy_50": 1,
+            "enable_enemy_75": 1,
+            "enable_enemy_100": 1,
+        }
+    load_world()
+    locations = sys.modules[WORLD_MODULE + ".Locations"]
+    key = locations.LocationPlanKey(True, True, True, True, step, (25, 50, 75, 100))
+    return {**locations.check_tables(key), "check_ids": locations.check_lookup(key)}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def write_checks(path: Path, lines: List[Tuple[int, str]], rate: float, written: Dict[int, float]) -> None:
+    journal = JournalWriter(path)
+    gap = 1 / rate if rate > 0 else 0.0
+    next_at = time.monotonic()
+    for location_id, line in lines:
+        if gap:
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_at += gap
+        written.setdefault(location_id, time.monotonic())
+        journal.append((line,))
+
+
+async def run(args: argparse.Namespace) -> Dict[str, object]:
+    data = slot_data(args.grainsanity_step, not args.no_check_ids)
+    server = StandinServer(GAME, {SLOT: data})
+    port = await server.start()
+
+    received: Dict[int, float] = {}
+    server.on_checks = lambda arrived, slot, locations: received.update(
+        (location_id, arrived) for location_id in locations if location_id not in received
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        bridge = Bridge(
+            f"ws://127.0.0.1:{port}", SLOT, data_dir,
+            batch_window=args.batch_window, max_batch=args.max_batch,
+            poll=args.poll, poll_interval=args.poll_interval, reconnect_delay=0.1,
+        )
+        task = asyncio.create_task(bridge.run())
+        while bridge._watch_task is None:
+            await asyncio.sleep(0.01)
+
+        if "check_ids" in data:
+            table = check_ids_from_slot_data(data)
+            resolve = lambda line: lookup_check(line, table)
+        else:
+            options = SlotOptions.from_slot_data(data)
+            resolve = lambda line: location_id_for_check(line, options)
+        lines = [(resolve(line), line) for line in check_lines(args.grainsanity_step)]
+        lines = [(location_id, line) for location_id, line in lines if location_id is not None]
+        written: Dict[int, float] = {}
+        writer = threading.Thread(
+            target=write_checks, args=(data_dir / STATE_FILE, lines, args.rate, written), daemon=True
+        )
+        writer.start()
+        while writer.is_alive():
+            await asyncio.sleep(0.01)
+
+        deadline = time.monotonic() + args.timeout
+        # Grainsanity ids of levels >= 10 overlap enemysanity ids, so some lines
+        # share a location and the bridge sends it once.
+        expected = {location_id for location_id, _ in lines}
+        while len(received) < len(expected) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        items = [300 + level_idx for level_idx in sorted(SEED_UPGRADE_CAPS)] * (args.items // 16 + 1)
+        items = items[:args.items]
+        item_start = time.monotonic()
+        await server.give_items(SLOT, items)
+        while read_int(data_dir / ITEMS_PROCESSED_FILE, 0) < len(items) and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        item_seconds = time.monotonic() - item_start
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await server.stop()
+
+    latencies = [(received[location_id] - written[location_id]) * 1000 for location_id in received]
+    return {
+        "watcher": "poll" if args.poll else "inotify",
+        "grainsanity_step": args.grainsanity_step,
+        "check_ids": not args.no_check_ids,
+        "rate": args.rate,
+        "batch_window_ms": args.batch_window * 1000,
+        "checks_written": len(lines),
+        "locations": len(expected),
+        "checks_received": len(received),
+        "packets": len(server.check_packets),
+        "latency_ms_p50": percentile(latencies, 50),
+        "latency_ms_p99": percentile(latencies, 99),
+        "latency_ms_max": max(latencies, default=0.0),
+        "items": len(items),
+        "items_ms": item_seconds * 1000,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bridge", description=__doc__)
+    parser.add_argument("--grainsanity-step", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=500.0, help="CHECK lines written per second (0: no limit)")
+    parser.add_argument("--batch-window", type=float, default=0.05)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--poll", action="store_true")
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--no-check-ids", action="store_true",
+                        help="leave check_ids out of the slot data so the bridge derives ids itself")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    errors = drifted()
+    for error in errors:
+        print(error, file=sys.stderr)
+    logging.basicConfig(level=logging.WARNING)
+    print(json.dumps(asyncio.run(run(args))))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""LocationChecks traffic with and without the checked-location cache.
+
+Plays every level's CHECK lines into ``abl_state.txt`` while a client
+forwards them to the stand-in server. After each level ABL.lua is reloaded
+``--reloads`` times; its in-memory ``completed_grain_sanity`` /
+``completed_enemy_pct`` tables start empty again, so the level's grainsanity
+and enemysanity lines are journaled again. The client is restarted every
+``--restart-every`` levels. Two clients:
+
+- ``per-line``: what client/Program.cs did before checked_locations.txt, one
+  LocationChecks packet per CHECK line and no memory of what was sent
+- ``bridge``: ablbridge, which drops known locations and batches the rest
+
+Reports the packets and location ids each sent, how many of those ids the
+server already had, and the wall time.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+import websockets
+
+from ablbridge.client import Bridge
+from ablbridge.journal import JournalReader, JournalWriter
+from ablbridge.protocol import GAME, SESSION_FILE, STATE_FILE, check_ids_from_slot_data, lookup_check
+
+from .bridge import SLOT, check_lines, slot_data
+from .standin.server import StandinServer
+
+RELOADED_PREFIXES = ("CHECK GRAIN", "CHECK ENEMIES")
+
+
+def playthrough(step: int, reloads: int) -> List[List[str]]:
+    """Per level, the lines Lua journals: the level's checks, then its repeats after each reload."""
+    levels: Dict[str, List[str]] = {}
+    for line in check_lines(step):
+        levels.setdefault(line.rsplit(" ", 1)[1], []).append(line)
+    out = []
+    for lines in levels.values():
+        repeated = [line for line in lines if line.startswith(RELOADED_PREFIXES) and line != "CHECK GRAIN"]
+        out.append(lines + repeated * reloads)
+    return out
+
+
+async def drain_messages(socket) -> None:
+    async for _ in socket:
+        pass
+
+
+async def per_line_client(uri: str, data_dir: Path, resolve: Callable[[str], Optional[int]],
+                          poll: float, progress: List[int]) -> None:
+    async with websockets.connect(uri, max_size=None, ping_interval=None) as socket:
+        await socket.recv()  # RoomInfo
+        await socket.send(json.dumps([{"cmd": "Connect", "game": GAME, "name": SLOT, "password": ""}]))
+        await socket.recv()  # Connected + ReceivedItems
+        drain = asyncio.create_task(drain_messages(socket))
+        reader = JournalReader(data_dir / STATE_FILE)
+        try:
+            while True:
+                for entry in reader.read():
+                    location_id = resolve(entry.payload)
+                    if location_id is not None:
+                        await socket.send(json.dumps([{"cmd": "LocationChecks", "locations": [location_id]}]))
+                    progress[0] += 1
+                reader.ack()
+                await asyncio.sleep(poll)
+        finally:
+            drain.cancel()
+            # A normal close; leaving the block on cancellation would close with 1011.
+            await socket.close()
+
+
+async def run_way(way: str, args: argparse.Namespace) -> Dict[str, object]:
+    data = slot_data(args.grainsanity_step)
+    table = check_ids_from_slot_data(data)
+    resolve = lambda line: lookup_check(line, table)
+    levels = playthrough(args.grainsanity_step, args.reloads)
+    expected: Set[int] = {resolve(line) for lines in levels for line in lines} - {None}
+
+    server = StandinServer(GAME, {SLOT: data})
+    port = await server.start()
+    uri = f"ws://127.0.0.1:{port}"
+    redundant = 0
+
+    def on_checks(arrived: float, slot: str, locations: List[int]) -> None:
+        nonlocal redundant
+        redundant += sum(1 for location_id in locations if location_id in server.checked[slot])
+
+    server.on_checks = on_checks
+    journaled = 0
+    progress = [0]  # lines the per-line client has read
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        # A session already in progress, so connecting does not reset the data directory.
+        (data_dir / SESSION_FILE).write_text(f"{server.seed_name}|{SLOT}|{uri}", encoding="utf-8")
+        journal = JournalWriter(data_dir / STATE_FILE)
+        task: Optional[asyncio.Task] = None
+        for index, lines in enumerate(levels):
+            if task is None:
+                if way == "bridge":
+                    bridge = Bridge(uri, SLOT, data_dir, batch_window=args.batch_window,
+                                    poll=True, poll_interval=args.poll, reconnect_delay=0.1)
+                    task = asyncio.create_task(bridge.run())
+                else:
+                    task = asyncio.create_task(per_line_client(uri, data_dir, resolve, args.poll, progress))
+
+            for line in lines:
+                journal.append((line,))
+            journaled += len(lines)
+            # Wait for the level's lines to reach the server before moving on.
+            wanted = {resolve(line) for line in lines} - {None}
+            deadline = time.monotonic() + args.timeout
+            while time.monotonic() < deadline:
+                if wanted <= server.checked[SLOT] and (way == "bridge" or progress[0] >= journaled):
+                    break
+                await asyncio.sleep(0.005)
+
+            if (index + 1) % args.restart_every == 0 or index == len(levels) - 1:
+                # Let the client ack what it has sent, then stop it.
+                await asyncio.sleep(args.poll * 2)
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+                task = None
+    seconds = time.perf_counter() - start
+    await server.stop()
+
+    return {
+        "client": way,
+        "grainsanity_step": args.grainsanity_step,
+        "reloads": args.reloads,
+        "restart_every": args.restart_every,
+        "lines_journaled": journaled,
+        "locations": len(expected),
+        "locations_received": len(server.checked[SLOT] & expected),
+        "packets": len(server.check_packets),
+        "ids_sent": sum(len(locations) for _, _, locations in server.check_packets),
+        "ids_redundant": redundant,
+        "wall_s": seconds,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.checks", description=__doc__)
+    parser.add_argument("--grainsanity-step", type=int, default=1)
+    parser.add_argument("--reloads", type=int, default=2, help="Lua script reloads per level")
+    parser.add_argument("--restart-every", type=int, default=4, help="restart the client every N levels")
+    parser.add_argument("--clients", nargs="+", choices=("per-line", "bridge"), default=["per-line", "bridge"])
+    parser.add_argument("--batch-window", type=float, default=0.05)
+    parser.add_argument("--poll", type=float, default=0.02, help="journal poll interval of both clients")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    failed = False
+    for way in args.clients:
+        row = asyncio.run(run_way(way, args))
+        failed |= row["locations_received"] != row["locations"]
+        print(json.dumps(row), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
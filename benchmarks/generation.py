@@ -0,0 +1,127 @@
+"""Per-stage generation benchmark for the A Bug's Life apworld.
+
+Sweeps player counts and option combinations, drives BugsLifeWorld through
+every generation stage and writes one JSON object per (point, repeat).
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .harness import STAGES, backend_name, build_multiworld, load_world, measure
+
+ENEMY_PCTS = (25, 50, 75, 100)
+FLIK_PRESETS = {
+    "none": {"enable_flik_individual": 0, "enable_flik_all": 0},
+    "individual": {"enable_flik_individual": 1, "enable_flik_all": 0},
+    "all": {"enable_flik_individual": 0, "enable_flik_all": 1},
+    "both": {"enable_flik_individual": 1, "enable_flik_all": 1},
+}
+
+
+def enemy_options(spec: str) -> Dict[str, int]:
+    """``none``, ``all`` or a slash-separated list of tiers such as ``50/100``."""
+    if spec == "none":
+        enabled = set()
+    elif spec == "all":
+        enabled = set(ENEMY_PCTS)
+    else:
+        enabled = {int(part) for part in spec.split("/")}
+        if not enabled <= set(ENEMY_PCTS):
+            raise argparse.ArgumentTypeError(f"unknown enemy tier in {spec!r}")
+    return {f"enable_enemy_{pct}": int(pct in enabled) for pct in ENEMY_PCTS}
+
+
+def grainsanity_options(step: int) -> Dict[str, int]:
+    """Step 0 turns grainsanity off."""
+    if step == 0:
+        return {"enable_grainsanity": 0}
+    return {"enable_grainsanity": 1, "grainsanity_step": step}
+
+
+def option_matrix(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    for step, enemies, flik in itertools.product(args.grainsanity_steps, args.enemy_tiers, args.flik):
+        options: Dict[str, Any] = {
+            "enable_level_complete": args.level_complete,
+            "enable_grain_all": args.grain_all,
+        }
+        options.update(grainsanity_options(step))
+        options.update(enemy_options(enemies))
+        options.update(FLIK_PRESETS[flik])
+        yield options
+
+
+def run_point(world_type: type, players: int, options: Dict[str, Any], seed: int,
+              stages: Sequence[str], trace_memory: bool) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"players": players, "seed": seed, "options": options}
+    start = time.perf_counter()
+    try:
+        multiworld = build_multiworld(world_type, players, options, seed)
+        row["stages"] = measure(multiworld, stages, trace_memory)
+        row["locations"] = sum(1 for loc in multiworld.get_locations() if loc.address is not None)
+        row["items"] = len(multiworld.itempool)
+    except Exception as ex:
+        row["error"] = f"{type(ex).__name__}: {ex}"
+    row["total_wall_s"] = time.perf_counter() - start
+    return row
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generation", description=__doc__)
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--grainsanity-steps", type=int, nargs="+", default=[0, 1, 10, 50],
+                        help="grainsanity steps to sweep; 0 disables grainsanity")
+    parser.add_argument("--enemy-tiers", nargs="+", default=["none", "all"],
+                        help="'none', 'all' or tiers like '50/100'")
+    parser.add_argument("--flik", nargs="+", choices=sorted(FLIK_PRESETS), default=["none", "both"])
+    parser.add_argument("--level-complete", type=int, choices=(0, 1), default=1)
+    parser.add_argument("--grain-all", type=int, choices=(0, 1), default=0)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-tracemalloc", dest="trace_memory", action="store_false",
+                        help="skip tracemalloc so wall times are not inflated by tracing")
+    parser.add_argument("--archipelago", metavar="PATH",
+                        help="run against an Archipelago checkout instead of the stand-in")
+    parser.add_argument("--output", "-o", metavar="FILE", help="JSONL output file (default: stdout)")
+    args = parser.parse_args(argv)
+    for spec in args.enemy_tiers:
+        try:
+            enemy_options(spec)
+        except (ValueError, argparse.ArgumentTypeError):
+            parser.error(f"invalid --enemy-tiers value {spec!r}")
+    for step in args.grainsanity_steps:
+        if not 0 <= step <= 50:
+            parser.error(f"grainsanity step {step} is outside 0-50")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    world_type = load_world(args.archipelago)
+    backend = backend_name(args.archipelago)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failures = 0
+    try:
+        for players in args.players:
+            for options in option_matrix(args):
+                for repeat in range(args.repeat):
+                    row = run_point(world_type, players, options, args.seed + repeat, args.stages, args.trace_memory)
+                    row["backend"] = backend
+                    row["repeat"] = repeat
+                    failures += "error" in row
+                    out.write(json.dumps(row) + "\n")
+                    out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
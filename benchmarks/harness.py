@@ -0,0 +1,115 @@
+"""Load the apworld and drive it through Archipelago's generation steps."""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import time
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APWORLD_DIR = REPO_ROOT / "apworld" / "abugslife"
+STANDIN_DIR = Path(__file__).resolve().with_name("standin")
+
+GAME = "A Bug's Life"
+WORLD_MODULE = "worlds.abugslife"
+
+STAGES = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+    "fill_slot_data",
+    "all_state_sweep",
+)
+
+
+def backend_name(archipelago: Optional[str]) -> str:
+    return "archipelago" if archipelago else "standin"
+
+
+def load_world(archipelago: Optional[str] = None) -> type:
+    """Import this repo's apworld as ``worlds.abugslife`` and return its World class.
+
+    ``archipelago`` is the path of an Archipelago checkout; without it the
+    stand-in modules are put on the path instead. Any installed copy of the
+    world is replaced so the benchmark always measures the working tree.
+    """
+    root = str(Path(archipelago).resolve()) if archipelago else str(STANDIN_DIR)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    import worlds  # noqa: F401  (Archipelago discovers its installed worlds here)
+    from worlds.AutoWorld import AutoWorldRegister
+
+    loaded = sys.modules.get(WORLD_MODULE)
+    if loaded is not None and Path(getattr(loaded, "__file__", "")).parent == APWORLD_DIR:
+        return loaded.BugsLifeWorld
+
+    for name in [m for m in sys.modules if m == WORLD_MODULE or m.startswith(WORLD_MODULE + ".")]:
+        del sys.modules[name]
+    AutoWorldRegister.world_types.pop(GAME, None)
+
+    spec = importlib.util.spec_from_file_location(
+        WORLD_MODULE, APWORLD_DIR / "__init__.py", submodule_search_locations=[str(APWORLD_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[WORLD_MODULE] = module
+    spec.loader.exec_module(module)
+    return module.BugsLifeWorld
+
+
+def build_multiworld(world_type: type, players: int, option_values: Dict[str, Any], seed: int):
+    """A MultiWorld where every slot plays A Bug's Life with the same options."""
+    from BaseClasses import CollectionState, MultiWorld
+
+    multiworld = MultiWorld(players)
+    multiworld.game = {player: world_type.game for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Player{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+
+    args = Namespace()
+    for key, option in world_type.options_dataclass.type_hints.items():
+        value = option_values.get(key, option.default)
+        setattr(args, key, {player: option.from_any(value) for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def run_stage(multiworld, stage: str) -> None:
+    from worlds.AutoWorld import call_all
+
+    if stage == "fill_slot_data":
+        for player in multiworld.player_ids:
+            multiworld.worlds[player].fill_slot_data()
+    elif stage == "all_state_sweep":
+        state = multiworld.get_all_state(False)
+        for location in multiworld.get_locations():
+            location.can_reach(state)
+    else:
+        call_all(multiworld, stage)
+
+
+def measure(multiworld, stages: Iterable[str] = STAGES, trace_memory: bool = True) -> Dict[str, Dict[str, float]]:
+    """Run the stages in order; wall time and (optionally) tracemalloc peak per stage."""
+    results: Dict[str, Dict[str, float]] = {}
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        for stage in stages:
+            if trace_memory:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            run_stage(multiworld, stage)
+            row = {"wall_s": time.perf_counter() - start}
+            if trace_memory:
+                row["peak_kib"] = (tracemalloc.get_traced_memory()[1] - base) / 1024
+            results[stage] = row
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return results
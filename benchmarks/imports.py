@@ -0,0 +1,116 @@
+"""Import cost of the apworld, and the generator of its prebuilt tables.
+
+Archipelago imports every installed world when the launcher or generator
+starts, so the world's import time is paid on every start. Each round runs
+a fresh interpreter that imports the Archipelago modules the world depends on
+(the stand-in ones by default), then times importing the world alone, with
+``-X importtime`` giving the self time of each of its modules. Reports
+medians over ``--rounds``.
+
+The World class attributes ``item_name_to_id``, ``location_name_to_id``,
+``item_name_groups`` and ``location_name_groups`` come prebuilt from apworld/abugslife/Tables.py instead of being assembled
+from f-strings at import. ``--write-tables`` regenerates that file from the
+builders in Items.py and Locations.py; every run fails if it is stale.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+from .harness import APWORLD_DIR, REPO_ROOT, STANDIN_DIR, WORLD_MODULE, load_world
+
+TABLES_FILE = APWORLD_DIR / "Tables.py"
+
+TABLES_HEADER = '''"""Prebuilt name -> id tables and name groups for the World class.
+
+Generated by ``python -m benchmarks.imports --write-tables`` from the
+build_item_*() functions in Items.py and build_location_*() functions in
+Locations.py; change those and regenerate instead of editing this file.
+"""
+'''
+
+_ROUND = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import BaseClasses, Options, worlds, worlds.AutoWorld, worlds.generic.Rules
+from benchmarks.harness import load_world
+start = time.perf_counter()
+load_world({archipelago!r})
+print(json.dumps({{"import_ms": (time.perf_counter() - start) * 1000}}))
+"""
+
+
+def render_tables(tables: Dict[str, Dict[str, Any]]) -> str:
+    parts = [TABLES_HEADER]
+    for name, table in tables.items():
+        parts.append(f"\n{name} = {{\n")
+        for key, value in table.items():
+            if isinstance(value, set):
+                parts.append(f"    {key!r}: {{\n")
+                parts.extend(f"        {member!r},\n" for member in sorted(value))
+                parts.append("    },\n")
+            else:
+                parts.append(f"    {key!r}: {value},\n")
+        parts.append("}\n")
+    return "".join(parts)
+
+
+def built_tables() -> Dict[str, Dict[str, Any]]:
+    from worlds.abugslife.Items import build_item_name_groups, build_item_table
+    from worlds.abugslife.Locations import build_location_name_groups, build_location_name_to_id
+
+    return {
+        "ITEM_NAME_TO_ID": build_item_table(),
+        "LOCATION_NAME_TO_ID": build_location_name_to_id(),
+        "ITEM_NAME_GROUPS": build_item_name_groups(),
+        "LOCATION_NAME_GROUPS": build_location_name_groups(),
+    }
+
+
+def run_round(archipelago: Optional[str]) -> Dict[str, float]:
+    root = os.path.abspath(archipelago) if archipelago else str(STANDIN_DIR)
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), PYTHONDONTWRITEBYTECODE="")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _ROUND.format(root=root, archipelago=archipelago)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    row = json.loads(proc.stdout.strip().splitlines()[-1])
+    for line in proc.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <module>"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2].startswith(WORLD_MODULE):
+            row[parts[2] + "_us"] = float(parts[0].rsplit(" ", 1)[-1])
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.imports", description=__doc__)
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--archipelago", default=None, help="Archipelago checkout (default: the stand-in modules)")
+    parser.add_argument("--write-tables", action="store_true", help="regenerate apworld/abugslife/Tables.py")
+    args = parser.parse_args(argv)
+
+    load_world(args.archipelago)
+    expected = render_tables(built_tables())
+    if args.write_tables:
+        TABLES_FILE.write_text(expected, encoding="utf-8")
+    current = TABLES_FILE.read_text(encoding="utf-8") == expected
+
+    run_round(args.archipelago)  # warm the bytecode caches
+    rounds = [run_round(args.archipelago) for _ in range(args.rounds)]
+    row: Dict[str, object] = {"rounds": args.rounds, "tables_current": current}
+    for key in rounds[0]:
+        row[key] = statistics.median(r.get(key, 0.0) for r in rounds)
+    print(json.dumps(row))
+    if not current:
+        print(f"{TABLES_FILE} is stale; rerun with --write-tables", file=sys.stderr)
+    return 0 if current else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Throughput and fuzz test of the IPC journal with concurrent processes.
+
+A writer process appends numbered entries in random-sized bursts while a
+reader process consumes them. The journal is compacted often (a small
+``--compact-bytes``) and the reader "crashes" at random, sometimes before
+acking what it read, and restarts from its ack file. The reader checks that
+it sees every entry, in order, resuming exactly after the last acked one.
+
+``--legacy`` runs the same load against the read-all-then-truncate scheme the
+state and command files used before, and counts the entries it loses.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ablbridge.journal import JournalReader, JournalWriter
+
+
+def _payload(k: int) -> str:
+    return f"CHECK GRAIN{k % 50 + 1} {k}"
+
+
+def _number(payload: str) -> int:
+    return int(payload.rsplit(" ", 1)[1])
+
+
+def run_writer(path: str, entries: int, max_burst: int, compact_bytes: int, seed: int, done) -> None:
+    rng = random.Random(seed)
+    writer = JournalWriter(Path(path), compact_bytes=compact_bytes)
+    k = 0
+    while k < entries:
+        burst = min(rng.randint(1, max_burst), entries - k)
+        writer.append(_payload(i) for i in range(k, k + burst))
+        k += burst
+        if rng.random() < 0.1:
+            time.sleep(rng.random() * 0.001)
+        if rng.random() < 0.001:
+            # Restart, recovering the sequence number from the file and ack.
+            writer = JournalWriter(Path(path), compact_bytes=compact_bytes)
+    done.set()
+
+
+def run_reader(path: str, entries: int, crash_rate: float, seed: int, done, results) -> None:
+    rng = random.Random(seed + 1)
+    reader = JournalReader(Path(path))
+    expected = 0  # next entry number the reader should see
+    acked = 0     # entries covered by the reader's last ack
+    reads = crashes = errors = redelivered = 0
+
+    while acked < entries:
+        batch = reader.read()
+        reads += 1
+        for entry in batch:
+            k = _number(entry.payload)
+            if k != expected:
+                errors += 1
+            expected = k + 1
+
+        if rng.random() < crash_rate:
+            crashes += 1
+            if rng.random() < 0.5:
+                reader.ack()
+                acked = expected
+            # Lose everything read since the last ack and start over from it.
+            redelivered += expected - acked
+            reader = JournalReader(Path(path))
+            expected = acked
+            continue
+
+        reader.ack()
+        acked = expected
+        if not batch and done.is_set() and acked >= entries:
+            break
+
+    results.put({"reads": reads, "crashes": crashes, "errors": errors, "redelivered": redelivered, "seen": acked})
+
+
+def run_legacy_writer(path: str, entries: int, max_burst: int, seed: int, done) -> None:
+    rng = random.Random(seed)
+    k = 0
+    while k < entries:
+        burst = min(rng.randint(1, max_burst), entries - k)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(_payload(i) + "\n" for i in range(k, k + burst)))
+        k += burst
+        if rng.random() < 0.1:
+            time.sleep(rng.random() * 0.001)
+    done.set()
+
+
+def run_legacy_reader(path: str, entries: int, done, results) -> None:
+    seen = set()
+    reads = 0
+    while True:
+        finished = done.is_set()
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+        reads += 1
+        if lines:
+            with open(path, "w", encoding="utf-8"):
+                pass
+        for line in lines:
+            try:
+                seen.add(_number(line))
+            except (ValueError, IndexError):
+                pass
+        if finished and not lines:
+            break
+    results.put({"reads": reads, "seen": len(seen), "lost": entries - len(seen)})
+
+
+def run(args: argparse.Namespace, seed: int) -> Dict[str, object]:
+    ctx = multiprocessing.get_context("spawn")
+    done = ctx.Event()
+    results = ctx.Queue()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "abl_state.txt")
+        if args.legacy:
+            writer = ctx.Process(target=run_legacy_writer, args=(path, args.entries, args.max_burst, seed, done))
+            reader = ctx.Process(target=run_legacy_reader, args=(path, args.entries, done, results))
+        else:
+            writer = ctx.Process(
+                target=run_writer, args=(path, args.entries, args.max_burst, args.compact_bytes, seed, done)
+            )
+            reader = ctx.Process(target=run_reader, args=(path, args.entries, args.crash_rate, seed, done, results))
+
+        start = time.perf_counter()
+        reader.start()
+        writer.start()
+        writer.join()
+        report = results.get(timeout=args.timeout)
+        elapsed = time.perf_counter() - start
+        reader.join()
+        size = Path(path).stat().st_size if Path(path).exists() else 0
+
+    return {
+        "mode": "legacy" if args.legacy else "journal",
+        "seed": seed,
+        "entries": args.entries,
+        "wall_s": elapsed,
+        "entries_per_s": args.entries / elapsed,
+        "final_bytes": size,
+        **report,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.journal", description=__doc__)
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--max-burst", type=int, default=50, help="most entries per append (grainsanity step 1 is 50)")
+    parser.add_argument("--compact-bytes", type=int, default=16 * 1024)
+    parser.add_argument("--crash-rate", type=float, default=0.01, help="chance of a reader crash per read")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--legacy", action="store_true", help="measure read-all-then-truncate instead")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for seed in range(args.seed, args.seed + args.rounds):
+        report = run(args, seed)
+        failed |= bool(report.get("errors")) or report["seen"] != args.entries
+        print(json.dumps(report), flush=True)
+    return 1 if failed and not args.legacy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Per-stage latency of checks and items through ABL.lua, the bridge and a server.
+
+Runs the real ABL.lua (under ``lupa``, in its own process, paced at
+``--fps``) with ``ABL_LATENCY_TRACE`` set, against the Python bridge and the
+stand-in server, all tracing. The stubbed game sits in Ant Hill with Flik
+ready and picks up a grain every ``--grain-frames`` frames, so ABL.lua
+journals a grainsanity check each time; every ``--item-interval`` seconds the
+server sends one item, alternating Ant Hill's berry and seed upgrades with
+extra lives. Afterwards the three traces are joined by ablbridge/latency.py
+and its report printed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ablbridge.client import Bridge
+from ablbridge.latency import analyze, format_report, read_events, summarize
+from ablbridge.protocol import BERRY_ID_BASE, DATA_DIR_NAME, EXTRA_LIFE_ID, GAME, MAX_BERRY_TIER, SEED_ID_BASE, SEED_UPGRADE_CAPS
+from ablbridge.tracing import CLIENT_LOG, LUA_LOG, TRACE_ENV
+
+from .bridge import SLOT, slot_data
+from .standin.server import StandinServer
+
+SCRIPT = Path(__file__).resolve().parent.parent / "lua" / "ABL.lua"
+LEVEL = 1
+
+ADDR = {
+    "level_index": 0x082504,
+    "level_code": 0x0A64B0,
+    "flik_status": 0x1FFF18,
+    "grain": 0x0A65A1,
+}
+FLIK_STATUS_READY = 0xFF20
+FLIK_STATUS_BUSY = 0x4669
+READY_FRAME = 60
+
+class _Finished(Exception):
+    pass
+
+
+def run_lua(base: str, frames: int, fps: float, grain_frames: int) -> None:
+    """Step ABL.lua through ``frames`` frames in real time, tracing latency."""
+    from lupa.lua54 import LuaRuntime
+
+    ram: Dict[int, int] = {}
+    frame = [-1]
+    start = time.monotonic()
+
+    def set_u16(addr: int, value: int) -> None:
+        ram[addr] = value & 0xFF
+        ram[addr + 1] = value >> 8 & 0xFF
+
+    def set_frame(n: int) -> None:
+        ram[ADDR["level_index"]] = LEVEL
+        set_u16(ADDR["level_code"], 0x100 + LEVEL)
+        set_u16(ADDR["flik_status"], FLIK_STATUS_READY if n >= READY_FRAME else FLIK_STATUS_BUSY)
+        ram[ADDR["grain"]] = min(max(n - READY_FRAME, 0) // grain_frames, 50)
+
+    def read_u8(addr, domain=None):
+        return ram.get(addr, 0)
+
+    def read_u16(addr, domain=None):
+        return ram.get(addr, 0) | ram.get(addr + 1, 0) << 8
+
+    def read_bytes(addr, length, domain=None):
+        return lua.table_from([ram.get(addr + i, 0) for i in range(length)])
+
+    def write_u8(addr, value, domain=None):
+        ram[addr] = value & 0xFF
+
+    def write_u16(addr, value, domain=None):
+        set_u16(addr, value & 0xFFFF)
+
+    def frameadvance():
+        frame[0] += 1
+        if frame[0] >= frames:
+            raise _Finished()
+        delay = start + frame[0] / fps - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        set_frame(frame[0])
+
+    lua = LuaRuntime()
+    env = lua.globals()
+    env.memory = lua.table(read_u8=read_u8, read_u16_le=read_u16, read_bytes_as_array=read_bytes,
+                           write_u8=write_u8, write_u16_le=write_u16)
+    env.emu = lua.table(frameadvance=frameadvance)
+    env.print = lambda *args: None
+    env.os.execute = lambda *args: True
+    env.os.getenv = lambda name: {"LOCALAPPDATA": base, "USERPROFILE": base, TRACE_ENV: "1"}.get(name)
+    set_frame(0)
+    try:
+        lua.globals().dofile(str(SCRIPT))
+    except Exception:
+        if frame[0] < frames:
+            raise
+
+
+def item_plan() -> List[int]:
+    """Ant Hill's berry and seed upgrades, each followed by an extra life."""
+    upgrades = [BERRY_ID_BASE + LEVEL] * MAX_BERRY_TIER
+    for colour, cap in enumerate(SEED_UPGRADE_CAPS[LEVEL]):
+        upgrades += [SEED_ID_BASE + colour * 100 + LEVEL] * cap
+    return [item for upgrade in upgrades for item in (upgrade, EXTRA_LIFE_ID)]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        data_dir = base / DATA_DIR_NAME
+        server_log = base / "standin.log"
+        server = StandinServer(GAME, {SLOT: slot_data(1)}, latency_log=server_log)
+        port = await server.start()
+        bridge = Bridge(f"ws://127.0.0.1:{port}", SLOT, data_dir, batch_window=args.batch_window,
+                        poll=args.poll, poll_interval=args.poll_interval, reconnect_delay=0.1,
+                        latency_trace=True)
+        task = asyncio.create_task(bridge.run())
+        while bridge._watch_task is None:
+            await asyncio.sleep(0.01)
+
+        # Two seconds past the items, so ABL.lua's once-a-second trace flush has them.
+        frames = int((args.seconds + 2) * args.fps)
+        lua = multiprocessing.get_context("spawn").Process(
+            target=run_lua, args=(str(base), frames, args.fps, args.grain_frames), daemon=True)
+        lua.start()
+
+        plan = item_plan()
+        deadline = time.monotonic() + args.seconds
+        given = 0
+        while time.monotonic() < deadline:
+            await asyncio.sleep(args.item_interval)
+            if given < len(plan):
+                await server.give_items(SLOT, [plan[given]])
+                given += 1
+        while lua.is_alive():
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(args.batch_window + 0.5)
+
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+        await server.stop()
+        bridge.latency.close()
+        server.latency.close()
+
+        stages = analyze(read_events(data_dir / CLIENT_LOG), read_events(data_dir / LUA_LOG),
+                         read_events(server_log))
+    return {"items_given": given, "locations_received": len(server.checked[SLOT]), "lua_exit": lua.exitcode,
+            "stages": summarize(stages)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.latency", description=__doc__)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--fps", type=float, default=59.94, help="frames per second (59.94: NTSC PlayStation)")
+    parser.add_argument("--grain-frames", type=int, default=30, help="frames between grain pickups")
+    parser.add_argument("--item-interval", type=float, default=0.5, help="seconds between received items")
+    parser.add_argument("--batch-window", type=float, default=0.05)
+    parser.add_argument("--poll", action="store_true", help="the bridge polls the state file instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    row = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(row), flush=True)
+    else:
+        print(f"items given {row['items_given']}, locations received {row['locations_received']}, "
+              f"ABL.lua exit {row['lua_exit']}\n")
+        print(format_report(row["stages"]), flush=True)
+    stages = row["stages"]
+    return 0 if row["lua_exit"] == 0 and "checks" in stages and "items (tiers)" in stages else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
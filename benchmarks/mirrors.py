@@ -0,0 +1,84 @@
+"""Check ablbridge's and abltrace's copies of the apworld's constants.
+
+ablbridge and abltrace run without Archipelago, so they cannot import the
+world package and restate its id bases, seed upgrade caps, berry-less levels,
+slot data option bits and check tokens. This compares every copy with the
+apworld's definition (Items.py, Locations.py, Tiers.py) and prints the ones
+that drifted; the bridge and replay benchmarks fail on any too.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, List, Optional, Tuple
+
+from .harness import load_world
+
+
+def mirrored_constants() -> List[Tuple[str, Any, Any]]:
+    """(name, copy, apworld definition) for every mirrored constant."""
+    load_world()
+    from worlds.abugslife import Locations, Tiers
+    from worlds.abugslife.Items import ABLItem, PROGRESSIVE_PREFIXES
+
+    from ablbridge import protocol
+    from abltrace import detect
+
+    tokens = {token: off for off, token in enumerate(Locations.LOCATION_SUFFIX_TOKENS) if token is not None}
+    return [
+        ("protocol.GAME", protocol.GAME, ABLItem.game),
+        ("protocol.EXTRA_LIFE_ID", protocol.EXTRA_LIFE_ID, Tiers.EXTRA_LIFE_ID),
+        ("protocol.HEALTH_UPGRADE_ID", protocol.HEALTH_UPGRADE_ID, Tiers.HEALTH_UPGRADE_ID),
+        ("protocol.BERRY_ID_BASE", protocol.BERRY_ID_BASE, PROGRESSIVE_PREFIXES["Berry"]),
+        ("protocol.SEED_ID_BASE", protocol.SEED_ID_BASE, PROGRESSIVE_PREFIXES["Brown Seed"]),
+        ("protocol.MAX_BERRY_TIER", protocol.MAX_BERRY_TIER, Tiers.MAX_BERRY_TIER),
+        ("protocol.SEED_COLOURS", protocol.SEED_COLOURS, Tiers.SEED_COLOURS),
+        ("protocol.SEED_UPGRADE_CAPS", protocol.SEED_UPGRADE_CAPS, Tiers.SEED_UPGRADE_CAPS),
+        ("protocol.BERRY_PROGRESSION_DISABLED_LEVELS", protocol.BERRY_PROGRESSION_DISABLED_LEVELS,
+         Tiers.BERRY_PROGRESSION_DISABLED_LEVELS),
+        ("protocol.MAX_GRAIN", protocol.MAX_GRAIN, Locations.MAX_GRAIN),
+        ("protocol.LOCATION_ID_BASE", protocol.LOCATION_ID_BASE, Locations.LOCATION_ID_BASE),
+        ("protocol.GRAINSANITY_ID_BASE", protocol.GRAINSANITY_ID_BASE, Locations.GRAINSANITY_ID_BASE),
+        ("protocol.ENEMYSANITY_ID_BASE", protocol.ENEMYSANITY_ID_BASE, Locations.ENEMYSANITY_ID_BASE),
+        ("protocol.SLOT_DATA_VERSION", protocol.SLOT_DATA_VERSION, Locations.SLOT_DATA_VERSION),
+        ("protocol.OPTION_LEVEL_COMPLETE", protocol.OPTION_LEVEL_COMPLETE, Locations.OPTION_LEVEL_COMPLETE),
+        ("protocol.OPTION_FLIK_INDIVIDUAL", protocol.OPTION_FLIK_INDIVIDUAL, Locations.OPTION_FLIK_INDIVIDUAL),
+        ("protocol.OPTION_FLIK_ALL", protocol.OPTION_FLIK_ALL, Locations.OPTION_FLIK_ALL),
+        ("protocol.OPTION_GRAIN_ALL", protocol.OPTION_GRAIN_ALL, Locations.OPTION_GRAIN_ALL),
+        ("protocol.OPTION_GRAINSANITY", protocol.OPTION_GRAINSANITY, Locations.OPTION_GRAINSANITY),
+        ("protocol.OPTION_ENEMY_25", protocol.OPTION_ENEMY_25, Locations.OPTION_ENEMY[25]),
+        ("protocol.OPTION_ENEMY_50", protocol.OPTION_ENEMY_50, Locations.OPTION_ENEMY[50]),
+        ("protocol.OPTION_ENEMY_75", protocol.OPTION_ENEMY_75, Locations.OPTION_ENEMY[75]),
+        ("protocol.OPTION_ENEMY_100", protocol.OPTION_ENEMY_100, Locations.OPTION_ENEMY[100]),
+        ("protocol.LOCATION_OFFSETS", protocol.LOCATION_OFFSETS, tokens),
+        ("detect.MAX_GRAIN", detect.MAX_GRAIN, Locations.MAX_GRAIN),
+        ("detect.ENEMY_PCTS", detect.ENEMY_PCTS, Locations.ENEMYSANITY_PCTS),
+        ("detect.OPTION_FLIK_INDIVIDUAL", detect.OPTION_FLIK_INDIVIDUAL, Locations.OPTION_FLIK_INDIVIDUAL),
+        ("detect.OPTION_FLIK_ALL", detect.OPTION_FLIK_ALL, Locations.OPTION_FLIK_ALL),
+        ("detect.OPTION_GRAINSANITY", detect.OPTION_GRAINSANITY, Locations.OPTION_GRAINSANITY),
+    ]
+
+
+def drifted() -> List[str]:
+    """One line per copy that differs from the apworld's definition."""
+    return [
+        f"{name} is {copy!r}, the apworld has {original!r}"
+        for name, copy, original in mirrored_constants()
+        if copy != original
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.mirrors", description=__doc__)
+    parser.parse_args(argv)
+
+    errors = drifted()
+    for error in errors:
+        print(error, file=sys.stderr)
+    if not errors:
+        print(f"{len(mirrored_constants())} mirrored constants match the apworld")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
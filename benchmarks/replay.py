@@ -0,0 +1,178 @@
+"""Replay speed of the vectorized check detectors, cross-checked against ABL.lua.
+
+Synthesizes hours of plausible RAM traces: level visits with loading and
+pause frames, grain and enemy counters that climb and reset on death, FLIK
+letters, finished and abandoned levels, and menus in between. The trace is
+saved in the recorder's format and memory-mapped back before replaying, so
+the timing includes loading. The first ``--verify-frames`` frames are also
+stepped through the real ABL.lua (under lupa) for every option preset, and
+any difference in the CHECK line stream fails the run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ablbridge.protocol import SEED_UPGRADE_CAPS, SlotOptions
+from abltrace.detect import FLIK_STATUS_READY, DetectorConfig, replay
+from abltrace.trace import empty, load, save
+
+from .bridge import slot_data
+from .mirrors import drifted
+
+FPS = 60
+FLIK_STATUS_BUSY = 0x4669
+LEVELS = sorted(SEED_UPGRADE_CAPS)
+
+
+def synthesize(frames: int, seed: int) -> np.ndarray:
+    """A trace of about ``frames`` frames of someone playing through levels."""
+    rng = np.random.default_rng(seed)
+    parts: List[np.ndarray] = []
+    total = 0
+    code = 0x100
+    while total < frames:
+        menu = empty(int(rng.integers(30, 600)))
+        menu["flik_status"] = rng.choice([0, FLIK_STATUS_BUSY], len(menu))
+        parts.append(menu)
+
+        level = int(rng.choice(LEVELS))
+        for _life in range(int(rng.integers(1, 4))):
+            code += 1
+            parts.append(_level_visit(rng, level, code))
+        total = sum(len(p) for p in parts)
+    return np.concatenate(parts)[:frames]
+
+
+def _level_visit(rng: np.random.Generator, level: int, code: int) -> np.ndarray:
+    n = int(rng.integers(20, 240)) * FPS
+    visit = empty(n)
+    visit["level_index"] = level
+    visit["level_code"] = code
+
+    # Loading, then ready with short pauses and cutscenes.
+    status = np.full(n, FLIK_STATUS_READY, dtype=np.uint16)
+    status[:int(rng.integers(1, 120))] = FLIK_STATUS_BUSY
+    for start in rng.integers(0, n, int(rng.integers(0, 6))):
+        status[start:start + int(rng.integers(1, 90))] = rng.choice([FLIK_STATUS_BUSY, 0])
+    visit["flik_status"] = status
+
+    # Counters only climb within one life; the rare glitch frame reads 0.
+    grain = np.cumsum(rng.random(n) < rng.uniform(0.002, 0.02))
+    visit["grain"] = np.minimum(grain, 50)
+    kills = np.minimum(np.cumsum(rng.random(n) < rng.uniform(0.001, 0.01)), 99)
+    visit["enemy_tens"] = kills // 10 | 0x30  # the high nibble is noise ABL.lua masks off
+    visit["enemy_units"] = kills % 10
+    glitches = rng.integers(0, n, int(rng.integers(0, 3)))
+    visit["grain"][glitches] = 0
+
+    mask = np.zeros(n, dtype=np.uint8)
+    for bit in range(4):
+        if rng.random() < 0.6:
+            mask[int(rng.integers(0, n)):] |= 1 << bit
+    visit["flik_mask"] = mask
+
+    # A stale status from the previous level, then 0, then 1 if finished.
+    complete = np.zeros(n, dtype=np.uint8)
+    if rng.random() < 0.3:
+        complete[:int(rng.integers(1, 200))] = 1
+    if rng.random() < 0.6:
+        complete[n - int(rng.integers(FPS, 3 * FPS)):] = 1
+    visit["level_complete"] = complete
+    return visit
+
+
+PRESETS = {
+    "all": dict(grain_step=1, enemies=True, flik=True),
+    "step10": dict(grain_step=10, enemies=True, flik=False),
+    "no-grainsanity": dict(grain_step=0, enemies=False, flik=True),
+}
+
+
+def preset_config(name: str) -> DetectorConfig:
+    preset = PRESETS[name]
+    step = preset["grain_step"] or 10
+    data = slot_data(step)
+    options = SlotOptions.from_slot_data(data)._replace(
+        grainsanity=bool(preset["grain_step"]),
+        flik_all=preset["flik"],
+        flik_individual=preset["flik"],
+    )
+    if not preset["enemies"]:
+        options = options._replace(enemy_kills=())
+    return DetectorConfig.from_slot_options(options)
+
+
+def verify(trace: np.ndarray, config: DetectorConfig) -> Dict[str, object]:
+    from abltrace.lua import run_script
+
+    start = time.perf_counter()
+    expected = run_script(trace, config.config_lines())
+    lua_seconds = time.perf_counter() - start
+    got = [check.line for check in replay(trace, config)]
+    first_diff = next((i for i, (a, b) in enumerate(zip(expected, got)) if a != b), min(len(expected), len(got)))
+    return {
+        "frames": len(trace),
+        "lua_checks": len(expected),
+        "replay_checks": len(got),
+        "match": expected == got,
+        "first_difference": None if expected == got else {
+            "index": first_diff,
+            "lua": expected[first_diff:first_diff + 3],
+            "replay": got[first_diff:first_diff + 3],
+        },
+        "lua_frames_per_s": len(trace) / lua_seconds,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.replay", description=__doc__)
+    parser.add_argument("--hours", type=float, default=4.0, help="length of the replayed trace")
+    parser.add_argument("--presets", nargs="+", choices=sorted(PRESETS), default=sorted(PRESETS))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--verify-frames", type=int, default=30000, help="frames to cross-check against ABL.lua (0: skip)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    frames = int(args.hours * 3600 * FPS)
+    errors = drifted()
+    for error in errors:
+        print(error, file=sys.stderr)
+    failed = bool(errors)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.abltrace"
+        save(synthesize(frames, args.seed), path)
+
+        for name in args.presets:
+            config = preset_config(name)
+            timings = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                checks = replay(load(path), config)
+                timings.append(time.perf_counter() - start)
+            best = min(timings)
+            row: Dict[str, object] = {
+                "preset": name,
+                "frames": frames,
+                "hours": args.hours,
+                "trace_bytes": path.stat().st_size,
+                "checks": len(checks),
+                "replay_ms": best * 1000,
+                "frames_per_s": frames / best,
+            }
+            if args.verify_frames:
+                row["verify"] = verify(np.array(load(path)[:args.verify_frames]), config)
+                failed |= not row["verify"]["match"]
+            print(json.dumps(row), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Throughput of the bitset progression solver on random placements.
+
+Shuffles a slot's item pool over its planned locations and solves each
+placement, reporting solves per second and how many placements were beatable.
+First checks that two locations sharing an id (3011) both survive spoiler
+parsing and land in their own levels.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import List, Optional
+
+from .generation import FLIK_PRESETS, enemy_options, grainsanity_options
+from .harness import build_multiworld, load_world
+
+# "Riverbed Canyon - 11 Grain" and "Ant Hill - 25% Enemies" are both 3011.
+COLLIDING_SPOILER = """Locations:
+
+Riverbed Canyon - 11 Grain: Progressive Green Seed Upgrade - Riverbed Canyon
+Ant Hill - 25% Enemies: Extra Life
+"""
+
+
+def colliding_pair_error() -> Optional[str]:
+    """What goes wrong reading and solving COLLIDING_SPOILER, or None."""
+    from worlds.abugslife.Items import ITEM_TABLE, KIND_GREEN
+    from worlds.abugslife.Solver import ProgressionSolver, lane_count, placement_from_spoiler
+
+    placement, _ = placement_from_spoiler(COLLIDING_SPOILER)
+    if len(placement) != 2:
+        return f"spoiler placement lost a location: {placement}"
+    # Entering Riverbed Canyon takes one brown seed upgrade; its grain check then gives a green one.
+    result = ProgressionSolver().solve(placement, [ITEM_TABLE["Progressive Brown Seed Upgrade - Riverbed Canyon"]])
+    if lane_count(result.counts, 10, KIND_GREEN) != 1:
+        return "the Riverbed Canyon grain check's item was not collected in Riverbed Canyon"
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.solver", description=__doc__)
+    parser.add_argument("--placements", type=int, default=10000)
+    parser.add_argument("--grainsanity-steps", type=int, nargs="+", default=[0, 10, 1])
+    parser.add_argument("--enemy-tiers", default="all")
+    parser.add_argument("--flik", choices=sorted(FLIK_PRESETS), default="both")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--archipelago", metavar="PATH")
+    args = parser.parse_args(argv)
+
+    world_type = load_world(args.archipelago)
+    from worlds.abugslife import item_pool_counts
+    from worlds.abugslife.Items import ITEM_TABLE
+    from worlds.abugslife.Locations import LocationPlanKey, plan_locations
+    from worlds.abugslife.Solver import ProgressionSolver, plan_levels
+
+    error = colliding_pair_error()
+    if error is not None:
+        print(f"colliding location ids: {error}", file=sys.stderr)
+        return 1
+
+    for step in args.grainsanity_steps:
+        options = {**grainsanity_options(step), **enemy_options(args.enemy_tiers), **FLIK_PRESETS[args.flik]}
+        world = build_multiworld(world_type, 1, options, args.seed).worlds[1]
+        key = LocationPlanKey.from_options(world.options)
+        location_names = [location_name for location_name, _, _, _ in plan_locations(key)]
+        pool = [ITEM_TABLE[name] for name, copies in item_pool_counts(key.level_complete, len(location_names))
+                for _ in range(copies)]
+        levels = plan_levels(key)
+        solver = ProgressionSolver(key.level_complete)
+
+        rng = random.Random(args.seed)
+        placements = []
+        for _ in range(args.placements):
+            rng.shuffle(pool)
+            placements.append(dict(zip(location_names, pool)))
+
+        beatable = 0
+        start = time.perf_counter()
+        for placement in placements:
+            beatable += solver.solve(placement, levels=levels).beatable
+        elapsed = time.perf_counter() - start
+
+        print(json.dumps({
+            "options": options,
+            "locations": len(location_names),
+            "placements": args.placements,
+            "beatable": beatable,
+            "wall_s": elapsed,
+            "us_per_solve": elapsed / args.placements * 1e6,
+        }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""Minimal stand-in for Archipelago's BaseClasses.
+
+Only the surface the A Bug's Life world and the benchmark harness touch is
+implemented, with the same names and call signatures as Archipelago so the
+world code runs unchanged against either.
+"""
+from __future__ import annotations
+
+import random
+from collections import Counter, deque
+from enum import IntFlag
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ItemClassification(IntFlag):
+    filler = 0b0000
+    progression = 0b0001
+    useful = 0b0010
+    trap = 0b0100
+    skip_balancing = 0b1000
+    progression_skip_balancing = 0b1001
+
+
+class Item:
+    game: str = "Generic"
+    __slots__ = ("name", "classification", "code", "player", "location")
+
+    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int):
+        self.name = name
+        self.classification = classification
+        self.code = code
+        self.player = player
+        self.location = None
+
+    @property
+    def advancement(self) -> bool:
+        return ItemClassification.progression in self.classification
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Location:
+    game: str = "Generic"
+    locked: bool = False
+    show_in_spoiler: bool = True
+    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+    item_rule = staticmethod(lambda item: True)
+    item: Optional[Item] = None
+
+    def __init__(self, player: int, name: str = "", address: Optional[int] = None, parent: Optional[Region] = None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+
+    def can_reach(self, state: CollectionState) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def place_locked_item(self, item: Item) -> None:
+        if self.item:
+            raise Exception(f"Location {self} already filled.")
+        self.item = item
+        item.location = self
+        self.locked = True
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Entrance:
+    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+
+    def __init__(self, player: int, name: str = "", parent: Optional[Region] = None):
+        self.player = player
+        self.name = name
+        self.parent_region = parent
+        self.connected_region: Optional[Region] = None
+
+    def can_reach(self, state: CollectionState) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def connect(self, region: Region) -> None:
+        self.connected_region = region
+        region.entrances.append(self)
+
+
+class _Register(list):
+    def __init__(self, cache: Dict[str, object]):
+        super().__init__()
+        self._cache = cache
+
+    def append(self, obj) -> None:
+        self._cache[obj.name] = obj
+        super().append(obj)
+
+    def extend(self, objs: Iterable) -> None:
+        for obj in objs:
+            self.append(obj)
+
+
+class Region:
+    def __init__(self, name: str, player: int, multiworld: MultiWorld, hint: Optional[str] = None):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.entrances: List[Entrance] = []
+        self.exits: List[Entrance] = _Register(multiworld.regions.entrance_cache[player])
+        self.locations: List[Location] = _Register(multiworld.regions.location_cache[player])
+
+    def can_reach(self, state: CollectionState) -> bool:
+        if state.stale[self.player]:
+            state.update_reachable_regions(self.player)
+        return self in state.reachable_regions[self.player]
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class RegionManager:
+    def __init__(self, players: int):
+        ids = range(1, players + 1)
+        self.region_cache: Dict[int, Dict[str, Region]] = {p: {} for p in ids}
+        self.entrance_cache: Dict[int, Dict[str, Entrance]] = {p: {} for p in ids}
+        self.location_cache: Dict[int, Dict[str, Location]] = {p: {} for p in ids}
+
+    def add_group(self, new_id: int) -> None:
+        self.region_cache[new_id] = {}
+        self.entrance_cache[new_id] = {}
+        self.location_cache[new_id] = {}
+
+    def append(self, region: Region) -> None:
+        self.region_cache[region.player][region.name] = region
+
+    def extend(self, regions: Iterable[Region]) -> None:
+        for region in regions:
+            self.append(region)
+
+    def __iter__(self):
+        for regions in self.region_cache.values():
+            yield from regions.values()
+
+    def __len__(self) -> int:
+        return sum(len(regions) for regions in self.region_cache.values())
+
+
+class MultiWorld:
+    def __init__(self, players: int):
+        self.players = players
+        self.player_ids = tuple(range(1, players + 1))
+        self.regions = RegionManager(players)
+        self.itempool: List[Item] = []
+        self.completion_condition: Dict[int, Callable[[CollectionState], bool]] = {}
+        self.worlds: Dict[int, object] = {}
+        self.game: Dict[int, str] = {}
+        self.player_name: Dict[int, str] = {}
+        self.precollected_items: Dict[int, List[Item]] = {p: [] for p in self.player_ids}
+        self.random = random.Random()
+        self.seed: Optional[int] = None
+        self.seed_name = ""
+        self.state: Optional[CollectionState] = None
+        # Item-link groups: player id -> {"name", "game", "players", "world"}.
+        self.groups: Dict[int, Dict[str, Any]] = {}
+
+    def set_seed(self, seed: Optional[int] = None) -> None:
+        self.seed = random.randint(0, 2 ** 64) if seed is None else seed
+        self.random.seed(self.seed)
+        self.seed_name = str(self.seed)
+
+    def set_options(self, args) -> None:
+        from worlds.AutoWorld import AutoWorldRegister
+
+        for player in self.player_ids:
+            world_type = AutoWorldRegister.world_types[self.game[player]]
+            world = world_type(self, player)
+            self.worlds[player] = world
+            world.options = world_type.options_dataclass(**{
+                option_key: getattr(args, option_key)[player]
+                for option_key in world_type.options_dataclass.type_hints
+            })
+
+    def get_all_ids(self) -> Tuple[int, ...]:
+        return self.player_ids + tuple(self.groups)
+
+    def add_group(self, name: str, game: str, players: AbstractSet[int] = frozenset()) -> Tuple[int, Dict[str, Any]]:
+        """A group player (as item links make) with its own world, after every player and earlier group."""
+        from worlds.AutoWorld import AutoWorldRegister
+
+        new_id = self.players + len(self.groups) + 1
+        self.regions.add_group(new_id)
+        self.game[new_id] = game
+        self.worlds[new_id] = AutoWorldRegister.world_types[game].create_group(self, new_id, set(players))
+        self.player_name[new_id] = name
+        group = self.groups[new_id] = {"name": name, "game": game, "players": set(players), "world": self.worlds[new_id]}
+        return new_id, group
+
+    def get_game_players(self, game_name: str) -> tuple:
+        return tuple(player for player in self.player_ids if self.game[player] == game_name)
+
+    def get_game_worlds(self, game_name: str) -> tuple:
+        return tuple(self.worlds[player] for player in self.player_ids if self.game[player] == game_name)
+
+    def get_region(self, region_name: str, player: int) -> Region:
+        return self.regions.region_cache[player][region_name]
+
+    def get_entrance(self, entrance_name: str, player: int) -> Entrance:
+        return self.regions.entrance_cache[player][entrance_name]
+
+    def get_location(self, location_name: str, player: int) -> Location:
+        return self.regions.location_cache[player][location_name]
+
+    def get_locations(self, player: Optional[int] = None) -> Iterable[Location]:
+        if player is not None:
+            return self.regions.location_cache[player].values()
+        return [loc for cache in self.regions.location_cache.values() for loc in cache.values()]
+
+    def get_unfilled_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for location in self.get_locations(player) if location.item is None]
+
+    def get_all_state(self, use_cache: bool, allow_partial_entrances: bool = False) -> CollectionState:
+        state = CollectionState(self)
+        for item in self.itempool:
+            self.worlds[item.player].collect(state, item)
+        state.sweep_for_advancements()
+        return state
+
+
+class CollectionState:
+    additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
+    additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
+
+    def __init__(self, parent: MultiWorld):
+        self.multiworld = parent
+        ids = parent.get_all_ids()
+        self.prog_items: Dict[int, Counter] = {player: Counter() for player in ids}
+        self.reachable_regions: Dict[int, Set[Region]] = {player: set() for player in ids}
+        self.blocked_connections: Dict[int, Set[Entrance]] = {player: set() for player in ids}
+        self.stale: Dict[int, bool] = {player: True for player in ids}
+        self.locations_checked: Set[Location] = set()
+        for function in self.additional_init_functions:
+            function(self, parent)
+        for items in parent.precollected_items.values():
+            for item in items:
+                self.collect(item, True)
+
+    def copy(self) -> CollectionState:
+        ret = CollectionState(self.multiworld)
+        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
+        ret.reachable_regions = {player: regions.copy() for player, regions in self.reachable_regions.items()}
+        ret.blocked_connections = {player: blocked.copy() for player, blocked in self.blocked_connections.items()}
+        ret.stale = self.stale.copy()
+        ret.locations_checked = self.locations_checked.copy()
+        for function in self.additional_copy_functions:
+            ret = function(self, ret)
+        return ret
+
+    def update_reachable_regions(self, player: int) -> None:
+        self.stale[player] = False
+        reachable = self.reachable_regions[player]
+        blocked = self.blocked_connections[player]
+        start = self.multiworld.get_region("Menu", player)
+        if start not in reachable:
+            reachable.add(start)
+            blocked.update(start.exits)
+        queue = deque(blocked)
+        while queue:
+            connection = queue.popleft()
+            new_region = connection.connected_region
+            if new_region in reachable:
+                blocked.discard(connection)
+            elif connection.can_reach(self):
+                reachable.add(new_region)
+                blocked.discard(connection)
+                blocked.update(new_region.exits)
+                queue.extend(new_region.exits)
+
+    def can_reach(self, spot, resolution_hint: Optional[str] = None, player: Optional[int] = None) -> bool:
+        if isinstance(spot, str):
+            getter = {
+                "Location": self.multiworld.get_location,
+                "Entrance": self.multiworld.get_entrance,
+            }.get(resolution_hint, self.multiworld.get_region)
+            spot = getter(spot, player)
+        return spot.can_reach(self)
+
+    def can_reach_location(self, spot: str, player: int) -> bool:
+        return self.multiworld.get_location(spot, player).can_reach(self)
+
+    def can_reach_region(self, spot: str, player: int) -> bool:
+        return self.multiworld.get_region(spot, player).can_reach(self)
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        return self.prog_items[player][item] >= count
+
+    def has_all_counts(self, item_counts, player: int) -> bool:
+        player_prog_items = self.prog_items[player]
+        return all(player_prog_items[item] >= count for item, count in item_counts.items())
+
+    def count(self, item: str, player: int) -> int:
+        return self.prog_items[player][item]
+
+    def collect(self, item: Item, prevent_sweep: bool = False, location: Optional[Location] = None) -> bool:
+        if location:
+            self.locations_checked.add(location)
+        changed = self.multiworld.worlds[item.player].collect(self, item)
+        self.stale[item.player] = True
+        if changed and not prevent_sweep:
+            self.sweep_for_advancements()
+        return changed
+
+    def remove(self, item: Item) -> None:
+        changed = self.multiworld.worlds[item.player].remove(self, item)
+        if changed:
+            self.stale[item.player] = True
+            self.reachable_regions[item.player] = set()
+            self.blocked_connections[item.player] = set()
+
+    def sweep_for_advancements(self, locations: Optional[Iterable[Location]] = None) -> None:
+        if locations is None:
+            locations = self.multiworld.get_locations()
+        pending = [loc for loc in locations if loc.item and loc.item.advancement and loc not in self.locations_checked]
+        progress = True
+        while progress:
+            progress = False
+            still_pending = []
+            for location in pending:
+                if location.can_reach(self):
+                    self.collect(location.item, True, location)
+                    progress = True
+                else:
+                    still_pending.append(location)
+            pending = still_pending
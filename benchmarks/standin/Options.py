@@ -0,0 +1,67 @@
+"""Minimal stand-in for Archipelago's Options module."""
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass
+
+
+class Option:
+    default = 0
+    display_name = ""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    @classmethod
+    def from_any(cls, data) -> Option:
+        return cls(int(data))
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value})"
+
+
+class Toggle(Option):
+    @classmethod
+    def from_any(cls, data) -> Toggle:
+        return cls(1 if data else 0)
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Choice(Option):
+    @classmethod
+    def from_any(cls, data) -> Choice:
+        if isinstance(data, str):
+            return cls(getattr(cls, f"option_{data}"))
+        return cls(int(data))
+
+
+class Range(Option):
+    range_start = 0
+    range_end = 1
+
+    @classmethod
+    def from_any(cls, data) -> Range:
+        value = int(data)
+        if not cls.range_start <= value <= cls.range_end:
+            raise Exception(f"{value} is outside of range {cls.range_start}-{cls.range_end} for option {cls.__name__}")
+        return cls(value)
+
+
+class _TypeHints(type):
+    @property
+    def type_hints(cls) -> typing.Dict[str, typing.Type[Option]]:
+        return typing.get_type_hints(cls)
+
+
+@dataclass
+class PerGameCommonOptions(metaclass=_TypeHints):
+    pass
@@ -0,0 +1,165 @@
+"""A minimal stand-in for an Archipelago server, for exercising clients locally.
+
+Speaks just enough of the websocket protocol for one game's clients: RoomInfo,
+Connect/Connected (with slot data), ReceivedItems, LocationChecks/RoomUpdate
+and Sync. Every LocationChecks packet is recorded with its arrival time. With
+``latency_log`` it also logs ``checks_received`` and ``items_sent`` events
+for ``python -m ablbridge.latency``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import websockets
+
+from ablbridge.tracing import LatencyLog
+
+
+class StandinServer:
+    def __init__(
+        self,
+        game: str,
+        slot_data: Mapping[str, Mapping[str, Any]],
+        seed_name: str = "standin",
+        password: Optional[str] = None,
+        latency_log: Optional[Path] = None,
+    ):
+        self.game = game
+        self.slot_data = dict(slot_data)
+        self.slot_numbers = {name: number for number, name in enumerate(self.slot_data, start=1)}
+        self.seed_name = seed_name
+        self.password = password
+
+        self.checked: Dict[str, Set[int]] = {name: set() for name in self.slot_data}
+        self.items: Dict[str, List[int]] = {name: [] for name in self.slot_data}
+        # (monotonic arrival time, slot name, locations) per LocationChecks packet.
+        self.check_packets: List[Tuple[float, str, List[int]]] = []
+        self.on_checks: Optional[Callable[[float, str, List[int]], None]] = None
+
+        self._clients: Dict[str, Set[Any]] = {name: set() for name in self.slot_data}
+        self._server = None
+        self.latency = LatencyLog(latency_log, seed=seed_name) if latency_log is not None else None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._server = await websockets.serve(self._serve, host, port, max_size=None, ping_interval=None)
+        return self.port
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def give_items(self, slot: str, item_ids: Iterable[int]) -> None:
+        """Append items to a slot's received list and push them to its clients."""
+        items = self.items[slot]
+        index = len(items)
+        items.extend(item_ids)
+        packet = self._received_items(slot, index)
+        if self.latency is not None:
+            self.latency.event("items_sent", slot=slot, index=index, items=items[index:])
+        await self._broadcast(slot, packet)
+
+    def _received_items(self, slot: str, index: int) -> Dict[str, Any]:
+        return {
+            "cmd": "ReceivedItems",
+            "index": index,
+            "items": [
+                {"item": item_id, "location": -1, "player": 0, "flags": 0, "class": "NetworkItem"}
+                for item_id in self.items[slot][index:]
+            ],
+        }
+
+    async def _broadcast(self, slot: str, *packets: Dict[str, Any]) -> None:
+        message = json.dumps(list(packets))
+        for socket in list(self._clients[slot]):
+            try:
+                await socket.send(message)
+            except websockets.exceptions.ConnectionClosed:
+                self._clients[slot].discard(socket)
+
+    async def _serve(self, socket, *_path) -> None:
+        slot: Optional[str] = None
+        await socket.send(json.dumps([{
+            "cmd": "RoomInfo",
+            "version": {"major": 0, "minor": 6, "build": 1, "class": "Version"},
+            "generator_version": {"major": 0, "minor": 6, "build": 1, "class": "Version"},
+            "tags": [],
+            "password": self.password is not None,
+            "permissions": {},
+            "hint_cost": 0,
+            "location_check_points": 0,
+            "games": [self.game],
+            "datapackage_checksums": {},
+            "seed_name": self.seed_name,
+            "time": time.time(),
+        }]))
+        try:
+            async for message in socket:
+                arrived = time.monotonic()
+                for packet in json.loads(message):
+                    cmd = packet.get("cmd")
+                    if cmd == "Connect":
+                        slot = await self._connect(socket, packet)
+                    elif slot is None:
+                        continue
+                    elif cmd == "LocationChecks":
+                        await self._location_checks(slot, packet.get("locations", []), arrived)
+                    elif cmd == "Sync":
+                        await socket.send(json.dumps([self._received_items(slot, 0)]))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            if slot is not None:
+                self._clients[slot].discard(socket)
+
+    async def _connect(self, socket, packet: Dict[str, Any]) -> Optional[str]:
+        name = packet.get("name")
+        errors = []
+        if name not in self.slot_data:
+            errors.append("InvalidSlot")
+        elif packet.get("game") != self.game:
+            errors.append("InvalidGame")
+        if self.password is not None and packet.get("password") != self.password:
+            errors.append("InvalidPassword")
+        if errors:
+            await socket.send(json.dumps([{"cmd": "ConnectionRefused", "errors": errors}]))
+            return None
+
+        self._clients[name].add(socket)
+        await socket.send(json.dumps([
+            {
+                "cmd": "Connected",
+                "team": 0,
+                "slot": self.slot_numbers[name],
+                "players": [
+                    {"team": 0, "slot": number, "alias": slot, "name": slot, "class": "NetworkPlayer"}
+                    for slot, number in self.slot_numbers.items()
+                ],
+                "missing_locations": [],
+                "checked_locations": sorted(self.checked[name]),
+                "slot_data": self.slot_data[name] if packet.get("slot_data", True) else {},
+                "slot_info": {},
+                "hint_points": 0,
+            },
+            self._received_items(name, 0),
+        ]))
+        return name
+
+    async def _location_checks(self, slot: str, locations: List[int], arrived: float) -> None:
+        self.check_packets.append((arrived, slot, locations))
+        if self.latency is not None:
+            self.latency.event("checks_received", arrived * 1000.0, slot=slot, locs=locations)
+        if self.on_checks is not None:
+            self.on_checks(arrived, slot, locations)
+
+        new = [location_id for location_id in locations if location_id not in self.checked[slot]]
+        if new:
+            self.checked[slot].update(new)
+            await self._broadcast(slot, {"cmd": "RoomUpdate", "checked_locations": new})
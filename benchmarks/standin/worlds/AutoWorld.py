@@ -0,0 +1,137 @@
+"""Minimal stand-in for Archipelago's worlds.AutoWorld."""
+from __future__ import annotations
+
+import random
+from typing import Any, ClassVar, Dict, Optional, Type
+
+from BaseClasses import CollectionState, Item, MultiWorld
+from Options import PerGameCommonOptions
+
+
+class AutoWorldRegister(type):
+    world_types: Dict[str, Type[World]] = {}
+
+    def __new__(mcs, name: str, bases: tuple, dct: Dict[str, Any]) -> AutoWorldRegister:
+        new_class = super().__new__(mcs, name, bases, dct)
+        if "game" in dct:
+            AutoWorldRegister.world_types[dct["game"]] = new_class
+        return new_class
+
+
+class AutoLogicRegister(type):
+    def __new__(mcs, name: str, bases: tuple, dct: Dict[str, Any]) -> AutoLogicRegister:
+        new_class = super().__new__(mcs, name, bases, dct)
+        for item_name, function in dct.items():
+            if item_name == "copy_mixin":
+                CollectionState.additional_copy_functions.append(function)
+            elif item_name == "init_mixin":
+                CollectionState.additional_init_functions.append(function)
+            elif not item_name.startswith("__"):
+                if hasattr(CollectionState, item_name):
+                    raise Exception(f"Name conflict on Logic Mixin {name} trying to overwrite {item_name}")
+                setattr(CollectionState, item_name, function)
+        return new_class
+
+
+class LogicMixin(metaclass=AutoLogicRegister):
+    pass
+
+
+class WebWorld:
+    theme = "grass"
+    tutorials = []
+
+
+class World(metaclass=AutoWorldRegister):
+    game: ClassVar[str]
+    options_dataclass: ClassVar[Type[PerGameCommonOptions]] = PerGameCommonOptions
+    options: PerGameCommonOptions
+    item_name_to_id: ClassVar[Dict[str, int]] = {}
+    location_name_to_id: ClassVar[Dict[str, int]] = {}
+    item_name_groups: ClassVar[Dict[str, set]] = {}
+    location_name_groups: ClassVar[Dict[str, set]] = {}
+    web: ClassVar[WebWorld] = WebWorld()
+
+    def __init__(self, multiworld: MultiWorld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    @classmethod
+    def create_group(cls, multiworld: MultiWorld, new_player_id: int, players: set) -> World:
+        """The world of a group player, with every option at its default."""
+        group = cls(multiworld, new_player_id)
+        group.options = cls.options_dataclass(**{
+            option_key: option.from_any(option.default)
+            for option_key, option in cls.options_dataclass.type_hints.items()
+        })
+        return group
+
+    def generate_early(self) -> None:
+        pass
+
+    def create_regions(self) -> None:
+        pass
+
+    def create_items(self) -> None:
+        pass
+
+    def set_rules(self) -> None:
+        pass
+
+    def connect_entrances(self) -> None:
+        pass
+
+    def generate_basic(self) -> None:
+        pass
+
+    def pre_fill(self) -> None:
+        pass
+
+    def generate_output(self, output_directory: str) -> None:
+        pass
+
+    def fill_slot_data(self) -> Dict[str, Any]:
+        return {}
+
+    def get_filler_item_name(self) -> str:
+        return self.random.choice(tuple(self.item_name_to_id.keys()))
+
+    def collect_item(self, state: CollectionState, item: Item, remove: bool = False) -> Optional[str]:
+        if item.advancement:
+            return item.name
+        return None
+
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        name = self.collect_item(state, item)
+        if name:
+            state.prog_items[self.player][name] += 1
+            return True
+        return False
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        name = self.collect_item(state, item, True)
+        if name:
+            state.prog_items[self.player][name] -= 1
+            if state.prog_items[self.player][name] < 1:
+                del state.prog_items[self.player][name]
+            return True
+        return False
+
+
+def call_single(multiworld: MultiWorld, method_name: str, player: int, *args: Any) -> Any:
+    return getattr(multiworld.worlds[player], method_name)(*args)
+
+
+def call_stage(multiworld: MultiWorld, method_name: str, *args: Any) -> None:
+    world_types = {multiworld.worlds[player].__class__ for player in multiworld.player_ids}
+    for world_type in sorted(world_types, key=lambda world: world.__name__):
+        stage_callable = getattr(world_type, f"stage_{method_name}", None)
+        if stage_callable:
+            stage_callable(multiworld, *args)
+
+
+def call_all(multiworld: MultiWorld, method_name: str, *args: Any) -> None:
+    for player in multiworld.player_ids:
+        call_single(multiworld, method_name, player, *args)
+    call_stage(multiworld, method_name, *args)
@@ -0,0 +1 @@
+"""Stand-in for Archipelago's ``worlds`` package; world discovery is left to the harness."""
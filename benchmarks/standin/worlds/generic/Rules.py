@@ -0,0 +1,14 @@
+"""Minimal stand-in for Archipelago's worlds.generic.Rules."""
+from typing import Callable
+
+
+def set_rule(spot, rule: Callable) -> None:
+    spot.access_rule = rule
+
+
+def add_rule(spot, rule: Callable, combine: str = "and") -> None:
+    old_rule = spot.access_rule
+    if combine == "or":
+        spot.access_rule = lambda state: rule(state) or old_rule(state)
+    else:
+        spot.access_rule = lambda state: rule(state) and old_rule(state)
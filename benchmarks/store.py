@@ -0,0 +1,109 @@
+"""Cost of applying received tier items and of Lua noticing them.
+
+Applies ``--items`` berry and seed items one at a time, the way items arrive
+while playing, once by rewriting the text tier files after each item (what
+the clients did before abl_tiers.bin) and once through the tier store. On the
+reader side it compares re-parsing the text files, which ABL.lua did every 300
+frames whether anything changed or not, with polling the store's header, both
+when nothing changed and when every poll sees a new generation.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ablbridge.protocol import (
+    BERRY_ID_BASE,
+    LEGACY_BERRY_FILE,
+    LEGACY_SEED_FILE,
+    SEED_ID_BASE,
+    SEED_UPGRADE_CAPS,
+    TIER_FILE,
+    TierState,
+    apply_items,
+    write_lines_atomic,
+)
+from ablbridge.store import TierReader, legacy_rows
+
+
+def item_stream(count: int) -> List[int]:
+    """Berry and seed items for every level, repeated; most hit their cap quickly."""
+    ids: List[int] = []
+    for level_idx in sorted(SEED_UPGRADE_CAPS):
+        ids.append(BERRY_ID_BASE + level_idx)
+        ids.extend(SEED_ID_BASE + colour * 100 + level_idx for colour in range(5))
+    return (ids * (count // len(ids) + 1))[:count]
+
+
+def save_legacy(tiers: TierState, data_dir: Path) -> None:
+    write_lines_atomic(data_dir / LEGACY_BERRY_FILE, (
+        f"LEVEL {level_idx} {tier}" for level_idx, tier in enumerate(tiers.berry_tiers) if tier > 0
+    ))
+    write_lines_atomic(data_dir / LEGACY_SEED_FILE, (
+        f"LEVEL {level_idx} " + " ".join(str(tier) for tier in seeds)
+        for level_idx, seeds in enumerate(tiers.seed_tiers) if any(seeds)
+    ))
+
+
+def per_call_us(fn: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def run(items: int, polls: int) -> Dict[str, float]:
+    stream = item_stream(items)
+    row: Dict[str, float] = {"items": items, "polls": polls}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        tiers = TierState(data_dir)
+        tiers.load()
+        start = time.perf_counter()
+        for item_id in stream:
+            apply_items(tiers, [item_id])
+            save_legacy(tiers, data_dir)
+        row["legacy_write_us_per_item"] = (time.perf_counter() - start) / items * 1e6
+        row["legacy_read_us"] = per_call_us(
+            lambda: (legacy_rows(data_dir / LEGACY_BERRY_FILE), legacy_rows(data_dir / LEGACY_SEED_FILE)), polls
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        tiers = TierState(data_dir)
+        tiers.load()
+        start = time.perf_counter()
+        for item_id in stream:
+            apply_items(tiers, [item_id])
+        row["store_write_us_per_item"] = (time.perf_counter() - start) / items * 1e6
+
+        reader = TierReader(data_dir / TIER_FILE)
+        reader.poll()
+        row["store_poll_unchanged_us"] = per_call_us(reader.poll, polls)
+
+        def poll_changed() -> None:
+            with tiers.store.update():
+                pass
+            reader.poll()
+
+        row["store_poll_changed_us"] = per_call_us(poll_changed, polls)
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.store", description=__doc__)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--polls", type=int, default=20000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.items, args.polls)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Cost of Level Complete entrance rules during reachability sweeps.
+
+Collects every slot's shuffled progression items one at a time into a fresh
+CollectionState, recomputing every slot's reachable regions every
+``--every`` items the way fill's sweeps do, then removes the items again in
+reverse; ``--rounds`` repeats it. This runs once with the entrance rules
+built on item names (level_rule_factories(), which call ``state.has`` for
+every alternative) and once with the per-level flags BugsLifeWorld.collect()
+and remove() maintain (level_access_rule()). Both ways must see the same
+reachable regions at every check. With ``--item-link`` an item-link group of
+every slot is added too, and a copy of the first slot's progression items,
+owned by the group, is collected and removed along with the rest.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .generation import FLIK_PRESETS, enemy_options, grainsanity_options
+from .harness import STAGES, build_multiworld, load_world, run_stage
+
+
+def use_name_rules(multiworld) -> None:
+    from worlds.abugslife.Rules import level_rule_factories
+
+    factories = level_rule_factories()
+    for world in multiworld.worlds.values():
+        for level_idx, entrance in world.level_entrances.items():
+            factory = factories.get(level_idx)
+            if factory is not None:
+                entrance.access_rule = factory(world.player)
+
+
+def reachable_regions(state, players) -> int:
+    for player in players:
+        state.update_reachable_regions(player)
+    return sum(len(state.reachable_regions[player]) for player in players)
+
+
+def sweep(multiworld, items: List[Any], every: int, rounds: int) -> Tuple[float, List[int]]:
+    from BaseClasses import CollectionState
+
+    players = multiworld.player_ids
+    seen: List[int] = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        seen = []
+        state = CollectionState(multiworld)
+        for index, item in enumerate(items):
+            state.collect(item, True)
+            if index % every == 0:
+                seen.append(reachable_regions(state, players))
+        for index, item in enumerate(reversed(items)):
+            state.remove(item)
+            if index % every == 0:
+                seen.append(reachable_regions(state, players))
+    return (time.perf_counter() - start) / rounds, seen
+
+
+def link_items(multiworld, items: List[Any]) -> List[Any]:
+    """Add an item-link group of every slot; returns its copies of the first slot's items."""
+    game = multiworld.game[multiworld.player_ids[0]]
+    _, group = multiworld.add_group("Linked", game, set(multiworld.player_ids))
+    first = multiworld.player_ids[0]
+    return [group["world"].create_item(item.name) for item in items if item.player == first]
+
+
+def run(world_type: type, players: int, options: Dict[str, Any], seed: int, every: int, rounds: int,
+        item_link: bool = False) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"players": players, "options": options, "item_link": item_link}
+    results = {}
+    for way in ("names", "flags"):
+        multiworld = build_multiworld(world_type, players, options, seed)
+        for stage in STAGES[:-1]:
+            run_stage(multiworld, stage)
+        if way == "names":
+            use_name_rules(multiworld)
+        items = [item for item in multiworld.itempool if item.advancement]
+        if item_link:
+            items += link_items(multiworld, items)
+        random.Random(seed).shuffle(items)
+        seconds, seen = sweep(multiworld, items, every, rounds)
+        results[way] = seen
+        row["progression_items"] = len(items)
+        row[f"{way}_ms_per_round"] = seconds * 1000
+    row["matches"] = results["names"] == results["flags"]
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.sweeps", description=__doc__)
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--grainsanity-steps", type=int, nargs="+", default=[0, 1])
+    parser.add_argument("--enemy-tiers", default="all")
+    parser.add_argument("--flik", choices=sorted(FLIK_PRESETS), default="both")
+    parser.add_argument("--every", type=int, default=1, help="re-check reachability every N items")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--item-link", action="store_true", help="add an item-link group of every slot")
+    parser.add_argument("--archipelago", metavar="PATH")
+    args = parser.parse_args(argv)
+
+    world_type = load_world(args.archipelago)
+    failed = False
+    for players in args.players:
+        for step in args.grainsanity_steps:
+            options = {
+                "enable_level_complete": 1,
+                **grainsanity_options(step),
+                **enemy_options(args.enemy_tiers),
+                **FLIK_PRESETS[args.flik],
+            }
+            row = run(world_type, players, options, args.seed, args.every, args.rounds, args.item_link)
+            failed |= not row["matches"]
+            print(json.dumps(row), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+﻿using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+
+// Append-only journal shared with ABL.lua. The format is documented with the
+// reference implementation in ablbridge/journal.py:
+//
+//   #ABLJ <journal id> <epoch>
+//   <seq> <payload>[\t<trace>]
+//
+// (the optional trace field is written when ABL_LATENCY_TRACE is set)
+// and the reader's position lives in "<journal>.ack" as
+// "<seq> <journal id> <epoch> <offset>".
+
+readonly record struct JournalEntry(long Seq, string Payload, string Trace = "");
+
+readonly record struct JournalAck(long Seq, string JournalId, long Epoch, long Offset)
+{
+    public static readonly JournalAck Empty = new(0, "", -1, 0);
+
+    public static string PathFor(string journalPath) => journalPath + ".ack";
+
+    public static JournalAck Read(string path)
+    {
+        try
+        {
+            if (!File.Exists(path)) return Empty;
+            var parts = File.ReadAllText(path).Split(' ', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
+            if (parts.Length == 4 &&
+                long.TryParse(parts[0], out var seq) &&
+                long.TryParse(parts[2], out var epoch) &&
+                long.TryParse(parts[3], out var offset))
+                return new JournalAck(seq, parts[1], epoch, offset);
+        }
+        catch (IOException) { }
+        return Empty;
+    }
+
+    public void Write(string path)
+    {
+        var tmp = path + ".tmp";
+        File.WriteAllText(tmp, $"{Seq} {JournalId} {Epoch} {Offset}\n");
+        File.Move(tmp, path, overwrite: true);
+    }
+}
+
+static class Journal
+{
+    public const string HeaderPrefix = "#ABLJ ";
+    public const long DefaultCompactBytes = 64 * 1024;
+
+    static readonly UTF8Encoding Utf8 = new(encoderShouldEmitUTF8Identifier: false);
+
+    public static byte[] Header(string journalId, long epoch) => Utf8.GetBytes($"{HeaderPrefix}{journalId} {epoch}\n");
+
+    public static bool TryParseHeader(byte[] data, out string journalId, out long epoch, out int length)
+    {
+        journalId = "";
+        epoch = 0;
+        length = Array.IndexOf(data, (byte)'\n') + 1;
+        if (length <= 0) return false;
+
+        var line = Utf8.GetString(data, 0, length).TrimEnd('\r', '\n');
+        if (!line.StartsWith(HeaderPrefix, StringComparison.Ordinal)) return false;
+
+        var parts = line.Substring(HeaderPrefix.Length).Split(' ');
+        if (parts.Length != 2 || !long.TryParse(parts[1], out epoch)) return false;
+        journalId = parts[0];
+        return true;
+    }
+
+    // Entries in data[start..], and how many of those bytes were complete lines.
+    public static List<JournalEntry> ParseEntries(byte[] data, int start, out int complete)
+    {
+        var entries = new List<JournalEntry>();
+        int end = Array.LastIndexOf(data, (byte)'\n') + 1;
+        complete = Math.Max(0, end - start);
+        if (complete == 0) return entries;
+
+        foreach (var raw in Utf8.GetString(data, start, complete).Split('\n'))
+        {
+            var line = raw.TrimEnd('\r');
+            int space = line.IndexOf(' ');
+            if (space > 0 && long.TryParse(line.AsSpan(0, space), out var seq))
+            {
+                var payload = line.Substring(space + 1);
+                int tab = payload.IndexOf('\t');
+                entries.Add(tab < 0
+                    ? new JournalEntry(seq, payload)
+                    : new JournalEntry(seq, payload.Substring(0, tab), payload.Substring(tab + 1)));
+            }
+        }
+        return entries;
+    }
+
+    public static byte[] ReadShared(string path)
+    {
+        using var fs = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
+        using var ms = new MemoryStream();
+        fs.CopyTo(ms);
+        return ms.ToArray();
+    }
+
+    public static byte[] EncodeEntry(long seq, string payload, string trace = "") =>
+        Utf8.GetBytes(trace.Length == 0 ? $"{seq} {payload}\n" : $"{seq} {payload}\t{trace}\n");
+}
+
+sealed class JournalWriter
+{
+    public string Path { get; }
+    public string AckPath { get; }
+    public long CompactBytes { get; }
+    public long Seq { get; private set; }
+
+    string _journalId;
+    long _epoch;
+
+    public JournalWriter(string path, long compactBytes = Journal.DefaultCompactBytes)
+    {
+        Path = path;
+        AckPath = JournalAck.PathFor(path);
+        CompactBytes = compactBytes;
+
+        TerminatePartialLine();
+
+        string? fileId = null;
+        long fileEpoch = -1;
+        if (File.Exists(path))
+        {
+            var data = Journal.ReadShared(path);
+            if (Journal.TryParseHeader(data, out var id, out fileEpoch, out int headerLength))
+            {
+                fileId = id;
+                foreach (var entry in Journal.ParseEntries(data, headerLength, out _))
+                    Seq = Math.Max(Seq, entry.Seq);
+            }
+        }
+
+        var ack = JournalAck.Read(AckPath);
+        Seq = Math.Max(Seq, ack.Seq);
+
+        if (fileId != null)
+        {
+            _journalId = fileId;
+            _epoch = fileEpoch;
+        }
+        else if (ack.JournalId.Length > 0)
+        {
+            _journalId = ack.JournalId;
+            _epoch = ack.Epoch;
+        }
+        else
+        {
+            _journalId = Random.Shared.Next().ToString("x8");
+            _epoch = -1;
+        }
+    }
+
+    // A writer that died mid-line leaves a fragment; ending it keeps the next
+    // entry from being glued onto it.
+    void TerminatePartialLine()
+    {
+        if (!File.Exists(Path)) return;
+        using var fs = new FileStream(Path, FileMode.Open, FileAccess.ReadWrite, FileShare.ReadWrite | FileShare.Delete);
+        if (fs.Length == 0) return;
+        fs.Seek(-1, SeekOrigin.End);
+        if (fs.ReadByte() != '\n')
+            fs.WriteByte((byte)'\n');
+    }
+
+    public long Append(params string[] payloads)
+    {
+        if (payloads.Length == 0) return Seq;
+
+        using var buffer = new MemoryStream();
+        if (!File.Exists(Path))
+        {
+            // A fresh file gets a new epoch so the reader rescans it.
+            _epoch++;
+            buffer.Write(Journal.Header(_journalId, _epoch));
+        }
+        foreach (var payload in payloads)
+            buffer.Write(Journal.EncodeEntry(++Seq, payload));
+
+        long size;
+        using (var fs = new FileStream(Path, FileMode.Append, FileAccess.Write, FileShare.ReadWrite | FileShare.Delete))
+        {
+            buffer.WriteTo(fs);
+            size = fs.Length;
+        }
+
+        if (size >= CompactBytes)
+            Compact();
+        return Seq;
+    }
+
+    // Drops every entry the reader has acked. Returns false if the file could
+    // not be replaced (the reader had it open); the next append tries again.
+    public bool Compact()
+    {
+        var ack = JournalAck.Read(AckPath);
+        long acked = ack.JournalId == _journalId ? ack.Seq : 0;
+
+        var data = Journal.ReadShared(Path);
+        if (!Journal.TryParseHeader(data, out _, out long fileEpoch, out int headerLength))
+            return false;
+
+        long epoch = Math.Max(fileEpoch, _epoch) + 1;
+        using var buffer = new MemoryStream();
+        buffer.Write(Journal.Header(_journalId, epoch));
+        foreach (var entry in Journal.ParseEntries(data, headerLength, out _))
+        {
+            if (entry.Seq > acked)
+                buffer.Write(Journal.EncodeEntry(entry.Seq, entry.Payload, entry.Trace));
+        }
+
+        var tmp = Path + ".tmp";
+        try
+        {
+            File.WriteAllBytes(tmp, buffer.ToArray());
+            File.Move(tmp, Path, overwrite: true);
+        }
+        catch (IOException)
+        {
+            try { File.Delete(tmp); } catch { }
+            return false;
+        }
+        catch (UnauthorizedAccessException)
+        {
+            try { File.Delete(tmp); } catch { }
+            return false;
+        }
+
+        _epoch = epoch;
+        return true;
+    }
+}
+
+sealed class JournalReader
+{
+    public string Path { get; }
+    public string AckPath { get; }
+
+    long _seq;
+    string _journalId;
+    long _epoch;
+    long _offset;
+    JournalAck _acked;
+
+    public JournalReader(string path)
+    {
+        Path = path;
+        AckPath = JournalAck.PathFor(path);
+        _acked = JournalAck.Read(AckPath);
+        (_seq, _journalId, _epoch, _offset) = _acked;
+    }
+
+    // Entries after the last one read, in order. Call Ack() once they are handled.
+    public List<JournalEntry> Read()
+    {
+        if (!File.Exists(Path)) return new List<JournalEntry>();
+
+        List<JournalEntry> entries;
+        try
+        {
+            using var fs = new FileStream(Path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
+            var head = new byte[Math.Min(fs.Length, 256)];
+            fs.ReadExactly(head);
+            if (!Journal.TryParseHeader(head, out var journalId, out var epoch, out int headerLength))
+                return new List<JournalEntry>();
+
+            if (journalId != _journalId)
+                _seq = 0;
+            if (journalId != _journalId || epoch != _epoch)
+            {
+                _journalId = journalId;
+                _epoch = epoch;
+                _offset = headerLength;
+            }
+
+            fs.Seek(Math.Min(_offset, fs.Length), SeekOrigin.Begin);
+            var rest = new byte[fs.Length - fs.Position];
+            fs.ReadExactly(rest);
+            entries = Journal.ParseEntries(rest, 0, out int complete);
+            _offset = fs.Length - rest.Length + complete;
+        }
+        catch (FileNotFoundException)
+        {
+            return new List<JournalEntry>();
+        }
+
+        var fresh = new List<JournalEntry>();
+        foreach (var entry in entries)
+        {
+            if (entry.Seq <= _seq) continue;
+            _seq = entry.Seq;
+            fresh.Add(entry);
+        }
+        return fresh;
+    }
+
+    // Persists the position after the last entry read.
+    public void Ack()
+    {
+        var ack = new JournalAck(_seq, _journalId, _epoch, _offset);
+        if (ack == _acked) return;
+        ack.Write(AckPath);
+        _acked = ack;
+    }
+}
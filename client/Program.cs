@@ -4,7 +4,9 @@ using Archipelago.MultiClient.Net.Helpers;
 using System;
 using System.Collections;
 using System.Collections.Generic;
+using System.Collections.ObjectModel;
 using System.IO;
+using System.Linq;
 using System.Threading;
 using System.Reflection;
 using static System.Environment;
@@ -27,29 +29,74 @@ class Program
     static bool EnableEnemy75;
     static bool EnableEnemy100;
 
+    // "<token> <level>" -> location id for this slot's enabled checks, from slot data.
+    static Dictionary<string, long>? _checkIds;
+
+    // Per level, from slot data: enabled grainsanity amounts (ascending) and the
+    // enemy counter value of each 25/50/75/100% tier (0: no check). Copied into
+    // abl_config.txt for ABL.lua.
+    static readonly Dictionary<int, int[]> _grainThresholds = new();
+    static readonly Dictionary<int, int[]> _enemyKills = new();
+
+    const int SlotDataVersion = 1;
+
+    // Bits of the "options" slot data field and config line.
+    const int OptionLevelComplete = 1 << 0;
+    const int OptionFlikIndividual = 1 << 1;
+    const int OptionFlikAll = 1 << 2;
+    const int OptionGrainAll = 1 << 3;
+    const int OptionGrainsanity = 1 << 4;
+    const int OptionEnemy25 = 1 << 5;
+    const int OptionEnemy50 = 1 << 6;
+    const int OptionEnemy75 = 1 << 7;
+    const int OptionEnemy100 = 1 << 8;
+
     static readonly object _berryLock = new();
     static readonly object _seedLock = new();
+    static TierStore? _tierStore;
 
     static FileSystemWatcher? _stateWatcher;
+    static readonly object _stateLock = new();
+    static readonly object _commandLock = new();
+    static JournalReader? _stateJournal;
+    static JournalWriter? _commandJournal;
     static readonly ManualResetEvent _exitEvent = new(false);
 
     static bool _propsInitialized;
     static PropertyInfo? _roomSeedProp;
     static PropertyInfo? _itemsReceivedProp;
 
-    static string DataDir =
-        Path.Combine(
-            GetFolderPath(SpecialFolder.LocalApplicationData),
-            "A_Bugs_Life_Archipelago"
-        );
+    // Replaces the default directory, as ABL.lua and ablbridge read it.
+    const string DataDirEnvVar = "ABL_DATA_DIR";
+
+    static readonly string BaseDataDir =
+        GetEnvironmentVariable(DataDirEnvVar) is { Length: > 0 } dataDir
+            ? dataDir
+            : Path.Combine(
+                GetFolderPath(SpecialFolder.LocalApplicationData),
+                "A_Bugs_Life_Archipelago"
+            );
+
+    // Set with --instance NAME or ABL_INSTANCE, as ABL.lua and ablbridge read
+    // it, to give one emulator/client pair its own directory under
+    // instances\; the supervisor names it <room seed>-<slot>.
+    const string InstanceEnvVar = "ABL_INSTANCE";
+
+    static string DataDir = BaseDataDir;
 
     static string StatePath => Path.Combine(DataDir, "abl_state.txt");
     static string CommandPath => Path.Combine(DataDir, "abl_command.txt");
-    static string BerryStatePath => Path.Combine(DataDir, "abl_berries.txt");
-    static string SeedStatePath => Path.Combine(DataDir, "abl_seeds.txt");
+    static string TierStorePath => Path.Combine(DataDir, "abl_tiers.bin");
+    // The text tier files abl_tiers.bin replaced; imported once if found.
+    static string LegacyBerryStatePath => Path.Combine(DataDir, "abl_berries.txt");
+    static string LegacySeedStatePath => Path.Combine(DataDir, "abl_seeds.txt");
     static string ConfigPath => Path.Combine(DataDir, "abl_config.txt");
     static string SessionPath => Path.Combine(DataDir, "session.txt");
     static string ItemsProcessedPath => Path.Combine(DataDir, "items_processed.txt");
+    // Locations the server has or has been sent this session, one id per line.
+    static string CheckedLocationsPath => Path.Combine(DataDir, "checked_locations.txt");
+
+    static readonly HashSet<long> _checkedLocations = new();
 
     static readonly int[,] SeedTiers = new int[256, 5];
 
@@ -127,6 +174,14 @@ class Program
         Console.WriteLine("This Archipelago Client is compatible only with the NTSC-U release for A Bug's Life (North American PS1 version)");
         Console.WriteLine();
 
+        string? instance = InstanceFromArgs(args);
+        if (!string.IsNullOrEmpty(instance))
+        {
+            DataDir = Path.Combine(BaseDataDir, "instances", SanitizeInstance(instance));
+            Console.WriteLine($"Instance {instance}: {DataDir}");
+            Console.WriteLine();
+        }
+
         Directory.CreateDirectory(DataDir);
 
         string serverAddress = "";
@@ -160,6 +215,7 @@ class Program
 
             _session = ArchipelagoSessionFactory.CreateSession(serverAddress);
             _session.Items.ItemReceived += OnItemReceived;
+            _session.Locations.CheckedLocationsUpdated += OnCheckedLocationsUpdated;
 
             var result = _session.TryConnectAndLogin(
                 game: gameName,
@@ -184,10 +240,11 @@ class Program
             string sessionKey = $"{seedName}|{slotName}|{serverAddress}";
 
             ResetLocalStateIfSessionChanged(sessionKey);
+            OpenJournals();
             ReadSlotDataAndWriteConfig(result);
+            SyncCheckedLocations();
 
-            LoadBerryState();
-            LoadSeedState();
+            LoadTierState();
 
             ProcessReceivedItemBacklog();
 
@@ -205,10 +262,32 @@ class Program
 
             _exitEvent.WaitOne();
             _stateWatcher?.Dispose();
+            _tierStore?.Dispose();
             return;
         }
     }
 
+    static string? InstanceFromArgs(string[] args)
+    {
+        for (int i = 0; i < args.Length; i++)
+        {
+            if (args[i] == "--instance" && i + 1 < args.Length)
+                return args[i + 1];
+            if (args[i].StartsWith("--instance=", StringComparison.Ordinal))
+                return args[i].Substring("--instance=".Length);
+        }
+        return GetEnvironmentVariable(InstanceEnvVar);
+    }
+
+    // Every UTF-8 byte outside [A-Za-z0-9_-] becomes '_', the same as in
+    // ABL.lua and ablbridge, so all three land in the same directory.
+    static string SanitizeInstance(string instance)
+    {
+        var chars = System.Text.Encoding.UTF8.GetBytes(instance)
+            .Select(b => char.IsAsciiLetterOrDigit((char)b) || b == '_' || b == '-' ? (char)b : '_');
+        return new string(chars.ToArray());
+    }
+
     static bool TryNormalizeServerAddress(string input, out string normalized, out string error)
     {
         normalized = "";
@@ -289,20 +368,41 @@ class Program
         Console.WriteLine("[AP] New session detected; resetting local state.");
 
         SafeDelete(ConfigPath);
-        SafeDelete(SeedStatePath);
-        SafeDelete(BerryStatePath);
+        SafeDelete(LegacySeedStatePath);
+        SafeDelete(LegacyBerryStatePath);
         SafeDelete(StatePath);
+        SafeDelete(JournalAck.PathFor(StatePath));
         SafeDelete(CommandPath);
+        SafeDelete(JournalAck.PathFor(CommandPath));
         SafeDelete(ItemsProcessedPath);
+        SafeDelete(CheckedLocationsPath);
 
         Array.Clear(_berryTiers, 0, _berryTiers.Length);
         for (int i = 0; i < SeedTiers.GetLength(0); i++)
             for (int j = 0; j < SeedTiers.GetLength(1); j++)
                 SeedTiers[i, j] = 0;
 
+        // Lua keeps the store open, so it is cleared rather than deleted.
+        try { Tiers.Clear(); }
+        catch (IOException ex) { Console.WriteLine("[AP] Failed to clear tier store: " + ex.Message); }
+
         try { File.WriteAllText(SessionPath, sessionKey); } catch { }
     }
 
+    static void OpenJournals()
+    {
+        _stateJournal = new JournalReader(StatePath);
+        _commandJournal = new JournalWriter(CommandPath);
+    }
+
+    static void QueueCommand(string command)
+    {
+        lock (_commandLock)
+        {
+            _commandJournal?.Append(command);
+        }
+    }
+
     static void SafeDelete(string path)
     {
         try
@@ -340,6 +440,9 @@ class Program
     {
         try
         {
+            _grainThresholds.Clear();
+            _enemyKills.Clear();
+
             var slotDataObj = loginResult.GetType().GetProperty("SlotData")?.GetValue(loginResult);
             var slotData = slotDataObj as System.Collections.IDictionary;
 
@@ -368,18 +471,74 @@ class Program
                 return def;
             }
 
-            EnableLevelComplete = GetInt("enable_level_complete", 1) != 0;
-            EnableGrainAll = GetInt("enable_grain_all", 0) != 0;
-            EnableFlikAll = GetInt("enable_flik_all", 0) != 0;
-            EnableFlikIndividual = GetInt("enable_flik_individual", 0) != 0;
+            T? GetJson<T>(string key) where T : class
+            {
+                if (!slotData.Contains(key) || slotData[key] is not { } value) return null;
+                try
+                {
+                    return System.Text.Json.JsonSerializer.Deserialize<T>(value.ToString() ?? "");
+                }
+                catch (System.Text.Json.JsonException ex)
+                {
+                    Console.WriteLine($"[AP] Warning: could not read {key} from SlotData: " + ex.Message);
+                    return null;
+                }
+            }
 
-            EnableGrainsanity = GetInt("enable_grainsanity", 0) != 0;
-            GrainsanityStep = Math.Clamp(GetInt("grainsanity_step", 10), 1, 50);
+            if (slotData.Contains("version"))
+            {
+                int bits = GetInt("options", OptionLevelComplete);
+                EnableLevelComplete = (bits & OptionLevelComplete) != 0;
+                EnableGrainAll = (bits & OptionGrainAll) != 0;
+                EnableFlikAll = (bits & OptionFlikAll) != 0;
+                EnableFlikIndividual = (bits & OptionFlikIndividual) != 0;
+
+                EnableGrainsanity = (bits & OptionGrainsanity) != 0;
+                int step = GetInt("grainsanity_step", 0);
+                GrainsanityStep = step > 0 ? Math.Clamp(step, 1, 50) : 10;
+
+                EnableEnemy25 = (bits & OptionEnemy25) != 0;
+                EnableEnemy50 = (bits & OptionEnemy50) != 0;
+                EnableEnemy75 = (bits & OptionEnemy75) != 0;
+                EnableEnemy100 = (bits & OptionEnemy100) != 0;
+
+                var levels = GetJson<int[]>("levels") ?? Array.Empty<int>();
+                var grain = GetJson<int[][]>("grain") ?? Array.Empty<int[]>();
+                var enemies = GetJson<int[][]>("enemies") ?? Array.Empty<int[]>();
+                for (int i = 0; i < levels.Length; i++)
+                {
+                    if (i < grain.Length) _grainThresholds[levels[i]] = grain[i];
+                    if (i < enemies.Length) _enemyKills[levels[i]] = enemies[i];
+                }
+            }
+            else
+            {
+                // Older apworlds send one key per option and no enemy kill
+                // counts, so enemysanity checks cannot fire for them.
+                EnableLevelComplete = GetInt("enable_level_complete", 1) != 0;
+                EnableGrainAll = GetInt("enable_grain_all", 0) != 0;
+                EnableFlikAll = GetInt("enable_flik_all", 0) != 0;
+                EnableFlikIndividual = GetInt("enable_flik_individual", 0) != 0;
+
+                EnableGrainsanity = GetInt("enable_grainsanity", 0) != 0;
+                GrainsanityStep = Math.Clamp(GetInt("grainsanity_step", 10), 1, 50);
+
+                EnableEnemy25 = GetInt("enable_enemy_25", 0) != 0;
+                EnableEnemy50 = GetInt("enable_enemy_50", 0) != 0;
+                EnableEnemy75 = GetInt("enable_enemy_75", 0) != 0;
+                EnableEnemy100 = GetInt("enable_enemy_100", 0) != 0;
+
+                if (EnableGrainsanity)
+                {
+                    var amounts = new List<int>();
+                    for (int amount = GrainsanityStep; amount <= 50; amount += GrainsanityStep)
+                        amounts.Add(amount);
+                    foreach (var level in SeedUpgradeCaps.Keys)
+                        _grainThresholds[level] = amounts.ToArray();
+                }
+            }
 
-            EnableEnemy25 = GetInt("enable_enemy_25", 0) != 0;
-            EnableEnemy50 = GetInt("enable_enemy_50", 0) != 0;
-            EnableEnemy75 = GetInt("enable_enemy_75", 0) != 0;
-            EnableEnemy100 = GetInt("enable_enemy_100", 0) != 0;
+            _checkIds = GetJson<Dictionary<string, long>>("check_ids");
 
             WriteLuaConfigFile();
         }
@@ -396,23 +555,39 @@ class Program
         {
             Directory.CreateDirectory(DataDir);
 
+            int bits = 0;
+            if (EnableLevelComplete) bits |= OptionLevelComplete;
+            if (EnableFlikIndividual) bits |= OptionFlikIndividual;
+            if (EnableFlikAll) bits |= OptionFlikAll;
+            if (EnableGrainAll) bits |= OptionGrainAll;
+            if (EnableGrainsanity) bits |= OptionGrainsanity;
+            if (EnableEnemy25) bits |= OptionEnemy25;
+            if (EnableEnemy50) bits |= OptionEnemy50;
+            if (EnableEnemy75) bits |= OptionEnemy75;
+            if (EnableEnemy100) bits |= OptionEnemy100;
+
             var lines = new List<string>
             {
-                $"enable_level_complete={(EnableLevelComplete ? 1 : 0)}",
-
-                $"enable_flik_individual={(EnableFlikIndividual ? 1 : 0)}",
-                $"enable_flik_all={(EnableFlikAll ? 1 : 0)}",
-
-                $"enable_grain_all={(EnableGrainAll ? 1 : 0)}",
-                $"enable_grainsanity={(EnableGrainsanity ? 1 : 0)}",
-                $"grainsanity_step={Math.Clamp(GrainsanityStep, 1, 50)}",
-
-                $"enable_enemy_25={(EnableEnemy25 ? 1 : 0)}",
-                $"enable_enemy_50={(EnableEnemy50 ? 1 : 0)}",
-                $"enable_enemy_75={(EnableEnemy75 ? 1 : 0)}",
-                $"enable_enemy_100={(EnableEnemy100 ? 1 : 0)}",
+                $"version={SlotDataVersion}",
+                $"options={bits}",
             };
-            File.WriteAllLines(ConfigPath, lines);
+            if (EnableGrainsanity)
+            {
+                foreach (var (level, amounts) in _grainThresholds)
+                    if (amounts.Length > 0)
+                        lines.Add($"grain_{level}={string.Join(",", amounts)}");
+            }
+            foreach (var (level, kills) in _enemyKills)
+            {
+                if (Array.Exists(kills, k => k > 0))
+                    lines.Add($"enemies_{level}={string.Join(",", kills)}");
+            }
+
+            // Lua rereads the config while playing; never let it see half a file.
+            var tmp = ConfigPath + ".tmp";
+            File.WriteAllLines(tmp, lines);
+            File.Move(tmp, ConfigPath, overwrite: true);
+            Tiers.BumpConfig();
         }
         catch (Exception ex)
         {
@@ -420,108 +595,88 @@ class Program
         }
     }
 
-    static void LoadBerryState()
+    static TierStore Tiers
     {
-        Array.Clear(_berryTiers, 0, _berryTiers.Length);
-
-        if (!File.Exists(BerryStatePath))
-            return;
-
-        try
+        get
         {
-            foreach (var line in File.ReadAllLines(BerryStatePath))
+            if (_tierStore == null)
             {
-                var parts = line.Trim().Split(' ');
-                if (parts.Length == 3 && parts[0] == "LEVEL" &&
-                    int.TryParse(parts[1], out var idx) &&
-                    int.TryParse(parts[2], out var tier))
-                {
-                    if (idx >= 0 && idx < _berryTiers.Length)
-                        _berryTiers[idx] = Math.Clamp(tier, 0, 4);
-                }
+                Directory.CreateDirectory(DataDir);
+                _tierStore = new TierStore(TierStorePath);
+                if (_tierStore.Created)
+                    ImportLegacyTierFiles(_tierStore);
             }
-        }
-        catch (IOException ex)
-        {
-            Console.WriteLine("[AP] Failed to load berry state: " + ex.Message);
+            return _tierStore;
         }
     }
 
-    static void SaveBerryState()
+    static void LoadTierState()
     {
         try
         {
-            var lines = new List<string>();
-            for (int i = 0; i < _berryTiers.Length; i++)
-            {
-                if (_berryTiers[i] > 0)
-                    lines.Add($"LEVEL {i} {_berryTiers[i]}");
-            }
-            File.WriteAllLines(BerryStatePath, lines);
+            var store = Tiers;
+            lock (_berryLock)
+                for (int i = 0; i < _berryTiers.Length; i++)
+                    _berryTiers[i] = Math.Clamp(store.Get(i, TierStore.BerryField), 0, 4);
+            lock (_seedLock)
+                for (int i = 0; i < SeedTiers.GetLength(0); i++)
+                    for (int c = 0; c < SeedTiers.GetLength(1); c++)
+                        SeedTiers[i, c] = store.Get(i, c);
         }
         catch (IOException ex)
         {
-            Console.WriteLine("[AP] Failed to save berry state: " + ex.Message);
+            Console.WriteLine("[AP] Failed to load tier store: " + ex.Message);
         }
     }
 
-    static void LoadSeedState()
+    // Carries over the tiers of a session started before the store existed.
+    static void ImportLegacyTierFiles(TierStore store)
     {
-        for (int i = 0; i < SeedTiers.GetLength(0); i++)
-            for (int j = 0; j < SeedTiers.GetLength(1); j++)
-                SeedTiers[i, j] = 0;
-
-        if (!File.Exists(SeedStatePath))
-            return;
-
         try
         {
-            foreach (var line in File.ReadAllLines(SeedStatePath))
+            using (store.Update())
             {
-                var parts = line.Trim().Split(' ');
-                if (parts.Length == 7 && parts[0] == "LEVEL" &&
-                    int.TryParse(parts[1], out var idx))
+                if (File.Exists(LegacyBerryStatePath))
                 {
-                    if (idx < 0 || idx >= 256) continue;
+                    foreach (var line in File.ReadAllLines(LegacyBerryStatePath))
+                    {
+                        var parts = line.Trim().Split(' ');
+                        if (parts.Length == 3 && parts[0] == "LEVEL" &&
+                            int.TryParse(parts[1], out var idx) &&
+                            int.TryParse(parts[2], out var tier))
+                        {
+                            if (idx >= 0 && idx < TierStore.Levels)
+                                store.Set(idx, TierStore.BerryField, Math.Clamp(tier, 0, 4));
+                        }
+                    }
+                }
 
-                    for (int c = 0; c < 5; c++)
+                if (File.Exists(LegacySeedStatePath))
+                {
+                    foreach (var line in File.ReadAllLines(LegacySeedStatePath))
                     {
-                        if (int.TryParse(parts[2 + c], out var tier))
-                            SeedTiers[idx, c] = Math.Max(0, tier);
+                        var parts = line.Trim().Split(' ');
+                        if (parts.Length == 7 && parts[0] == "LEVEL" &&
+                            int.TryParse(parts[1], out var idx))
+                        {
+                            if (idx < 0 || idx >= TierStore.Levels) continue;
+
+                            for (int c = 0; c < TierStore.SeedColours; c++)
+                            {
+                                if (int.TryParse(parts[2 + c], out var tier))
+                                    store.Set(idx, c, Math.Max(0, tier));
+                            }
+                        }
                     }
                 }
             }
         }
         catch (IOException ex)
         {
-            Console.WriteLine("[AP] Failed to load seed state: " + ex.Message);
+            Console.WriteLine("[AP] Failed to import old tier files: " + ex.Message);
         }
     }
 
-    static void SaveSeedState()
-    {
-        try
-        {
-            var lines = new List<string>();
-
-            for (int i = 0; i < 256; i++)
-            {
-                bool any = false;
-                for (int c = 0; c < 5; c++)
-                    if (SeedTiers[i, c] > 0) any = true;
-
-                if (!any) continue;
-
-                lines.Add($"LEVEL {i} {SeedTiers[i, 0]} {SeedTiers[i, 1]} {SeedTiers[i, 2]} {SeedTiers[i, 3]} {SeedTiers[i, 4]}");
-            }
-
-            File.WriteAllLines(SeedStatePath, lines);
-        }
-        catch (IOException ex)
-        {
-            Console.WriteLine("[AP] Failed to save seed state: " + ex.Message);
-        }
-    }
     static void OnItemReceived(ReceivedItemsHelper helper)
     {
         var info = helper.PeekItem();
@@ -553,14 +708,44 @@ class Program
 
         Console.WriteLine($"[AP] Processing received-item backlog: {processed} -> {count}");
 
+        // Fold the backlog instead of replaying it item by item: count each
+        // tier item once and apply its copies in one step (reduce_items in the
+        // apworld's Tiers.py), queue lives and health in one journal append,
+        // and publish every tier change to Lua as one store update.
+        var copies = new Dictionary<long, int>();
+        var commands = new List<string>();
         for (int i = processed; i < count; i++)
         {
             var itemObj = list[i];
             if (itemObj == null) continue;
 
             long id = TryGetLongProperty(itemObj, "ItemId");
-            string name = TryGetStringProperty(itemObj, "ItemName") ?? $"Item #{id}";
-            HandleItem(id, name);
+            if (id == 210) commands.Add("LIFE +1");
+            else if (id == 211) commands.Add("HEALTH +1");
+            else if (id >= 300 && id < 900) copies[id] = copies.GetValueOrDefault(id) + 1;
+        }
+
+        using (Tiers.Update())
+        {
+            foreach (var (id, n) in copies)
+            {
+                if (id < 400) HandleBerryUpgrade(id, n);
+                else HandleSeedUpgrade(id, n);
+            }
+        }
+
+        if (commands.Count > 0)
+        {
+            try
+            {
+                lock (_commandLock)
+                    _commandJournal?.Append(commands.ToArray());
+                Console.WriteLine($"[AP] Queued {commands.Count} extra life / health commands");
+            }
+            catch (IOException ex)
+            {
+                Console.WriteLine("[AP] Failed to queue backlog commands: " + ex.Message);
+            }
         }
 
         try { File.WriteAllText(ItemsProcessedPath, count.ToString()); } catch { }
@@ -630,10 +815,11 @@ class Program
             var fileName = Path.GetFileName(StatePath);
             _stateWatcher = new FileSystemWatcher(DataDir, fileName)
             {
-                NotifyFilter = NotifyFilters.LastWrite,
+                // Compaction replaces the journal, which shows up as a rename/create.
+                NotifyFilter = NotifyFilters.LastWrite | NotifyFilters.FileName,
                 EnableRaisingEvents = true
             };
-            _stateWatcher.Changed += (s, e) =>
+            FileSystemEventHandler onChange = (s, e) =>
             {
                 try
                 {
@@ -644,6 +830,12 @@ class Program
                     Console.WriteLine("[AP] State watcher error: " + ex.Message);
                 }
             };
+            _stateWatcher.Changed += onChange;
+            _stateWatcher.Created += onChange;
+            _stateWatcher.Renamed += (s, e) => onChange(s, e);
+
+            // Pick up anything journaled while the client was not running.
+            ProcessStateFile();
         }
         catch (Exception ex)
         {
@@ -698,8 +890,7 @@ class Program
         {
             try
             {
-                using var writer = new StreamWriter(CommandPath, append: true);
-                writer.WriteLine("LIFE +1");
+                QueueCommand("LIFE +1");
             }
             catch (IOException ex)
             {
@@ -713,8 +904,7 @@ class Program
         {
             try
             {
-                using var writer = new StreamWriter(CommandPath, append: true);
-                writer.WriteLine("HEALTH +1");
+                QueueCommand("HEALTH +1");
             }
             catch (IOException ex)
             {
@@ -726,31 +916,7 @@ class Program
 
         if (id >= 300 && id < 400)
         {
-            int levelIndex = (int)(id - 300);
-            if (levelIndex < 0 || levelIndex >= _berryTiers.Length) return;
-
-            if (BerryProgressionDisabledLevels.Contains(levelIndex))
-            {
-                Console.WriteLine($"[AP] Ignoring berry upgrade for level {levelIndex} (disabled: purple seeds grant berries / no gold berry)");
-                return;
-            }
-
-            lock (_berryLock)
-            {
-                int current = _berryTiers[levelIndex];
-                if (current < 4)
-                {
-                    int newTier = current + 1;
-                    _berryTiers[levelIndex] = newTier;
-                    SaveBerryState();
-                    Console.WriteLine($"[AP] Upgraded berry for level {levelIndex} to tier {newTier}");
-                }
-                else
-                {
-                    Console.WriteLine($"[AP] Berry tier already max for level {levelIndex}");
-                }
-            }
-
+            HandleBerryUpgrade(id);
             return;
         }
 
@@ -761,7 +927,38 @@ class Program
         }
     }
 
-    static void HandleSeedUpgrade(long itemId)
+    // Berry and seed tiers are saturating counters, so `copies` of one item
+    // raise a tier straight to min(current + copies, cap), exactly where
+    // applying them one at a time would leave it.
+    static void HandleBerryUpgrade(long itemId, int copies = 1)
+    {
+        int levelIndex = (int)(itemId - 300);
+        if (levelIndex < 0 || levelIndex >= _berryTiers.Length) return;
+
+        if (BerryProgressionDisabledLevels.Contains(levelIndex))
+        {
+            Console.WriteLine($"[AP] Ignoring berry upgrade for level {levelIndex} (disabled: purple seeds grant berries / no gold berry)");
+            return;
+        }
+
+        lock (_berryLock)
+        {
+            int current = _berryTiers[levelIndex];
+            if (current < 4)
+            {
+                int newTier = Math.Min(current + copies, 4);
+                _berryTiers[levelIndex] = newTier;
+                Tiers.Set(levelIndex, TierStore.BerryField, newTier);
+                Console.WriteLine($"[AP] Upgraded berry for level {levelIndex} to tier {newTier}");
+            }
+            else
+            {
+                Console.WriteLine($"[AP] Berry tier already max for level {levelIndex}");
+            }
+        }
+    }
+
+    static void HandleSeedUpgrade(long itemId, int copies = 1)
     {
         int colourIndex;
         int levelIndex;
@@ -785,9 +982,9 @@ class Program
             int current = SeedTiers[levelIndex, colourIndex];
             if (current < cap)
             {
-                int next = current + 1;
+                int next = Math.Min(current + copies, cap);
                 SeedTiers[levelIndex, colourIndex] = next;
-                SaveSeedState();
+                Tiers.Set(levelIndex, colourIndex, next);
                 Console.WriteLine($"[AP] Seed upgrade: level {levelIndex}, colour {colourIndex}, now {next}");
             }
             else
@@ -799,124 +996,225 @@ class Program
 
     static void ProcessStateFile()
     {
-        if (_session == null)
-            return;
+        lock (_stateLock)
+        {
+            if (_session == null || _stateJournal == null)
+                return;
 
-        if (!File.Exists(StatePath))
-            return;
+            List<JournalEntry> entries;
+            try
+            {
+                entries = _stateJournal.Read();
+            }
+            catch (IOException)
+            {
+                return;
+            }
 
-        string[] lines;
-        try
-        {
-            lines = File.ReadAllLines(StatePath);
+            if (entries.Count == 0)
+                return;
+
+            // Everything new from one read goes out in a single LocationChecks packet.
+            var batch = new List<long>();
+            lock (_checkedLocations)
+            {
+                foreach (var entry in entries)
+                {
+                    long locationId = LocationIdForLine(entry.Payload);
+                    if (locationId < 0 || _checkedLocations.Contains(locationId) || batch.Contains(locationId))
+                        continue;
+                    Console.WriteLine($"[AP] Completing location {locationId} from {entry.Payload.Trim()}");
+                    batch.Add(locationId);
+                }
+            }
+
+            if (batch.Count > 0 && !CompleteLocations(batch.ToArray()))
+                return; // leave the journal unacked so the next start reads the checks again
+
+            try { _stateJournal.Ack(); }
+            catch (IOException ex)
+            {
+                Console.WriteLine("[AP] Failed to save state journal position: " + ex.Message);
+            }
         }
-        catch (IOException)
+    }
+
+    // Location id of one CHECK line, or -1 if it is not a check of this slot.
+    static long LocationIdForLine(string raw)
+    {
+        var line = raw.Trim();
+        if (string.IsNullOrEmpty(line)) return -1;
+
+        if (_checkIds != null)
         {
-            return;
+            if (line.StartsWith("CHECK ", StringComparison.Ordinal) &&
+                _checkIds.TryGetValue(line.Substring(6), out var id))
+                return id;
+            return -1;
         }
 
-        if (lines.Length == 0)
-            return;
+        // Slot data from an apworld without check_ids: derive the id.
+        var parts = line.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+        if (parts.Length < 3 || parts[0] != "CHECK") return -1;
 
-        try { File.WriteAllText(StatePath, string.Empty); } catch { }
+        if (!int.TryParse(parts[^1], out var levelIndex)) return -1;
 
-        foreach (var raw in lines)
-        {
-            var line = raw.Trim();
-            if (string.IsNullOrEmpty(line)) continue;
+        int locationId = -1;
 
-            var parts = line.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length < 3 || parts[0] != "CHECK") continue;
+        string checkToken = parts[1];
 
-            if (!int.TryParse(parts[^1], out var levelIndex)) continue;
+        if (checkToken.Equals("LEVEL_COMPLETE", StringComparison.OrdinalIgnoreCase) && !EnableLevelComplete) return -1;
 
-            int locationId = -1;
+        if (checkToken.Equals("GRAIN", StringComparison.OrdinalIgnoreCase) && !EnableGrainAll) return -1;
+        if (checkToken.StartsWith("GRAIN", StringComparison.OrdinalIgnoreCase) && checkToken.Length > 5 && !EnableGrainsanity) return -1;
 
-            string checkToken = parts[1];
+        if (checkToken.StartsWith("ENEMIES", StringComparison.OrdinalIgnoreCase) && checkToken.Length > 7)
+        {
+            if (checkToken.EndsWith("25", StringComparison.OrdinalIgnoreCase) && !EnableEnemy25) return -1;
+            if (checkToken.EndsWith("50", StringComparison.OrdinalIgnoreCase) && !EnableEnemy50) return -1;
+            if (checkToken.EndsWith("75", StringComparison.OrdinalIgnoreCase) && !EnableEnemy75) return -1;
+            if (checkToken.EndsWith("100", StringComparison.OrdinalIgnoreCase) && !EnableEnemy100) return -1;
+        }
 
-            if (checkToken.Equals("LEVEL_COMPLETE", StringComparison.OrdinalIgnoreCase) && !EnableLevelComplete) continue;
+        if (checkToken.Equals("FLIK_ALL", StringComparison.OrdinalIgnoreCase) && !EnableFlikAll) return -1;
+        if (checkToken.StartsWith("FLIK_", StringComparison.OrdinalIgnoreCase) && checkToken.Length == 6 && !EnableFlikIndividual) return -1;
 
-            if (checkToken.Equals("GRAIN", StringComparison.OrdinalIgnoreCase) && !EnableGrainAll) continue;
-            if (checkToken.StartsWith("GRAIN", StringComparison.OrdinalIgnoreCase) && checkToken.Length > 5 && !EnableGrainsanity) continue;
+        if (checkToken.StartsWith("GRAIN", StringComparison.OrdinalIgnoreCase))
+        {
+            int grainAmount = 0;
+            int parsedLevelIndex = levelIndex;
 
-            if (checkToken.StartsWith("ENEMIES", StringComparison.OrdinalIgnoreCase) && checkToken.Length > 7)
+            if (checkToken.Length > 5 && int.TryParse(checkToken.Substring(5), out grainAmount))
             {
-                if (checkToken.EndsWith("25", StringComparison.OrdinalIgnoreCase) && !EnableEnemy25) continue;
-                if (checkToken.EndsWith("50", StringComparison.OrdinalIgnoreCase) && !EnableEnemy50) continue;
-                if (checkToken.EndsWith("75", StringComparison.OrdinalIgnoreCase) && !EnableEnemy75) continue;
-                if (checkToken.EndsWith("100", StringComparison.OrdinalIgnoreCase) && !EnableEnemy100) continue;
             }
-
-            if (checkToken.Equals("FLIK_ALL", StringComparison.OrdinalIgnoreCase) && !EnableFlikAll) continue;
-            if (checkToken.StartsWith("FLIK_", StringComparison.OrdinalIgnoreCase) && checkToken.Length == 6 && !EnableFlikIndividual) continue;
-
-            if (checkToken.StartsWith("GRAIN", StringComparison.OrdinalIgnoreCase))
+            else if (parts.Length >= 4 && int.TryParse(parts[2], out grainAmount) && int.TryParse(parts[3], out parsedLevelIndex))
             {
-                int grainAmount = 0;
-                int parsedLevelIndex = levelIndex;
-
-                if (checkToken.Length > 5 && int.TryParse(checkToken.Substring(5), out grainAmount))
-                {
-                }
-                else if (parts.Length >= 4 && int.TryParse(parts[2], out grainAmount) && int.TryParse(parts[3], out parsedLevelIndex))
-                {
-                    levelIndex = parsedLevelIndex;
-                }
-
-                if (grainAmount > 0)
-                {
-                    locationId = 2000 + (levelIndex * 100) + grainAmount;
-                }
-                else
-                {
-                    locationId = (1000 + levelIndex * 10) + 5;
-                }
+                levelIndex = parsedLevelIndex;
             }
-            else if (checkToken.StartsWith("ENEMIES", StringComparison.OrdinalIgnoreCase))
-            {
-                int pct = 0;
-                int parsedLevelIndex = levelIndex;
 
-                if (checkToken.Length > 7 && int.TryParse(checkToken.Substring(7), out pct))
-                {
-                }
-                else if (parts.Length >= 4 && int.TryParse(parts[2], out pct) && int.TryParse(parts[3], out parsedLevelIndex))
-                {
-                    levelIndex = parsedLevelIndex;
-                }
-
-                int tier = pct / 25;
-                locationId = 3000 + (levelIndex * 10) + tier;
+            if (grainAmount > 0)
+            {
+                locationId = 2000 + (levelIndex * 100) + grainAmount;
             }
             else
             {
-                int baseId = 1000 + levelIndex * 10;
-                int offset = checkToken switch
-                {
-                    "FLIK_F" => 0,
-                    "FLIK_L" => 1,
-                    "FLIK_I" => 2,
-                    "FLIK_K" => 3,
-                    "FLIK_ALL" => 4,
-                    "LEVEL_COMPLETE" => 7,
-                    _ => -1
-                };
+                locationId = (1000 + levelIndex * 10) + 5;
+            }
+        }
+        else if (checkToken.StartsWith("ENEMIES", StringComparison.OrdinalIgnoreCase))
+        {
+            int pct = 0;
+            int parsedLevelIndex = levelIndex;
 
-                if (offset >= 0)
-                    locationId = baseId + offset;
+            if (checkToken.Length > 7 && int.TryParse(checkToken.Substring(7), out pct))
+            {
+            }
+            else if (parts.Length >= 4 && int.TryParse(parts[2], out pct) && int.TryParse(parts[3], out parsedLevelIndex))
+            {
+                levelIndex = parsedLevelIndex;
             }
 
-            if (locationId < 0) continue;
-            Console.WriteLine($"[AP] Completing location {locationId} from {line}");
+            int tier = pct / 25;
+            locationId = 3000 + (levelIndex * 10) + tier;
+        }
+        else
+        {
+            int baseId = 1000 + levelIndex * 10;
+            int offset = checkToken switch
+            {
+                "FLIK_F" => 0,
+                "FLIK_L" => 1,
+                "FLIK_I" => 2,
+                "FLIK_K" => 3,
+                "FLIK_ALL" => 4,
+                "LEVEL_COMPLETE" => 7,
+                _ => -1
+            };
+
+            if (offset >= 0)
+                locationId = baseId + offset;
+        }
 
+        return locationId;
+    }
+
+    static bool CompleteLocations(long[] locationIds)
+    {
+        if (_session == null)
+            return false;
+
+        try
+        {
+            _session.Locations.CompleteLocationChecks(locationIds);
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine("[AP] Failed to complete locations: " + ex.Message);
+            return false;
+        }
+
+        RecordCheckedLocations(locationIds);
+        return true;
+    }
+
+    static void OnCheckedLocationsUpdated(ReadOnlyCollection<long> newCheckedLocations)
+    {
+        RecordCheckedLocations(newCheckedLocations);
+    }
+
+    // Adds ids to the checked set, appending the new ones to checked_locations.txt.
+    static void RecordCheckedLocations(IEnumerable<long> locationIds)
+    {
+        lock (_checkedLocations)
+        {
+            var added = locationIds.Where(_checkedLocations.Add).ToList();
+            if (added.Count == 0)
+                return;
+            try { File.AppendAllLines(CheckedLocationsPath, added.Select(id => id.ToString())); }
+            catch (IOException ex) { Console.WriteLine("[AP] Failed to save checked locations: " + ex.Message); }
+        }
+    }
+
+    // Replaces the checked set with the server's checked locations and resends
+    // cached ones the server is missing (sent just before a disconnect).
+    static void SyncCheckedLocations()
+    {
+        if (_session == null)
+            return;
+
+        var cached = new HashSet<long>();
+        try
+        {
+            if (File.Exists(CheckedLocationsPath))
+                foreach (var line in File.ReadLines(CheckedLocationsPath))
+                    if (long.TryParse(line.Trim(), out var id))
+                        cached.Add(id);
+        }
+        catch (IOException) { }
+
+        var server = new HashSet<long>(_session.Locations.AllLocationsChecked);
+        var missing = cached.Where(id => !server.Contains(id)).OrderBy(id => id).ToArray();
+
+        lock (_checkedLocations)
+        {
+            _checkedLocations.Clear();
+            _checkedLocations.UnionWith(server);
+            _checkedLocations.UnionWith(missing);
             try
             {
-                _session.Locations.CompleteLocationChecks(locationId);
-            }
-            catch (Exception ex)
-            {
-                Console.WriteLine("[AP] Failed to complete location: " + ex.Message);
+                Directory.CreateDirectory(DataDir);
+                var tmp = CheckedLocationsPath + ".tmp";
+                File.WriteAllLines(tmp, _checkedLocations.OrderBy(id => id).Select(id => id.ToString()));
+                File.Move(tmp, CheckedLocationsPath, overwrite: true);
             }
+            catch (IOException ex) { Console.WriteLine("[AP] Failed to save checked locations: " + ex.Message); }
+        }
+
+        if (missing.Length > 0)
+        {
+            Console.WriteLine($"[AP] Resending {missing.Length} checked locations the server is missing.");
+            try { _session.Locations.CompleteLocationChecks(missing); }
+            catch (Exception ex) { Console.WriteLine("[AP] Failed to complete locations: " + ex.Message); }
         }
     }
 }
\ No newline at end of file
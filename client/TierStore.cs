@@ -0,0 +1,134 @@
+﻿using System;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Threading;
+
+// Per-level seed and berry tiers shared with ABL.lua. The format is documented
+// with the reference implementation in ablbridge/store.py:
+//
+//   "ABLS" u16 version, u16 levels, u32 generation, u32 config generation
+//   256 x [brown, green, blue, purple, yellow, berry]
+//
+// The client is the only writer and changes single bytes in place. The
+// generation is odd while an update is in progress, so Lua can tell a torn
+// read from a finished one and only rereads the records when it moved.
+
+sealed class TierStore : IDisposable
+{
+    public const int Levels = 256;
+    public const int SeedColours = 5;
+    public const int RecordSize = SeedColours + 1;
+    public const int BerryField = SeedColours;
+
+    const int Version = 1;
+    const int GenerationOffset = 8;
+    const int ConfigGenerationOffset = 12;
+    const int HeaderSize = 16;
+    const int Size = HeaderSize + Levels * RecordSize;
+    static readonly byte[] Magic = { (byte)'A', (byte)'B', (byte)'L', (byte)'S' };
+
+    readonly object _lock = new();
+    readonly MemoryMappedFile _file;
+    readonly MemoryMappedViewAccessor _view;
+    int _depth;
+
+    public string Path { get; }
+
+    // True when the file was new (or not a tier store) and was laid out empty.
+    public bool Created { get; }
+
+    public TierStore(string path)
+    {
+        Path = path;
+
+        var stream = new FileStream(path, FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.ReadWrite | FileShare.Delete);
+        if (stream.Length != Size)
+        {
+            stream.SetLength(0);
+            stream.SetLength(Size);
+            Created = true;
+        }
+        _file = MemoryMappedFile.CreateFromFile(stream, null, Size, MemoryMappedFileAccess.ReadWrite, HandleInheritability.None, leaveOpen: false);
+        _view = _file.CreateViewAccessor(0, Size);
+
+        var magic = new byte[Magic.Length];
+        _view.ReadArray(0, magic, 0, magic.Length);
+        if (Created || !magic.AsSpan().SequenceEqual(Magic) || _view.ReadUInt16(4) != Version || _view.ReadUInt16(6) != Levels)
+        {
+            _view.WriteArray(0, new byte[Size], 0, Size);
+            _view.WriteArray(0, Magic, 0, Magic.Length);
+            _view.Write(4, (ushort)Version);
+            _view.Write(6, (ushort)Levels);
+            Created = true;
+        }
+        else if ((Generation & 1) != 0)
+        {
+            // The last writer died mid-update; every field is a single byte,
+            // so the records are usable as they are.
+            _view.Write(GenerationOffset, Generation + 1);
+        }
+    }
+
+    public uint Generation => _view.ReadUInt32(GenerationOffset);
+
+    // Groups writes so Lua sees all of them or none; nests.
+    public IDisposable Update()
+    {
+        Monitor.Enter(_lock);
+        if (_depth++ == 0)
+            _view.Write(GenerationOffset, Generation + 1);
+        return new UpdateScope(this);
+    }
+
+    void EndUpdate()
+    {
+        if (--_depth == 0)
+            _view.Write(GenerationOffset, Generation + 1);
+        Monitor.Exit(_lock);
+    }
+
+    sealed class UpdateScope : IDisposable
+    {
+        TierStore? _store;
+        public UpdateScope(TierStore store) => _store = store;
+        public void Dispose()
+        {
+            _store?.EndUpdate();
+            _store = null;
+        }
+    }
+
+    static long Offset(int level, int field)
+    {
+        if (level < 0 || level >= Levels || field < 0 || field >= RecordSize)
+            throw new ArgumentOutOfRangeException(nameof(level), $"no tier field {field} for level {level}");
+        return HeaderSize + level * RecordSize + field;
+    }
+
+    public int Get(int level, int field) => _view.ReadByte(Offset(level, field));
+
+    public void Set(int level, int field, int value)
+    {
+        using (Update())
+            _view.Write(Offset(level, field), (byte)Math.Clamp(value, 0, 255));
+    }
+
+    public void Clear()
+    {
+        using (Update())
+            _view.WriteArray(HeaderSize, new byte[Size - HeaderSize], 0, Size - HeaderSize);
+    }
+
+    public void BumpConfig()
+    {
+        lock (_lock)
+            _view.Write(ConfigGenerationOffset, _view.ReadUInt32(ConfigGenerationOffset) + 1);
+    }
+
+    public void Dispose()
+    {
+        _view.Flush();
+        _view.Dispose();
+        _file.Dispose();
+    }
+}
@@ -22,18 +22,46 @@ local function script_dir()
     return (src:gsub("\\", "/"):match("^(.*)/") or ".")
 end
 
-local localAppData = os.getenv("LOCALAPPDATA") or os.getenv("USERPROFILE")
-if not localAppData then
-  print("ABL Lua ERROR: LOCALAPPDATA not available")
-  return
+-- Resolved as ablbridge's default_data_dir() does: $ABL_DATA_DIR, else
+-- A_Bugs_Life_Archipelago in %LOCALAPPDATA% or the XDG data home, with this
+-- platform's path separator.
+local SEP = package.config:sub(1, 1)
+
+local function env_dir(name)
+    local dir = os.getenv(name)
+    if dir and dir ~= "" then return dir end
 end
 
-local dataDir = (os.getenv("LOCALAPPDATA") or "") .. "\\A_Bugs_Life_Archipelago\\"
+local function data_home()
+    local home = env_dir("LOCALAPPDATA") or env_dir("XDG_DATA_HOME")
+    if home then return home end
+    home = env_dir("HOME") or env_dir("USERPROFILE")
+    if home then return home .. SEP .. ".local" .. SEP .. "share" end
+end
+
+local dataDir = env_dir("ABL_DATA_DIR")
+if dataDir then
+    dataDir = dataDir:gsub("[/\\]+$", "") .. SEP
+else
+    local dataHome = data_home()
+    if not dataHome then
+      print("ABL Lua ERROR: none of ABL_DATA_DIR, LOCALAPPDATA, XDG_DATA_HOME or HOME is set")
+      return
+    end
+    dataDir = dataHome .. SEP .. "A_Bugs_Life_Archipelago" .. SEP
+end
+
+-- ABL_INSTANCE gives one emulator/client pair its own directory, so several
+-- can share a machine; the client must be given the same name. Bytes
+-- outside [A-Za-z0-9_-] become "_", as in client/Program.cs and ablbridge.
+local instance = os.getenv("ABL_INSTANCE")
+if instance and instance ~= "" then
+    dataDir = dataDir .. "instances" .. SEP .. instance:gsub("[^%w_%-]", "_") .. SEP
+end
 
 local statePath      = dataDir .. "abl_state.txt"
 local commandPath    = dataDir .. "abl_command.txt"
-local berryStatePath = dataDir .. "abl_berries.txt"
-local seedStatePath  = dataDir .. "abl_seeds.txt"
+local tierStorePath  = dataDir .. "abl_tiers.bin"
 
 local read_u8  = memory.read_u8
 local read_u16 = memory.read_u16_le
@@ -113,42 +141,22 @@ local function berry_label(tier)
   return BERRY_TIER_NAME[tier] or ("Tier " .. tostring(tier))
 end
 
-local enemy_thresholds = {
-  [17] = { [25] = -1, [50] =  2, [75] = -1, [100] =  4 }, -- Training
-  [1]  = { [25] =  5, [50] = 10, [75] = 15, [100] = 21 }, -- Ant Hill
-  [3]  = { [25] = 12, [50] = 25, [75] = 37, [100] = 50 }, -- Tunnels
-  [2]  = { [25] = -1, [50] =  2, [75] = -1, [100] =  3 }, -- Council Chamber
-  [6]  = { [25] =  3, [50] =  6, [75] =  9, [100] = 12 }, -- Cliffside
-  [10] = { [25] = 13, [50] = 25, [75] = 38, [100] = 51 }, -- Riverbed Canyon
-  [11] = { [25] =  2, [50] =  5, [75] =  7, [100] =  9 }, -- Bird Nest
-  [4]  = { [25] =  6, [50] = 13, [75] = 20, [100] = 26 }, -- City Entrance
-  [5]  = { [25] =  6, [50] = 12, [75] = 18, [100] = 23 }, -- City Square
-  [14] = { [25] = -1, [50] = -1, [75] = -1, [100] =  1 }, -- Bug Bar
-  [7]  = { [25] =  6, [50] = 12, [75] = 18, [100] = 24 }, -- Clover Forest
-  [12] = { [25] =  8, [50] = 16, [75] = 24, [100] = 32 }, -- The Tree
-  [13] = { [25] = -1, [50] =  2, [75] = -1, [100] =  4 }, -- Battle Arena
-  [9]  = { [25] =  4, [50] =  8, [75] = 12, [100] = 15 }, -- Ant Hill, Part 2
-  [8]  = { [25] = 14, [50] = 28, [75] = 42, [100] = 56 }, -- Riverbed Flight
-  [15] = { [25] =  4, [50] =  8, [75] = 12, [100] = 16 }, -- Canyon Showdown
-}
+local ENEMY_PCTS = { 25, 50, 75, 100 }
 
-local function enemy_need(level_index, pct)
-  local t = enemy_thresholds[level_index]
-  if not t then return nil end
-  local v = t[pct]
-  if not v or v < 1 then return nil end
-  return v
-end
+-- Bits of "options" in abl_config.txt, as the client copies them from slot data.
+local OPTION_FLIK_INDIVIDUAL = 1 << 1
+local OPTION_FLIK_ALL        = 1 << 2
+local OPTION_GRAIN_ALL       = 1 << 3
+local OPTION_GRAINSANITY     = 1 << 4
 
 local level_init_done = false
 local grainsanity_enabled = false
-local grainsanity_step = 10
 local grain_all = false
 
-local enemysanity_25 = false
-local enemysanity_50 = false
-local enemysanity_75 = false
-local enemysanity_100 = false
+-- Per level, from abl_config.txt: enabled grainsanity amounts in ascending
+-- order, and the enemy counter value for each ENEMY_PCTS tier (0: no check).
+local grain_thresholds = {}
+local enemy_kills = {}
 local enemy_observed_max = {}
 
 local flik_individual = false
@@ -164,46 +172,111 @@ local configPath = dataDir .. "abl_config.txt"
 -- Utility
 ---------------------------------------------------------------------
 
+-- File operations this frame: opens, renames, removes and tier store reads.
+-- The scheduler in the main loop starts no job that would take it past
+-- IO_OPS_PER_FRAME.
+local io_ops = 0
+local IO_OPS_PER_FRAME = 4
+-- Held back from the jobs for flush_state() at the end of the frame.
+local STATE_FLUSH_OPS = 1
+
+local function io_open(path, mode)
+    io_ops = io_ops + 1
+    return io.open(path, mode)
+end
+
+local function io_rename(from, to)
+    io_ops = io_ops + 1
+    return os.rename(from, to)
+end
+
+local function io_remove(path)
+    io_ops = io_ops + 1
+    return os.remove(path)
+end
+
+-- Commands are polled every command_poll_interval frames, which doubles up
+-- to COMMAND_POLL_MAX_FRAMES while nothing happens and drops back to
+-- COMMAND_POLL_MIN_FRAMES on activity: commands read, new tiers, checks sent.
+local COMMAND_POLL_MIN_FRAMES = 2
+local COMMAND_POLL_MAX_FRAMES = 32
+
+local frameCounter = 0
+local command_poll_interval = COMMAND_POLL_MIN_FRAMES
+local next_command_poll = 0
+
+local function note_io_activity()
+    command_poll_interval = COMMAND_POLL_MIN_FRAMES
+    next_command_poll = min(next_command_poll, frameCounter + COMMAND_POLL_MIN_FRAMES)
+end
+
+-- Latency trace, on when ABL_LATENCY_TRACE is set to anything but "" or "0";
+-- ablbridge/latency.py reads it. Events are stamped with the frame count
+-- since the script started, and a "clock" event on the first frame of every
+-- os.time() second ties frames to wall time. CHECK lines also carry their
+-- frame ("f=<frame>"). The events are appended to abl_latency_lua.log once a
+-- second, outside the I/O budget.
+local latency_env = os.getenv("ABL_LATENCY_TRACE")
+local LATENCY_TRACE = latency_env ~= nil and latency_env ~= "" and latency_env ~= "0"
+local latencyPath = dataDir .. "abl_latency_lua.log"
+local trace_frame = 0
+local trace_second = nil
+local trace_events = {}
+
+local function trace_event(ev, fields)
+    if not LATENCY_TRACE then return end
+    insert(trace_events, fmt('{"ev":"%s","f":%d%s}\n', ev, trace_frame, fields or ""))
+end
+
+-- Called at the start of every frame.
+local function trace_tick()
+    if not LATENCY_TRACE then return end
+    trace_frame = trace_frame + 1
+    local now = os.time()
+    if now == trace_second then return end
+    trace_second = now
+    trace_event("clock", fmt(',"wall":%d', now))
+    local f = io.open(latencyPath, "ab")
+    if f then
+        f:write(table.concat(trace_events))
+        f:close()
+        trace_events = {}
+    end
+end
+
+local function parse_list(v)
+    local out = {}
+    for n in v:gmatch("%d+") do
+        out[#out + 1] = tonumber(n)
+    end
+    return out
+end
+
 local function load_config()
     grainsanity_enabled = false
-    grainsanity_step = 10
     grain_all = false
     flik_individual = false
     flik_all = false
-    enemysanity_25 = false
-    enemysanity_50 = false
-    enemysanity_75 = false
-    enemysanity_100 = false
+    grain_thresholds = {}
+    enemy_kills = {}
 
-    local function parse_bool(v)
-        v = tostring(v):lower()
-        return (v == "1" or v == "true" or v == "yes" or v == "on")
-    end
-
-    local f = io.open(configPath, "r")
+    local f = io_open(configPath, "r")
     if not f then return end
 
     for line in f:lines() do
         local k, v = line:match("^(%S+)%s*=%s*(%S+)")
         if k and v then
-            if k == "enable_grain_all" or k == "grain_all" then
-                grain_all = parse_bool(v)
-            elseif k == "enable_grainsanity" or k == "grainsanity" then
-                grainsanity_enabled = parse_bool(v)
-            elseif k == "grainsanity_step" or k == "step" then
-                grainsanity_step = tonumber(v) or 10
-            elseif k == "enable_enemy_25" or k == "enemy25" then
-                enemysanity_25 = parse_bool(v)
-            elseif k == "enable_enemy_50" or k == "enemy50" then
-                enemysanity_50 = parse_bool(v)
-            elseif k == "enable_enemy_75" or k == "enemy75" then
-                enemysanity_75 = parse_bool(v)
-            elseif k == "enable_enemy_100" or k == "enemy100" then
-                enemysanity_100 = parse_bool(v)
-            elseif k == "enable_flik_individual" or k == "flik_individual" then
-                flik_individual = parse_bool(v)
-            elseif k == "enable_flik_all" or k == "flik_all" then
-                flik_all = parse_bool(v)
+            local prefix, level = k:match("^(%a+)_(%d+)$")
+            if k == "options" then
+                local bits = tonumber(v) or 0
+                grainsanity_enabled = bits & OPTION_GRAINSANITY ~= 0
+                grain_all = bits & OPTION_GRAIN_ALL ~= 0
+                flik_individual = bits & OPTION_FLIK_INDIVIDUAL ~= 0
+                flik_all = bits & OPTION_FLIK_ALL ~= 0
+            elseif prefix == "grain" then
+                grain_thresholds[tonumber(level)] = parse_list(v)
+            elseif prefix == "enemies" then
+                enemy_kills[tonumber(level)] = parse_list(v)
             end
         end
     end
@@ -217,27 +290,342 @@ local function assertPath(name, p)
   end
 end
 
-local function append_state(line)
-    local f = io.open(statePath, "a")
-    if not f then return end
-    f:write(line, "\n")
+---------------------------------------------------------------------
+-- Journals (format: ablbridge/journal.py)
+---------------------------------------------------------------------
+
+local JOURNAL_COMPACT_BYTES = 64 * 1024
+
+local function read_file(path)
+    local f = io_open(path, "rb")
+    if not f then return nil end
+    local data = f:read("a")
+    f:close()
+    return data
+end
+
+-- Moves path .. ".tmp" over path. The second result is true when path was
+-- removed but the .tmp could not take its place, so only the .tmp is left.
+local function install_tmp(path)
+    local tmp = path .. ".tmp"
+    if io_rename(tmp, path) then return true, false end
+    -- Windows will not rename over an existing file.
+    if not io_remove(path) then return false, false end
+    if io_rename(tmp, path) then return true, false end
+    return false, true
+end
+
+local function replace_file(path, text)
+    local f = io_open(path .. ".tmp", "wb")
+    if not f then return false, false end
+    f:write(text)
     f:close()
+    return install_tmp(path)
 end
 
-local function read_enemy_kills()
-    local tens_raw  = read_u8(enemy_tens_addr,  ram_domain)
-    local units_raw = read_u8(enemy_units_addr, ram_domain)
+local function journal_read_ack(path)
+    local data = read_file(path .. ".ack") or ""
+    local seq, id, epoch, offset = data:match("^(%d+) (%S+) (%-?%d+) (%d+)")
+    if not seq then
+        return { seq = 0, id = "", epoch = -1, offset = 0 }
+    end
+    return { seq = tonumber(seq), id = id, epoch = tonumber(epoch), offset = tonumber(offset) }
+end
 
-    local tens  = tens_raw  & 0x0F
-    local units = units_raw & 0x0F
+local function journal_parse_header(line)
+    local id, epoch = (line or ""):match("^#ABLJ (%S+) (%-?%d+)\r?\n$")
+    if id then return id, tonumber(epoch) end
+    return nil
+end
 
-    return tens * 10 + units
+local function journal_header(j, epoch)
+    return fmt("#ABLJ %s %d\n", j.id, epoch or j.epoch)
 end
 
-local function unlock_all_levels()
-    local v = read_u8(unlock_all_levels_addr, ram_domain)
+local function journal_writer(path)
+    -- stranded: the epoch of a compacted journal left only in the .tmp.
+    local j = { path = path, seq = 0, id = nil, epoch = -1, stranded = nil }
+
+    local data = read_file(path)
+    if not data and install_tmp(path) then
+        -- The last session ended with the journal stranded in its .tmp.
+        data = read_file(path)
+    end
+    if data then
+        if #data > 0 and data:sub(-1) ~= "\n" then
+            -- Finish a line cut short by a crash so the next entry starts clean.
+            local f = io_open(path, "ab")
+            if f then f:write("\n"); f:close() end
+            data = data .. "\n"
+        end
+        j.id, j.epoch = journal_parse_header(data:match("^[^\n]*\n"))
+        for seq in data:gmatch("\n(%d+) ") do
+            j.seq = max(j.seq, tonumber(seq))
+        end
+    end
+
+    local ack = journal_read_ack(path)
+    j.seq = max(j.seq, ack.seq)
+    if not j.id then
+        if ack.id ~= "" then
+            j.id, j.epoch = ack.id, ack.epoch
+        else
+            j.id, j.epoch = fmt("%08x", math.random(0, 0x7FFFFFFF)), -1
+        end
+    end
+    return j
+end
+
+-- Returns true once nothing is left to do, false if it should be retried.
+local function journal_compact(j)
+    if j.stranded then
+        if not install_tmp(j.path) then return false end
+        j.epoch, j.stranded = j.stranded, nil
+        return true
+    end
+
+    local data = read_file(j.path)
+    if not data then return true end
+    local ack = journal_read_ack(j.path)
+    local acked = (ack.id == j.id) and ack.seq or 0
+
+    local keep = {}
+    for line in data:gmatch("([^\n]*)\n") do
+        local seq = tonumber(line:match("^(%d+) "))
+        if seq and seq > acked then insert(keep, line .. "\n") end
+    end
+
+    local epoch = j.epoch + 1
+    local replaced, stranded = replace_file(j.path, journal_header(j, epoch) .. table.concat(keep))
+    if replaced then
+        j.epoch = epoch
+        return true
+    end
+    log_error("failed to compact " .. j.path)
+    if not stranded then return true end
+    -- Unacked entries are only in the .tmp now; appending would start a new
+    -- journal without them, so appends wait until a later frame moves it.
+    j.stranded = epoch
+    return false
+end
+
+-- Appends the payloads, each followed by the trace field if one is given,
+-- with a single open. Returns the journal's size, or nil if it could not be
+-- opened; compacting is left to the caller.
+local function journal_append(j, payloads, trace)
+    if j.stranded then return nil end
+    local f = io_open(j.path, "ab")
+    if not f then
+        log_error("failed to append to " .. j.path)
+        return nil
+    end
+
+    local parts = {}
+    if f:seek("end") == 0 then
+        j.epoch = j.epoch + 1
+        insert(parts, journal_header(j))
+    end
+    local suffix = trace and ("\t" .. trace) or ""
+    for _, payload in ipairs(payloads) do
+        j.seq = j.seq + 1
+        insert(parts, fmt("%d %s%s\n", j.seq, payload, suffix))
+    end
+
+    f:write(table.concat(parts))
+    local size = f:seek("end")
+    f:close()
+    return size
+end
+
+local function journal_reader(path)
+    local ack = journal_read_ack(path)
+    return {
+        path = path,
+        seq = ack.seq, id = ack.id, epoch = ack.epoch, offset = ack.offset,
+        acked = fmt("%d %s %d %d\n", ack.seq, ack.id, ack.epoch, ack.offset),
+    }
+end
+
+-- Payloads of the entries written since the last read.
+local function journal_read(j)
+    local f = io_open(j.path, "rb")
+    if not f then return {} end
+
+    local header = f:read("L")
+    local id, epoch = journal_parse_header(header)
+    if not id then
+        f:close()
+        return {}
+    end
+    if id ~= j.id then j.seq = 0 end
+    if id ~= j.id or epoch ~= j.epoch then
+        j.id, j.epoch, j.offset = id, epoch, #header
+    end
+
+    f:seek("set", j.offset)
+    local data = f:read("a") or ""
+    f:close()
+
+    local complete = data:match("^.*\n")
+    if not complete then return {} end
+    j.offset = j.offset + #complete
+
+    local payloads = {}
+    for line in complete:gmatch("([^\n]*)\n") do
+        local seq, payload = line:match("^(%d+) ([^\r\t]*)")
+        seq = tonumber(seq)
+        if seq and seq > j.seq then
+            j.seq = seq
+            insert(payloads, payload)
+        end
+    end
+    return payloads
+end
+
+local function journal_ack(j)
+    local text = fmt("%d %s %d %d\n", j.seq, j.id, j.epoch, j.offset)
+    if text ~= j.acked and replace_file(j.path .. ".ack", text) then
+        j.acked = text
+    end
+end
+
+local state_journal = nil
+local command_journal = nil
+
+-- CHECK lines queued this frame; flush_state() journals them after step().
+local state_buffer = {}
+local state_compact_due = false
+
+local function append_state(line)
+    insert(state_buffer, line)
+end
+
+local function flush_state()
+    if #state_buffer == 0 then return end
+    -- A frame a compaction filled keeps its lines for the next one.
+    if io_ops + STATE_FLUSH_OPS > IO_OPS_PER_FRAME then return end
+    local size = journal_append(state_journal, state_buffer, LATENCY_TRACE and fmt("f=%d", trace_frame) or nil)
+    -- On failure the lines stay queued for the next frame.
+    if not size then return end
+    trace_event("checks", fmt(',"seq":%d,"n":%d', state_journal.seq, #state_buffer))
+    state_buffer = {}
+    note_io_activity()
+    if size >= JOURNAL_COMPACT_BYTES then
+        state_compact_due = true
+    end
+end
+
+---------------------------------------------------------------------
+-- RAM snapshot
+---------------------------------------------------------------------
+
+-- Every address the script reads, fetched once per frame by take_snapshot()
+-- with one memory.read_bytes_as_array per range (byte by byte on a BizHawk
+-- without it). { first address, length }.
+local RAM_RANGES = {
+    { unlock_all_levels_addr, 1 },
+    { level_complete_status_addr, 1 },
+    { level_index_addr, 1 },
+    { level_code_addr, 2 },
+    -- health, berry, seed tiers, lives, grain, FLIK letters
+    { health_addr, flik_addr - health_addr + 1 },
+    -- seed upgrade list, enemy counter
+    { seed_upgrade_list_addr, enemy_units_addr - seed_upgrade_list_addr + 1 },
+    { flik_status_addr, 2 },
+}
+
+local read_bytes = memory.read_bytes_as_array
+local ram_bytes = {}
+
+-- The frame's read-only view, handed to the detectors: the decoded values
+-- only the game writes, and u8()/u16() for the addresses the script writes
+-- too, which see the writes queued earlier in the frame.
+local ram = {}
+
+function ram.u8(addr)
+    return ram_bytes[addr] or read_u8(addr, ram_domain)
+end
+
+function ram.u16(addr)
+    local lo, hi = ram_bytes[addr], ram_bytes[addr + 1]
+    if lo and hi then return lo | hi << 8 end
+    return read_u16(addr, ram_domain)
+end
+
+local function take_snapshot()
+    for _, range in ipairs(RAM_RANGES) do
+        local first, length = range[1], range[2]
+        if read_bytes then
+            local bytes = read_bytes(first, length, ram_domain)
+            for i = 1, length do
+                ram_bytes[first + i - 1] = bytes[i]
+            end
+        else
+            for addr = first, first + length - 1 do
+                ram_bytes[addr] = read_u8(addr, ram_domain)
+            end
+        end
+    end
+
+    ram.level_index = ram_bytes[level_index_addr]
+    ram.level_code = ram.u16(level_code_addr)
+    ram.flik_status = ram.u16(flik_status_addr)
+    ram.flik_mask = ram_bytes[flik_addr]
+    ram.grain = ram_bytes[grain_addr]
+    ram.level_complete_status = ram_bytes[level_complete_status_addr]
+    -- BCD, one digit in the low nibble of each byte.
+    ram.enemy_kills = (ram_bytes[enemy_tens_addr] & 0x0F) * 10 + (ram_bytes[enemy_units_addr] & 0x0F)
+end
+
+-- Writes made during the frame, applied by flush_writes() after step(). A
+-- later write to an address replaces the earlier one.
+local pending_writes = {}
+local pending_by_addr = {}
+
+local function queue_write(addr, value, wide)
+    local entry = pending_by_addr[addr]
+    if entry then
+        entry[2], entry[3] = value, wide
+    else
+        entry = { addr, value, wide }
+        insert(pending_writes, entry)
+        pending_by_addr[addr] = entry
+    end
+
+    if ram_bytes[addr] then
+        ram_bytes[addr] = value & 0xFF
+        if wide and ram_bytes[addr + 1] then
+            ram_bytes[addr + 1] = value >> 8 & 0xFF
+        end
+    end
+end
+
+local function ram_write_u8(addr, value)
+    queue_write(addr, value, false)
+end
+
+local function ram_write_u16(addr, value)
+    queue_write(addr, value, true)
+end
+
+local function flush_writes()
+    if #pending_writes == 0 then return end
+    local writes = pending_writes
+    pending_writes = {}
+    pending_by_addr = {}
+    for _, entry in ipairs(writes) do
+        if entry[3] then
+            write_u16(entry[1], entry[2], ram_domain)
+        else
+            write_u8(entry[1], entry[2], ram_domain)
+        end
+    end
+end
+
+local function unlock_all_levels(ram)
+    local v = ram.u8(unlock_all_levels_addr)
     if v == 1 then
-        write_u8(unlock_all_levels_addr, 15, ram_domain)
+        ram_write_u8(unlock_all_levels_addr, 15)
         log_debug("forced unlock all levels (1 -> 15)")
     end
 end
@@ -248,19 +636,19 @@ end
 local function init_after_first_frame()
     assertPath("statePath", statePath)
     assertPath("commandPath", commandPath)
-    assertPath("berryStatePath", berryStatePath)
-    assertPath("seedStatePath", seedStatePath)
-    os.execute('mkdir "' .. dataDir .. '" >nul 2>nul')
+    assertPath("tierStorePath", tierStorePath)
+    if SEP == "\\" then
+        os.execute('mkdir "' .. dataDir .. '" >nul 2>nul')
+    else
+        os.execute('mkdir -p "' .. dataDir .. '" 2>/dev/null')
+    end
+    state_journal = journal_writer(statePath)
+    command_journal = journal_reader(commandPath)
     load_config()
     log_debug(fmt(
-      "config: grainsanity=%s step=%d grain_all=%s enemy25=%s enemy50=%s enemy75=%s enemy100=%s flik_individual=%s flik_all=%s",
+      "config: grainsanity=%s grain_all=%s flik_individual=%s flik_all=%s",
       tostring(grainsanity_enabled),
-      grainsanity_step,
       tostring(grain_all),
-      tostring(enemysanity_25),
-      tostring(enemysanity_50),
-      tostring(enemysanity_75),
-      tostring(enemysanity_100),
       tostring(flik_individual),
       tostring(flik_all)
     ))
@@ -275,105 +663,120 @@ init_after_first_frame()
 -- Commands from C#
 ---------------------------------------------------------------------
 
-local function process_commands()
-    local f = io.open(commandPath, "r")
-    if not f then return end
-
-    local lines = {}
-    for line in f:lines() do
-        if line ~= "" then
-            insert(lines, line)
-        end
+-- Returns true if there were new commands.
+local function process_commands(ram)
+    local lines = journal_read(command_journal)
+    if #lines == 0 then
+        journal_ack(command_journal)
+        return false
     end
-    f:close()
-
-    if #lines == 0 then return end
-
-    local wf = io.open(commandPath, "w")
-    if wf then wf:write(""); wf:close() end
+    trace_event("commands", fmt(',"seq":%d,"n":%d', command_journal.seq, #lines))
 
     for _, line in ipairs(lines) do
         local cmd, a = line:match("^(%S+)%s*(%S*)")
 
         if cmd == "LIFE" and a == "+1" then
-            local lives = read_u8(lives_addr, ram_domain)
+            local lives = ram.u8(lives_addr)
             if lives < MAX_LIVES then
                 local new = lives + 1
                 if new > MAX_LIVES then new = MAX_LIVES end
-                write_u8(lives_addr, new, ram_domain)
+                ram_write_u8(lives_addr, new)
                 log_info("gave extra life -> " .. new)
             end
 
         elseif cmd == "HEALTH" and a == "+1" then
-            local status = read_u16(flik_status_addr, ram_domain)
-            if status == FLIK_STATUS_READY then
-                local hp = read_u8(health_addr, ram_domain)
+            if ram.flik_status == FLIK_STATUS_READY then
+                local hp = ram.u8(health_addr)
                 if hp > 0 and hp < MAX_HEALTH then
                     local new_hp = hp + 1
                     if new_hp > MAX_HEALTH then new_hp = MAX_HEALTH end
-                    write_u8(health_addr, new_hp, ram_domain)
+                    ram_write_u8(health_addr, new_hp)
                     log_info("increased health -> " .. new_hp)
                 end
             end
         end
     end
+
+    journal_ack(command_journal)
+    return true
 end
 
 ---------------------------------------------------------------------
--- Berry tiers (absolute per level)
+-- Berry and seed tiers (absolute per level; format: ablbridge/store.py)
 ---------------------------------------------------------------------
 
 local berry_tiers = {}
+local seed_tiers = {}
 
-local function load_berry_state()
-    berry_tiers = {}
-    local f = io.open(berryStatePath, "r")
-    if not f then return end
+local TIER_STORE_MAGIC = "ABLS"
+local TIER_STORE_VERSION = 1
+local TIER_STORE_LEVELS = 256
+local TIER_STORE_HEADER = "<c4I2I2I4I4"
+local TIER_STORE_HEADER_SIZE = 16
+local TIER_RECORD_SIZE = 6
+local TIER_POLL_FRAMES = 15
+
+local tier_store = {
+    f = nil,
+    generation = -1,
+    config_generation = -1,
+    config_due = false,
+    dirty = false,
+}
 
-    for line in f:lines() do
-        local idx, tier = line:match("^LEVEL%s+(%d+)%s+(%d+)")
-        if idx and tier then
-            idx  = tonumber(idx)
-            tier = tonumber(tier)
-            if idx and tier then
-                if tier < 0 then tier = 0 end
-                if tier > 4 then tier = 4 end
-                berry_tiers[idx] = tier
-            end
-        end
+-- Reads the store header and, only if the generation moved, the records.
+-- Returns true when berry_tiers/seed_tiers were rebuilt.
+local function poll_tier_store()
+    local f = tier_store.f
+    if not f then
+        f = io_open(tierStorePath, "rb")
+        if not f then return false end
+        -- Unbuffered, so every seek+read sees the writer's latest bytes.
+        f:setvbuf("no")
+        tier_store.f = f
     end
 
-    f:close()
-end
+    io_ops = io_ops + 1
+    f:seek("set", 0)
+    local head = f:read(TIER_STORE_HEADER_SIZE)
+    if not head or #head < TIER_STORE_HEADER_SIZE then return false end
+    local magic, version, levels, generation, config_generation = string.unpack(TIER_STORE_HEADER, head)
+    if magic ~= TIER_STORE_MAGIC or version ~= TIER_STORE_VERSION or levels ~= TIER_STORE_LEVELS then
+        return false
+    end
 
----------------------------------------------------------------------
--- Seed extra tiers (per level)
----------------------------------------------------------------------
+    if config_generation ~= tier_store.config_generation then
+        -- Reloaded by the scheduler on a frame with room for it.
+        tier_store.config_generation = config_generation
+        tier_store.config_due = true
+    end
 
-local seed_tiers = {}
+    if generation == tier_store.generation or generation & 1 == 1 then return false end
 
-local function load_seed_state()
-    seed_tiers = {}
-    local f = io.open(seedStatePath, "r")
-    if not f then return end
+    io_ops = io_ops + 1
+    local body = f:read(TIER_STORE_LEVELS * TIER_RECORD_SIZE)
+    f:seek("set", 8)
+    local after = f:read(4)
+    if not body or #body < TIER_STORE_LEVELS * TIER_RECORD_SIZE or not after then return false end
+    if string.unpack("<I4", after) ~= generation then return false end
 
-    for line in f:lines() do
-        local idx, b, g, bl, p, y =
-            line:match("^LEVEL%s+(%d+)%s+(%d+)%s+(%d+)%s+(%d+)%s+(%d+)%s+(%d+)")
-        if idx and b and g and bl and p and y then
-            idx = tonumber(idx)
-            b   = tonumber(b)
-            g   = tonumber(g)
-            bl  = tonumber(bl)
-            p   = tonumber(p)
-            y   = tonumber(y)
-            if idx then
-                seed_tiers[idx] = { b, g, bl, p, y }
-            end
+    berry_tiers = {}
+    seed_tiers = {}
+    for idx = 0, TIER_STORE_LEVELS - 1 do
+        local b, g, bl, p, y, berry = body:byte(idx * TIER_RECORD_SIZE + 1, idx * TIER_RECORD_SIZE + TIER_RECORD_SIZE)
+        if berry > 0 then
+            berry_tiers[idx] = min(berry, 4)
+        end
+        if b + g + bl + p + y > 0 then
+            seed_tiers[idx] = { b, g, bl, p, y }
         end
     end
 
-    f:close()
+    tier_store.generation = generation
+    tier_store.dirty = true
+    note_io_activity()
+    trace_event("tiers", fmt(',"gen":%d', generation))
+    return true
 end
 
 ---------------------------------------------------------------------
@@ -390,11 +793,12 @@ local wait_level_complete_zero = false
 
 local level_complete_armed = false
 local prev_level_complete_status = 0
+-- In bit order, so the letters of one frame are always queued F, L, I, K.
 local flik_bits = {
-    F = 0x01,
-    L = 0x02,
-    I = 0x04,
-    K = 0x08
+    { "F", 0x01 },
+    { "L", 0x02 },
+    { "I", 0x04 },
+    { "K", 0x08 },
 }
 
 local current_level_index = nil
@@ -455,18 +859,18 @@ local function clamp_tier(t)
     return t
 end
 
-local function read_seed_tier(addr)
-    local raw = read_u8(addr, ram_domain)
+local function read_seed_tier(ram, addr)
+    local raw = ram.u8(addr)
     return clamp_tier(floor(raw / 0x11))
 end
 
-local function read_seed_raw(addr)
-    return read_u8(addr, ram_domain)
+local function read_seed_raw(ram, addr)
+    return ram.u8(addr)
 end
 
 local function write_seed_tier(addr, tier)
     tier = clamp_tier(tier)
-    write_u8(addr, tier * 0x11, ram_domain)
+    ram_write_u8(addr, tier * 0x11)
 end
 
 local function write_seed_hud_block(seed_index, tier)
@@ -477,19 +881,19 @@ local function write_seed_hud_block(seed_index, tier)
     tier = clamp_tier(tier)
     local tier_group = max(tier - 1, 0)
 
-    write_u8(base_addr, row2_base + tier_group, ram_domain)
+    ram_write_u8(base_addr, row2_base + tier_group)
 
     local v0 = 0x00 + 0x40 * tier_group
     local v1 = 0x15 + 0x40 * tier_group
     local v2 = 0x2A + 0x40 * tier_group
 
-    write_u8(base_addr + 0x02, v0, ram_domain)
-    write_u8(base_addr + 0x04, v1, ram_domain)
-    write_u8(base_addr + 0x06, v2, ram_domain)
+    ram_write_u8(base_addr + 0x02, v0)
+    ram_write_u8(base_addr + 0x04, v1)
+    ram_write_u8(base_addr + 0x06, v2)
 
-    write_u8(base_addr + 0x08, v0, ram_domain)
-    write_u8(base_addr + 0x0A, v1, ram_domain)
-    write_u8(base_addr + 0x0C, v2, ram_domain)
+    ram_write_u8(base_addr + 0x08, v0)
+    ram_write_u8(base_addr + 0x0A, v1)
+    ram_write_u8(base_addr + 0x0C, v2)
 end
 
 local function compute_packed_upgrade_list_from_tiers(tiers_by_index)
@@ -513,18 +917,18 @@ end
 
 local function write_seed_upgrade_list_from_tiers(tiers_by_index)
     local packed = compute_packed_upgrade_list_from_tiers(tiers_by_index)
-    write_u16(seed_upgrade_list_addr, packed, ram_domain)
+    ram_write_u16(seed_upgrade_list_addr, packed)
 end
 
-local function apply_seed_upgrades_for_level(level_index)
+local function apply_seed_upgrades_for_level(ram, level_index)
     local extras = seed_tiers[level_index] or { 0, 0, 0, 0, 0 }
 
     base_seed_tiers = {
-        read_seed_tier(brown_seed_addr),
-        read_seed_tier(green_seed_addr),
-        read_seed_tier(blue_seed_addr),
-        read_seed_tier(purple_seed_addr),
-        read_seed_tier(yellow_seed_addr),
+        read_seed_tier(ram, brown_seed_addr),
+        read_seed_tier(ram, green_seed_addr),
+        read_seed_tier(ram, blue_seed_addr),
+        read_seed_tier(ram, purple_seed_addr),
+        read_seed_tier(ram, yellow_seed_addr),
     }
 
     applied_seed_extras = { 0, 0, 0, 0, 0 }
@@ -585,7 +989,7 @@ local function sync_seed_upgrades_during_level()
     end
 end
 
-local function enforce_ap_seed_truth()
+local function enforce_ap_seed_truth(ram)
     if not current_level_index or not base_seed_tiers or not applied_seed_extras then return end
 
     local desired_tiers = {}
@@ -599,7 +1003,7 @@ local function enforce_ap_seed_truth()
 
         local addr = seed_addr_by_index[seed_index]
         if addr then
-            local current_tier = read_seed_tier(addr)
+            local current_tier = read_seed_tier(ram, addr)
             if current_tier > max_unlocked then
                 write_seed_tier(addr, max_unlocked)
                 write_seed_hud_block(seed_index, max_unlocked)
@@ -609,9 +1013,9 @@ local function enforce_ap_seed_truth()
     end
 
     local desired_packed = compute_packed_upgrade_list_from_tiers(desired_tiers)
-    local current_packed = read_u16(seed_upgrade_list_addr, ram_domain)
+    local current_packed = ram.u16(seed_upgrade_list_addr)
     if current_packed ~= desired_packed then
-        write_u16(seed_upgrade_list_addr, desired_packed, ram_domain)
+        ram_write_u16(seed_upgrade_list_addr, desired_packed)
         any_fixed = true
     end
 
@@ -638,7 +1042,7 @@ local function apply_berry_tier_for_level(level_index)
     local tier = berry_tiers[level_index] or 0
     tier = clamp_tier(tier)
     desired_berry_tier = tier
-    write_u8(berry_addr, berry_raw_from_tier(tier), ram_domain)
+    ram_write_u8(berry_addr, berry_raw_from_tier(tier))
 end
 
 local function sync_berry_tier_during_level()
@@ -649,12 +1053,12 @@ local function sync_berry_tier_during_level()
 
     if desired_berry_tier == nil or tier ~= desired_berry_tier then
         desired_berry_tier = tier
-        write_u8(berry_addr, berry_raw_from_tier(tier), ram_domain)
+        ram_write_u8(berry_addr, berry_raw_from_tier(tier))
         log_info("applied updated AP berry tier -> " .. berry_label(tier))
     end
 end
 
-local function enforce_ap_berry_truth()
+local function enforce_ap_berry_truth(ram)
     if desired_berry_tier == nil then return false end
 
     local minTier = desired_berry_tier
@@ -669,15 +1073,15 @@ local function enforce_ap_berry_truth()
     local maxTier = minTier
     if purpleMax > maxTier then maxTier = purpleMax end
 
-    local currentRaw = read_u8(berry_addr, ram_domain)
+    local currentRaw = ram.u8(berry_addr)
     local currentTier = berry_tier_from_raw(currentRaw)
 
     if currentTier < minTier then
-        write_u8(berry_addr, berry_raw_from_tier(minTier), ram_domain)
+        ram_write_u8(berry_addr, berry_raw_from_tier(minTier))
         return true
     end
     if currentTier > maxTier then
-        write_u8(berry_addr, berry_raw_from_tier(maxTier), ram_domain)
+        ram_write_u8(berry_addr, berry_raw_from_tier(maxTier))
         return true
     end
 
@@ -688,10 +1092,10 @@ end
 -- Level state
 ---------------------------------------------------------------------
 
-local function update_level_state()
-    local idx    = read_u8(level_index_addr, ram_domain)
-    local code   = read_u16(level_code_addr, ram_domain)
-    local status = read_u16(flik_status_addr, ram_domain)
+local function update_level_state(ram)
+    local idx    = ram.level_index
+    local code   = ram.level_code
+    local status = ram.flik_status
 
     if code ~= current_level_code then
         current_level_code = code
@@ -700,7 +1104,7 @@ local function update_level_state()
         wait_level_complete_zero = false
     end
 
-    if not enemy_thresholds[idx] then
+    if not LEVEL_NAME[idx] then
         current_level_index = nil
         base_seed_tiers = nil
         applied_seed_extras = nil
@@ -728,19 +1132,20 @@ local function update_level_state()
     end
 
     if not level_init_done then
-        load_berry_state()
-        load_seed_state()
+        poll_tier_store()
+        tier_store.dirty = false
 
-        prev_flik_mask = read_u8(flik_addr, ram_domain)
-        prev_grain     = read_u8(grain_addr, ram_domain)
-        prev_enemies   = read_enemy_kills()
+        prev_flik_mask = ram.flik_mask
+        prev_grain     = ram.grain
+        prev_enemies   = ram.enemy_kills
 
         enemy_observed_max[current_level_index] = 0
 
-        wait_level_complete_zero = (read_u8(level_complete_status_addr, ram_domain) ~= 0)
+        wait_level_complete_zero = (ram.level_complete_status ~= 0)
 
         apply_berry_tier_for_level(current_level_index)
-        apply_seed_upgrades_for_level(current_level_index)
+        apply_seed_upgrades_for_level(ram, current_level_index)
+        trace_event("tiers_applied", fmt(',"gen":%d', tier_store.generation))
 
         warmupFramesRemaining = WARMUP_FRAMES
         level_init_done = true
@@ -757,9 +1162,9 @@ local function update_level_state()
     end
 end
 
-local function track_enemy_max()
+local function track_enemy_max(ram)
   if not current_level_index then return end
-  local c = read_enemy_kills()
+  local c = ram.enemy_kills
   local prev = enemy_observed_max[current_level_index] or 0
   if c > prev then
     enemy_observed_max[current_level_index] = c
@@ -770,19 +1175,20 @@ end
 -- Checks (edge-triggered)
 ---------------------------------------------------------------------
 
-local function get_level_index_for_checks()
+local function get_level_index_for_checks(ram)
     if current_level_index ~= nil then
         return current_level_index
     end
-    return read_u8(level_index_addr, ram_domain)
+    return ram.level_index
 end
 
-local function check_flik()
-    local level_index = get_level_index_for_checks()
-    local mask = read_u8(flik_addr, ram_domain)
+local function check_flik(ram)
+    local level_index = get_level_index_for_checks(ram)
+    local mask = ram.flik_mask
 
     if flik_individual then
-        for letter, bitmask in pairs(flik_bits) do
+        for _, bit in ipairs(flik_bits) do
+            local letter, bitmask = bit[1], bit[2]
             local had_before = prev_flik_mask & bitmask ~= 0
             local has_now    = mask & bitmask ~= 0
 
@@ -808,9 +1214,9 @@ local function check_flik()
     prev_flik_mask = mask
 end
 
-local function check_grain()
-    local level_index = get_level_index_for_checks()
-    local grain = read_u8(grain_addr, ram_domain)
+local function check_grain(ram)
+    local level_index = get_level_index_for_checks(ram)
+    local grain = ram.grain
 
     if not completed_grain[level_index] and grain == MAX_GRAIN and prev_grain < MAX_GRAIN then
         completed_grain[level_index] = true
@@ -821,23 +1227,29 @@ local function check_grain()
     prev_grain = grain
 end
 
-local function check_grain_sanity()
+local function check_grain_sanity(ram)
   if not grainsanity_enabled then return end
-  local level_index = get_level_index_for_checks()
-  local grain = read_u8(grain_addr, ram_domain)
+  local level_index = get_level_index_for_checks(ram)
+  local thresholds = grain_thresholds[level_index]
+  if not thresholds then return end
 
-  if not completed_grain_sanity[level_index] then completed_grain_sanity[level_index] = {} end
+  local grain = ram.grain
+  if grain <= prev_grain then return end
 
-  local step = max(1, min(MAX_GRAIN, grainsanity_step))
+  local done = completed_grain_sanity[level_index]
+  if not done then
+    done = {}
+    completed_grain_sanity[level_index] = done
+  end
 
-  local t = step
-  while t <= MAX_GRAIN do
-    if grain >= t and prev_grain < t and not completed_grain_sanity[level_index][t] then
-      completed_grain_sanity[level_index][t] = true
+  for i = 1, #thresholds do
+    local t = thresholds[i]
+    if t > grain then break end
+    if t > prev_grain and not done[t] then
+      done[t] = true
       append_state(fmt("CHECK GRAIN%d %d", t, level_index))
       log_info("queued GRAIN " .. t .. " check for level " .. level_label(level_index))
     end
-    t = t + step
   end
 end
 
@@ -845,29 +1257,27 @@ local function round_nearest(x)
   return floor(x + 0.5)
 end
 
-function check_enemy_sanity()
-    local status = read_u16(flik_status_addr, ram_domain)
-    if status ~= FLIK_STATUS_READY then
+function check_enemy_sanity(ram)
+    if ram.flik_status ~= FLIK_STATUS_READY then
         return
     end
 
-    local level_index = get_level_index_for_checks()
+    local level_index = get_level_index_for_checks(ram)
     if not level_index then return end
 
-    local count = read_enemy_kills()
+    local count = ram.enemy_kills
+    local kills = enemy_kills[level_index]
 
     if DEBUG_MODE then
-        local t = enemy_thresholds[level_index] or {}
-        local need25, need50, need75, need100 = t[25], t[50], t[75], t[100]
+        local need = kills or { 0, 0, 0, 0 }
 
-        local function hit(need) return (need and need > 0 and count >= need) and 1 or 0 end
+        local function hit(i) return (need[i] > 0 and count >= need[i]) and 1 or 0 end
 
         local peak = enemy_observed_max[level_index] or 0
 
         local key = table.concat({
             level_index,
-            hit(need25), hit(need50), hit(need75), hit(need100),
-            enemysanity_25 and 1 or 0, enemysanity_50 and 1 or 0, enemysanity_75 and 1 or 0, enemysanity_100 and 1 or 0,
+            hit(1), hit(2), hit(3), hit(4),
             (completed_enemy_pct[25][level_index] and 1 or 0),
             (completed_enemy_pct[50][level_index] and 1 or 0),
             (completed_enemy_pct[75][level_index] and 1 or 0),
@@ -878,11 +1288,10 @@ function check_enemy_sanity()
         if dbg_enemy_last.key ~= key then
             dbg_enemy_last.key = key
             log_debug(fmt(
-                "lvl=%d count=%d peak=%d need(25/50/75/100)=(%s/%s/%s/%s) hit=(%d/%d/%d/%d) enabled=(%s/%s/%s/%s) done=(%s/%s/%s/%s)",
+                "lvl=%d count=%d peak=%d need(25/50/75/100)=(%d/%d/%d/%d) hit=(%d/%d/%d/%d) done=(%s/%s/%s/%s)",
                 level_index, count, peak,
-                tostring(need25), tostring(need50), tostring(need75), tostring(need100),
-                hit(need25), hit(need50), hit(need75), hit(need100),
-                tostring(enemysanity_25), tostring(enemysanity_50), tostring(enemysanity_75), tostring(enemysanity_100),
+                need[1], need[2], need[3], need[4],
+                hit(1), hit(2), hit(3), hit(4),
                 tostring(completed_enemy_pct[25][level_index]),
                 tostring(completed_enemy_pct[50][level_index]),
                 tostring(completed_enemy_pct[75][level_index]),
@@ -891,46 +1300,33 @@ function check_enemy_sanity()
         end
     end
 
-    local function fire(pct)
-        if completed_enemy_pct[pct][level_index] then return end
-        completed_enemy_pct[pct][level_index] = true
-        append_state("CHECK ENEMIES" .. pct .. " " .. level_index)
-        log_info("queued ENEMIES " .. pct .. "% check for level " .. level_label(level_index))
-    end
-
-    local function try_pct(pct, enabled)
-        if not enabled then return end
-
-        local t = enemy_thresholds[level_index]
-        local v = t and t[pct] or nil
-        if not v or v < 1 then return end
-
-        if count >= v and prev_enemies < v then
-            fire(pct)
+    if kills and count > prev_enemies then
+        for i = 1, #ENEMY_PCTS do
+            local need = kills[i] or 0
+            local pct = ENEMY_PCTS[i]
+            if need > 0 and count >= need and prev_enemies < need and not completed_enemy_pct[pct][level_index] then
+                completed_enemy_pct[pct][level_index] = true
+                append_state("CHECK ENEMIES" .. pct .. " " .. level_index)
+                log_info("queued ENEMIES " .. pct .. "% check for level " .. level_label(level_index))
+            end
         end
     end
 
-    try_pct(25, enemysanity_25)
-    try_pct(50, enemysanity_50)
-    try_pct(75, enemysanity_75)
-    try_pct(100, enemysanity_100)
-
     prev_enemies = count
 end
 
-local function check_level_complete()
+local function check_level_complete(ram)
     if not current_level_index then return end
     if not level_init_done then return end
     if warmupFramesRemaining and warmupFramesRemaining > 0 then return end
 
-    local status = read_u16(flik_status_addr, ram_domain)
-    if status ~= FLIK_STATUS_READY then return end
+    if ram.flik_status ~= FLIK_STATUS_READY then return end
 
-    local level_index = get_level_index_for_checks()
+    local level_index = get_level_index_for_checks(ram)
     if not level_index then return end
     if completed_level_complete[level_index] then return end
 
-    local s = read_u8(level_complete_status_addr, ram_domain)
+    local s = ram.level_complete_status
 
     if not level_complete_armed then
         if s == 0 then
@@ -952,50 +1348,120 @@ local function check_level_complete()
 end
 
 ---------------------------------------------------------------------
--- Main loop
+-- I/O scheduler
 ---------------------------------------------------------------------
 
-local frameCounter = 0
-local reloadEveryFrames = 300
+local next_tier_poll = TIER_POLL_FRAMES
+
+-- In priority order. A ready job runs only if its usual cost fits in what
+-- is left of the frame's budget; otherwise it stays ready for the next
+-- frame, so the work of a busy frame spreads over the following ones. A job
+-- costing more than the jobs' share (compaction) runs alone, on a frame no
+-- other job has used, and takes the state flush's share too.
+local io_jobs = {
+    {
+        cost = 3, -- command journal read, ack write and rename
+        ready = function() return frameCounter >= next_command_poll end,
+        run = function()
+            if process_commands(ram) then
+                note_io_activity()
+            else
+                command_poll_interval = min(command_poll_interval * 2, COMMAND_POLL_MAX_FRAMES)
+            end
+            next_command_poll = frameCounter + command_poll_interval
+        end,
+    },
+    {
+        cost = 2, -- header read, records read
+        ready = function() return frameCounter >= next_tier_poll end,
+        run = function()
+            next_tier_poll = frameCounter + TIER_POLL_FRAMES
+            poll_tier_store()
+        end,
+    },
+    {
+        cost = 1,
+        ready = function() return tier_store.config_due end,
+        run = function()
+            tier_store.config_due = false
+            load_config()
+        end,
+    },
+    {
+        cost = 4, -- journal and ack reads, rewrite and rename
+        ready = function() return state_compact_due end,
+        run = function()
+            state_compact_due = not journal_compact(state_journal)
+        end,
+    },
+}
+
+local function run_io_jobs()
+    local budget = IO_OPS_PER_FRAME - STATE_FLUSH_OPS
+    for _, job in ipairs(io_jobs) do
+        if job.ready() then
+            if io_ops + job.cost <= budget then
+                job.run()
+            elseif job.cost > budget and io_ops == 0 then
+                job.run()
+                return
+            end
+        end
+    end
+end
+
+---------------------------------------------------------------------
+-- Main loop
+---------------------------------------------------------------------
 
 local function step()
-    unlock_all_levels()
-    update_level_state()
+    take_snapshot()
+    unlock_all_levels(ram)
+    update_level_state(ram)
     if not current_level_index then return end
-    process_commands()
-    local status = read_u16(flik_status_addr, ram_domain)
+    local status = ram.flik_status
     frameCounter = frameCounter + 1
-    if current_level_index and (frameCounter % reloadEveryFrames == 0) and status == FLIK_STATUS_READY and level_init_done then
-        load_config()
-        load_seed_state()
-        load_berry_state()
+    run_io_jobs()
+    if tier_store.dirty and status == FLIK_STATUS_READY and level_init_done then
+        tier_store.dirty = false
         sync_seed_upgrades_during_level()
         sync_berry_tier_during_level()
+        trace_event("tiers_applied", fmt(',"gen":%d', tier_store.generation))
     end
 
-    enforce_ap_seed_truth()
-    enforce_ap_berry_truth()
+    enforce_ap_seed_truth(ram)
+    enforce_ap_berry_truth(ram)
 
     if warmupFramesRemaining > 0 then
         warmupFramesRemaining = warmupFramesRemaining - 1
-        prev_flik_mask = read_u8(flik_addr, ram_domain)
-        prev_grain     = read_u8(grain_addr, ram_domain)
-        prev_enemies   = read_enemy_kills()
+        prev_flik_mask = ram.flik_mask
+        prev_grain     = ram.grain
+        prev_enemies   = ram.enemy_kills
         return
     end
 
-    track_enemy_max()
-    check_flik()
-    check_grain_sanity()
-    check_grain()
-    check_enemy_sanity()
-    check_level_complete()
+    track_enemy_max(ram)
+    check_flik(ram)
+    check_grain_sanity(ram)
+    check_grain(ram)
+    check_enemy_sanity(ram)
+    check_level_complete(ram)
 end
 
 while true do
+    io_ops = 0
+    trace_tick()
     local ok, err = pcall(step)
     if not ok then
         log_error(tostring(err))
     end
+    ok, err = pcall(flush_writes)
+    if not ok then
+        log_error(tostring(err))
+    end
+    ok, err = pcall(flush_state)
+    if not ok then
+        log_error(tostring(err))
+    end
     emu.frameadvance()
 end
\ No newline at end of file
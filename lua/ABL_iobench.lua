@@ -0,0 +1,287 @@
+---------------------------------------------------------------------
+-- Counts the file I/O ABL.lua does per 10k frames, outside BizHawk.
+--
+--   lua5.4 lua/ABL_iobench.lua [frames] [script]
+--
+-- Runs the script (default: ABL.lua next to this file) under a stock Lua
+-- 5.4 with `memory` and `emu` stubbed: a scripted player goes through
+-- levels picking up grain, FLIK letters and kills and finishing each one,
+-- while a stand-in client appends a command every few seconds and bumps
+-- the tier store now and then. io.open, os.rename, os.remove and every
+-- call on an opened file are counted, and so are the calls into `memory`;
+-- the totals per 10k frames, the busiest frame and the CHECK lines
+-- journaled are printed at the end. The state journal starts out holding
+-- more than JOURNAL_COMPACT_BYTES of entries the client has acked, and the
+-- run fails unless ABL.lua compacts them away.
+---------------------------------------------------------------------
+local frames = tonumber(arg and arg[1]) or 100000
+local script = arg and arg[2]
+if not script then
+    local src = debug.getinfo(1, "S").source:gsub("^@", ""):gsub("\\", "/")
+    script = (src:match("^(.*)/") or ".") .. "/ABL.lua"
+end
+
+local FLIK_STATUS_READY = 0xFF20
+local FLIK_STATUS_BUSY  = 0x4669
+local LEVELS = { 17, 1, 3, 2, 6, 10, 11, 4, 5, 14, 7, 12, 13, 9, 8, 15 }
+local LEVEL_FRAMES = 3600
+local COMMAND_EVERY = 300
+local TIER_BUMP_EVERY = 1800
+local JOURNAL_COMPACT_BYTES = 64 * 1024
+
+---------------------------------------------------------------------
+-- Data directory (ABL.lua appends "A_Bugs_Life_Archipelago" to it)
+---------------------------------------------------------------------
+
+local raw_open, raw_rename, raw_remove = io.open, os.rename, os.remove
+local sep = package.config:sub(1, 1)
+local windows = sep == "\\"
+
+local base = os.tmpname()
+raw_remove(base)
+local prefix = base .. sep .. "A_Bugs_Life_Archipelago" .. sep
+if windows then
+    os.execute('mkdir "' .. prefix .. '" >nul 2>nul')
+else
+    os.execute('mkdir -p "' .. prefix .. '"')
+end
+
+local FILES = {
+    "abl_config.txt", "abl_state.txt", "abl_state.txt.ack", "abl_state.txt.tmp",
+    "abl_command.txt", "abl_command.txt.ack", "abl_command.txt.ack.tmp",
+    "abl_command.txt.tmp", "abl_tiers.bin",
+}
+
+local function write_file(name, mode, text)
+    local f = assert(raw_open(prefix .. name, mode))
+    f:write(text)
+    f:close()
+end
+
+local config = { "options=30" }
+for _, level in ipairs(LEVELS) do
+    config[#config + 1] = ("grain_%d=10,20,30,40,50"):format(level)
+    config[#config + 1] = ("enemies_%d=5,10,15,20"):format(level)
+end
+write_file("abl_config.txt", "w", table.concat(config, "\n") .. "\n")
+
+-- An acked backlog past ABL.lua's compaction threshold in the state journal.
+local backlog = { "#ABLJ bench 0\n" }
+local backlog_bytes = #backlog[1]
+local backlog_seq = 0
+while backlog_bytes <= JOURNAL_COMPACT_BYTES do
+    backlog_seq = backlog_seq + 1
+    local line = ("%d BACKLOG %s\n"):format(backlog_seq, ("x"):rep(40))
+    backlog[#backlog + 1] = line
+    backlog_bytes = backlog_bytes + #line
+end
+write_file("abl_state.txt", "wb", table.concat(backlog))
+write_file("abl_state.txt.ack", "wb", ("%d bench 0 %d\n"):format(backlog_seq, backlog_bytes))
+
+-- The client side: a command journal and a tier store (ablbridge formats).
+local command_seq = 0
+write_file("abl_command.txt", "wb", "#ABLJ bench 0\n")
+
+local function send_command(text)
+    command_seq = command_seq + 1
+    write_file("abl_command.txt", "ab", ("%d %s\n"):format(command_seq, text))
+end
+
+local tier_generation = 0
+
+local function write_tier_store(berry)
+    local records = {}
+    for idx = 0, 255 do
+        records[#records + 1] = string.pack("BBBBBB", 0, 0, 0, 0, 0, berry)
+    end
+    local head = string.pack("<c4I2I2I4I4", "ABLS", 1, 256, tier_generation, 0)
+    write_file("abl_tiers.bin", "r+b", head .. table.concat(records))
+end
+
+write_file("abl_tiers.bin", "wb", "")
+write_tier_store(1)
+
+---------------------------------------------------------------------
+-- I/O counting
+---------------------------------------------------------------------
+
+local counts = { open = 0, rename = 0, remove = 0, file = 0, memory = 0 }
+local compactions = 0
+local frame_ops = 0
+local busiest = 0
+
+local function count(kind)
+    counts[kind] = counts[kind] + 1
+    frame_ops = frame_ops + 1
+end
+
+local FILE_METHODS = { read = true, write = true, seek = true, lines = true, flush = true, close = true, setvbuf = true }
+
+io.open = function(path, mode)
+    count("open")
+    local f, err = raw_open(path, mode)
+    if not f then return f, err end
+    -- Forward method calls to the real handle, counting the I/O ones.
+    return setmetatable({}, {
+        __index = function(_, key)
+            local method = f[key]
+            if type(method) ~= "function" then return method end
+            return function(_, ...)
+                if FILE_METHODS[key] then count("file") end
+                return method(f, ...)
+            end
+        end,
+    })
+end
+os.rename = function(from, to)
+    count("rename")
+    if to == prefix .. "abl_state.txt" then compactions = compactions + 1 end
+    return raw_rename(from, to)
+end
+os.remove = function(path)
+    count("remove")
+    return raw_remove(path)
+end
+os.getenv = function(name)
+    if name == "LOCALAPPDATA" or name == "USERPROFILE" then return base end
+    return nil
+end
+if not windows then os.execute = function() return true end end
+
+---------------------------------------------------------------------
+-- Emulator
+---------------------------------------------------------------------
+
+local ADDR = {
+    level_index    = 0x082504,
+    level_code     = 0x0A64B0,
+    flik_status    = 0x1FFF18,
+    flik_mask      = 0x0A65A2,
+    grain          = 0x0A65A1,
+    enemy_tens     = 0x0B019A,
+    enemy_units    = 0x0B019B,
+    level_complete = 0x0823A0,
+}
+
+local ram = {}
+local frame = -1
+
+local function set_u16(addr, value)
+    ram[addr] = value & 0xFF
+    ram[addr + 1] = value >> 8
+end
+
+-- Frame n of the scripted playthrough.
+local function set_frame(n)
+    local visit = n // LEVEL_FRAMES
+    local t = n % LEVEL_FRAMES
+    local level = LEVELS[visit % #LEVELS + 1]
+    ram[ADDR.level_index] = level
+    set_u16(ADDR.level_code, 0x100 + visit)
+    set_u16(ADDR.flik_status, t < 90 and FLIK_STATUS_BUSY or FLIK_STATUS_READY)
+    local played = math.max(t - 90, 0)
+    ram[ADDR.grain] = math.min(played // 60, 50)
+    local kills = math.min(played // 150, 20)
+    ram[ADDR.enemy_tens] = kills // 10
+    ram[ADDR.enemy_units] = kills % 10
+    ram[ADDR.flik_mask] = (1 << math.min(played // 700, 4)) - 1
+    ram[ADDR.level_complete] = t >= LEVEL_FRAMES - 120 and 1 or 0
+end
+
+local function read_u8(addr)
+    counts.memory = counts.memory + 1
+    return ram[addr] or 0
+end
+
+local function read_u16(addr)
+    counts.memory = counts.memory + 1
+    return (ram[addr] or 0) | (ram[addr + 1] or 0) << 8
+end
+
+local function read_bytes_as_array(addr, length)
+    counts.memory = counts.memory + 1
+    local out = {}
+    for i = 1, length do
+        out[i] = ram[addr + i - 1] or 0
+    end
+    return out
+end
+
+local function write_u8(addr, value)
+    counts.memory = counts.memory + 1
+    ram[addr] = value & 0xFF
+end
+
+local function write_u16(addr, value)
+    counts.memory = counts.memory + 1
+    set_u16(addr, value & 0xFFFF)
+end
+
+local Finished = {}
+
+memory = {
+    read_u8 = read_u8,
+    read_u16_le = read_u16,
+    read_bytes_as_array = read_bytes_as_array,
+    write_u8 = write_u8,
+    write_u16_le = write_u16,
+}
+emu = {
+    frameadvance = function()
+        -- Frame 0 also holds the script's start-up reads.
+        if frame > 0 then busiest = math.max(busiest, frame_ops) end
+        frame_ops = 0
+        frame = frame + 1
+        if frame >= frames then error(Finished) end
+        if frame > 0 and frame % COMMAND_EVERY == 0 then send_command("LIFE +1") end
+        if frame > 0 and frame % TIER_BUMP_EVERY == 0 then
+            tier_generation = tier_generation + 2
+            write_tier_store(1 + (frame // TIER_BUMP_EVERY) % 4)
+        end
+        set_frame(frame)
+    end,
+}
+
+local real_print = print
+print = function() end
+
+---------------------------------------------------------------------
+-- Run
+---------------------------------------------------------------------
+
+local ok, err = pcall(dofile, script)
+print = real_print
+if not ok and err ~= Finished then
+    error(err, 0)
+end
+
+local checks, left = 0, 0
+local journal = raw_open(prefix .. "abl_state.txt", "rb")
+if journal then
+    for line in journal:lines() do
+        if line:match("^%d+ CHECK ") then checks = checks + 1 end
+        if line:match("^%d+ BACKLOG ") then left = left + 1 end
+    end
+    journal:close()
+end
+for _, name in ipairs(FILES) do raw_remove(prefix .. name) end
+raw_remove(prefix)
+raw_remove(base)
+
+local per = 10000 / frames
+local total = counts.open + counts.rename + counts.remove + counts.file
+print(("script:            %s"):format(script))
+print(("frames:            %d"):format(frames))
+print(("CHECK lines:       %d"):format(checks))
+print("per 10k frames:")
+print(("  io.open          %.1f"):format(counts.open * per))
+print(("  os.rename        %.1f"):format(counts.rename * per))
+print(("  os.remove        %.1f"):format(counts.remove * per))
+print(("  file methods     %.1f"):format(counts.file * per))
+print(("  total            %.1f"):format(total * per))
+print(("  memory calls     %.1f"):format(counts.memory * per))
+print(("busiest frame:     %d calls (after start-up)"):format(busiest))
+print(("state compactions: %d (%d of %d acked entries left)"):format(compactions, left, backlog_seq))
+if compactions == 0 or left > 0 then
+    error("the acked state journal backlog was not compacted", 0)
+end
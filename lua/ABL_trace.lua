@@ -0,0 +1,87 @@
+---------------------------------------------------------------------
+-- Records the RAM ABL.lua's check detectors read, one packed record per
+-- frame, so `python -m abltrace` can replay a session without BizHawk.
+-- Run it next to ABL.lua; the layout is abltrace/trace.py's FRAME_DTYPE.
+---------------------------------------------------------------------
+local ram_domain = "MainRAM"
+local read_u8  = memory.read_u8
+local read_u16 = memory.read_u16_le
+local pack = string.pack
+
+local level_index_addr           = 0x082504
+local level_code_addr            = 0x0A64B0
+local flik_status_addr           = 0x1FFF18
+local flik_addr                  = 0x0A65A2
+local grain_addr                 = 0x0A65A1
+local enemy_tens_addr            = 0x0B019A
+local enemy_units_addr           = 0x0B019B
+local level_complete_status_addr = 0x0823A0
+
+local TRACE_VERSION = 1
+local RECORD_FORMAT = "<I1I2I2I1I1I1I1I1"
+local FLUSH_FRAMES = 600
+
+local path = os.getenv("ABL_TRACE")
+if not path or path == "" then
+    -- ABL.lua's data directory.
+    local sep = package.config:sub(1, 1)
+    local function env_dir(name)
+        local dir = os.getenv(name)
+        if dir and dir ~= "" then return dir end
+    end
+    local dir = env_dir("ABL_DATA_DIR")
+    if dir then
+        dir = dir:gsub("[/\\]+$", "") .. sep
+    else
+        local user_home = env_dir("HOME") or env_dir("USERPROFILE")
+        local home = env_dir("LOCALAPPDATA") or env_dir("XDG_DATA_HOME")
+            or (user_home and user_home .. sep .. ".local" .. sep .. "share") or "."
+        dir = home .. sep .. "A_Bugs_Life_Archipelago" .. sep
+    end
+    -- The data directory of ABL.lua's ABL_INSTANCE, if set.
+    local instance = os.getenv("ABL_INSTANCE")
+    if instance and instance ~= "" then
+        dir = dir .. "instances" .. sep .. instance:gsub("[^%w_%-]", "_") .. sep
+    end
+    path = dir .. "session.abltrace"
+end
+
+local out = io.open(path, "wb")
+if not out then
+    print("ABL trace ERROR: cannot open " .. path)
+    return
+end
+out:write(pack("<c8I4I4", "ABLTRACE", TRACE_VERSION, pack(RECORD_FORMAT, 0, 0, 0, 0, 0, 0, 0, 0):len()))
+
+local buffer = {}
+
+local function flush()
+    if #buffer == 0 then return end
+    out:write(table.concat(buffer))
+    out:flush()
+    buffer = {}
+end
+
+event.onexit(function()
+    flush()
+    out:close()
+end)
+
+print("ABL trace: recording to " .. path)
+
+while true do
+    buffer[#buffer + 1] = pack(RECORD_FORMAT,
+        read_u8(level_index_addr, ram_domain),
+        read_u16(level_code_addr, ram_domain),
+        read_u16(flik_status_addr, ram_domain),
+        read_u8(flik_addr, ram_domain),
+        read_u8(grain_addr, ram_domain),
+        read_u8(enemy_tens_addr, ram_domain),
+        read_u8(enemy_units_addr, ram_domain),
+        read_u8(level_complete_status_addr, ram_domain)
+    )
+    if #buffer >= FLUSH_FRAMES then
+        flush()
+    end
+    emu.frameadvance()
+end